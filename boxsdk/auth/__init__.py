@@ -8,11 +8,16 @@
     from .jwt_auth import JWTAuth
 except ImportError:
     JWTAuth = None  # If extras[jwt] are not installed, JWTAuth won't be available.
+from .jwt_token_pool import JWTTokenPool
 from .oauth2 import OAuth2
 try:
     from .redis_managed_oauth2 import RedisManagedOAuth2
 except ImportError:
     RedisManagedOAuth2 = None  # If extras[redis] are not installed, RedisManagedOAuth2 won't be available.
+try:
+    from .redis_token_manager import RedisTokenManager
+except ImportError:
+    RedisTokenManager = None  # If extras[redis] are not installed, RedisTokenManager won't be available.
 try:
     from .redis_managed_jwt_auth import RedisManagedJWTAuth
 except ImportError:
@@ -2,10 +2,12 @@
 
 from __future__ import absolute_import, unicode_literals
 
+from binascii import hexlify
 from datetime import datetime, timedelta
+import hashlib
 import json
-import random
-import string
+from os import urandom
+from threading import Lock
 import time
 
 from cryptography.hazmat.backends import default_backend
@@ -19,6 +21,7 @@
 from .oauth2 import OAuth2
 from ..object.user import User
 from ..util.compat import NoneType
+from ..util.lru_cache import LRUCache
 
 
 class JWTAuth(OAuth2):
@@ -26,6 +29,11 @@ class JWTAuth(OAuth2):
     Responsible for handling JWT Auth for Box Developer Edition. Can authenticate enterprise instances or app users.
     """
     _GRANT_TYPE = 'urn:ietf:params:oauth:grant-type:jwt-bearer'
+    # The number of random bytes in the jti claim, which is hex encoded. Box requires it to be 16-128 characters long.
+    _JTI_BYTES = 32
+    # The RSA private keys loaded by this process, by the digests of their PEM data and passphrase.
+    _rsa_private_key_cache = LRUCache(capacity=16)
+    _rsa_private_key_cache_lock = Lock()
 
     def __init__(
             self,
@@ -185,11 +193,57 @@ def _construct_and_send_jwt_auth(self, sub, sub_type, now_time=None):
         :rtype:
             `unicode`
         """
-        system_random = random.SystemRandom()
-        jti_length = system_random.randint(16, 128)
-        ascii_alphabet = string.ascii_letters + string.digits
-        ascii_len = len(ascii_alphabet)
-        jti = ''.join(ascii_alphabet[int(system_random.random() * ascii_len)] for _ in range(jti_length))
+        data = self._construct_jwt_auth_data(sub, sub_type, now_time)
+        return self.send_token_request(data, access_token=None, expect_refresh_token=False)[0]
+
+    def _construct_and_execute_jwt_auth(self, sub, sub_type, now_time=None):
+        """
+        Construct the claims used for JWT auth and send a request to get a JWT, without storing the token.
+
+        :param sub:
+            The enterprise ID or user ID to auth.
+        :type sub:
+            `unicode`
+        :param sub_type:
+            Either 'enterprise' or 'user'
+        :type sub_type:
+            `unicode`
+        :param now_time:
+            Optional. The current UTC time is needed in order to construct the expiration time of the JWT claim.
+            If None, `datetime.utcnow()` will be used.
+        :type now_time:
+            `datetime` or None
+        :return:
+            The response for the token request.
+        :rtype:
+            :class:`TokenResponse`
+        """
+        data = self._construct_jwt_auth_data(sub, sub_type, now_time)
+        return self._execute_token_request(data, access_token=None, expect_refresh_token=False)
+
+    def _construct_jwt_auth_data(self, sub, sub_type, now_time=None):
+        """
+        Construct the parameters of a request to get a JWT, including the signed assertion.
+
+        :param sub:
+            The enterprise ID or user ID to auth.
+        :type sub:
+            `unicode`
+        :param sub_type:
+            Either 'enterprise' or 'user'
+        :type sub_type:
+            `unicode`
+        :param now_time:
+            Optional. The current UTC time is needed in order to construct the expiration time of the JWT claim.
+            If None, `datetime.utcnow()` will be used.
+        :type now_time:
+            `datetime` or None
+        :return:
+            The parameters of the token request.
+        :rtype:
+            `dict`
+        """
+        jti = hexlify(urandom(self._JTI_BYTES)).decode('ascii')
         if now_time is None:
             now_time = datetime.utcnow()
         now_plus_30 = now_time + timedelta(seconds=30)
@@ -218,7 +272,7 @@ def _construct_and_send_jwt_auth(self, sub, sub_type, now_time=None):
             data['box_device_id'] = self._box_device_id
         if self._box_device_name:
             data['box_device_name'] = self._box_device_name
-        return self.send_token_request(data, access_token=None, expect_refresh_token=False)[0]
+        return data
 
     def _auth_with_jwt(self, sub, sub_type):
         """
@@ -241,11 +295,33 @@ def _auth_with_jwt(self, sub, sub_type):
         :rtype:
             `unicode`
         """
+        return self._retry_jwt_auth(self._construct_and_send_jwt_auth, sub, sub_type)
+
+    def _retry_jwt_auth(self, send_jwt_auth, sub, sub_type):
+        """
+        Send a JWT auth request, retrying it if it's rate limited, if Box fails to respond, or if authorization fails
+        because the expiration time is out of sync with the Box servers.
+
+        :param send_jwt_auth:
+            The method that constructs and sends the request, given the subject, the subject type and the current time.
+        :type send_jwt_auth:
+            `callable`
+        :param sub:
+            The enterprise ID or user ID to auth.
+        :type sub:
+            `unicode`
+        :param sub_type:
+            Either 'enterprise' or 'user'
+        :type sub_type:
+            `unicode`
+        :return:
+            The return value of `send_jwt_auth`.
+        """
         attempt_number = 0
         jwt_time = None
         while True:
             try:
-                return self._construct_and_send_jwt_auth(sub, sub_type, jwt_time)
+                return send_jwt_auth(sub, sub_type, jwt_time)
             except BoxOAuthException as ex:
                 network_response = ex.network_response
                 code = network_response.status_code  # pylint: disable=maybe-no-member
@@ -401,6 +477,43 @@ def authenticate_instance(self, enterprise=None):
         self._user_id = None
         return self._auth_with_jwt(self._enterprise_id, 'enterprise')
 
+    def request_token(self, user=None):
+        """
+        Request an access token for a user, or for the enterprise if no user is given.
+
+        Unlike `authenticate_user()` and `authenticate_instance()`, the token isn't stored, and this auth object keeps
+        authenticating as the same user or enterprise, so one auth object can be used to request tokens for many users
+        concurrently, e.g. by a :class:`JWTTokenPool`.
+
+        :param user:
+            (optional) The user to request a token for, expressed as a Box User ID or as a :class:`User` instance.
+        :type user:
+            `unicode` or :class:`User` or `None`
+        :raises:
+            :exc:`ValueError` if no user was passed and the object isn't configured with an enterprise ID.
+        :return:
+            The response for the token request, including the access token and the number of seconds until it
+            expires.
+        :rtype:
+            :class:`TokenResponse`
+        """
+        user_id = self._normalize_user_id(user)
+        if user_id is not None:
+            return self._retry_jwt_auth(self._construct_and_execute_jwt_auth, user_id, 'user')
+        if not self._enterprise_id:
+            raise ValueError("request_token: Requires the enterprise ID, but it was not provided.")
+        return self._retry_jwt_auth(self._construct_and_execute_jwt_auth, self._enterprise_id, 'enterprise')
+
+    @property
+    def enterprise_id(self):
+        """
+        Get the ID of the enterprise that this auth object authenticates as, if it's configured with one.
+
+        :rtype:
+            `unicode` or None
+        """
+        return self._enterprise_id
+
     def _refresh(self, access_token):
         """
         Base class override.
@@ -433,11 +546,7 @@ def _normalize_rsa_private_key(cls, file_sys_path, data, passphrase=None):
                 )
         if isinstance(data, binary_type):
             passphrase = cls._normalize_rsa_private_key_passphrase(passphrase)
-            return serialization.load_pem_private_key(
-                data,
-                password=passphrase,
-                backend=default_backend(),
-            )
+            return cls._load_rsa_private_key(data, passphrase)
         if isinstance(data, RSAPrivateKey):
             return data
         raise TypeError(
@@ -448,6 +557,42 @@ def _normalize_rsa_private_key(cls, file_sys_path, data, passphrase=None):
             .format(data.__class__.__name__)
         )
 
+    @classmethod
+    def _load_rsa_private_key(cls, data, passphrase):
+        """
+        Load an RSA private key from PEM data, reusing the key object if this process has already loaded the same key
+        with the same passphrase. Decrypting a passphrase-protected key is deliberately slow, so this saves time when
+        many auth objects are created for the same app, e.g. with `from_settings_file()`.
+
+        :param data:
+            The PEM data of the key.
+        :type data:
+            `bytes`
+        :param passphrase:
+            The passphrase of the key, or None if it isn't encrypted.
+        :type passphrase:
+            `bytes` or None
+        :rtype:
+            :class:`RSAPrivateKey`
+        """
+        cache_key = (
+            hashlib.sha256(data).digest(),
+            hashlib.sha256(passphrase).digest() if passphrase is not None else None,
+        )
+        with cls._rsa_private_key_cache_lock:
+            try:
+                return cls._rsa_private_key_cache.get(cache_key)
+            except KeyError:
+                pass
+        rsa_private_key = serialization.load_pem_private_key(
+            data,
+            password=passphrase,
+            backend=default_backend(),
+        )
+        with cls._rsa_private_key_cache_lock:
+            cls._rsa_private_key_cache.set(cache_key, rsa_private_key)
+        return rsa_private_key
+
     @staticmethod
     def _normalize_rsa_private_key_passphrase(passphrase):
         if isinstance(passphrase, text_type):
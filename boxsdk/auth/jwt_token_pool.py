@@ -0,0 +1,287 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from collections import OrderedDict
+from threading import Lock
+import time
+
+from .oauth2 import OAuth2
+from ..client import Client
+from ..object.user import User
+from ..session.session import AuthorizedSession
+
+
+class JWTTokenPool(object):
+    """
+    Requests access tokens for many users of a JWT app with a single :class:`JWTAuth`, and caches them until shortly
+    before they expire.
+
+    Services that act on behalf of many app users can get a lightweight client for each user from the pool, instead of
+    creating a :class:`JWTAuth` for each user, which reloads the RSA private key and requests a new token every time.
+    Concurrent requests for a token for the same user are combined into one, and the tokens of users that haven't been
+    used for `max_idle_time` seconds are dropped.
+    """
+
+    def __init__(self, auth, refresh_before_expiry=60, max_idle_time=600, max_entries=None):
+        """
+        :param auth:
+            The auth object to request tokens with. Its own tokens aren't changed by the pool.
+        :type auth:
+            :class:`JWTAuth`
+        :param refresh_before_expiry:
+            The number of seconds before a token expires at which it's no longer handed out, so that requests aren't
+            made with a token that's about to expire.
+        :type refresh_before_expiry:
+            `float`
+        :param max_idle_time:
+            The number of seconds after which the token of a user who hasn't been handed one out is dropped.
+        :type max_idle_time:
+            `float`
+        :param max_entries:
+            The maximum number of tokens to keep, or None for no limit. When there are more, the tokens that were least
+            recently handed out are dropped.
+        :type max_entries:
+            `int` or None
+        """
+        super(JWTTokenPool, self).__init__()
+        self._auth = auth
+        self._refresh_before_expiry = refresh_before_expiry
+        self._max_idle_time = max_idle_time
+        self._max_entries = max_entries
+        # The token entries of each subject, by subject, from the least to the most recently used.
+        self._entries = OrderedDict()
+        # The locks that combine concurrent requests for a token for the same subject, by subject.
+        self._subject_locks = {}
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_access_token(self, user=None, stale_access_token=None):
+        """
+        Get an access token for a user, or for the enterprise if no user is given, requesting one if there isn't a
+        cached token that's valid for long enough.
+
+        :param user:
+            (optional) The user to get a token for, expressed as a Box User ID or as a :class:`User` instance.
+        :type user:
+            `unicode` or :class:`User` or `None`
+        :param stale_access_token:
+            (optional) A token for the user that was rejected by Box. If it's the cached token, a new one is requested.
+        :type stale_access_token:
+            `unicode` or `None`
+        :return:
+            The access token.
+        :rtype:
+            `unicode`
+        """
+        subject = self._get_subject(user)
+        access_token = self._get_cached_access_token(subject, stale_access_token)
+        if access_token is not None:
+            return access_token
+        with self._lock:
+            subject_lock = self._subject_locks.setdefault(subject, Lock())
+        with subject_lock:
+            # Another thread may have requested a token for the subject while this one was waiting for the lock.
+            access_token = self._get_cached_access_token(subject, stale_access_token)
+            if access_token is not None:
+                return access_token
+            requested_at = time.time()
+            token_response = self._auth.request_token(user)
+            # pylint:disable=no-member
+            expires_at = requested_at + token_response.expires_in if 'expires_in' in token_response else None
+            with self._lock:
+                self._entries.pop(subject, None)
+                self._entries[subject] = _TokenEntry(token_response.access_token, expires_at, time.time())
+                self._evict_idle()
+            return token_response.access_token
+
+    def get_auth(self, user=None):
+        """
+        Get an auth object for a user, or for the enterprise if no user is given, that gets its tokens from the pool.
+
+        :param user:
+            (optional) The user to authenticate as, expressed as a Box User ID or as a :class:`User` instance.
+        :type user:
+            `unicode` or :class:`User` or `None`
+        :rtype:
+            :class:`PooledJWTAuth`
+        """
+        return PooledJWTAuth(self, user)
+
+    def get_client(self, user=None):
+        """
+        Get a client that makes requests as a user, or as the enterprise if no user is given, with tokens from the
+        pool. The clients share the network layer and configuration of the session of the pool's auth object.
+
+        :param user:
+            (optional) The user to make requests as, expressed as a Box User ID or as a :class:`User` instance.
+        :type user:
+            `unicode` or :class:`User` or `None`
+        :rtype:
+            :class:`Client`
+        """
+        auth = self.get_auth(user)
+        # pylint:disable=protected-access
+        return Client(auth, session=AuthorizedSession(auth, **self._auth._session.get_constructor_kwargs()))
+
+    def discard(self, user=None):
+        """
+        Drop the cached token of a user, or of the enterprise if no user is given.
+
+        :param user:
+            (optional) The user whose token to drop, expressed as a Box User ID or as a :class:`User` instance.
+        :type user:
+            `unicode` or :class:`User` or `None`
+        """
+        with self._lock:
+            self._entries.pop(self._get_subject(user), None)
+
+    def evict_idle(self):
+        """
+        Drop the tokens that have expired, and those of the users who haven't been handed one out for
+        `max_idle_time` seconds.
+
+        Idle tokens are also dropped whenever a new token is requested, so this only needs to be called to free up
+        memory when no new tokens are being requested.
+        """
+        with self._lock:
+            self._evict_idle()
+
+    def _get_subject(self, user):
+        """
+        Get the subject of the tokens of a user, or of the enterprise if no user is given.
+
+        :param user:
+            The user, expressed as a Box User ID or as a :class:`User` instance, or None for the enterprise.
+        :type user:
+            `unicode` or :class:`User` or `None`
+        :return:
+            The subject type and the ID of the user or enterprise.
+        :rtype:
+            (`unicode`, `unicode`)
+        """
+        if user is None:
+            return 'enterprise', self._auth.enterprise_id
+        return 'user', user.object_id if isinstance(user, User) else user
+
+    def _get_cached_access_token(self, subject, stale_access_token):
+        """
+        Get the cached token of a subject, if it's valid for long enough and isn't the token that was rejected.
+
+        :param subject:
+            The subject type and the ID of the user or enterprise.
+        :type subject:
+            (`unicode`, `unicode`)
+        :param stale_access_token:
+            A token for the subject that was rejected by Box, or None.
+        :type stale_access_token:
+            `unicode` or `None`
+        :rtype:
+            `unicode` or `None`
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.pop(subject, None)
+            if entry is None:
+                return None
+            if entry.access_token == stale_access_token or not entry.is_valid_at(now + self._refresh_before_expiry):
+                return None
+            entry.last_used = now
+            self._entries[subject] = entry
+            return entry.access_token
+
+    def _evict_idle(self):
+        """
+        Drop the expired, idle and least recently used tokens, while holding the lock.
+        """
+        now = time.time()
+        for subject, entry in list(self._entries.items()):
+            if not entry.is_valid_at(now) or entry.last_used < now - self._max_idle_time:
+                del self._entries[subject]
+        while self._max_entries is not None and len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        for subject in list(self._subject_locks):
+            if subject not in self._entries and not self._subject_locks[subject].locked():
+                del self._subject_locks[subject]
+
+
+class _TokenEntry(object):
+    """
+    A cached access token, with the time it expires at and the time it was last handed out.
+    """
+    __slots__ = ('access_token', 'expires_at', 'last_used')
+
+    def __init__(self, access_token, expires_at, last_used):
+        self.access_token = access_token
+        self.expires_at = expires_at
+        self.last_used = last_used
+
+    def is_valid_at(self, timestamp):
+        """
+        Whether the token is still valid at a time.
+
+        :param timestamp:
+            The time, as a Unix timestamp.
+        :type timestamp:
+            `float`
+        :rtype:
+            `bool`
+        """
+        return self.expires_at is None or timestamp < self.expires_at
+
+
+class PooledJWTAuth(OAuth2):
+    """
+    Box SDK OAuth2 subclass.
+    Authenticates as a user, or as the enterprise, with tokens from a :class:`JWTTokenPool`.
+    """
+
+    def __init__(self, pool, user=None):
+        """
+        :param pool:
+            The pool to get tokens from.
+        :type pool:
+            :class:`JWTTokenPool`
+        :param user:
+            (optional) The user to authenticate as, expressed as a Box User ID or as a :class:`User` instance, or None
+            to authenticate as the enterprise.
+        :type user:
+            `unicode` or :class:`User` or `None`
+        """
+        # pylint:disable=protected-access
+        auth = pool._auth
+        super(PooledJWTAuth, self).__init__(auth._client_id, auth._client_secret, session=auth._session)
+        self._pool = pool
+        self._user = user
+
+    @property
+    def access_token(self):
+        """
+        Base class override.
+
+        Get the pool's token for the user, if it's valid for long enough. If not, None is returned, which makes the
+        session request a new one with `refresh()`.
+        """
+        # pylint:disable=protected-access
+        return self._pool._get_cached_access_token(self._pool._get_subject(self._user), None)
+
+    def _get_tokens(self):
+        """
+        Base class override. Get the pool's token for the user.
+        """
+        return self.access_token, None
+
+    def _refresh(self, access_token):
+        """
+        Base class override. Get a token for the user from the pool, which requests a new one if needed.
+        """
+        return self._pool.get_access_token(self._user, stale_access_token=access_token), None
+
+    def revoke(self):
+        """
+        Base class override. Revoke the user's token, and drop it from the pool.
+        """
+        super(PooledJWTAuth, self).revoke()
+        self._pool.discard(self._user)
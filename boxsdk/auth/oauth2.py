@@ -7,7 +7,9 @@
 import random
 import string  # pylint:disable=deprecated-module
 import sys
-from threading import Lock
+from threading import Lock, Timer
+import time
+import weakref
 
 # pylint:disable=import-error,no-name-in-module,relative-import
 from six.moves.urllib.parse import urlencode, urlunsplit
@@ -62,6 +64,7 @@ def __init__(
             refresh_token=None,
             session=None,
             refresh_lock=None,
+            refresh_before_expiry=None,
     ):
         """
         :param client_id:
@@ -100,6 +103,13 @@ def __init__(
             Lock used to synchronize token refresh. If not specified, then a :class:`threading.Lock` will be used.
         :type refresh_lock:
             Context Manager
+        :param refresh_before_expiry:
+            If specified, the access token is refreshed in the background, at a random time between this many seconds
+            and half as many again before it expires, but no sooner than halfway through its lifetime, so that requests
+            aren't made with an expired token. If not, the access token is only refreshed once a request fails because
+            it has expired.
+        :type refresh_before_expiry:
+            `float` or None
         """
         self._client_id = client_id
         self._client_secret = client_secret
@@ -110,6 +120,9 @@ def __init__(
         self._refresh_lock = refresh_lock or Lock()
         self._box_device_id = box_device_id
         self._box_device_name = box_device_name
+        self._refresh_before_expiry = refresh_before_expiry
+        self._access_token_expires_at = None
+        self._refresh_timer = None
         self._closed = False
         self._api_config = API()
         self._logger = getLogger(__name__)
@@ -126,6 +139,19 @@ def access_token(self):
         """
         return self._access_token
 
+    @property
+    def access_token_expires_at(self):
+        """
+        Get the time at which the current access token expires, as a Unix timestamp.
+
+        :return:
+            The time at which the access token expires, or None if it isn't known, e.g. because the token was passed
+            to the constructor, or retrieved from another process.
+        :rtype:
+            `float` or None
+        """
+        return self._access_token_expires_at
+
     @property
     def closed(self):
         """True iff the auth object has been closed.
@@ -313,6 +339,8 @@ def _update_current_tokens(self, access_token, refresh_token):
         :type refresh_token:
             `unicode` or `None`
         """
+        if access_token != self._access_token:
+            self._access_token_expires_at = None
         self._access_token, self._refresh_token = access_token, refresh_token
 
     def _execute_token_request(self, data, access_token, expect_refresh_token=True):
@@ -398,12 +426,52 @@ def send_token_request(self, data, access_token, expect_refresh_token=True):
         :rtype:
             (`unicode`, `unicode`)
         """
+        requested_at = time.time()
         token_response = self._execute_token_request(data, access_token, expect_refresh_token)
         # pylint:disable=no-member
         refresh_token = token_response.refresh_token if 'refresh_token' in token_response else None
         self._store_tokens(token_response.access_token, refresh_token)
+        if 'expires_in' in token_response:
+            # The token expires `expires_in` seconds after Box issued it, which is some time after it was requested.
+            self._access_token_expires_at = requested_at + token_response.expires_in
+            self._schedule_refresh(token_response.access_token, token_response.expires_in)
         return self._access_token, self._refresh_token
 
+    def _schedule_refresh(self, access_token, expires_in):
+        """
+        Schedule the refresh of an access token in the background, ahead of its expiry, if proactive refresh is enabled.
+
+        The refresh time is jittered, so that many processes that got their tokens at the same time don't all refresh
+        them at the same time.
+
+        :param access_token:
+            The access token to refresh.
+        :type access_token:
+            `unicode`
+        :param expires_in:
+            The number of seconds until the access token expires.
+        :type expires_in:
+            `float`
+        """
+        if self._refresh_before_expiry is None:
+            return
+        self._cancel_refresh()
+        # Tokens are refreshed no sooner than halfway through their lifetime, so that a `refresh_before_expiry` close to
+        # the lifetime of the tokens doesn't make each refresh immediately schedule another one.
+        delay = max(expires_in / 2, expires_in - self._refresh_before_expiry * random.uniform(1, 1.5))
+        # The timer only holds a weak reference, so that it doesn't keep an auth object that's no longer used alive.
+        self._refresh_timer = Timer(delay, _refresh_in_background, args=(weakref.ref(self), access_token))
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _cancel_refresh(self):
+        """
+        Cancel the scheduled background refresh of the access token, if any.
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
     def revoke(self):
         """
         Revoke the authorization for the current access/refresh token pair.
@@ -436,6 +504,7 @@ def revoke(self):
                     network_response,
                 )
             self._store_tokens(None, None)
+            self._cancel_refresh()
 
     def close(self, revoke=True):
         """Close the auth object.
@@ -457,6 +526,7 @@ def close(self, revoke=True):
         :type revoke:   `bool`
         """
         self._closed = True
+        self._cancel_refresh()
         if revoke:
             self.revoke()
 
@@ -505,3 +575,28 @@ def closing(self, **close_kwargs):
     def _check_closed(self):
         if self.closed:
             raise ValueError("operation on a closed auth object")
+
+
+def _refresh_in_background(auth_ref, access_token):
+    """
+    Refresh an access token that's about to expire, from a background thread.
+
+    If the refresh fails, the token is refreshed once a request fails because it has expired, as usual.
+
+    :param auth_ref:
+        A weak reference to the auth object.
+    :type auth_ref:
+        :class:`weakref.ref`
+    :param access_token:
+        The access token to refresh. If it has already been refreshed, nothing is done.
+    :type access_token:
+        `unicode`
+    """
+    auth = auth_ref()
+    if auth is None or auth.closed:
+        return
+    # pylint:disable=protected-access,broad-except
+    try:
+        auth.refresh(access_token)
+    except Exception:
+        auth._logger.warning('Failed to refresh the access token ahead of its expiry.', exc_info=True)
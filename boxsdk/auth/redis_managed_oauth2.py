@@ -2,6 +2,7 @@
 
 from __future__ import unicode_literals
 
+from threading import Lock as ThreadingLock
 from uuid import uuid4
 
 from redis import StrictRedis
@@ -25,11 +26,25 @@ def __init__(self, unique_id=uuid4(), redis_server=None, *args, **kwargs):
             An instance of a Redis server, configured to talk to Redis.
         :type redis_server:
             :class:`Redis`
+        :param token_manager:
+            (optional, keyword only) If specified, the tokens are read from the manager's local copy, which it keeps up
+            to date as other processes store new tokens, and only one process refreshes them at a time while the
+            others wait for the new tokens. If not, the tokens are read from Redis on every refresh, and refreshes wait
+            for a lock in Redis. `unique_id` and `redis_server` are ignored if this is specified.
+        :type token_manager:
+            :class:`RedisTokenManager`
         """
         # pylint:disable=keyword-arg-before-vararg
-        self._unique_id = unique_id
-        self._redis_server = redis_server or StrictRedis()
-        refresh_lock = Lock(redis=self._redis_server, name='{0}_lock'.format(self._unique_id))
+        self._token_manager = kwargs.pop('token_manager', None)
+        if self._token_manager is not None:
+            self._unique_id = self._token_manager.unique_id
+            self._redis_server = self._token_manager.redis_server
+            # The token manager makes sure that only one process refreshes the tokens at a time.
+            refresh_lock = ThreadingLock()
+        else:
+            self._unique_id = unique_id
+            self._redis_server = redis_server or StrictRedis()
+            refresh_lock = Lock(redis=self._redis_server, name='{0}_lock'.format(self._unique_id))
         super(RedisManagedOAuth2Mixin, self).__init__(*args, refresh_lock=refresh_lock, **kwargs)
         if self._access_token is None:
             self._get_and_update_current_tokens()
@@ -42,11 +57,43 @@ def unique_id(self):
         """
         return self._unique_id
 
+    def refresh(self, access_token_to_refresh):
+        """
+        Base class override.
+        If there's a token manager, refreshes the tokens through it, so that only one process refreshes them at a time.
+        """
+        if self._token_manager is None:
+            return super(RedisManagedOAuth2Mixin, self).refresh(access_token_to_refresh)
+        self._check_closed()
+        tokens = self._token_manager.refresh(access_token_to_refresh, self._refresh_latest_tokens)
+        self._update_current_tokens(*tokens)
+        return tokens
+
+    def _refresh_latest_tokens(self, access_token, refresh_token):
+        """
+        Refresh the latest tokens, for the token manager.
+
+        :param access_token:
+            The latest access token.
+        :type access_token:
+            `unicode` or None
+        :param refresh_token:
+            The latest refresh token.
+        :type refresh_token:
+            `unicode` or None
+        """
+        with self._refresh_lock:
+            self._check_closed()
+            self._update_current_tokens(access_token, refresh_token)
+            self._refresh(access_token)
+
     def _get_tokens(self):
         """
         Base class override.
-        Gets the latest tokens from redis before returning them.
+        Gets the latest tokens from redis before returning them, or from the token manager's local copy.
         """
+        if self._token_manager is not None:
+            return self._token_manager.get_tokens()
         return self._redis_server.hvals(self._unique_id) or (None, None)
 
     def _store_tokens(self, access_token, refresh_token):
@@ -55,7 +102,10 @@ def _store_tokens(self, access_token, refresh_token):
         Saves the refreshed tokens in redis.
         """
         super(RedisManagedOAuth2Mixin, self)._store_tokens(access_token, refresh_token)
-        self._redis_server.hmset(self._unique_id, {'access': access_token, 'refresh': refresh_token})
+        if self._token_manager is not None:
+            self._token_manager.store_tokens(access_token, refresh_token)
+        else:
+            self._redis_server.hmset(self._unique_id, {'access': access_token, 'refresh': refresh_token})
 
 
 class RedisManagedOAuth2(RedisManagedOAuth2Mixin):
@@ -0,0 +1,298 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from collections import namedtuple
+import json
+from logging import getLogger
+from threading import Condition, Lock, Thread
+import time
+
+from redis import StrictRedis
+from redis.exceptions import LockError
+from redis.lock import Lock as RedisLock
+
+
+class RedisTokens(namedtuple('RedisTokens', ['version', 'access_token', 'refresh_token'])):
+    """
+    The tokens of a :class:`RedisTokenManager`, with the version that they were stored with.
+    """
+    __slots__ = ()
+
+
+class RedisTokenManager(object):
+    """
+    Shares the tokens of auth objects with the same unique ID between processes, e.g. all of the workers of an app,
+    without making a round trip to Redis every time the tokens are read.
+
+    Each process keeps a local copy of the tokens, which new tokens are pushed to over a Redis pub/sub channel as soon
+    as any process stores them, so reading them doesn't need a lock or a request to Redis. Each version of the tokens is
+    numbered, so that an older version never replaces a newer one. When a token is rejected, only one thread of one
+    process refreshes it, while holding a lease that expires after `lease_timeout` seconds in case the process dies.
+    The others wait for the new tokens to be pushed to them.
+
+    The tokens are stored in the same format as :class:`RedisManagedOAuth2`, so auth objects that don't use a token
+    manager can share them too.
+    """
+
+    _STORE_SCRIPT = """
+        local version = redis.call('INCR', KEYS[2])
+        if ARGV[1] == '' then
+            redis.call('DEL', KEYS[1])
+        else
+            redis.call('HMSET', KEYS[1], 'access', ARGV[1], 'refresh', ARGV[2])
+        end
+        redis.call('PUBLISH', KEYS[3], cjson.encode({version, ARGV[1], ARGV[2]}))
+        return version
+    """
+
+    # How long waiting threads wait for new tokens to be pushed before checking Redis for them.
+    _POLL_INTERVAL = 1
+
+    def __init__(self, unique_id, redis_server=None, lease_timeout=30):
+        """
+        :param unique_id:
+            An identifier for the tokens. Processes which wish to share tokens must use the same ID.
+        :type unique_id:
+            `unicode`
+        :param redis_server:
+            An instance of a Redis server, configured to talk to Redis.
+        :type redis_server:
+            :class:`Redis`
+        :param lease_timeout:
+            The number of seconds after which the lease of a process that's refreshing the tokens expires, so that
+            another process can refresh them if it dies.
+        :type lease_timeout:
+            `float`
+        """
+        super(RedisTokenManager, self).__init__()
+        self._unique_id = unique_id
+        self._redis_server = redis_server or StrictRedis()
+        self._lease_timeout = lease_timeout
+        self._version_key = '{0}_version'.format(unique_id)
+        self._channel = '{0}_tokens'.format(unique_id)
+        self._lease_name = '{0}_lease'.format(unique_id)
+        self._store_script = self._redis_server.register_script(self._STORE_SCRIPT)
+        self._tokens = None
+        # Guards updates to the local copy of the tokens, and notifies threads waiting for new ones.
+        self._condition = Condition()
+        # Makes the threads of this process refresh the tokens one at a time.
+        self._refresh_lock = Lock()
+        self._closed = False
+        self._logger = getLogger(__name__)
+        self._pubsub = self._redis_server.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(self._channel)
+        self._listener = Thread(target=self._listen)
+        self._listener.daemon = True
+        self._listener.start()
+
+    @property
+    def unique_id(self):
+        """
+        Get the unique ID of the tokens.
+
+        :rtype:
+            `unicode`
+        """
+        return self._unique_id
+
+    @property
+    def redis_server(self):
+        """
+        Get the Redis server that the tokens are stored in.
+
+        :rtype:
+            :class:`Redis`
+        """
+        return self._redis_server
+
+    @property
+    def version(self):
+        """
+        Get the version of the local copy of the tokens, or None if they haven't been loaded yet.
+
+        :rtype:
+            `int` or None
+        """
+        tokens = self._tokens
+        return tokens.version if tokens is not None else None
+
+    def get_tokens(self):
+        """
+        Get the latest tokens. The tokens are loaded from Redis the first time, and read from the local copy after that.
+
+        :return:
+            The access token and the refresh token, either of which may be None.
+        :rtype:
+            (`unicode` or None, `unicode` or None)
+        """
+        tokens = self._tokens
+        if tokens is None:
+            tokens = self._load()
+        return tokens.access_token, tokens.refresh_token
+
+    def store_tokens(self, access_token, refresh_token):
+        """
+        Store new tokens in Redis, and push them to all of the processes that share them.
+
+        :param access_token:
+            The new access token, or None to delete the tokens.
+        :type access_token:
+            `unicode` or None
+        :param refresh_token:
+            The new refresh token, or None.
+        :type refresh_token:
+            `unicode` or None
+        """
+        version = self._store_script(
+            keys=[self._unique_id, self._version_key, self._channel],
+            args=[access_token or '', refresh_token or ''],
+        )
+        self._update(RedisTokens(int(version), access_token, refresh_token))
+
+    def refresh(self, access_token_to_refresh, refresh_tokens):
+        """
+        Get new tokens to replace an access token that was rejected, refreshing them only if no other thread or process
+        already has.
+
+        :param access_token_to_refresh:
+            The access token that was rejected, or None if there isn't one.
+        :type access_token_to_refresh:
+            `unicode` or None
+        :param refresh_tokens:
+            Callback that's called with the latest access and refresh tokens to refresh them, and stores the new tokens
+            with :meth:`store_tokens`.
+        :type refresh_tokens:
+            `callable` of (`unicode` or None, `unicode` or None) => None
+        :return:
+            The new access token and refresh token.
+        :rtype:
+            (`unicode` or None, `unicode` or None)
+        """
+        with self._refresh_lock:
+            tokens = self._tokens or self._load()
+            while not self._has_replaced(tokens, access_token_to_refresh):
+                lease = RedisLock(self._redis_server, self._lease_name, timeout=self._lease_timeout)
+                if lease.acquire(blocking=False):
+                    try:
+                        # Another process may have stored new tokens without this one being notified.
+                        tokens = self._load()
+                        if not self._has_replaced(tokens, access_token_to_refresh):
+                            refresh_tokens(tokens.access_token, tokens.refresh_token)
+                            tokens = self._tokens
+                        break
+                    finally:
+                        self._release(lease)
+                # Another process is refreshing the tokens. Wait for them to be pushed, and check Redis in case the
+                # notification was missed.
+                with self._condition:
+                    if self._tokens is tokens:
+                        self._condition.wait(self._POLL_INTERVAL)
+                tokens = self._load() if self._tokens is tokens else self._tokens
+            return tokens.access_token, tokens.refresh_token
+
+    def close(self):
+        """
+        Stop listening for new tokens.
+        """
+        self._closed = True
+        self._listener.join()
+        self._pubsub.close()
+
+    @staticmethod
+    def _has_replaced(tokens, access_token_to_refresh):
+        """
+        Whether tokens have replaced an access token that was rejected.
+
+        :param tokens:
+            The tokens.
+        :type tokens:
+            :class:`RedisTokens`
+        :param access_token_to_refresh:
+            The access token that was rejected, or None if there isn't one.
+        :type access_token_to_refresh:
+            `unicode` or None
+        :rtype:
+            `bool`
+        """
+        return tokens.access_token is not None and tokens.access_token != access_token_to_refresh
+
+    def _release(self, lease):
+        """
+        Release the lease for refreshing the tokens, if it hasn't already expired.
+
+        :param lease:
+            The lease.
+        :type lease:
+            :class:`redis.lock.Lock`
+        """
+        try:
+            lease.release()
+        except LockError:
+            self._logger.warning('The lease for refreshing the tokens of %s expired before the refresh finished.', self._unique_id)
+
+    def _load(self):
+        """
+        Load the tokens from Redis into the local copy.
+
+        :return:
+            The latest tokens.
+        :rtype:
+            :class:`RedisTokens`
+        """
+        pipeline = self._redis_server.pipeline()
+        pipeline.hgetall(self._unique_id)
+        pipeline.get(self._version_key)
+        values, version = pipeline.execute()
+        values = {_decode(key): _decode(value) for key, value in values.items()}
+        return self._update(RedisTokens(
+            int(version or 0),
+            values.get('access') or None,
+            values.get('refresh') or None,
+        ))
+
+    def _update(self, tokens):
+        """
+        Replace the local copy of the tokens, unless it's newer, and notify the threads waiting for new tokens.
+
+        :param tokens:
+            The tokens.
+        :type tokens:
+            :class:`RedisTokens`
+        :return:
+            The latest tokens.
+        :rtype:
+            :class:`RedisTokens`
+        """
+        with self._condition:
+            if self._tokens is None or tokens.version >= self._tokens.version:
+                self._tokens = tokens
+                self._condition.notify_all()
+            return self._tokens
+
+    def _listen(self):
+        """
+        Update the local copy of the tokens with the new tokens pushed by other processes, until closed.
+        """
+        while not self._closed:
+            try:
+                message = self._pubsub.get_message(timeout=self._POLL_INTERVAL)
+            except Exception:  # pylint:disable=broad-except
+                self._logger.warning('Failed to receive new tokens for %s.', self._unique_id, exc_info=True)
+                time.sleep(self._POLL_INTERVAL)
+                continue
+            if message is not None and message['type'] == 'message':
+                version, access_token, refresh_token = json.loads(_decode(message['data']))
+                self._update(RedisTokens(version, access_token or None, refresh_token or None))
+
+
+def _decode(value):
+    """
+    Decode a value read from Redis, which is bytes unless the Redis client decodes responses.
+
+    :type value:
+        `bytes` or `unicode`
+    :rtype:
+        `unicode`
+    """
+    return value.decode('utf-8') if isinstance(value, bytes) else value
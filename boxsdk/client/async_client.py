@@ -0,0 +1,36 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from .client import Client
+from ..session.async_session import AsyncSession, AsyncAuthorizedSession
+
+
+class AsyncClient(Client):
+    """
+    Box client subclass for use with asyncio, which makes requests without blocking the event loop.
+
+    Methods of the client and of the objects it creates that make API calls return awaitables, e.g.
+    `await client.folder('0').get()`. Collections can be iterated over with `async for`, e.g.
+    `async for item in client.folder('0').get_items(): ...`. Many API calls can be awaited at once, e.g. with
+    :func:`asyncio.gather`. Getting objects and metadata, getting the items of a folder and iterating over collections
+    is done entirely on the event loop. Other API call methods are run in a pool of threads, while their requests are
+    made from the event loop, so each of them holds a thread until it returns.
+
+    The client should be closed when it is no longer needed, either with `await client.close()` or by using it as an
+    asynchronous context manager.
+    """
+    unauthorized_session_class = AsyncSession
+    authorized_session_class = AsyncAuthorizedSession
+
+    async def close(self):
+        """
+        Close the client's session, and any connections it has open.
+        """
+        await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -7,6 +7,7 @@
 from ..session.session import Session, AuthorizedSession
 from ..object.cloneable import Cloneable
 from ..util.api_call_decorator import api_call
+from ..util.batch import BatchExecutor
 from ..object.search import Search
 from ..object.events import Events
 from ..object.collaboration_whitelist import CollaborationWhitelist
@@ -492,7 +493,18 @@ def get_current_enterprise(self):
         )
 
     @api_call
-    def users(self, limit=None, offset=0, filter_term=None, user_type=None, fields=None, use_marker=False, marker=None):
+    def users(
+            self,
+            limit=None,
+            offset=0,
+            filter_term=None,
+            user_type=None,
+            fields=None,
+            use_marker=False,
+            marker=None,
+            fan_out_workers=0,
+            stream_entries=False,
+    ):
         """
         Get a list of all users for the Enterprise along with their user_id, public_name, and login.
 
@@ -524,6 +536,16 @@ def users(self, limit=None, offset=0, filter_term=None, user_type=None, fields=N
             The paging marker to start returning items from when using marker-based paging.
         :type marker:
             `unicode` or None
+        :param fan_out_workers:
+            If more than 0, request the following pages with this many concurrent requests after the first page has
+            been retrieved, up to twice as many pages ahead, instead of one page at a time. Not supported with marker-based paging.
+        :type fan_out_workers:
+            `int`
+        :param stream_entries:
+            Whether to parse each page of users as it is received, holding only one user at a time in memory instead
+            of the whole page. Useful with a high `limit` and many `fields`. Pages aren't fanned out when streaming.
+        :type stream_entries:
+            `bool`
         :return:
             The list of all users in the enterprise.
         :rtype:
@@ -546,6 +568,7 @@ def users(self, limit=None, offset=0, filter_term=None, user_type=None, fields=N
                 fields=fields,
                 additional_params=additional_params,
                 return_full_pages=False,
+                stream_entries=stream_entries,
             )
         return LimitOffsetBasedObjectCollection(
             url=url,
@@ -555,6 +578,8 @@ def users(self, limit=None, offset=0, filter_term=None, user_type=None, fields=N
             offset=offset,
             fields=fields,
             return_full_pages=False,
+            fan_out_workers=fan_out_workers,
+            stream_entries=stream_entries,
         )
 
     @api_call
@@ -1312,6 +1337,39 @@ def get_shared_item(self, shared_link, password=None):
             response_object=response,
         )
 
+    def batch(self, operations, max_workers=BatchExecutor.DEFAULT_MAX_WORKERS, max_requests_per_host=None):
+        """
+        Make many independent API calls concurrently, e.g.
+        `client.batch([BatchOperation(file.rename, name) for file, name in renames])`.
+
+        A failed operation doesn't stop the others; its exception is returned in place of its result. When Box asks for
+        requests to be made later, no operation in the batch makes a new request until the time it asked for.
+
+        :param operations:
+            The API calls to make.
+        :type operations:
+            `Iterable` of :class:`BatchOperation`
+        :param max_workers:
+            The maximum number of API calls to make at once.
+        :type max_workers:
+            `int`
+        :param max_requests_per_host:
+            The maximum number of requests to have in flight at once to any one host, or None for no limit other than
+            `max_workers`.
+        :type max_requests_per_host:
+            `int` or None
+        :returns:
+            The result of each operation, or the exception it raised, in the same order as the operations.
+        :rtype:
+            `list`
+        """
+        batch_executor = BatchExecutor(
+            self._session,
+            max_workers=max_workers,
+            max_requests_per_host=max_requests_per_host,
+        )
+        return batch_executor.execute(operations)
+
     @api_call
     def make_request(self, method, url, **kwargs):
         """
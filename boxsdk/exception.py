@@ -144,4 +144,31 @@ def __str__(self):
         )
 
 
-__all__ = list(map(str, ['BoxException', 'BoxAPIException', 'BoxOAuthException', 'BoxNetworkException']))
+@attr.s(repr=True, slots=True, frozen=True)
+class BoxCircuitOpenException(BoxException):
+    """
+    Exception raised instead of making a request, because the circuit breaker of the session is open.
+
+    :param url:
+        The url of the request that wasn't made
+    :type url:
+        `unicode`
+    :param method:
+        The HTTP verb of the request that wasn't made.
+    :type method:
+        `unicode`
+    """
+    url = attr.ib()
+    method = attr.ib()
+
+    def __str__(self):
+        return 'Request "{0.method} {0.url}" was not made, because the circuit breaker is open.'.format(self)
+
+
+__all__ = list(map(str, [
+    'BoxException',
+    'BoxAPIException',
+    'BoxOAuthException',
+    'BoxNetworkException',
+    'BoxCircuitOpenException',
+]))
@@ -0,0 +1,292 @@
+# coding: utf-8
+
+from __future__ import unicode_literals
+
+from abc import ABCMeta, abstractmethod
+import asyncio
+from collections import namedtuple
+from io import BytesIO, IOBase
+import json
+from logging import getLogger
+import sys
+
+import aiohttp
+from requests.structures import CaseInsensitiveDict
+from six import add_metaclass, binary_type, text_type
+
+from .default_network import DefaultNetwork, DefaultNetworkResponse
+from .network_interface import NetworkResponse
+
+
+@add_metaclass(ABCMeta)
+class AsyncNetwork(object):
+    """
+    Abstract base class specifying the interface of an asynchronous network layer, as used by :class:`AsyncSession`.
+
+    The interface mirrors that of :class:`Network`, except that `request()` and `retry_after()` are coroutines, and the
+    network layer can be closed.
+    """
+
+    @abstractmethod
+    async def request(self, method, url, access_token, **kwargs):
+        """
+        Make a network request to the given url with the given method, and read the response.
+
+        :param method:
+            The HTTP verb that should be used to make the request.
+        :type method:
+            `unicode`
+        :param url:
+            The URL for the request.
+        :type url:
+            `unicode`
+        :param access_token:
+            The OAuth2 access token used to authorize the request.
+        :type access_token:
+            `unicode`
+        :rtype:   :class:`NetworkResponse`
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    async def retry_after(self, delay, request_method, *args, **kwargs):
+        """
+        Make a network request after a given delay, without blocking the event loop in the meantime.
+
+        :param delay:
+            How long until the request should be executed.
+        :type delay:
+            `float`
+        :param request_method:
+            A coroutine function that will execute the request.
+        :type request_method:
+            `callable`
+        :rtype:   :class:`NetworkResponse`
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    async def close(self):
+        """
+        Close the network layer, and any connections it has open.
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @property
+    def network_response_constructor(self):
+        """The constructor to use for creating NetworkResponse instances.
+
+        This is not a required part of the interface; see :attr:`Network.network_response_constructor`.
+
+        :return:
+            A callable that returns an instance of :class:`NetworkResponse`.
+        :rtype:   `type` or `callable`
+        """
+        return NetworkResponse
+
+
+class AsyncDefaultNetwork(AsyncNetwork):
+    """Implements the asynchronous network interface using the aiohttp library."""
+
+    DEFAULT_CONNECTION_LIMIT = 100
+    _UPLOAD_CHUNK_SIZE = 64 * 1024
+
+    # Requests and exceptions are logged the same way as by the synchronous network layer.
+    LOGGER_NAME = DefaultNetwork.LOGGER_NAME
+    REQUEST_FORMAT = DefaultNetwork.REQUEST_FORMAT
+    EXCEPTION_FORMAT = DefaultNetwork.EXCEPTION_FORMAT
+    _log_request = DefaultNetwork._log_request  # pylint:disable=protected-access
+    _log_exception = DefaultNetwork._log_exception  # pylint:disable=protected-access
+
+    def __init__(self, connection_limit=DEFAULT_CONNECTION_LIMIT):
+        """
+        :param connection_limit:
+            The maximum number of connections to keep open at once. Requests made while all connections are in use
+            wait for one to become available.
+        :type connection_limit:
+            `int`
+        """
+        super(AsyncDefaultNetwork, self).__init__()
+        self._connection_limit = connection_limit
+        self._session = None
+        self._logger = getLogger(__name__)
+
+    async def request(self, method, url, access_token, **kwargs):
+        """Base class override.
+
+        Make a network request using an aiohttp.ClientSession, and read the whole response.
+        Logs information about an API request and response, and logs exceptions before re-raising them.
+        """
+        self._log_request(method, url, **kwargs)
+        try:
+            async with self._get_session().request(method, url, **self._get_request_kwargs(**kwargs)) as response:
+                content = await response.read()
+        except Exception:
+            self._log_exception(method, url, sys.exc_info())
+            raise
+        # pylint:disable=abstract-class-instantiated
+        return self.network_response_constructor(
+            request_response=_BufferedResponse(
+                request=_BufferedRequest(method=method, url=url),
+                status_code=response.status,
+                headers=CaseInsensitiveDict(response.headers),
+                content=content,
+            ),
+            access_token_used=access_token,
+        )
+
+    async def retry_after(self, delay, request_method, *args, **kwargs):
+        """Base class override.
+        Retry after sleeping for delay seconds.
+        """
+        await asyncio.sleep(delay)
+        return await request_method(*args, **kwargs)
+
+    async def close(self):
+        """Base class override."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def network_response_constructor(self):
+        """Baseclass override.
+
+        A callable that accepts `request_response` and `access_token_used`
+        keyword arguments for the :class:`AsyncDefaultNetworkResponse` constructor,
+        and returns an instance of :class:`AsyncDefaultNetworkResponse`.
+        """
+        return AsyncDefaultNetworkResponse
+
+    def _get_session(self):
+        """
+        Get the aiohttp session used to make requests. The session is created on first use, because it must be created
+        from within a running event loop.
+
+        :rtype:
+            :class:`aiohttp.ClientSession`
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self._connection_limit))
+        return self._session
+
+    def _get_request_kwargs(self, params=None, data=None, headers=None, stream=None, proxies=None, timeout=None, **kwargs):
+        """
+        Translate the keyword arguments that the session passes to the network layer, which follow the conventions of
+        the requests library, to those of the aiohttp library.
+
+        :rtype:
+            `dict`
+        """
+        # pylint:disable=unused-argument
+        # The whole response is always read, so `stream` makes no difference.
+        headers = dict(headers or {})
+        if params:
+            kwargs['params'] = self._get_request_params(params)
+        if isinstance(data, text_type):
+            data = data.encode('utf-8')
+        if isinstance(data, binary_type) and 'Content-Type' not in headers:
+            # Like the requests library, don't claim a content type for a raw request body.
+            kwargs['skip_auto_headers'] = ['Content-Type']
+        elif hasattr(data, 'read') and not isinstance(data, IOBase):
+            # Multipart uploads are read from a :class:`MultipartStream`, which aiohttp can't read from by itself.
+            if getattr(data, 'len', None) is not None:
+                headers['Content-Length'] = text_type(data.len)
+            data = self._read_stream(data)
+        if data is not None:
+            kwargs['data'] = data
+        if proxies:
+            kwargs['proxy'] = proxies.get('https') or proxies.get('http')
+        if isinstance(timeout, tuple):
+            kwargs['timeout'] = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        elif timeout is not None:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+        kwargs['headers'] = headers
+        return kwargs
+
+    @staticmethod
+    def _get_request_params(params):
+        """
+        Convert query string parameters to the form that aiohttp accepts, following the conventions of the requests
+        library: parameters whose value is None are left out, a list value becomes a repeated parameter, and other values
+        are converted to strings.
+
+        :param params:
+            The query string parameters for the request.
+        :type params:
+            `dict`
+        :rtype:
+            `list` of (`unicode`, `unicode`)
+        """
+        request_params = []
+        for name, value in params.items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            request_params.extend((name, text_type(value)) for value in values if value is not None)
+        return request_params
+
+    @classmethod
+    async def _read_stream(cls, stream):
+        """
+        Read the body of a request from a synchronous stream, one chunk at a time, in the default executor of the event
+        loop, so that reading from the stream doesn't block the event loop.
+
+        :param stream:
+            The stream to read.
+        :type stream:
+            `file`
+        """
+        loop = asyncio.get_event_loop()
+        while True:
+            chunk = await loop.run_in_executor(None, stream.read, cls._UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+class AsyncDefaultNetworkResponse(DefaultNetworkResponse):
+    """Implementation of the network response interface for :class:`AsyncDefaultNetwork`.
+
+    The content of the response has already been read by the time the response is constructed, so all of the content
+    accessors of :class:`DefaultNetworkResponse`, including `response_as_stream`, can be used without awaiting
+    anything. `request_response` is an object with the parts of the interface of :class:`requests.Response` that the
+    SDK uses.
+    """
+
+
+_BufferedRequest = namedtuple('_BufferedRequest', ['method', 'url'])
+
+
+class _BufferedResponse(namedtuple('_BufferedResponse', ['request', 'status_code', 'headers', 'content'])):
+    """
+    A response whose content has been read into memory, with the parts of the interface of :class:`requests.Response`
+    that :class:`DefaultNetworkResponse` uses.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        # pylint:disable=invalid-name
+        return self.status_code < 400
+
+    @property
+    def raw(self):
+        return _BufferedStream(self.content)
+
+    def json(self):
+        return json.loads(self.content.decode('utf-8'))
+
+
+class _BufferedStream(BytesIO):
+    """
+    A stream over content that has been read into memory, with the `stream()` method of :class:`urllib3.HTTPResponse`.
+    """
+
+    def stream(self, amt=64 * 1024, decode_content=None):
+        # pylint:disable=unused-argument
+        # aiohttp has already decoded the content.
+        while True:
+            chunk = self.read(amt)
+            if not chunk:
+                return
+            yield chunk
@@ -2,12 +2,16 @@
 
 from __future__ import unicode_literals
 
+from collections import namedtuple
 from logging import getLogger
 from pprint import pformat
+import socket
 import sys
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.connection import HTTPConnection  # pylint:disable=import-error
 from six import text_type, PY2
 
 from .network_interface import Network, NetworkResponse
@@ -21,9 +25,71 @@ class DefaultNetwork(Network):
     REQUEST_FORMAT = '\x1b[36m%(method)s %(url)s %(request_kwargs)s\x1b[0m'
     EXCEPTION_FORMAT = '\x1b[31mRequest "%(method)s %(url)s" failed with %(exc_type_name)s exception: %(exc_value)r\x1b[0m'
 
-    def __init__(self):
+    def __init__(
+            self,
+            pool_connections=10,
+            pool_maxsize=10,
+            pool_block=False,
+            tcp_nodelay=True,
+            tcp_keepalive=False,
+            send_buffer_size=None,
+            receive_buffer_size=None,
+    ):
+        """
+        :param pool_connections:
+            The number of hosts to keep a pool of connections for, e.g. api.box.com and upload.box.com.
+        :type pool_connections:
+            `int`
+        :param pool_maxsize:
+            The maximum number of connections to each host to keep open for reuse. Set this to at least the number of
+            threads that make requests concurrently, otherwise the extra connections are closed after each request.
+        :type pool_maxsize:
+            `int`
+        :param pool_block:
+            Whether requests wait for a connection to a host when `pool_maxsize` connections to it are in use, so that
+            there are never more than `pool_maxsize` of them, instead of opening an extra connection.
+        :type pool_block:
+            `bool`
+        :param tcp_nodelay:
+            Whether to disable Nagle's algorithm on the connections, so that small requests are sent without delay.
+        :type tcp_nodelay:
+            `bool`
+        :param tcp_keepalive:
+            Whether to enable TCP keep-alive probes on the connections, so that idle connections in the pool aren't
+            dropped by firewalls and load balancers.
+        :type tcp_keepalive:
+            `bool`
+        :param send_buffer_size:
+            The size of the send buffer of each socket, in bytes, or None to use the operating system's default.
+        :type send_buffer_size:
+            `int` or None
+        :param receive_buffer_size:
+            The size of the receive buffer of each socket, in bytes, or None to use the operating system's default.
+        :type receive_buffer_size:
+            `int` or None
+        """
         super(DefaultNetwork, self).__init__()
+        socket_options = [
+            option for option in HTTPConnection.default_socket_options
+            if option[:2] != (socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        ]
+        if tcp_nodelay:
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+        if tcp_keepalive:
+            socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if send_buffer_size is not None:
+            socket_options.append((socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_size))
+        if receive_buffer_size is not None:
+            socket_options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer_size))
+        self._adapter = _SocketOptionsHTTPAdapter(
+            socket_options,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
         self._session = requests.Session()
+        self._session.mount('https://', self._adapter)
+        self._session.mount('http://', self._adapter)
         self._logger = getLogger(__name__)
 
     def request(self, method, url, access_token, **kwargs):
@@ -64,6 +130,32 @@ def network_response_constructor(self):
         """
         return DefaultNetworkResponse
 
+    def get_connection_pool_stats(self):
+        """
+        Get the utilization of the pool of connections to each host that requests have been made to, not including
+        requests made through a proxy.
+
+        :rtype:
+            `list` of :class:`ConnectionPoolStats`
+        """
+        pools = self._adapter.poolmanager.pools
+        stats = []
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            # The queue of the pool holds the idle connections, and a None for each connection that can be opened.
+            queued = list(pool.pool.queue)
+            stats.append(ConnectionPoolStats(
+                host='{0}://{1}:{2}'.format(pool.scheme, pool.host, pool.port),
+                maxsize=pool.pool.maxsize,
+                in_use=pool.pool.maxsize - len(queued),
+                idle=sum(connection is not None for connection in queued),
+                connections_opened=pool.num_connections,
+                requests=pool.num_requests,
+            ))
+        return stats
+
     def _log_request(self, method, url, **kwargs):
         """
         Logs information about the Box API request.
@@ -102,6 +194,48 @@ def _log_exception(self, method, url, exc_info):
         )
 
 
+class ConnectionPoolStats(namedtuple(
+        'ConnectionPoolStats',
+        ['host', 'maxsize', 'in_use', 'idle', 'connections_opened', 'requests'],
+)):
+    """
+    The utilization of the pool of connections to a host.
+
+    `in_use` is the number of the pool's connections that requests are using, `idle` is the number of open connections
+    that are waiting to be reused, and `connections_opened` is the total number of connections that have been opened
+    to the host. If `connections_opened` keeps growing while `in_use` is at `maxsize`, requests are opening extra
+    connections that are discarded afterwards, because the pool is too small.
+    """
+    __slots__ = ()
+
+
+class _SocketOptionsHTTPAdapter(HTTPAdapter):
+    """
+    A transport adapter that sets options on the sockets of the connections that it opens.
+    """
+    __attrs__ = HTTPAdapter.__attrs__ + ['_socket_options']
+
+    def __init__(self, socket_options, **kwargs):
+        """
+        :param socket_options:
+            The (level, option, value) tuples to set on each socket with `setsockopt()`.
+        :type socket_options:
+            `list` of `tuple`
+        """
+        self._socket_options = socket_options
+        super(_SocketOptionsHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        """Base class override."""
+        pool_kwargs['socket_options'] = self._socket_options
+        super(_SocketOptionsHTTPAdapter, self).init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        """Base class override."""
+        proxy_kwargs['socket_options'] = self._socket_options
+        return super(_SocketOptionsHTTPAdapter, self).proxy_manager_for(proxy, **proxy_kwargs)
+
+
 class DefaultNetworkResponse(NetworkResponse):
     """Implementation of the network interface using the requests library.
 
@@ -4,7 +4,7 @@
 import copy
 import six
 
-from ..util.translator import Translator
+from ..util.translator import LazyResponseObject, Translator
 
 
 class BaseAPIJSONObjectMeta(type):
@@ -83,7 +83,31 @@ def __init__(self, response_object=None, **kwargs):
         """
         super(BaseAPIJSONObject, self).__init__(**kwargs)
         self._response_object = response_object or {}
-        self.__dict__.update(self._response_object)
+        if isinstance(self._response_object, LazyResponseObject):
+            # The fields of a lazily translated object are looked up by __getattr__() when they are first used. Fields
+            # with the same name as an attribute of the class would never get there, so they are set now, as usual.
+            for name in self._get_class_attribute_names().intersection(self._response_object):
+                self.__dict__[name] = self._response_object[name]
+        else:
+            self.__dict__.update(self._response_object)
+
+    def __getattr__(self, name):
+        """
+        Get a field of a lazily translated response object, translating it the first time it is used.
+
+        Only called when the attribute wasn't found otherwise.
+
+        :param name:
+            The name of the field.
+        :type name:
+            `unicode`
+        """
+        # Look the response object up in __dict__, so that this isn't called again if it hasn't been set yet.
+        response_object = self.__dict__.get('_response_object', None)
+        if isinstance(response_object, LazyResponseObject) and name in response_object:
+            value = self.__dict__[name] = response_object[name]
+            return value
+        raise AttributeError("'{0}' object has no attribute '{1}'".format(self.__class__.__name__, name))
 
     def __getitem__(self, item):
         """
@@ -145,6 +169,20 @@ def untranslated_fields(cls):
         """
         return cls._untranslated_fields
 
+    @classmethod
+    def _get_class_attribute_names(cls):
+        """
+        The names of the attributes of the class, e.g. its methods.
+
+        :rtype:
+            `frozenset` of `unicode`
+        """
+        # Each class caches its own names, rather than using the ones cached by a base class.
+        attribute_names = cls.__dict__.get('_class_attribute_names', None)
+        if attribute_names is None:
+            attribute_names = cls._class_attribute_names = frozenset(dir(cls))
+        return attribute_names
+
     @classmethod
     def _untranslate(cls, value):
         """
@@ -7,6 +7,7 @@
 
 from .item import Item
 from ..util.api_call_decorator import api_call
+from ..util.chunked_downloader import ChunkedDownloader, ResumableDownloader
 from ..pagination.marker_based_object_collection import MarkerBasedObjectCollection
 from ..pagination.limit_offset_based_object_collection import LimitOffsetBasedObjectCollection
 
@@ -74,7 +75,7 @@ def create_upload_session(self, file_size, file_name=None):
         )
 
     @api_call
-    def get_chunked_uploader(self, file_path, rename_file=False):
+    def get_chunked_uploader(self, file_path, rename_file=False, max_workers=1, journal=None):
         """
         Instantiate the chunked upload instance and create upload session with path to file.
 
@@ -86,6 +87,14 @@ def get_chunked_uploader(self, file_path, rename_file=False):
             Indicates whether the file should be renamed or not.
         :type rename_file:
             `bool`
+        :param max_workers:
+            The maximum number of parts to upload concurrently.
+        :type max_workers:
+            `int`
+        :param journal:
+            An on-disk journal of the uploaded parts, so that the upload can be resumed by another process.
+        :type journal:
+            :class:`ChunkedUploadJournal` or None
         :returns:
             A :class:`ChunkedUploader` object.
         :rtype:
@@ -95,7 +104,12 @@ def get_chunked_uploader(self, file_path, rename_file=False):
         content_stream = open(file_path, 'rb')
         file_name = os.path.basename(file_path) if rename_file else None
         upload_session = self.create_upload_session(total_size, file_name)
-        return upload_session.get_chunked_uploader_for_stream(content_stream, total_size)
+        return upload_session.get_chunked_uploader_for_stream(
+            content_stream,
+            total_size,
+            max_workers=max_workers,
+            journal=journal,
+        )
 
     def _get_accelerator_upload_url_for_update(self):
         """
@@ -179,6 +193,94 @@ def download_to(self, writeable_stream, file_version=None, byte_range=None):
         for chunk in box_response.network_response.response_as_stream.stream(decode_content=True):
             writeable_stream.write(chunk)
 
+    def get_chunked_downloader(
+            self,
+            writeable_stream,
+            file_version=None,
+            part_size=ChunkedDownloader.DEFAULT_PART_SIZE,
+            max_workers=4,
+            verify_sha1=False,
+    ):
+        """
+        Instantiate a chunked downloader, which downloads the file in ranged requests made concurrently.
+
+        :param writeable_stream:
+            A seekable file-like object where bytes can be written into, at any offset.
+        :type writeable_stream:
+            `file`
+        :param file_version:
+            The specific version of the file to retrieve the contents of. If not specified, the current version of the
+            file is downloaded.
+        :type file_version:
+            :class:`FileVersion` or None
+        :param part_size:
+            The number of bytes to download with each ranged request.
+        :type part_size:
+            `int`
+        :param max_workers:
+            The maximum number of ranged requests to make concurrently.
+        :type max_workers:
+            `int`
+        :param verify_sha1:
+            Whether to check the downloaded content against the SHA-1 of the file version. The stream must then also
+            be readable.
+        :type verify_sha1:
+            `bool`
+        :returns:
+            A :class:`ChunkedDownloader` object.
+        :rtype:
+            :class:`ChunkedDownloader`
+        """
+        return ChunkedDownloader(
+            self,
+            writeable_stream,
+            file_version=file_version,
+            part_size=part_size,
+            max_workers=max_workers,
+            verify_sha1=verify_sha1,
+        )
+
+    def get_resumable_downloader(
+            self,
+            file_path,
+            file_version=None,
+            checkpoint_interval=ResumableDownloader.DEFAULT_CHECKPOINT_INTERVAL,
+            verify_sha1=False,
+    ):
+        """
+        Instantiate a resumable downloader, which downloads the file to a local path, and picks up where a previous
+        download to the same path left off if it was interrupted.
+
+        :param file_path:
+            The local path to download the file to.
+        :type file_path:
+            `unicode`
+        :param file_version:
+            The specific version of the file to retrieve the contents of. If not specified, the current version of the
+            file is downloaded, and a resumed download continues from the version that the download started with.
+        :type file_version:
+            :class:`FileVersion` or None
+        :param checkpoint_interval:
+            How many bytes to download between checkpoints of the download's progress.
+        :type checkpoint_interval:
+            `int`
+        :param verify_sha1:
+            Whether to check the bytes kept from an interrupted download, and the complete download, by their SHA-1.
+        :type verify_sha1:
+            `bool`
+        :returns:
+            A :class:`ResumableDownloader` object.
+        :rtype:
+            :class:`ResumableDownloader`
+        """
+        return ResumableDownloader(
+            self,
+            file_path,
+            file_version=file_version,
+            checkpoint_interval=checkpoint_interval,
+            verify_sha1=verify_sha1,
+        )
+
     @api_call
     def get_download_url(self, file_version=None):
         url = self.get_url('content')
@@ -1,6 +1,8 @@
 # coding: utf-8
 
 from __future__ import unicode_literals
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import json
 import os
 from six import text_type
@@ -8,7 +10,9 @@
 from boxsdk.object.group import Group
 from boxsdk.object.item import Item
 from boxsdk.object.user import User
+from boxsdk.pagination.limit_offset_based_compact_collection import LimitOffsetBasedCompactCollection
 from boxsdk.pagination.limit_offset_based_object_collection import LimitOffsetBasedObjectCollection
+from boxsdk.pagination.marker_based_compact_collection import MarkerBasedCompactCollection
 from boxsdk.pagination.marker_based_object_collection import MarkerBasedObjectCollection
 from boxsdk.util.api_call_decorator import api_call
 from boxsdk.util.text_enum import TextEnum
@@ -148,7 +152,7 @@ def create_upload_session(self, file_size, file_name):
         )
 
     @api_call
-    def get_chunked_uploader(self, file_path):
+    def get_chunked_uploader(self, file_path, max_workers=1, journal=None):
         """
         Instantiate the chunked upload instance and create upload session with path to file.
 
@@ -156,6 +160,14 @@ def get_chunked_uploader(self, file_path):
             The local path to the file you wish to upload.
         :type file_path:
             `unicode`
+        :param max_workers:
+            The maximum number of parts to upload concurrently.
+        :type max_workers:
+            `int`
+        :param journal:
+            An on-disk journal of the uploaded parts, so that the upload can be resumed by another process.
+        :type journal:
+            :class:`ChunkedUploadJournal` or None
         :returns:
             A :class:`ChunkedUploader` object.
         :rtype:
@@ -165,7 +177,12 @@ def get_chunked_uploader(self, file_path):
         content_stream = open(file_path, 'rb')
         file_name = os.path.basename(file_path)
         upload_session = self.create_upload_session(total_size, file_name)
-        return upload_session.get_chunked_uploader_for_stream(content_stream, total_size)
+        return upload_session.get_chunked_uploader_for_stream(
+            content_stream,
+            total_size,
+            max_workers=max_workers,
+            journal=journal,
+        )
 
     def _get_accelerator_upload_url_fow_new_uploads(self):
         """
@@ -179,7 +196,18 @@ def _get_accelerator_upload_url_fow_new_uploads(self):
         return self._get_accelerator_upload_url()
 
     @api_call
-    def get_items(self, limit=None, offset=0, marker=None, use_marker=False, sort=None, direction=None, fields=None):
+    def get_items(
+            self,
+            limit=None,
+            offset=0,
+            marker=None,
+            use_marker=False,
+            sort=None,
+            direction=None,
+            fields=None,
+            prefetch_pages=0,
+            compact=False,
+    ):
         """
         Get the items in a folder.
 
@@ -211,10 +239,21 @@ def get_items(self, limit=None, offset=0, marker=None, use_marker=False, sort=No
             List of fields to request.
         :type fields:
             `Iterable` of `unicode`
+        :param prefetch_pages:
+            The number of pages of items to request in the background while the current page is iterated over. With
+            marker-based paging, at most 1 page is requested ahead.
+        :type prefetch_pages:
+            `int`
+        :param compact:
+            Whether to return the items as compact, read-only :class:`CompactRecord` records instead of full
+            :class:`Item` objects, to save memory when holding many items. Use `record.to_object()` to get the full
+            object for a record.
+        :type compact:
+            `bool`
         :returns:
             The collection of items in the folder.
         :rtype:
-            `Iterable` of :class:`Item`
+            `Iterable` of :class:`Item` or :class:`CompactRecord`
         """
         url = self.get_url('items')
         additional_params = {}
@@ -227,7 +266,8 @@ def get_items(self, limit=None, offset=0, marker=None, use_marker=False, sort=No
 
         if use_marker:
             additional_params['usemarker'] = True
-            return MarkerBasedObjectCollection(
+            collection_class = MarkerBasedCompactCollection if compact else MarkerBasedObjectCollection
+            return collection_class(
                 url=url,
                 session=self._session,
                 limit=limit,
@@ -235,9 +275,11 @@ def get_items(self, limit=None, offset=0, marker=None, use_marker=False, sort=No
                 fields=fields,
                 additional_params=additional_params,
                 return_full_pages=False,
+                prefetch_pages=prefetch_pages,
             )
 
-        return LimitOffsetBasedObjectCollection(
+        collection_class = LimitOffsetBasedCompactCollection if compact else LimitOffsetBasedObjectCollection
+        return collection_class(
             url=url,
             session=self._session,
             limit=limit,
@@ -245,8 +287,102 @@ def get_items(self, limit=None, offset=0, marker=None, use_marker=False, sort=No
             fields=fields,
             additional_params=additional_params,
             return_full_pages=False,
+            prefetch_pages=prefetch_pages,
         )
 
+    def walk(self, max_workers=4, fields=None, limit=None, max_depth=None, folder_filter=None):
+        """
+        Walk the tree of folders below this folder, like :func:`os.walk`.
+
+        The folders are listed breadth-first, by a pool of `max_workers` threads, each of which lists one folder at a
+        time with marker-based paging. For each listed folder, `(folder, subfolders, files)` is yielded as soon as the
+        folder has been listed, so folders aren't necessarily yielded in breadth-first order. `subfolders` is the list of
+        the :class:`Folder` objects in the folder, and `files` is the list of its other items, i.e. files and web links.
+
+        As with :func:`os.walk`, removing folders from `subfolders` before resuming the walk keeps them from being
+        walked. Subfolders can also be pruned with `max_depth` and `folder_filter`.
+
+        :param max_workers:
+            The maximum number of folders to list concurrently.
+        :type max_workers:
+            `int`
+        :param fields:
+            List of fields to request for the items in each folder. Box always returns the type and ID of each item.
+        :type fields:
+            `Iterable` of `unicode` or None
+        :param limit:
+            The maximum number of items to request per page. If not specified, then will use the server-side default.
+        :type limit:
+            `int` or None
+        :param max_depth:
+            The maximum depth of the folders to list, where this folder is at depth 0, or None to walk the whole tree.
+        :type max_depth:
+            `int` or None
+        :param folder_filter:
+            A function that is called with each subfolder, and returns whether to walk it, or None to walk all of them.
+            The subfolders that aren't walked are still included in `subfolders`.
+        :type folder_filter:
+            `callable` or None
+        :returns:
+            A `(folder, subfolders, files)` tuple for each folder that was listed.
+        :rtype:
+            `Iterator` of (:class:`Folder`, `list` of :class:`Folder`, `list` of :class:`Item`)
+        :raises:
+            The exception raised by the first failed listing, if any. The listings in progress are cancelled.
+        """
+        if fields is not None:
+            fields = list(fields)
+        # Folders wait in this queue until a worker is free to list them, so the pool is never handed more than
+        # `max_workers` folders at a time, however wide the tree is.
+        pending_folders = deque([(self, 0)])
+        futures = {}
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while pending_folders or futures:
+                while pending_folders and len(futures) < max_workers:
+                    folder, depth = pending_folders.popleft()
+                    # pylint:disable=protected-access
+                    futures[executor.submit(folder._get_subfolders_and_files, fields, limit)] = (folder, depth)
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder, depth = futures.pop(future)
+                    subfolders, files = future.result()
+                    yield folder, subfolders, files
+                    if max_depth is not None and depth >= max_depth:
+                        continue
+                    for subfolder in subfolders:
+                        if folder_filter is None or folder_filter(subfolder):
+                            pending_folders.append((subfolder, depth + 1))
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _get_subfolders_and_files(self, fields=None, limit=None):
+        """
+        Get all of the items in the folder, with marker-based paging, split into its subfolders and its other items.
+
+        :param fields:
+            List of fields to request.
+        :type fields:
+            `Iterable` of `unicode` or None
+        :param limit:
+            The maximum number of items to request per page. If not specified, then will use the server-side default.
+        :type limit:
+            `int` or None
+        :returns:
+            The subfolders of the folder, and its other items, i.e. files and web links.
+        :rtype:
+            `tuple` of (`list` of :class:`Folder`, `list` of :class:`Item`)
+        """
+        subfolders, files = [], []
+        for item in self.get_items(limit=limit, use_marker=True, fields=fields):
+            if item.type == 'folder':
+                subfolders.append(item)
+            else:
+                files.append(item)
+        return subfolders, files
+
     @api_call
     def upload_stream(
             self,
@@ -22,7 +22,7 @@ class Group(BaseObject):
     _item_type = 'group'
 
     @api_call
-    def get_memberships(self, limit=None, offset=None, fields=None):
+    def get_memberships(self, limit=None, offset=None, fields=None, fan_out_workers=0):
         """
         Get the membership records for the group, which indicate which users are included in the group.
 
@@ -34,6 +34,11 @@ def get_memberships(self, limit=None, offset=None, fields=None):
             The maximum number of items to return in a page.
         :type limit:
             `int` or None
+        :param fan_out_workers:
+            If more than 0, request the following pages with this many concurrent requests after the first page has
+            been retrieved, up to twice as many pages ahead, instead of one page at a time.
+        :type fan_out_workers:
+            `int`
         :returns:
             The collection of membership objects for the group.
         :rtype:
@@ -46,6 +51,7 @@ def get_memberships(self, limit=None, offset=None, fields=None):
             offset=offset,
             fields=fields,
             return_full_pages=False,
+            fan_out_workers=fan_out_workers,
         )
 
     @api_call
@@ -192,6 +192,7 @@ def query(
             fields=None,
             sort=None,
             direction=None,
+            fan_out_workers=0,
             **kwargs
     ):
         """
@@ -265,6 +266,11 @@ def query(
             The direction to display the sorted search results. Can be set to `DESC` for descending or `ASC` for ascending.
         :type direction:
             `unicode` or None
+        :param fan_out_workers:
+            If more than 0, request the following pages with this many concurrent requests after the first page has
+            been retrieved, up to twice as many pages ahead, instead of one page at a time.
+        :type fan_out_workers:
+            `int`
         :return:
             The collection of items that match the search query.
         :rtype:
@@ -309,4 +315,5 @@ def query(
             fields=fields,
             additional_params=additional_params,
             return_full_pages=False,
+            fan_out_workers=fan_out_workers,
         )
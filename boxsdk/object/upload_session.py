@@ -61,7 +61,7 @@ def upload_part_bytes(self, part_bytes, offset, total_size, part_content_sha1=No
         :param part_bytes:
             Part bytes
         :type part_bytes:
-            `bytes`
+            `bytes` or :class:`memoryview`
         :param offset:
             Offset, in number of bytes, of the part compared to the beginning of the file. This number should be a
             multiple of the part size.
@@ -159,7 +159,7 @@ def abort(self):
         """
         return self.delete()
 
-    def get_chunked_uploader_for_stream(self, content_stream, file_size):
+    def get_chunked_uploader_for_stream(self, content_stream, file_size, max_workers=1, journal=None):
         """
         Instantiate the chunked upload instance and create upload session.
 
@@ -171,14 +171,22 @@ def get_chunked_uploader_for_stream(self, content_stream, file_size):
             The size of the file that this part belongs to.
         :type file_size:
             `int`
+        :param max_workers:
+            The maximum number of parts to upload concurrently.
+        :type max_workers:
+            `int`
+        :param journal:
+            An on-disk journal of the uploaded parts, so that the upload can be resumed by another process.
+        :type journal:
+            :class:`ChunkedUploadJournal` or None
         :returns:
             A :class:`ChunkedUploader` object.
         :rtype:
             :class:`ChunkedUploader`
         """
-        return ChunkedUploader(self, content_stream, file_size)
+        return ChunkedUploader(self, content_stream, file_size, max_workers=max_workers, journal=journal)
 
-    def get_chunked_uploader(self, file_path):
+    def get_chunked_uploader(self, file_path, max_workers=1, journal=None):
         """
         Instantiate the chunked upload instance and create upload session with path to file.
 
@@ -186,6 +194,14 @@ def get_chunked_uploader(self, file_path):
             The local path to the file you wish to upload.
         :type file_path:
             `unicode`
+        :param max_workers:
+            The maximum number of parts to upload concurrently.
+        :type max_workers:
+            `int`
+        :param journal:
+            An on-disk journal of the uploaded parts, so that the upload can be resumed by another process.
+        :type journal:
+            :class:`ChunkedUploadJournal` or None
         :returns:
             A :class:`ChunkedUploader` object.
         :rtype:
@@ -196,4 +212,6 @@ def get_chunked_uploader(self, file_path):
         return self.get_chunked_uploader_for_stream(
             content_stream=content_stream,
             file_size=total_size,
+            max_workers=max_workers,
+            journal=journal,
         )
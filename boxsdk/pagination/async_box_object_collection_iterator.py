@@ -0,0 +1,50 @@
+# coding: utf-8
+
+from __future__ import unicode_literals
+
+from collections import deque
+
+
+class AsyncBoxObjectCollectionIterator(object):
+    """
+    An asynchronous iterator over a :class:`BoxObjectCollection` that uses an :class:`AsyncSession`.
+
+    Pages are requested from Box one at a time, as the iterator reaches the end of the previous page, just like when
+    the collection is iterated over synchronously. The pointer to the next page of the collection is updated as pages
+    are retrieved, so `next_pointer()` can be used to start another collection from where iteration stopped.
+    """
+
+    def __init__(self, collection):
+        """
+        :param collection:
+            The collection to iterate over.
+        :type collection:
+            :class:`BoxObjectCollection`
+        """
+        super(AsyncBoxObjectCollectionIterator, self).__init__()
+        self._collection = collection
+        self._entries = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        """
+        Returns either a Page (a Sequence of BaseObjects) or a BaseObject, depending on the `return_full_pages` argument
+        of the collection. Awaiting this method may make an API call to Box.
+
+        :rtype:
+            :class:`Page` or :class:`BaseObject`
+        """
+        # pylint:disable=protected-access
+        collection = self._collection
+        while not self._entries:
+            if collection._has_retrieved_all_items:
+                raise StopAsyncIteration
+            box_response = await collection._session.get(collection._url, params=collection._get_next_page_params())
+            page = collection._get_page(box_response.json())
+            if collection._return_full_pages:
+                return page
+            # Pages with 0 items are skipped, as when iterating synchronously.
+            self._entries.extend(page)
+        return self._entries.popleft()
@@ -4,10 +4,13 @@
 
 from abc import ABCMeta, abstractmethod
 import collections
+from concurrent.futures import ThreadPoolExecutor
 
 from six import add_metaclass
 
 from boxsdk.pagination.page import Page
+from boxsdk.util.columns import ColumnBuilder
+from boxsdk.util.json_stream import StreamedJSONPage
 
 
 @add_metaclass(ABCMeta)
@@ -37,6 +40,8 @@ def __init__(
             fields=None,
             additional_params=None,
             return_full_pages=False,
+            prefetch_pages=0,
+            stream_entries=False,
     ):
         """
         :param session:
@@ -66,6 +71,23 @@ def __init__(
             call to next(). If False, the iterator will return a single Box object on each next() call.
         :type return_full_pages:
             `bool`
+        :param prefetch_pages:
+            The number of pages to request in the background while the current page is being iterated over, or 0 to
+            only request each page once the previous one has been iterated over. The next page of a marker-based
+            collection can't be requested until the current one has been retrieved, so at most 1 page is prefetched
+            for those. At most this many pages are held in memory, in addition to the current page. If a page turns out
+            not to be where the collection expected it to be, e.g. because entries were added to the collection, the
+            pages after it are requested one at a time instead.
+        :type prefetch_pages:
+            `int`
+        :param stream_entries:
+            If True, and `return_full_pages` is False, then each page is parsed as it is received from Box, and its
+            entries are returned one at a time, so that only one entry at a time is held in memory instead of the whole
+            page. This keeps memory use low for large pages, e.g. with a high `limit` and many `fields`. Pages aren't
+            prefetched when entries are streamed, and the pointer to the next page is updated once all the entries of
+            the current page have been returned.
+        :type stream_entries:
+            `bool`
         """
         super(BoxObjectCollection, self).__init__()
         self._session = session
@@ -74,6 +96,9 @@ def __init__(
         self._fields = fields
         self._additional_params = additional_params
         self._return_full_pages = return_full_pages
+        self._prefetch_pages = prefetch_pages
+        self._prefetch_workers = prefetch_pages
+        self._stream_entries = stream_entries
         self._has_retrieved_all_items = False
         self._all_items = None
 
@@ -88,7 +113,10 @@ def next(self):
             :class:`Page` or :class:`BaseObject`
         """
         if self._all_items is None:
-            self._all_items = self._items_generator()
+            if self._stream_entries and not self._return_full_pages:
+                self._all_items = self._streamed_items_generator()
+            else:
+                self._all_items = self._items_generator()
         return next(self._all_items)
 
     __next__ = next
@@ -98,32 +126,246 @@ def _items_generator(self):
         :rtype:
             :class:`Page` or :class:`BaseObject`
         """
+        pages = self._pages_generator()
+        try:
+            for page in pages:
+                if self._return_full_pages:
+                    yield page
+                else:
+                    # It's possible for the Box API to return 0 items in a page, even if there are more items to be
+                    # retrieved on subsequent pages. When self._return_full_pages is True, then yielding a 0-item
+                    # page is fine because that's what the page returned.
+                    # But when we are iterating over individual items, and not pages, it's odd to yield a sequence of
+                    # Nones (for that page that had 0 items). So instead, we continue to request more pages until we
+                    # have Box objects to yield.
+                    if not page:
+                        continue
+                    for entry in page:
+                        yield entry
+        finally:
+            pages.close()
+
+    def _pages_generator(self):
+        """
+        :rtype:
+            :class:`Page`
+        """
+        prefetched_pages = collections.deque()
+        executor = ThreadPoolExecutor(max_workers=self._prefetch_workers) if self._prefetch_pages > 0 else None
+        try:
+            while not self._has_retrieved_all_items:
+                if prefetched_pages:
+                    _, prefetched_page = prefetched_pages.popleft()
+                    page = self._get_page(prefetched_page.result().json())
+                else:
+                    page = self._get_page(self._load_next_page())
+                if executor is not None and not self._has_retrieved_all_items:
+                    if not self._prefetch_next_pages(executor, prefetched_pages):
+                        self._stop_prefetching(executor, prefetched_pages)
+                        executor = None
+                yield page
+        finally:
+            if executor is not None:
+                self._stop_prefetching(executor, prefetched_pages)
+
+    def _streamed_items_generator(self):
+        """
+        :rtype:
+            :class:`BaseObject`
+        """
+        # The page only translates the entries; the other values of each response aren't needed.
+        page = self._page_constructor(self._session, {})
+        entries = self._streamed_entries_generator()
+        try:
+            for entry in entries:
+                yield page._translate_entry(entry)  # pylint:disable=protected-access
+        finally:
+            entries.close()
+
+    def _streamed_entries_generator(self):
+        """
+        :rtype:
+            `dict`
+        """
         while not self._has_retrieved_all_items:
-            response_object = self._load_next_page()
+            box_response = self._session.get(
+                self._url,
+                params=self._get_next_page_params(),
+                expect_json_response=False,
+                stream=True,
+            )
+            response_as_stream = box_response.network_response.response_as_stream
+            try:
+                streamed_page = StreamedJSONPage(response_as_stream.stream(decode_content=True))
+                for entry in streamed_page.entries():
+                    yield entry
+            finally:
+                response_as_stream.close()
+            self._update_pointer_to_next_page(streamed_page.metadata)
+            self._has_retrieved_all_items = not self._has_more_pages(streamed_page.metadata)
 
-            self._update_pointer_to_next_page(response_object)
-            self._has_retrieved_all_items = not self._has_more_pages(response_object)
-            page = self._page_constructor(self._session, response_object)
+    def _entries_generator(self):
+        """
+        The untranslated entries of the rest of the collection.
 
-            if self._return_full_pages:
-                yield page
-            else:
-                # It's possible for the Box API to return 0 items in a page, even if there are more items to be
-                # retrieved on subsequent pages. When self._return_full_pages is True, then yielding a 0-item
-                # page is fine because that's what the page returned.
-                # But when we are iterating over individual items, and not pages, it's odd to yield a sequence of
-                # Nones (for that page that had 0 items). So instead, we continue to request more pages until we
-                # have Box objects to yield.
-                if not page:
-                    continue
-                for entry in page:
+        :rtype:
+            `dict`
+        """
+        if self._stream_entries:
+            for entry in self._streamed_entries_generator():
+                yield entry
+        else:
+            for page in self._pages_generator():
+                for entry in page.entries_json:
                     yield entry
 
+    def to_columns(self, fields, typecodes=None):
+        """
+        Get the values of the given fields of the rest of the entries in the collection, as columns, without creating
+        Box objects for the entries. The entries are requested from Box, as when iterating over the collection.
+
+        :param fields:
+            The names of the fields to get. Nested fields are separated by '.', e.g. 'parent.id'.
+        :type fields:
+            `Iterable` of `unicode`
+        :param typecodes:
+            The :class:`array` typecode of each field that should be stored in a typed array, e.g. `{'size': 'q'}`.
+            Defaults to :attr:`ColumnBuilder.DEFAULT_TYPECODES`.
+        :type typecodes:
+            `dict` of `unicode` to `unicode` or None
+        :returns:
+            The column of values of each field, in the order of the entries.
+        :rtype:
+            :class:`OrderedDict` of `unicode` to `list` or :class:`array`
+        """
+        column_builder = ColumnBuilder(fields, typecodes)
+        column_builder.add_all(self._entries_generator())
+        return column_builder.columns
+
+    def to_arrays(self, fields, typecodes=None):
+        """
+        Get the values of the given fields of the rest of the entries in the collection, as NumPy arrays, without
+        creating Box objects for the entries. Requires NumPy.
+
+        :param fields:
+            The names of the fields to get. Nested fields are separated by '.', e.g. 'parent.id'.
+        :type fields:
+            `Iterable` of `unicode`
+        :param typecodes:
+            The :class:`array` typecode of each field that should be stored in a typed array, e.g. `{'size': 'q'}`.
+            Defaults to :attr:`ColumnBuilder.DEFAULT_TYPECODES`.
+        :type typecodes:
+            `dict` of `unicode` to `unicode` or None
+        :rtype:
+            :class:`OrderedDict` of `unicode` to :class:`numpy.ndarray`
+        """
+        column_builder = ColumnBuilder(fields, typecodes)
+        column_builder.add_all(self._entries_generator())
+        return column_builder.to_arrays()
+
+    def _prefetch_next_pages(self, executor, prefetched_pages):
+        """
+        Request the pages after the current one in the background, up to self._prefetch_pages of them.
+
+        :param executor:
+            The executor to request pages with.
+        :type executor:
+            :class:`ThreadPoolExecutor`
+        :param prefetched_pages:
+            The HTTP params and pending response of each page that has already been requested, in order. Updated in
+            place.
+        :type prefetched_pages:
+            :class:`deque` of (`dict`, :class:`Future`)
+        :returns:
+            Whether the pages that were already requested are the ones after the current page. If not, no more pages
+            are requested, and they should be discarded.
+        :rtype:
+            `bool`
+        """
+        requested_count = len(prefetched_pages)
+        if requested_count:
+            # The pages in between follow from the first and last pages that were requested, so only those are checked.
+            last_pointer_params = self._next_pages_pointer_params(requested_count, start=requested_count - 1)
+            expected_params = [
+                self._get_next_page_params(),
+                self._get_next_page_params(last_pointer_params[0]) if last_pointer_params else None,
+            ]
+            if [prefetched_pages[0][0], prefetched_pages[-1][0]] != expected_params:
+                # The pages after the current one aren't the ones that were expected when they were requested, e.g.
+                # because the number of entries in the collection changed. Since the collection is changing, fall back
+                # to requesting pages one at a time.
+                return False
+        # Only the pages after those that were already requested are requested, so each page is requested once.
+        for pointer_params in self._next_pages_pointer_params(self._prefetch_pages, start=requested_count):
+            params = self._get_next_page_params(pointer_params)
+            prefetched_pages.append((params, executor.submit(self._session.get, self._url, params=params)))
+        return True
+
+    @staticmethod
+    def _stop_prefetching(executor, prefetched_pages):
+        """
+        Discard the pages that have been requested in the background, and stop requesting pages.
+
+        :param executor:
+            The executor that requested the pages.
+        :type executor:
+            :class:`ThreadPoolExecutor`
+        :param prefetched_pages:
+            The HTTP params and pending response of each page that has been requested. Cleared in place.
+        :type prefetched_pages:
+            :class:`deque` of (`dict`, :class:`Future`)
+        """
+        for _, prefetched_page in prefetched_pages:
+            prefetched_page.cancel()
+        prefetched_pages.clear()
+        executor.shutdown(wait=False)
+
+    def __aiter__(self):
+        """
+        Returns an asynchronous iterator over the collection, for a collection that uses an :class:`AsyncSession`.
+        The iterator returns either Pages or BaseObjects, like next().
+
+        :rtype:
+            :class:`AsyncBoxObjectCollectionIterator`
+        """
+        # The asynchronous iterator is imported here, because its module can only be imported on Python 3.
+        from .async_box_object_collection_iterator import AsyncBoxObjectCollectionIterator  # pylint:disable=import-outside-toplevel
+        return AsyncBoxObjectCollectionIterator(self)
+
+    def _get_page(self, response_object):
+        """
+        Update the pointer to the next page from a response from Box, and return the page of Box objects in it.
+
+        :param response_object:
+            The parsed HTTP response from Box after requesting more pages.
+        :type response_object:
+            `dict`
+        :rtype:
+            :class:`Page`
+        """
+        self._update_pointer_to_next_page(response_object)
+        self._has_retrieved_all_items = not self._has_more_pages(response_object)
+        return self._page_constructor(self._session, response_object)
+
     def _load_next_page(self):
         """
         Request the next page of entries from Box. Raises any network-related exceptions, including BoxAPIException.
         Returns a parsed dictionary of the JSON response from Box
 
+        :rtype:
+            `dict`
+        """
+        box_response = self._session.get(self._url, params=self._get_next_page_params())
+        return box_response.json()
+
+    def _get_next_page_params(self, pointer_params=None):
+        """
+        The dict of HTTP params for the request for the next page of entries.
+
+        :param pointer_params:
+            The HTTP params that specify which page to retrieve, or None for the next page.
+        :type pointer_params:
+            `dict` or None
         :rtype:
             `dict`
         """
@@ -134,9 +376,27 @@ def _load_next_page(self):
             params['fields'] = ','.join(self._fields)
         if self._additional_params:
             params.update(self._additional_params)
-        params.update(self._next_page_pointer_params())
-        box_response = self._session.get(self._url, params=params)
-        return box_response.json()
+        params.update(self._next_page_pointer_params() if pointer_params is None else pointer_params)
+        return params
+
+    def _next_pages_pointer_params(self, count, start=0):
+        """
+        The dicts of HTTP params that specify which pages of Box objects to retrieve next, for as many of the next
+        `count` pages as can be known before the next page has been retrieved, skipping the first `start` of them.
+
+        :param count:
+            The maximum number of pages, including the skipped ones.
+        :type count:
+            `int`
+        :param start:
+            The number of pages to skip, e.g. because they have already been requested.
+        :type start:
+            `int`
+        :rtype:
+            `list` of `dict`
+        """
+        # pylint:disable=unused-argument
+        return [self._next_page_pointer_params()] if start == 0 else []
 
     @abstractmethod
     def _update_pointer_to_next_page(self, response_object):
@@ -0,0 +1,146 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from collections import Mapping
+
+import six
+from six.moves import intern  # pylint:disable=redefined-builtin
+
+from .page import Page
+
+
+# Maps each tuple of field names that records have been created with to the index of each field in the tuple. Records
+# with the same fields, e.g. the items of a listing, share one dict of indexes.
+_field_indexes_cache = {}
+_MAX_CACHED_FIELD_INDEXES = 1024
+
+
+def _get_field_indexes(field_names):
+    """
+    Get the index of each field in a tuple of field names, shared by all records with the same fields.
+
+    :param field_names:
+        The names of the fields.
+    :type field_names:
+        `tuple` of `unicode`
+    :rtype:
+        `dict` of `unicode` to `int`
+    """
+    try:
+        return _field_indexes_cache[field_names]
+    except KeyError:
+        if len(_field_indexes_cache) >= _MAX_CACHED_FIELD_INDEXES:
+            _field_indexes_cache.clear()
+        field_indexes = {field_name: index for index, field_name in enumerate(field_names)}
+        return _field_indexes_cache.setdefault(field_names, field_indexes)
+
+
+class CompactRecord(Mapping):
+    """
+    A compact, read-only record of a Box object in a listing, e.g. an item in a folder.
+
+    A record holds only a tuple of the values of its fields, which can be read as attributes (`record.name`) or as keys
+    (`record['name']`). The field names are shared by all records with the same fields, and nested objects are left as
+    dicts, so a record takes a fraction of the memory of a full Box object. Use :meth:`to_object` to get the full Box
+    object when it's needed, e.g. to make API calls.
+    """
+
+    __slots__ = ('_session', '_field_indexes', '_values')
+
+    def __init__(self, session, response_object):
+        """
+        :param session:
+            The Box session to create full Box objects with.
+        :type session:
+            :class:`BoxSession`
+        :param response_object:
+            The JSON object representing the Box object, as returned by the Box API.
+        :type response_object:
+            `dict`
+        """
+        super(CompactRecord, self).__init__()
+        self._session = session
+        self._field_indexes = _get_field_indexes(tuple(response_object))
+        values = list(six.itervalues(response_object))
+        type_index = self._field_indexes.get('type', None)
+        if type_index is not None and isinstance(values[type_index], str):
+            # Every record in a listing has one of a few types, so each type string only needs to be held once.
+            values[type_index] = intern(values[type_index])
+        self._values = tuple(values)
+
+    def __getitem__(self, key):
+        """Base class override."""
+        return self._values[self._field_indexes[key]]
+
+    def __getattr__(self, name):
+        """
+        Get the value of a field.
+
+        :param name:
+            The name of the field.
+        :type name:
+            `unicode`
+        """
+        # Fields of records are never private, and the slots of the record may not be set yet, e.g. while unpickling.
+        if not name.startswith('_'):
+            try:
+                return self[name]
+            except KeyError:
+                pass
+        raise AttributeError("'{0}' object has no attribute '{1}'".format(self.__class__.__name__, name))
+
+    def __iter__(self):
+        """Base class override."""
+        return iter(self._field_indexes)
+
+    def __len__(self):
+        """Base class override."""
+        return len(self._values)
+
+    def __repr__(self):
+        """Base class override."""
+        description = '<Box {0} {1} {2}>'.format(self.__class__.__name__, self.get('type'), self.get('id'))
+        if six.PY2:
+            return description.encode('utf-8')
+        return description
+
+    @property
+    def object_id(self):
+        """
+        The Box ID of the object.
+
+        :rtype:
+            `unicode` or None
+        """
+        return self.get('id')
+
+    @property
+    def object_type(self):
+        """
+        The Box type of the object.
+
+        :rtype:
+            `unicode` or None
+        """
+        return self.get('type')
+
+    def to_object(self):
+        """
+        Translate the record into the full Box object, e.g. a :class:`File`.
+
+        :rtype:
+            :class:`BaseAPIJSONObject`
+        """
+        return self._session.translator.translate(self._session, dict(self))
+
+
+class CompactPage(Page):
+    """A page of :class:`CompactRecord` records, instead of full Box objects."""
+
+    def _translate_entry(self, item_json):
+        """Base class override.
+
+        Entries of a CompactPage are returned as compact records.
+        """
+        return CompactRecord(self._session, item_json)
@@ -6,7 +6,9 @@
 
 
 class DictPage(Page):
-    def __getitem__(self, key):
-        item_json = self._response_object[self._item_entries_key_name][key]
+    def _translate_entry(self, item_json):
+        """Base class override.
 
+        Entries of a DictPage are returned as they are, without being translated.
+        """
         return item_json
@@ -0,0 +1,11 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from .compact_page import CompactPage
+from .limit_offset_based_object_collection import LimitOffsetBasedObjectCollection
+
+
+class LimitOffsetBasedCompactCollection(LimitOffsetBasedObjectCollection):
+    """Represents a limit/offset-based collection of compact, read-only records, which are not translated into objects."""
+    _page_constructor = CompactPage
@@ -22,12 +22,22 @@ def __init__(
             additional_params=None,
             return_full_pages=False,
             offset=0,
+            prefetch_pages=0,
+            fan_out_workers=0,
+            stream_entries=False,
     ):
         """
         :param offset:
             The offset index to start paging from.
         :type offset:
             `int`
+        :param fan_out_workers:
+            If more than 0, then once the first page has been retrieved, the following pages are requested with this
+            many requests at once, instead of one page at a time, keeping up to twice as many pages requested ahead of
+            the current one. The offsets of the pages are known from the total count in the first page. Entries are
+            still iterated over in order; pages are held in memory until then. Overrides `prefetch_pages`.
+        :type fan_out_workers:
+            `int`
         """
         super(LimitOffsetBasedObjectCollection, self).__init__(
             session,
@@ -36,12 +46,20 @@ def __init__(
             fields=fields,
             additional_params=additional_params,
             return_full_pages=return_full_pages,
+            prefetch_pages=prefetch_pages,
+            stream_entries=stream_entries,
         )
         self._offset = offset
+        self._total_count = None
+        if fan_out_workers > 0:
+            # Keep enough pages requested ahead for all of the workers to stay busy, without holding the whole
+            # collection in memory.
+            self._prefetch_pages = fan_out_workers * 2
+            self._prefetch_workers = fan_out_workers
 
     def _update_pointer_to_next_page(self, response_object):
         """Baseclass override."""
-        total_count = response_object['total_count']
+        total_count = self._total_count = response_object['total_count']
 
         if 'limit' in response_object:
             self._limit, old_limit = int(response_object['limit']), self._limit
@@ -79,6 +97,16 @@ def _next_page_pointer_params(self):
         """Baseclass override."""
         return {'offset': self._offset}
 
+    def _next_pages_pointer_params(self, count, start=0):
+        """Baseclass override.
+
+        The offsets of the pages after the next one follow from the limit and the total count of the last page.
+        """
+        if self._total_count is None or not self._limit:
+            return super(LimitOffsetBasedObjectCollection, self)._next_pages_pointer_params(count, start)
+        end = min(self._total_count, self._offset + count * self._limit)
+        return [{'offset': offset} for offset in range(self._offset + start * self._limit, end, self._limit)]
+
     def next_pointer(self):
         """Baseclass override."""
         return self._offset
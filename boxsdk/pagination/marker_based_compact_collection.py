@@ -0,0 +1,11 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from .compact_page import CompactPage
+from .marker_based_object_collection import MarkerBasedObjectCollection
+
+
+class MarkerBasedCompactCollection(MarkerBasedObjectCollection):
+    """Represents a marker-based collection of compact, read-only records, which are not translated into objects."""
+    _page_constructor = CompactPage
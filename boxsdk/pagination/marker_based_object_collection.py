@@ -23,6 +23,8 @@ def __init__(
             return_full_pages=False,
             marker=None,
             supports_limit_offset_paging=False,
+            prefetch_pages=0,
+            stream_entries=False,
     ):
         """
         :param marker:
@@ -42,6 +44,8 @@ def __init__(
             fields=fields,
             additional_params=additional_params,
             return_full_pages=return_full_pages,
+            prefetch_pages=prefetch_pages,
+            stream_entries=stream_entries,
         )
         self._marker = marker
         self._supports_limit_offset_paging = supports_limit_offset_paging
@@ -5,6 +5,8 @@
 from collections import Sequence
 import copy
 
+from ..util.columns import ColumnBuilder
+
 
 class Page(Sequence, object):
     """
@@ -46,6 +48,60 @@ def response_object(self):
         """
         return copy.deepcopy(self._response_object)
 
+    @property
+    def entries_json(self):
+        """
+        The entries of the page, as returned by the Box API, without translating them.
+
+        :rtype:
+            `list` of `dict`
+        """
+        return self._response_object[self._item_entries_key_name]
+
+    def to_columns(self, fields, typecodes=None):
+        """
+        Get the values of the given fields of the entries of the page, as columns, without creating Box objects for the
+        entries.
+
+        :param fields:
+            The names of the fields to get. Nested fields are separated by '.', e.g. 'parent.id'.
+        :type fields:
+            `Iterable` of `unicode`
+        :param typecodes:
+            The :class:`array` typecode of each field that should be stored in a typed array, e.g. `{'size': 'q'}`.
+            Defaults to :attr:`ColumnBuilder.DEFAULT_TYPECODES`.
+        :type typecodes:
+            `dict` of `unicode` to `unicode` or None
+        :returns:
+            The column of values of each field, in the order of the entries.
+        :rtype:
+            :class:`OrderedDict` of `unicode` to `list` or :class:`array`
+        """
+        column_builder = ColumnBuilder(fields, typecodes)
+        column_builder.add_all(self.entries_json)
+        return column_builder.columns
+
+    def to_arrays(self, fields, typecodes=None):
+        """
+        Get the values of the given fields of the entries of the page, as NumPy arrays, without creating Box objects for
+        the entries. Requires NumPy.
+
+        :param fields:
+            The names of the fields to get. Nested fields are separated by '.', e.g. 'parent.id'.
+        :type fields:
+            `Iterable` of `unicode`
+        :param typecodes:
+            The :class:`array` typecode of each field that should be stored in a typed array, e.g. `{'size': 'q'}`.
+            Defaults to :attr:`ColumnBuilder.DEFAULT_TYPECODES`.
+        :type typecodes:
+            `dict` of `unicode` to `unicode` or None
+        :rtype:
+            :class:`OrderedDict` of `unicode` to :class:`numpy.ndarray`
+        """
+        column_builder = ColumnBuilder(fields, typecodes)
+        column_builder.add_all(self.entries_json)
+        return column_builder.to_arrays()
+
     def __getitem__(self, key):
         """
         Try to get the attribute from the API response object.
@@ -57,7 +113,20 @@ def __getitem__(self, key):
         :rtype:
             :class:`BaseObject`
         """
-        item_json = self._response_object[self._item_entries_key_name][key]
+        item_json = self.entries_json[key]
+        return self._translate_entry(item_json)
+
+    def _translate_entry(self, item_json):
+        """
+        Translate an entry of the page into a Box object.
+
+        :param item_json:
+            The entry, as returned by the Box API.
+        :type item_json:
+            `dict`
+        :rtype:
+            :class:`BaseObject`
+        """
         return self._translator.translate(self._session, item_json)
 
     def __len__(self):
@@ -67,4 +136,4 @@ def __len__(self):
         :rtype:
             `int`
         """
-        return len(self._response_object[self._item_entries_key_name])
+        return len(self.entries_json)
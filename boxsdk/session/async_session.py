@@ -0,0 +1,464 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import local
+
+from .session import Session, AuthorizedSession
+from ..network.async_network import AsyncDefaultNetwork
+from ..object.base_object import BaseObject
+from ..object.folder import Folder
+from ..object.item import Item
+from ..object.metadata import Metadata
+
+
+class AsyncSession(Session):
+    """
+    Box API session for use with asyncio. Provides automatic retry of failed requests, without blocking the event loop.
+
+    Requests made through the session are coroutines, so they must be awaited, e.g. `await session.get(url)`. Methods of
+    SDK objects that make API calls (those decorated with :func:`api_call`) return awaitables when the object was
+    created with an :class:`AsyncSession`; see :meth:`run_api_call`.
+    """
+
+    def __init__(self, network_layer=None, api_call_executor=None, **kwargs):
+        """
+        :param network_layer:
+            Asynchronous network implementation used by the session to make requests. Defaults to a new
+            :class:`AsyncDefaultNetwork`.
+        :type network_layer:
+            :class:`AsyncNetwork`
+        :param api_call_executor:
+            The executor to run the API call methods that don't have a coroutine implementation in; see
+            :meth:`run_api_call`. Its number of workers is the maximum number of those methods that run at once.
+            Defaults to a new :class:`ThreadPoolExecutor` with `AsyncDefaultNetwork.DEFAULT_CONNECTION_LIMIT` workers,
+            which is shut down when the session is closed.
+        :type api_call_executor:
+            :class:`concurrent.futures.Executor`
+        """
+        super(AsyncSession, self).__init__(network_layer=network_layer or AsyncDefaultNetwork(), **kwargs)
+        self._owns_api_call_executor = api_call_executor is None
+        self._api_call_executor = api_call_executor or ThreadPoolExecutor(
+            max_workers=AsyncDefaultNetwork.DEFAULT_CONNECTION_LIMIT,
+        )
+
+    def get_constructor_kwargs(self):
+        """Base class override."""
+        kwargs = super(AsyncSession, self).get_constructor_kwargs()
+        kwargs['api_call_executor'] = self._api_call_executor
+        return kwargs
+
+    def request(self, method, url, **kwargs):
+        """Base class override.
+
+        Make a request to the Box API. Returns a coroutine that makes the request, unless the request is being made by an
+        API call method that is being run by :meth:`run_api_call`, in which case the request is made on the event loop
+        and its response is returned once it has been received.
+        """
+        loop = getattr(_api_call_threads, 'loop', None)
+        if loop is not None:
+            return asyncio.run_coroutine_threadsafe(self._request(method, url, **kwargs), loop).result()
+        return self._request(method, url, **kwargs)
+
+    async def close(self):
+        """
+        Close the network layer of the session, and any connections it has open, and stop the executor that API call
+        methods are run in if the session created it. Sessions created from this one, e.g. with :meth:`as_user`, share
+        the network layer, so they are closed too; closing one of them doesn't stop the executor it shares.
+        """
+        await self._network_layer.close()
+        if self._owns_api_call_executor:
+            self._api_call_executor.shutdown(wait=False)
+
+    def run_api_call(self, method, *args, **kwargs):
+        """
+        Run a method of an SDK object that makes API calls with this session, and return an awaitable for its result.
+
+        The most commonly used methods, such as :meth:`BaseObject.get`, :meth:`Item.get`, :meth:`Metadata.get` and
+        :meth:`Folder.get_items`, have coroutine implementations that are run on the event loop, so any number of them
+        can be awaited at once without using a thread each. Collections are also iterated over on the event loop, with
+        `async for`.
+
+        Other methods that make API calls are written to make requests synchronously. To run them without blocking the
+        event loop, the method is run once in the session's `api_call_executor`. Each request that it makes is sent from
+        the event loop, while the method waits for the response, so each of these methods holds a thread of the executor
+        until it returns, and at most as many of them as the executor has workers run at once.
+
+        :param method:
+            The bound method to run.
+        :type method:
+            `callable`
+        :returns:
+            An awaitable for the result of the method. If the result is a :class:`BoxObjectCollection`, it can also be
+            iterated over directly with `async for`.
+        :rtype:
+            :class:`AsyncAPICall`
+        """
+        if getattr(_api_call_threads, 'loop', None) is not None:
+            # This is an API call made by another API call method, which is already being run.
+            return method(*args, **kwargs)
+        native_api_call = _NATIVE_API_CALLS.get(getattr(method, '__func__', None))
+        if native_api_call is not None:
+            return AsyncAPICall(partial(native_api_call, method.__self__, *args, **kwargs))
+        return AsyncAPICall(partial(self._run_api_call, method, args, kwargs))
+
+    async def _run_api_call(self, method, args, kwargs):
+        """
+        Run an API call method in the session's `api_call_executor`, and return its result.
+
+        :param method:
+            The bound method to run.
+        :type method:
+            `callable`
+        :param args:
+            The positional arguments to the method.
+        :type args:
+            `tuple`
+        :param kwargs:
+            The keyword arguments to the method.
+        :type kwargs:
+            `dict`
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._api_call_executor, partial(_call_api_call, loop, method, args, kwargs))
+
+    async def _request(self, method, url, **kwargs):
+        """
+        Make a request to the Box API.
+
+        :param method:
+            The HTTP verb for the request.
+        :type method:
+            `unicode`
+        :param url:
+            The URL for the request.
+        :type url:
+            `unicode`
+        :rtype:
+            :class:`BoxResponse`
+        """
+        response = await self._prepare_and_send_request(method, url, **kwargs)
+        return self.box_response_constructor(response)
+
+    async def _prepare_and_send_request(
+            self,
+            method,
+            url,
+            headers=None,
+            auto_session_renewal=True,
+            expect_json_response=True,
+            **kwargs
+    ):
+        """Base class override.
+
+        Prepare a request to be sent to the Box API, send it, and retry it for the same types of failure as
+        :class:`Session` does.
+        """
+        # pylint:disable=invalid-overridden-method
+        files = kwargs.get('files')
+        kwargs['file_stream_positions'] = None
+        if files:
+            kwargs['file_stream_positions'] = dict((name, file_tuple[1].tell()) for name, file_tuple in files.items())
+        attempt_number = 0
+        request_headers = self._get_request_headers()
+        request_headers.update(headers or {})
+        cache_key, cache_variant, cached_response = self._look_up_response_cache(
+            method,
+            url,
+            request_headers,
+            expect_json_response,
+            kwargs,
+        )
+        if cached_response is not None and self._response_cache.is_fresh(cached_response):
+            self._response_cache.record_hit()
+            return cached_response
+
+        request = self.box_request_constructor(
+            url=url,
+            method=method,
+            headers=request_headers,
+            auto_session_renewal=auto_session_renewal,
+            expect_json_response=expect_json_response,
+        )
+        self._start_retries(request)
+
+        network_response = await self._send_request(request, **kwargs)
+
+        while True:
+            self._record_response(network_response)
+            retry = self._get_retry_request_callable(network_response, attempt_number, request, **kwargs)
+
+            if retry is None or attempt_number >= self._get_max_retry_attempts():
+                break
+
+            attempt_number += 1
+            self._logger.debug('Retrying request')
+            network_response = await retry(request, **kwargs)
+
+        network_response = self._update_response_cache(
+            request,
+            cache_key,
+            cache_variant,
+            cached_response,
+            network_response,
+        )
+        self._raise_on_unsuccessful_request(network_response, request)
+
+        return network_response
+
+    async def _send_request(self, request, **kwargs):
+        """Base class override.
+
+        Make a request to the Box API, once the rate limiter of the session allows it, without blocking the event loop.
+        """
+        # pylint:disable=invalid-overridden-method
+        if self._rate_limiter is not None:
+            await asyncio.sleep(self._rate_limiter.reserve(self._get_endpoint_class(request.url)))
+        return await super(AsyncSession, self)._send_request(request, **kwargs)
+
+    def _wait_for_rate_limit(self, request):
+        """Base class override.
+
+        The rate limit has already been waited for, by :meth:`_send_request`.
+        """
+
+
+class AsyncAuthorizedSession(AuthorizedSession, AsyncSession):
+    """
+    Box API authorized session for use with asyncio. Provides auth, automatic retry of failed requests, and session
+    renewal, without blocking the event loop.
+
+    Access tokens are refreshed in the default executor of the event loop, since :class:`OAuth2` refreshes tokens
+    synchronously. :class:`OAuth2` serializes concurrent refreshes, so when many requests fail at once because the access
+    token expired, only one of them refreshes it.
+    """
+
+    def _get_retry_request_callable(self, network_response, attempt_number, request, **kwargs):
+        """Base class override.
+
+        For 401 Unauthorized responses, renew the session by refreshing the access token; then retry.
+        """
+        if network_response.status_code == 401 and request.auto_session_renewal:
+            request.auto_session_renewal = False
+            return partial(self._renew_session_and_send_request, network_response.access_token_used)
+        return super(AsyncAuthorizedSession, self)._get_retry_request_callable(
+            network_response,
+            attempt_number,
+            request,
+            **kwargs
+        )
+
+    async def _send_request(self, request, **kwargs):
+        """Base class override.
+
+        Make a request to the Box API, first getting an access token if there isn't one yet.
+        """
+        # pylint:disable=invalid-overridden-method
+        if request.auto_session_renewal and self._oauth.access_token is None:
+            await self._renew_session_async(None)
+            request.auto_session_renewal = False
+        return await super(AsyncAuthorizedSession, self)._send_request(request, **kwargs)
+
+    async def _renew_session_and_send_request(self, access_token_used, request, **kwargs):
+        """
+        Renew the session by refreshing the access token, then make a request to the Box API.
+
+        :param access_token_used:
+            The access token that was rejected by the Box API.
+        :type access_token_used:
+            `unicode` or None
+        :param request:
+            The API request to send.
+        :type request:
+            :class:`BoxRequest`
+        """
+        await self._renew_session_async(access_token_used)
+        return await self._send_request(request, **kwargs)
+
+    async def _renew_session_async(self, access_token_used):
+        """
+        Renew the session by refreshing the access token, without blocking the event loop.
+
+        :param access_token_used:
+            The access token that's currently being used by the session, that needs to be refreshed.
+        :type access_token_used:
+            `unicode` or None
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._renew_session, access_token_used)
+
+
+class AsyncAPICall(object):
+    """
+    The result of calling an API call method of an SDK object that uses an :class:`AsyncSession`.
+
+    It can be awaited for the result of the method. If the method returns a :class:`BoxObjectCollection`, it can
+    instead be iterated over with `async for`, e.g. `async for item in folder.get_items(): ...`.
+    """
+
+    def __init__(self, api_call):
+        """
+        :param api_call:
+            A coroutine function that runs the API call method, and returns its result.
+        :type api_call:
+            `callable`
+        """
+        super(AsyncAPICall, self).__init__()
+        self._api_call = api_call
+
+    def __await__(self):
+        return self._api_call().__await__()
+
+    def __aiter__(self):
+        return self._iterate_result().__aiter__()
+
+    async def _iterate_result(self):
+        collection = await self
+        async for item in collection:
+            yield item
+
+
+# The event loop that each thread running an API call method makes its requests on, if any.
+_api_call_threads = local()
+
+
+def _call_api_call(loop, method, args, kwargs):
+    """
+    Call an API call method in a thread of an executor, making its requests on an event loop.
+
+    :param loop:
+        The event loop to make the requests of the method on.
+    :type loop:
+        :class:`asyncio.AbstractEventLoop`
+    :param method:
+        The bound method to call.
+    :type method:
+        `callable`
+    :param args:
+        The positional arguments to the method.
+    :type args:
+        `tuple`
+    :param kwargs:
+        The keyword arguments to the method.
+    :type kwargs:
+        `dict`
+    """
+    _api_call_threads.loop = loop
+    try:
+        return method(*args, **kwargs)
+    finally:
+        _api_call_threads.loop = None
+
+
+async def _get_object(base_object, fields=None, headers=None):
+    """
+    Coroutine implementation of :meth:`BaseObject.get`.
+
+    :param base_object:
+        The object to get information about.
+    :type base_object:
+        :class:`BaseObject`
+    :param fields:
+        List of fields to request.
+    :type fields:
+        `Iterable` of `unicode`
+    :param headers:
+        Additional headers to send with the request.
+    :type headers:
+        `dict`
+    :rtype:
+        :class:`BaseObject`
+    """
+    params = {'fields': ','.join(fields)} if fields else None
+    box_response = await base_object.session.get(base_object.get_url(), params=params, headers=headers)
+    return base_object.translator.translate(
+        session=base_object.session,
+        response_object=box_response.json(),
+    )
+
+
+async def _get_item(item, fields=None, etag=None):
+    """
+    Coroutine implementation of :meth:`Item.get`.
+
+    :param item:
+        The file or folder to get information about.
+    :type item:
+        :class:`Item`
+    :param fields:
+        List of fields to request.
+    :type fields:
+        `Iterable` of `unicode`
+    :param etag:
+        If specified, instruct the Box API to get the info only if the current version's etag doesn't match.
+    :type etag:
+        `unicode` or None
+    :rtype:
+        :class:`Item`
+    """
+    headers = {'If-None-Match': etag} if etag is not None else None
+    return await _get_object(item, fields=fields, headers=headers)
+
+
+async def _get_metadata(metadata):
+    """
+    Coroutine implementation of :meth:`Metadata.get`.
+
+    :param metadata:
+        The metadata instance to get.
+    :type metadata:
+        :class:`Metadata`
+    :rtype:
+        `dict`
+    """
+    box_response = await metadata.session.get(metadata.get_url())
+    return box_response.json()
+
+
+def _get_api_call_function(owner, name):
+    """
+    Get the function decorated with :func:`api_call` that implements a method of a class.
+
+    :param owner:
+        The class that defines the method.
+    :type owner:
+        `type`
+    :param name:
+        The name of the method.
+    :type name:
+        `unicode`
+    :rtype:
+        `callable`
+    """
+    return owner.__dict__[name]._func_that_makes_an_api_call  # pylint:disable=protected-access
+
+
+_get_folder_items = _get_api_call_function(Folder, 'get_items')
+
+
+async def _get_items(folder, *args, **kwargs):
+    """
+    Coroutine implementation of :meth:`Folder.get_items`. Getting the items of a folder doesn't make any requests; the
+    pages of the collection it returns are requested as it is iterated over.
+
+    :param folder:
+        The folder to get the items of.
+    :type folder:
+        :class:`Folder`
+    :rtype:
+        :class:`BoxObjectCollection`
+    """
+    return _get_folder_items(folder, *args, **kwargs)
+
+
+# The coroutine implementations of API call methods, by the function that implements the method synchronously. A
+# method that is overridden by a subclass is run in the executor, unless the override has its own implementation here.
+_NATIVE_API_CALLS = {
+    _get_api_call_function(BaseObject, 'get'): _get_object,
+    _get_api_call_function(Item, 'get'): _get_item,
+    _get_api_call_function(Metadata, 'get'): _get_metadata,
+    _get_folder_items: _get_items,
+}
@@ -21,12 +21,15 @@ class BoxRequest(object):
     :type auto_session_renewal:     `bool` or None
     :param expect_json_response:    Whether or not the API response must be JSON.
     :type expect_json_response:     `bool` or None
+    :param retry_state:             The retries of the request so far, when the session has a retry scheduler.
+    :type retry_state:              :class:`RetryState` or None
     """
     url = attr.ib()
     method = attr.ib(default='GET')
     headers = attr.ib(default=attr.Factory(dict))
     auto_session_renewal = attr.ib(default=True)
     expect_json_response = attr.ib(default=True)
+    retry_state = attr.ib(default=None)
 
     def __repr__(self):
         return '<BoxRequest for {self.method} {self.url} with headers {headers}'.format(
@@ -8,7 +8,7 @@
 from functools import partial
 from logging import getLogger
 
-from boxsdk.exception import BoxException
+from boxsdk.exception import BoxException, BoxCircuitOpenException
 from .box_request import BoxRequest as _BoxRequest
 from .box_response import BoxResponse as _BoxResponse
 from ..config import API, Client, Proxy
@@ -16,6 +16,8 @@
 from ..network.default_network import DefaultNetwork
 from ..util.json import is_json_response
 from ..util.multipart_stream import MultipartStream
+from ..util.rate_limiter import EndpointClass
+from ..util.response_cache import ResponseCache
 from ..util.shared_link import get_shared_link_header
 from ..util.translator import Translator
 
@@ -38,6 +40,9 @@ def __init__(
             api_config=None,
             client_config=None,
             proxy_config=None,
+            rate_limiter=None,
+            retry_scheduler=None,
+            response_cache=None,
     ):
         """
         :param network_layer:
@@ -71,12 +76,28 @@ def __init__(
             Object containing proxy information.
         :type proxy_config:
             :class:`Proxy` or None
+        :param rate_limiter:
+            (optional) Rate limiter to wait for before making each request, including retried requests.
+        :type rate_limiter:
+            :class:`RateLimiter` or None
+        :param retry_scheduler:
+            (optional) Retry scheduler that decides whether, and when, to retry failed requests. Defaults to retrying
+            202, 429 and 5xx responses up to `API.MAX_RETRY_ATTEMPTS` times, with exponential backoff.
+        :type retry_scheduler:
+            :class:`RetryScheduler` or None
+        :param response_cache:
+            (optional) Cache of the JSON responses to GET requests, which are revalidated with their ETags.
+        :type response_cache:
+            :class:`ResponseCache` or None
         """
         if translator is None:
             translator = Translator(extend_default_translator=True, new_child=True)
         self._api_config = api_config or API()
         self._client_config = client_config or Client()
         self._proxy_config = proxy_config or Proxy()
+        self._rate_limiter = rate_limiter
+        self._retry_scheduler = retry_scheduler
+        self._response_cache = response_cache
         super(Session, self).__init__()
         self._network_layer = network_layer or DefaultNetwork()
         self._default_headers = {
@@ -229,6 +250,9 @@ def get_constructor_kwargs(self):
             client_config=self._client_config,
             proxy_config=self._proxy_config,
             default_headers=self._default_headers.copy(),
+            rate_limiter=self._rate_limiter,
+            retry_scheduler=self._retry_scheduler,
+            response_cache=self._response_cache,
         )
 
     def as_user(self, user):
@@ -382,6 +406,16 @@ def _prepare_and_send_request(
         attempt_number = 0
         request_headers = self._get_request_headers()
         request_headers.update(headers or {})
+        cache_key, cache_variant, cached_response = self._look_up_response_cache(
+            method,
+            url,
+            request_headers,
+            expect_json_response,
+            kwargs,
+        )
+        if cached_response is not None and self._response_cache.is_fresh(cached_response):
+            self._response_cache.record_hit()
+            return cached_response
 
         request = self.box_request_constructor(
             url=url,
@@ -390,19 +424,28 @@ def _prepare_and_send_request(
             auto_session_renewal=auto_session_renewal,
             expect_json_response=expect_json_response,
         )
+        self._start_retries(request)
 
         network_response = self._send_request(request, **kwargs)
 
         while True:
+            self._record_response(network_response)
             retry = self._get_retry_request_callable(network_response, attempt_number, request, **kwargs)
 
-            if retry is None or attempt_number >= API.MAX_RETRY_ATTEMPTS:
+            if retry is None or attempt_number >= self._get_max_retry_attempts():
                 break
 
             attempt_number += 1
             self._logger.debug('Retrying request')
             network_response = retry(request, **kwargs)
 
+        network_response = self._update_response_cache(
+            request,
+            cache_key,
+            cache_variant,
+            cached_response,
+            network_response,
+        )
         self._raise_on_unsuccessful_request(network_response, request)
 
         return network_response
@@ -443,17 +486,181 @@ def _get_retry_request_callable(self, network_response, attempt_number, request,
         except TypeError:
             pass
         code = network_response.status_code
-        if (code in (202, 429) or code >= 500) and grant_type != self._JWT_GRANT_TYPE:
-            return partial(
-                self._network_layer.retry_after,
-                self.get_retry_after_time(attempt_number, network_response.headers.get('Retry-After', None)),
-                self._send_request,
-            )
-        return None
+        if grant_type == self._JWT_GRANT_TYPE:
+            return None
+        retry_after_header = network_response.headers.get('Retry-After', None)
+        if self._retry_scheduler is not None:
+            delay = self._retry_scheduler.get_retry_delay(request.retry_state, code, attempt_number, retry_after_header)
+        elif code in (202, 429) or code >= 500:
+            delay = self.get_retry_after_time(attempt_number, retry_after_header)
+        else:
+            delay = None
+        if delay is None:
+            return None
+        return partial(self._network_layer.retry_after, delay, self._send_request)
+
+    def _get_max_retry_attempts(self):
+        """
+        Get the maximum number of times to retry a request.
+
+        :rtype:
+            `int`
+        """
+        if self._retry_scheduler is not None:
+            return self._retry_scheduler.max_attempts
+        return API.MAX_RETRY_ATTEMPTS
+
+    def _start_retries(self, request):
+        """
+        Check that the retry scheduler of the session allows a request to be made, and start keeping track of its retries.
+
+        :param request:
+            The API request that is about to be sent.
+        :type request:
+            :class:`BoxRequest`
+        :raises:
+            :class:`BoxCircuitOpenException` if the circuit breaker of the retry scheduler is open.
+        """
+        if self._retry_scheduler is None:
+            return
+        if not self._retry_scheduler.allow_request():
+            raise BoxCircuitOpenException(url=request.url, method=request.method)
+        request.retry_state = self._retry_scheduler.start()
+
+    def _record_response(self, network_response):
+        """
+        Let the retry scheduler of the session know the outcome of a request.
+
+        :param network_response:
+            The response from the Box API.
+        :type network_response:
+            :class:`NetworkResponse`
+        """
+        if self._retry_scheduler is not None:
+            self._retry_scheduler.record_response(network_response.status_code)
+
+    def _look_up_response_cache(self, method, url, request_headers, expect_json_response, kwargs):
+        """
+        Look up the cached response to a request, if it's a request whose response can be cached, and prepare the
+        request to revalidate it.
+
+        Only GET requests for JSON responses, which aren't streamed and aren't already conditional, are cached.
+
+        :param method:
+            The HTTP verb of the request.
+        :type method:
+            `unicode`
+        :param url:
+            The URL of the request.
+        :type url:
+            `unicode`
+        :param request_headers:
+            The headers of the request. An `If-None-Match` header is added if there is a cached response to revalidate.
+        :type request_headers:
+            `dict`
+        :param expect_json_response:
+            Whether the response content should be json.
+        :type expect_json_response:
+            `bool`
+        :param kwargs:
+            The keyword arguments of the request, for the network layer.
+        :type kwargs:
+            `dict`
+        :returns:
+            The key and variant that the response is cached under, or None if it can't be cached, and the cached
+            response, or None if there isn't one.
+        :rtype:
+            `tuple` of (`unicode` or None, `unicode` or None, :class:`CachedNetworkResponse` or None)
+        """
+        if self._response_cache is None or method != 'GET' or not expect_json_response:
+            return None, None, None
+        if kwargs.get('stream') or 'If-None-Match' in request_headers:
+            return None, None, None
+        cache_key = ResponseCache.get_key(url, request_headers)
+        cache_variant = ResponseCache.get_variant(kwargs.get('params'))
+        cached_response = self._response_cache.get(cache_key, cache_variant)
+        if cached_response is not None and cached_response.etag is not None:
+            request_headers['If-None-Match'] = cached_response.etag
+        return cache_key, cache_variant, cached_response
+
+    def _update_response_cache(self, request, cache_key, cache_variant, cached_response, network_response):
+        """
+        Update the response cache with the response to a request.
+
+        The response is cached if it can be. If Box responded with 304 Not Modified, the cached response is returned
+        instead. Any other successful request drops the cached responses from its URL.
+
+        :param request:
+            The API request.
+        :type request:
+            :class:`BoxRequest`
+        :param cache_key:
+            The key that the response is cached under, or None if it can't be cached.
+        :type cache_key:
+            `unicode` or None
+        :param cache_variant:
+            The variant of the response.
+        :type cache_variant:
+            `unicode` or None
+        :param cached_response:
+            The response that was being revalidated, if any.
+        :type cached_response:
+            :class:`CachedNetworkResponse` or None
+        :param network_response:
+            The response from the Box API.
+        :type network_response:
+            :class:`NetworkResponse`
+        :returns:
+            The response to return for the request.
+        :rtype:
+            :class:`NetworkResponse`
+        """
+        if self._response_cache is None:
+            return network_response
+        if cache_key is None:
+            if request.method != 'GET' and network_response.ok:
+                self._response_cache.invalidate(ResponseCache.get_key(request.url, request.headers))
+            return network_response
+        if network_response.status_code == 304 and cached_response is not None:
+            return self._response_cache.revalidate(cache_key, cache_variant, cached_response)
+        if network_response.status_code == 200:
+            self._response_cache.store(cache_key, cache_variant, network_response)
+        return network_response
 
     def _get_request_headers(self):
         return self._default_headers.copy()
 
+    def _get_endpoint_class(self, url):
+        """
+        Get the class of Box API endpoint that a request is for, to find the rate limit that applies to it.
+
+        :param url:
+            The URL for the request.
+        :type url:
+            `unicode`
+        :rtype:
+            :class:`EndpointClass` or None
+        """
+        if url.startswith(self._api_config.UPLOAD_URL):
+            return EndpointClass.UPLOAD
+        if url.startswith(self.get_url('search')):
+            return EndpointClass.SEARCH
+        if url.startswith(self._api_config.BASE_API_URL):
+            return EndpointClass.API
+        return None
+
+    def _wait_for_rate_limit(self, request):
+        """
+        Wait until the rate limiter of the session allows the request to be made.
+
+        :param request:
+            The API request that is about to be sent.
+        :type request:
+            :class:`BoxRequest`
+        """
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(self._get_endpoint_class(request.url))
+
     def _prepare_proxy(self):
         """
         Prepares basic authenticated and unauthenticated proxies for requests.
@@ -513,6 +720,7 @@ def _send_request(self, request, **kwargs):
             request.headers['Content-Type'] = multipart_stream.content_type
 
         # send the request
+        self._wait_for_rate_limit(request)
         network_response = self._network_layer.request(
             request.method,
             request.url,
@@ -18,6 +18,9 @@ def api_call(method):
     decorator and then passing a `extra_network_parameters` parameter to the method will cause
     the object's clone method to be called.
 
+    If the object's session is an :class:`AsyncSession`, the decorated method returns an awaitable
+    for its result instead.
+
     :param method:
         The method to decorate.
     :type method:
@@ -68,9 +71,36 @@ def call(instance, *args, **kwargs):
                 instance = instance.clone(instance.session.with_default_network_request_kwargs(extra_network_parameters))
 
             method = self._func_that_makes_an_api_call.__get__(instance, owner)
+            run_api_call = self._get_api_call_runner(instance)
+            if run_api_call is not None:
+                return run_api_call(method, *args, **kwargs)
             return method(*args, **kwargs)
 
         # Since the caller passed a non-`None` instance to `__get__()`, they
         # want a bound method back, not an unbound function. Thus, we must bind
         # `call()` to `_instance` and then return that bound method.
         return call.__get__(_instance, owner)
+
+    @staticmethod
+    def _get_api_call_runner(instance):
+        """
+        Sessions that make requests asynchronously, such as :class:`AsyncSession`, decide how API call methods are run,
+        with a `run_api_call()` method.
+
+        :param instance:
+            The object whose API call method is being called.
+        :type instance:
+            :class:`Cloneable`
+        :returns:
+            The `run_api_call()` method of the object's session, or None if the API call method should just be called.
+        :rtype:
+            `callable` or None
+        """
+        try:
+            session = instance.session
+        except NotImplementedError:
+            return None
+        # This is looked up on the class, so that mock sessions are treated as synchronous.
+        if getattr(type(session), 'run_api_call', None) is None:
+            return None
+        return session.run_api_call
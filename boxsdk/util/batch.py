@@ -0,0 +1,230 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+import time
+
+from six.moves.urllib.parse import urlparse
+
+from boxsdk.network.network_interface import Network
+
+
+class BatchOperation(object):
+    """
+    An API call prepared to be made as part of a batch, e.g. `BatchOperation(file.rename, 'new name.txt')`.
+    """
+
+    def __init__(self, method, *args, **kwargs):
+        """
+        :param method:
+            The method that makes the API call, bound to the object to make it on, such as `file.rename` or
+            `file.metadata().set`. The object must be :class:`Cloneable`.
+        :type method:
+            `callable`
+        :param args:
+            The positional arguments to call the method with.
+        :param kwargs:
+            The keyword arguments to call the method with.
+        """
+        super(BatchOperation, self).__init__()
+        self._method = method
+        self._args = args
+        self._kwargs = kwargs
+
+    def execute(self, network_layer):
+        """
+        Make the API call with the session of the object the method is bound to, including its default headers such as
+        As-User or BoxApi, but with the given network layer instead of the session's own.
+
+        :param network_layer:
+            The network layer to make the API call with.
+        :type network_layer:
+            :class:`Network`
+        :returns:
+            The result of the method.
+        """
+        cloneable = self._method.__self__
+        session = cloneable.session
+        kwargs = session.get_constructor_kwargs()
+        kwargs['network_layer'] = network_layer
+        cloneable = cloneable.clone(session.__class__(**kwargs))
+        return getattr(cloneable, self._method.__name__)(*self._args, **self._kwargs)
+
+
+class BatchExecutor(object):
+    """
+    Executes many independent API calls concurrently.
+    """
+
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, session, max_workers=DEFAULT_MAX_WORKERS, max_requests_per_host=None):
+        """
+        :param session:
+            The session whose network layer to make the API calls with. Each API call is made with the session of the
+            object it's made on, with the network layer replaced.
+        :type session:
+            :class:`Session`
+        :param max_workers:
+            The maximum number of API calls to make at once.
+        :type max_workers:
+            `int`
+        :param max_requests_per_host:
+            The maximum number of requests to have in flight at once to any one host, e.g. to the upload host, or None
+            to only limit the number of API calls with `max_workers`.
+        :type max_requests_per_host:
+            `int` or None
+        """
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        if max_requests_per_host is not None and max_requests_per_host < 1:
+            raise ValueError('max_requests_per_host must be at least 1')
+        super(BatchExecutor, self).__init__()
+        self._max_workers = max_workers
+        self._network_layer = _BatchNetwork(session.get_constructor_kwargs()['network_layer'], max_requests_per_host)
+
+    def execute(self, operations):
+        """
+        Make the API calls of the operations.
+
+        A failed operation doesn't stop the others; its exception is returned in place of its result. Operations are
+        retried as usual when Box asks for requests to be made later (429 Too Many Requests). Until the time given in the
+        Retry-After header of such a response has passed, no operation in the batch makes a new request.
+
+        :param operations:
+            The operations to execute.
+        :type operations:
+            `Iterable` of :class:`BatchOperation`
+        :returns:
+            The result of each operation, or the exception it raised, in the same order as the operations.
+        :rtype:
+            `list`
+        """
+        return list(self.iterate(operations))
+
+    def iterate(self, operations):
+        """
+        Make the API calls of the operations, like :meth:`execute`, and yield their results as they become available.
+
+        Operations are taken from `operations` only as the pool has room for them, so at most twice `max_workers`
+        operations are submitted but not yet yielded at any time. A batch of any size can therefore be executed from a
+        generator of operations, without holding an operation, a future or a session for each of them.
+
+        :param operations:
+            The operations to execute.
+        :type operations:
+            `Iterable` of :class:`BatchOperation`
+        :returns:
+            The result of each operation, or the exception it raised, in the same order as the operations.
+        :rtype:
+            `Iterator`
+        """
+        pending_futures = deque()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            for operation in operations:
+                if len(pending_futures) >= self._max_workers * 2:
+                    yield self._get_result(pending_futures.popleft())
+                pending_futures.append(executor.submit(operation.execute, self._network_layer))
+            while pending_futures:
+                yield self._get_result(pending_futures.popleft())
+        finally:
+            for future in pending_futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def _get_result(future):
+        """
+        Wait for an operation to finish, and get its result.
+
+        :param future:
+            The future of the operation.
+        :type future:
+            :class:`Future`
+        :returns:
+            The result of the operation, or the exception it raised.
+        """
+        exception = future.exception()
+        return exception if exception is not None else future.result()
+
+
+class _BatchNetwork(Network):
+    """
+    A network layer that limits the number of requests in flight to each host, and holds back new requests while Box
+    has asked for requests to be made later.
+    """
+
+    def __init__(self, network_layer, max_requests_per_host):
+        """
+        :param network_layer:
+            The network layer to make requests with.
+        :type network_layer:
+            :class:`Network`
+        :param max_requests_per_host:
+            The maximum number of requests to have in flight at once to any one host, or None for no limit.
+        :type max_requests_per_host:
+            `int` or None
+        """
+        super(_BatchNetwork, self).__init__()
+        self._network_layer = network_layer
+        self._host_semaphores = defaultdict(lambda: BoundedSemaphore(max_requests_per_host))
+        self._limit_hosts = max_requests_per_host is not None
+        self._lock = Lock()
+        self._paused_until = 0
+
+    def request(self, method, url, access_token, **kwargs):
+        """Base class override.
+
+        Make a request once the host has a free slot, and no earlier response has asked for requests to be made later.
+        """
+        self._wait_until_unpaused()
+        if self._limit_hosts:
+            with self._lock:
+                semaphore = self._host_semaphores[urlparse(url).netloc]
+            with semaphore:
+                network_response = self._network_layer.request(method, url, access_token, **kwargs)
+        else:
+            network_response = self._network_layer.request(method, url, access_token, **kwargs)
+        if network_response.status_code == 429:
+            self._pause(network_response.headers.get('Retry-After', None))
+        return network_response
+
+    def retry_after(self, delay, request_method, *args, **kwargs):
+        """Base class override."""
+        return self._network_layer.retry_after(delay, request_method, *args, **kwargs)
+
+    @property
+    def network_response_constructor(self):
+        """Base class override."""
+        return self._network_layer.network_response_constructor
+
+    def _pause(self, retry_after_header):
+        """
+        Hold back new requests for as long as Box asked.
+
+        :param retry_after_header:
+            Value of the 'Retry-After' response header.
+        :type retry_after_header:
+            `unicode` or None
+        """
+        try:
+            delay = int(retry_after_header)
+        except (ValueError, TypeError):
+            return
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.time() + delay)
+
+    def _wait_until_unpaused(self):
+        """
+        Wait until new requests may be made.
+        """
+        while True:
+            with self._lock:
+                delay = self._paused_until - time.time()
+            if delay <= 0:
+                return
+            time.sleep(delay)
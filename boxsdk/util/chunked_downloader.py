@@ -0,0 +1,576 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import io
+import json
+import os
+from threading import Lock
+
+from requests.exceptions import ChunkedEncodingError, ConnectionError as RequestsConnectionError
+from requests.packages.urllib3.exceptions import ProtocolError, ReadTimeoutError  # pylint:disable=import-error
+from six.moves import range  # pylint:disable=redefined-builtin
+
+from boxsdk.config import API
+from boxsdk.exception import BoxAPIException, BoxException
+from boxsdk.util.compat import replace_file
+
+
+# The errors raised while a download is being streamed when the connection drops, after which the download is resumed
+# from the last byte written. Other errors, e.g. failures to write to the local stream, are raised immediately.
+_CONNECTION_ERRORS = (RequestsConnectionError, ChunkedEncodingError, ProtocolError, ReadTimeoutError)
+
+
+class ChunkedDownloader(object):
+
+    DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, file, writeable_stream, file_version=None, part_size=DEFAULT_PART_SIZE, max_workers=4,
+                 verify_sha1=False):
+        # pylint:disable=redefined-builtin
+        """
+        The initializer for the :class:`ChunkedDownloader`
+
+        :param file:
+            The file to download.
+        :type file:
+            :class:`File`
+        :param writeable_stream:
+            A seekable file-like object where bytes can be written into, at any offset. The file is written starting
+            at the current position of the stream.
+        :type writeable_stream:
+            `file`
+        :param file_version:
+            The specific version of the file to download. If not specified, the current version of the file is looked
+            up once, and every part is downloaded from that version, so that the content can't change mid-download.
+        :type file_version:
+            :class:`FileVersion` or None
+        :param part_size:
+            The number of bytes to download with each ranged request.
+        :type part_size:
+            `int`
+        :param max_workers:
+            The maximum number of parts to download concurrently.
+        :type max_workers:
+            `int`
+        :param verify_sha1:
+            Whether to read the downloaded content back from the stream and check it against the SHA-1 of the file
+            version. The stream must then also be readable.
+        :type verify_sha1:
+            `bool`
+        :returns:
+            An initialized :class:`ChunkedDownloader` object.
+        :rtype:
+            :class:`ChunkedDownloader`
+        """
+        if part_size < 1:
+            raise ValueError('part_size must be at least 1')
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self._file = file
+        self._writeable_stream = writeable_stream
+        self._file_version = file_version
+        self._part_size = part_size
+        self._max_workers = max_workers
+        self._verify_sha1 = verify_sha1
+        self._write_lock = Lock()
+
+    def start(self):
+        """
+        Starts the process of downloading the file in concurrent ranged requests.
+
+        :raises:
+            :class:`BoxException` if `verify_sha1` was specified and the downloaded content doesn't match.
+        """
+        file_version, file_size, sha1 = _get_file_version_info(self._file, self._file_version)
+        if self._verify_sha1 and sha1 is None:
+            raise BoxException('The SHA-1 of the file version is not known, so the download cannot be verified.')
+        stream_offset = self._writeable_stream.tell()
+        self._preallocate(stream_offset + file_size)
+        part_ranges = [
+            (start, min(start + self._part_size, file_size) - 1)
+            for start in range(0, file_size, self._part_size)
+        ]
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        futures = []
+        try:
+            futures = [
+                executor.submit(self._download_range, file_version, stream_offset, start, end)
+                for start, end in part_ranges
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+        self._writeable_stream.seek(stream_offset + file_size)
+        if self._verify_sha1:
+            self._check_sha1(stream_offset, file_size, sha1)
+
+    def _preallocate(self, size):
+        """
+        Extend the stream to the size of the downloaded file up front, so that parts can be written at their offsets
+        in any order.
+
+        :param size:
+            The size of the stream once the file has been downloaded.
+        :type size:
+            `int`
+        """
+        try:
+            self._writeable_stream.truncate(size)
+        except (AttributeError, EnvironmentError, ValueError):
+            # Streams that can't be extended this way grow as the parts are written.
+            pass
+
+    def _download_range(self, file_version, stream_offset, start, end):
+        """
+        Download one range of the file and write it at its offset in the stream. If the download fails mid-way, it is
+        retried from the first byte that wasn't written yet.
+
+        :param file_version:
+            The version of the file to download.
+        :type file_version:
+            :class:`FileVersion`
+        :param stream_offset:
+            The position in the stream where the file starts.
+        :type stream_offset:
+            `int`
+        :param start:
+            The offset of the first byte of the range in the file.
+        :type start:
+            `int`
+        :param end:
+            The offset of the last byte of the range in the file.
+        :type end:
+            `int`
+        """
+        range_writer = _RangeWriter(self._writeable_stream, self._write_lock, stream_offset + start, end - start + 1)
+        attempt_number = 0
+        while range_writer.bytes_written < end - start + 1:
+            try:
+                self._file.download_to(
+                    range_writer,
+                    file_version=file_version,
+                    byte_range=(start + range_writer.bytes_written, end),
+                )
+                break
+            except _CONNECTION_ERRORS:
+                # The connection dropped while the range was being streamed.
+                attempt_number += 1
+                if attempt_number >= API.MAX_RETRY_ATTEMPTS:
+                    raise
+        if range_writer.bytes_written != end - start + 1:
+            raise BoxException('Expected {0} bytes for range {1}-{2}, got {3}.'.format(
+                end - start + 1,
+                start,
+                end,
+                range_writer.bytes_written,
+            ))
+
+    def _check_sha1(self, stream_offset, file_size, sha1):
+        """
+        Read the downloaded file back from the stream, and check its SHA-1.
+
+        :param stream_offset:
+            The position in the stream where the file starts.
+        :type stream_offset:
+            `int`
+        :param file_size:
+            The size of the file.
+        :type file_size:
+            `int`
+        :param sha1:
+            The expected hex SHA-1 digest.
+        :type sha1:
+            `unicode`
+        :raises:
+            :class:`BoxException` if the SHA-1 doesn't match.
+        """
+        content_sha1 = hashlib.sha1()
+        self._writeable_stream.seek(stream_offset)
+        remaining = file_size
+        while remaining > 0:
+            block = self._writeable_stream.read(min(remaining, self._part_size))
+            if not block:
+                break
+            content_sha1.update(block)
+            remaining -= len(block)
+        self._writeable_stream.seek(stream_offset + file_size)
+        if content_sha1.hexdigest() != sha1:
+            raise BoxException('The SHA-1 of the downloaded file is {0}, expected {1}.'.format(
+                content_sha1.hexdigest(),
+                sha1,
+            ))
+
+
+class ResumableDownloader(object):
+
+    DEFAULT_CHECKPOINT_INTERVAL = 8 * 1024 * 1024
+
+    def __init__(self, file, file_path, file_version=None, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL,
+                 verify_sha1=False):
+        # pylint:disable=redefined-builtin
+        """
+        The initializer for the :class:`ResumableDownloader`
+
+        :param file:
+            The file to download.
+        :type file:
+            :class:`File`
+        :param file_path:
+            The local path to download the file to.
+        :type file_path:
+            `unicode`
+        :param file_version:
+            The specific version of the file to download. If not specified, the current version of the file is looked
+            up when the download begins, and a resumed download continues from that same version.
+        :type file_version:
+            :class:`FileVersion` or None
+        :param checkpoint_interval:
+            How many bytes to download between checkpoints. At each checkpoint, the downloaded bytes are synced to disk
+            and recorded in a checkpoint file next to the destination.
+        :type checkpoint_interval:
+            `int`
+        :param verify_sha1:
+            Whether to check the SHA-1 of the bytes kept from a partial download against the checkpoint, and the SHA-1
+            of the complete file against the file version. Otherwise only the size of a partial download is checked.
+        :type verify_sha1:
+            `bool`
+        :returns:
+            An initialized :class:`ResumableDownloader` object.
+        :rtype:
+            :class:`ResumableDownloader`
+        """
+        if checkpoint_interval < 1:
+            raise ValueError('checkpoint_interval must be at least 1')
+        self._file = file
+        self._file_path = file_path
+        self._file_version = file_version
+        self._checkpoint_interval = checkpoint_interval
+        self._verify_sha1 = verify_sha1
+
+    @property
+    def checkpoint_path(self):
+        """
+        The local path of the checkpoint file, which exists while a download is incomplete.
+
+        :rtype:
+            `unicode`
+        """
+        return '{0}.checkpoint'.format(self._file_path)
+
+    def download(self):
+        """
+        Download the file. If a previous download to the same path was interrupted, and the bytes it kept are valid,
+        only the rest of the file is downloaded.
+
+        :raises:
+            :class:`BoxException` if `verify_sha1` was specified and the downloaded content doesn't match.
+        """
+        checkpoint = self._load_checkpoint()
+        if checkpoint is not None:
+            file_version = self._file.translator.get('file_version')(
+                session=self._file.session,
+                object_id=checkpoint['file_version_id'],
+            )
+            file_size, sha1 = checkpoint['size'], checkpoint['sha1']
+        else:
+            file_version, file_size, sha1 = _get_file_version_info(self._file, self._file_version)
+        if self._verify_sha1 and sha1 is None:
+            raise BoxException('The SHA-1 of the file version is not known, so the download cannot be verified.')
+        mode = 'r+b' if checkpoint is not None and os.path.exists(self._file_path) else 'wb'
+        with io.open(self._file_path, mode) as writeable_stream:
+            offset, content_sha1 = self._get_resume_offset(writeable_stream, checkpoint)
+            writeable_stream.truncate(offset)
+            writeable_stream.seek(offset)
+            checkpoint = {
+                'file_id': self._file.object_id,
+                'file_version_id': file_version.object_id,
+                'size': file_size,
+                'sha1': sha1,
+            }
+            self._save_checkpoint(checkpoint, offset, content_sha1)
+            checkpoint_writer = _CheckpointWriter(
+                writeable_stream,
+                content_sha1,
+                self._checkpoint_interval,
+                lambda position: self._save_checkpoint(checkpoint, position, content_sha1),
+            )
+            attempt_number = 0
+            while offset + checkpoint_writer.bytes_written < file_size:
+                try:
+                    self._file.download_to(
+                        checkpoint_writer,
+                        file_version=file_version,
+                        byte_range=(offset + checkpoint_writer.bytes_written,),
+                    )
+                    break
+                except _CONNECTION_ERRORS:
+                    # The connection dropped mid-download. Carry on from the last byte written.
+                    attempt_number += 1
+                    if attempt_number >= API.MAX_RETRY_ATTEMPTS:
+                        raise
+            if offset + checkpoint_writer.bytes_written != file_size:
+                raise BoxException('Expected {0} bytes, got {1}.'.format(
+                    file_size,
+                    offset + checkpoint_writer.bytes_written,
+                ))
+        # The checkpoint is of no use once every byte has been downloaded, even if the content turns out to be bad.
+        os.remove(self.checkpoint_path)
+        if self._verify_sha1 and content_sha1.hexdigest() != sha1:
+            raise BoxException('The SHA-1 of the downloaded file is {0}, expected {1}.'.format(
+                content_sha1.hexdigest(),
+                sha1,
+            ))
+
+    def _load_checkpoint(self):
+        """
+        Load the checkpoint of a previous download, if there is one for the same file and, if one was specified, the
+        same file version.
+
+        :returns:
+            The checkpoint, or None if there isn't a usable one.
+        :rtype:
+            `dict` or None
+        """
+        try:
+            with io.open(self.checkpoint_path, 'rb') as checkpoint_file:
+                checkpoint = json.loads(checkpoint_file.read().decode('utf-8'))
+        except (EnvironmentError, ValueError):
+            return None
+        if checkpoint.get('file_id') != self._file.object_id:
+            return None
+        if self._file_version is not None and checkpoint.get('file_version_id') != self._file_version.object_id:
+            return None
+        return checkpoint
+
+    def _get_resume_offset(self, readable_stream, checkpoint):
+        """
+        Determine how many bytes of a partial download can be kept, and rebuild the SHA-1 of those bytes.
+
+        :param readable_stream:
+            The destination file, opened for reading.
+        :type readable_stream:
+            `file`
+        :param checkpoint:
+            The checkpoint of the previous download, or None.
+        :type checkpoint:
+            `dict` or None
+        :returns:
+            The offset to continue downloading from, and the SHA-1 of the bytes before it.
+        :rtype:
+            (`int`, :class:`hashlib.sha1`)
+        """
+        content_sha1 = hashlib.sha1()
+        if checkpoint is None:
+            return 0, content_sha1
+        offset = checkpoint['offset']
+        readable_stream.seek(0, os.SEEK_END)
+        if readable_stream.tell() < offset:
+            return 0, hashlib.sha1()
+        if self._verify_sha1:
+            readable_stream.seek(0)
+            remaining = offset
+            while remaining > 0:
+                block = readable_stream.read(min(remaining, self._checkpoint_interval))
+                if not block:
+                    break
+                content_sha1.update(block)
+                remaining -= len(block)
+            if checkpoint.get('offset_sha1') not in (None, content_sha1.hexdigest()):
+                return 0, hashlib.sha1()
+        return offset, content_sha1
+
+    def _save_checkpoint(self, checkpoint, offset, content_sha1):
+        """
+        Atomically replace the checkpoint file.
+
+        :param checkpoint:
+            The part of the checkpoint that identifies the file version being downloaded.
+        :type checkpoint:
+            `dict`
+        :param offset:
+            The number of bytes that have been synced to disk.
+        :type offset:
+            `int`
+        :param content_sha1:
+            The SHA-1 of the bytes that have been synced to disk.
+        :type content_sha1:
+            :class:`hashlib.sha1`
+        """
+        checkpoint = dict(checkpoint, offset=offset)
+        # The SHA-1 of the bytes written so far is only worth keeping if it was computed from all of them.
+        checkpoint['offset_sha1'] = content_sha1.hexdigest() if self._verify_sha1 else None
+        temporary_path = '{0}.tmp'.format(self.checkpoint_path)
+        with io.open(temporary_path, 'wb') as checkpoint_file:
+            checkpoint_file.write(json.dumps(checkpoint, sort_keys=True).encode('utf-8'))
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        replace_file(temporary_path, self.checkpoint_path)
+
+
+def _get_file_version_info(file, file_version):
+    """
+    Determine the file version to download, along with its size and SHA-1.
+
+    :param file:
+        The file to download.
+    :type file:
+        :class:`File`
+    :param file_version:
+        The specific version of the file to download, or None for the current version.
+    :type file_version:
+        :class:`FileVersion` or None
+    :returns:
+        The file version, its size in bytes, and its hex SHA-1 digest, or None if it isn't known.
+    :rtype:
+        (:class:`FileVersion`, `int`, `unicode` or None)
+    """
+    # pylint:disable=redefined-builtin
+    if file_version is None:
+        file_info = file.get(fields=['file_version', 'size', 'sha1'])
+        return file_info.file_version, file_info.size, file_info.sha1
+    file_size = file_version['size'] if 'size' in file_version else _get_file_version_size(file, file_version)
+    return file_version, file_size, file_version.response_object.get('sha1')
+
+
+def _get_file_version_size(file, file_version):
+    """
+    Look up the size of a file version that was referenced only by its id, by requesting its first byte and reading
+    the size of the whole file from the Content-Range header of the response.
+
+    :param file:
+        The file to download.
+    :type file:
+        :class:`File`
+    :param file_version:
+        The version of the file.
+    :type file_version:
+        :class:`FileVersion`
+    :returns:
+        The size of the file version in bytes.
+    :rtype:
+        `int`
+    """
+    # pylint:disable=redefined-builtin
+    try:
+        box_response = file.session.get(
+            file.get_url('content'),
+            expect_json_response=False,
+            stream=True,
+            params={'version': file_version.object_id},
+            headers={'Range': 'bytes=0-0'},
+        )
+    except BoxAPIException as exception:
+        # An empty file has no first byte to download.
+        if exception.status == 416:
+            return 0
+        raise
+    box_response.network_response.response_as_stream.close()
+    content_range = box_response.headers.get('Content-Range')
+    if content_range is not None:
+        return int(content_range.rsplit('/', 1)[1])
+    return int(box_response.headers['Content-Length'])
+
+
+class _RangeWriter(object):
+    """
+    A writeable stream that writes a range of a file at its offset in a shared stream.
+    """
+
+    def __init__(self, writeable_stream, write_lock, position, max_size=None):
+        """
+        :param writeable_stream:
+            The shared stream to write into.
+        :type writeable_stream:
+            `file`
+        :param write_lock:
+            The lock that guards the position of the shared stream.
+        :type write_lock:
+            :class:`Lock`
+        :param position:
+            The position in the shared stream where the range starts.
+        :type position:
+            `int`
+        :param max_size:
+            The size of the range. Writing more than this, e.g. because the Range header was ignored, is an error.
+        :type max_size:
+            `int` or None
+        """
+        self._writeable_stream = writeable_stream
+        self._write_lock = write_lock
+        self._position = position
+        self._max_size = max_size
+        self.bytes_written = 0
+
+    def write(self, chunk):
+        """
+        Write the next chunk of the range.
+
+        :param chunk:
+            The bytes to write.
+        :type chunk:
+            `bytes`
+        """
+        if self._max_size is not None and self.bytes_written + len(chunk) > self._max_size:
+            raise BoxException('Received more bytes than requested for the range.')
+        with self._write_lock:
+            self._writeable_stream.seek(self._position + self.bytes_written)
+            self._writeable_stream.write(chunk)
+        self.bytes_written += len(chunk)
+
+
+class _CheckpointWriter(object):
+    """
+    A writeable stream that writes sequentially to a file, keeping a running SHA-1 of the file and syncing it to disk
+    at regular checkpoints.
+    """
+
+    def __init__(self, writeable_stream, content_sha1, checkpoint_interval, save_checkpoint):
+        """
+        :param writeable_stream:
+            The destination file.
+        :type writeable_stream:
+            `file`
+        :param content_sha1:
+            The running SHA-1 of the destination file.
+        :type content_sha1:
+            :class:`hashlib.sha1`
+        :param checkpoint_interval:
+            How many bytes to write between checkpoints.
+        :type checkpoint_interval:
+            `int`
+        :param save_checkpoint:
+            Called with the position of the destination file once everything before it has been synced to disk.
+        :type save_checkpoint:
+            `callable`
+        """
+        self._writeable_stream = writeable_stream
+        self._content_sha1 = content_sha1
+        self._checkpoint_interval = checkpoint_interval
+        self._save_checkpoint = save_checkpoint
+        self._bytes_since_checkpoint = 0
+        self.bytes_written = 0
+
+    def write(self, chunk):
+        """
+        Write the next chunk of the file.
+
+        :param chunk:
+            The bytes to write.
+        :type chunk:
+            `bytes`
+        """
+        self._writeable_stream.write(chunk)
+        self._content_sha1.update(chunk)
+        self.bytes_written += len(chunk)
+        self._bytes_since_checkpoint += len(chunk)
+        if self._bytes_since_checkpoint >= self._checkpoint_interval:
+            self._writeable_stream.flush()
+            os.fsync(self._writeable_stream.fileno())
+            self._save_checkpoint(self._writeable_stream.tell())
+            self._bytes_since_checkpoint = 0
@@ -0,0 +1,196 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import io
+import json
+import os
+
+from boxsdk.exception import BoxException
+from boxsdk.util.compat import replace_file
+
+
+class ChunkedUploadJournal(object):
+    """
+    An on-disk record of the progress of a chunked upload, so that the upload can be resumed by another process.
+
+    The journal is a file of JSON lines. The first line identifies the upload session, and every following line is the
+    record of a part that has been uploaded. Lines are appended and synced to disk one at a time, so a crash can at
+    worst leave a partially written last line, which is ignored when the journal is loaded.
+    """
+
+    def __init__(self, path):
+        """
+        :param path:
+            The local path of the journal file. The file does not need to exist yet.
+        :type path:
+            `unicode`
+        """
+        super(ChunkedUploadJournal, self).__init__()
+        self._path = path
+        self._header = None
+        self._parts = {}
+        self._valid_length = 0
+        self._load()
+
+    @property
+    def path(self):
+        """
+        The local path of the journal file.
+
+        :rtype:
+            `unicode`
+        """
+        return self._path
+
+    @property
+    def upload_session_id(self):
+        """
+        The id of the upload session that the journal belongs to, or None if the journal hasn't been started.
+
+        :rtype:
+            `unicode` or None
+        """
+        return self._header['upload_session_id'] if self._header is not None else None
+
+    @property
+    def file_size(self):
+        """
+        The total size of the file being uploaded, or None if the journal hasn't been started.
+
+        :rtype:
+            `int` or None
+        """
+        return self._header['file_size'] if self._header is not None else None
+
+    @property
+    def parts(self):
+        """
+        The records of the parts that have been uploaded, ordered by offset.
+
+        :rtype:
+            `list` of `dict`
+        """
+        return [self._parts[offset] for offset in sorted(self._parts)]
+
+    def start(self, upload_session_id, file_size, part_size):
+        """
+        Start journaling an upload session. If the journal already belongs to the upload session, it is kept, so that
+        the parts recorded by a previous process are not lost.
+
+        :param upload_session_id:
+            The id of the upload session.
+        :type upload_session_id:
+            `unicode`
+        :param file_size:
+            The total size of the file being uploaded.
+        :type file_size:
+            `int`
+        :param part_size:
+            The size of each part of the upload session.
+        :type part_size:
+            `int`
+        :raises:
+            :class:`BoxException` if the journal belongs to a different upload session or file.
+        """
+        header = {
+            'upload_session_id': upload_session_id,
+            'file_size': file_size,
+            'part_size': part_size,
+        }
+        if self._header is not None:
+            if self._header != header:
+                raise BoxException(
+                    'The journal at {0} belongs to upload session {1}, not {2}.'.format(
+                        self._path,
+                        self._header['upload_session_id'],
+                        upload_session_id,
+                    )
+                )
+            # Drop a partially written last line left by a crash, so that new records start on a line of their own.
+            with io.open(self._path, 'r+b') as journal_file:
+                journal_file.truncate(self._valid_length)
+            return
+        # Write the header to a temporary file first, so that a crash can't leave a journal without one.
+        temporary_path = '{0}.tmp'.format(self._path)
+        with io.open(temporary_path, 'wb') as journal_file:
+            self._valid_length = self._write_line(journal_file, header)
+        replace_file(temporary_path, self._path)
+        self._header = header
+        self._parts = {}
+
+    def record_part(self, part):
+        """
+        Record that a part has been uploaded.
+
+        :param part:
+            The uploaded part record, as returned by :meth:`UploadSession.upload_part_bytes`.
+        :type part:
+            `dict`
+        """
+        if self._header is None:
+            raise BoxException('The journal must be started before parts can be recorded.')
+        with io.open(self._path, 'ab') as journal_file:
+            self._valid_length += self._write_line(journal_file, part)
+        self._parts[part['offset']] = part
+
+    def delete(self):
+        """
+        Delete the journal, once the upload session has been committed or aborted.
+        """
+        try:
+            os.remove(self._path)
+        except OSError:
+            if os.path.exists(self._path):
+                raise
+        self._header = None
+        self._parts = {}
+        self._valid_length = 0
+
+    def _load(self):
+        """
+        Load the journal file, if it exists, ignoring a partially written last line.
+        """
+        try:
+            with io.open(self._path, 'rb') as journal_file:
+                lines = journal_file.read().splitlines(True)
+        except (IOError, OSError):
+            if os.path.exists(self._path):
+                raise
+            return
+        records = []
+        for line in lines:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                records.append(json.loads(line.decode('utf-8')))
+            except ValueError:
+                break
+            self._valid_length += len(line)
+        if records:
+            self._header = records[0]
+            self._parts = dict((part['offset'], part) for part in records[1:])
+
+    @staticmethod
+    def _write_line(journal_file, record):
+        """
+        Append a record to the journal file, and sync it to disk.
+
+        :param journal_file:
+            The journal file, opened for writing in binary mode.
+        :type journal_file:
+            `file`
+        :param record:
+            The record to append.
+        :type record:
+            `dict`
+        :returns:
+            The number of bytes written.
+        :rtype:
+            `int`
+        """
+        line = json.dumps(record, sort_keys=True).encode('utf-8') + b'\n'
+        journal_file.write(line)
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+        return len(line)
@@ -1,13 +1,27 @@
 from __future__ import unicode_literals, absolute_import
 
+from collections import OrderedDict
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
 import hashlib
+import io
+import mmap
+from operator import itemgetter
+import os
+import stat
+
+from six.moves import range  # pylint:disable=redefined-builtin
 
 from boxsdk.exception import BoxException
 
 
+# The size of the blocks in which each part is fed to the part and whole-file SHA-1s, small enough that a block is
+# still in the CPU cache when the second hash reads it.
+_HASH_BLOCK_SIZE = 64 * 1024
+
+
 class ChunkedUploader(object):
 
-    def __init__(self, upload_session, content_stream, file_size):
+    def __init__(self, upload_session, content_stream, file_size, max_workers=1, journal=None):
         """
         The initializer for the :class:`ChunkedUploader`
 
@@ -23,18 +37,34 @@ def __init__(self, upload_session, content_stream, file_size):
             The total size of the file for the chunked upload.
         :type file_size:
             `int`
+        :param max_workers:
+            The maximum number of parts to upload concurrently. Parts are always read from the stream in order, and
+            only one part is read ahead of the uploads in flight. Defaults to 1, which uploads parts one at a time.
+        :type max_workers:
+            `int`
+        :param journal:
+            An on-disk journal of the uploaded parts, so that the upload can be resumed by another process. The
+            journal is deleted once the upload session is committed or aborted.
+        :type journal:
+            :class:`ChunkedUploadJournal` or None
         :returns:
             An intialized`ChunkedUploader` object.
         :rtype:
             :class:`ChunkedUploader`
         """
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
         self._upload_session = upload_session
         self._content_stream = content_stream
         self._file_size = file_size
+        self._max_workers = max_workers
+        self._journal = journal
         self._part_array = []
         self._sha1 = hashlib.sha1()
         self._part_definitions = {}
-        self._inflight_part = None
+        self._inflight_parts = OrderedDict()
+        self._stream_offset = 0
+        self._content_map, self._content_view, self._content_view_start = _memory_map_stream(content_stream)
         self._is_aborted = False
 
     def start(self):
@@ -48,9 +78,9 @@ def start(self):
         """
         if self._is_aborted:
             raise BoxException('The upload has been previously aborted. Please retry upload with a new upload session.')
+        self._start_journal()
         self._upload()
-        content_sha1 = self._sha1.digest()
-        return self._upload_session.commit(content_sha1=content_sha1, parts=self._part_array)
+        return self._commit()
 
     def resume(self):
         """
@@ -63,20 +93,15 @@ def resume(self):
         """
         if self._is_aborted:
             raise BoxException('The upload has been previously aborted. Please retry upload with a new upload session.')
-        parts = self._upload_session.get_parts()
-        self._part_array = []
-        # Construct a part array that is the first consecutive run of uploaded parts up to an inflight part so resume
-        # has a previous state to start from for in process uploads and cross process uploads.
-        # Construct a part definition to be used later to determine if a part has been uploaded by offset.
-        for part in parts:
-            if self._inflight_part and part['offset'] <= self._inflight_part.offset:
-                self._part_array.append(part)
-            if self._inflight_part and part['offset'] == self._inflight_part.offset:
-                self._inflight_part = None
+        self._start_journal()
+        # Record every part that Box has already received, whether it was uploaded by this process or by another one.
+        # Parts that were in flight when the upload failed, and parts read again from a fresh stream, are then only
+        # uploaded if Box does not have them yet. Box's list of parts is authoritative: the journal only identifies the
+        # upload session, and a part that it records but Box doesn't list is uploaded again.
+        for part in self._upload_session.get_parts():
             self._part_definitions[part['offset']] = part
         self._upload()
-        content_sha1 = self._sha1.digest()
-        return self._upload_session.commit(content_sha1=content_sha1, parts=self._part_array)
+        return self._commit()
 
     def abort(self):
         """
@@ -87,43 +112,269 @@ def abort(self):
         :rtype:
             `bool`
         """
+        self._close_memory_map()
         self._content_stream = None
         self._part_array = []
-        self._inflight_part = None
+        self._inflight_parts.clear()
         self._is_aborted = True
-        return self._upload_session.abort()
+        is_aborted = self._upload_session.abort()
+        if self._journal is not None:
+            self._journal.delete()
+        return is_aborted
+
+    def _commit(self):
+        """
+        Commit the upload session with all of the uploaded parts, ordered by offset.
+
+        :returns:
+            An uploaded :class:`File`
+        :rtype:
+            :class:`File`
+        """
+        self._part_array = sorted(self._part_definitions.values(), key=itemgetter('offset'))
+        content_sha1 = self._sha1.digest()
+        uploaded_file = self._upload_session.commit(content_sha1=content_sha1, parts=self._part_array)
+        self._close_memory_map()
+        if self._journal is not None:
+            self._journal.delete()
+        return uploaded_file
+
+    def _close_memory_map(self):
+        """
+        Unmap the file backing the content stream, if it was memory mapped, once the upload has been committed or
+        aborted, so that the map doesn't keep the file open (and locked, on Windows) until it's garbage collected.
+        """
+        if self._content_map is None:
+            return
+        # The map can only be closed once the views of it, including the chunks of the parts, have been released.
+        for inflight_part in self._inflight_parts.values():
+            if isinstance(inflight_part.chunk, memoryview):
+                inflight_part.chunk.release()
+        self._content_view.release()
+        try:
+            self._content_map.close()
+        except BufferError:
+            # A chunk is still referenced elsewhere, so the map is closed when it's garbage collected instead.
+            pass
+        self._content_map = None
+        self._content_view = None
+
+    def _start_journal(self):
+        """
+        Start journaling the upload session, if there is a journal.
+        """
+        if self._journal is not None:
+            self._journal.start(self._upload_session.object_id, self._file_size, self._upload_session.part_size)
 
     def _upload(self):
         """
         Utility function for looping through all parts of of the upload session and uploading them.
         """
-        while len(self._part_array) < self._upload_session.total_parts:
-            # Retrieve the part inflight if it exists, if it does not exist then get the next part from the stream.
-            next_part = self._inflight_part or self._get_next_part()
-            # Set the retrieve part to the current part inflight.
-            self._inflight_part = next_part
-            self._sha1.update(next_part.chunk)
+        if self._max_workers > 1:
+            self._upload_concurrently()
+            return
+        for next_part in self._iter_pending_parts():
             # Retrieve the uploaded part if the part has already been uploaded. If not upload the current part.
             uploaded_part = self._part_definitions.get(next_part.offset) or next_part.upload()
-            self._inflight_part = None
-            # Record that the part has been uploaded.
-            self._part_array.append(uploaded_part)
-            self._part_definitions[next_part.offset] = uploaded_part
+            self._record_uploaded_part(next_part, uploaded_part)
+
+    def _upload_concurrently(self):
+        """
+        Upload the remaining parts of the upload session using a pool of `max_workers` threads.
+
+        Parts are read from the stream, and added to the whole-file SHA-1, in offset order on the calling thread;
+        only the part uploads themselves run in the pool. If a part fails to upload, the parts that did complete are
+        recorded, the remaining parts stay in flight for :meth:`resume`, and the exception is re-raised.
+        """
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        futures = {}
+        try:
+            for next_part in self._iter_pending_parts():
+                uploaded_part = self._part_definitions.get(next_part.offset)
+                if uploaded_part is not None:
+                    self._record_uploaded_part(next_part, uploaded_part)
+                    continue
+                if len(futures) >= self._max_workers:
+                    self._wait_for_part_uploads(futures, FIRST_COMPLETED)
+                futures[executor.submit(next_part.upload)] = next_part
+            self._wait_for_part_uploads(futures, ALL_COMPLETED)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _wait_for_part_uploads(self, futures, return_when):
+        """
+        Wait for part uploads to finish, and record the ones that succeeded.
+
+        :param futures:
+            A mapping from each part upload future to the :class:`InflightPart` being uploaded. Finished futures are
+            removed from it.
+        :type futures:
+            `dict`
+        :param return_when:
+            When to stop waiting, as accepted by :func:`concurrent.futures.wait`.
+        :type return_when:
+            `unicode`
+        :raises:
+            The exception raised by the first failed part upload, if any.
+        """
+        done, _ = wait(futures, return_when=return_when)
+        errors = []
+        for future in done:
+            part = futures.pop(future)
+            if future.exception() is None:
+                self._record_uploaded_part(part, future.result())
+            else:
+                errors.append(future.exception())
+        if errors:
+            raise errors[0]
+
+    def _iter_pending_parts(self):
+        """
+        Yield the parts that still need to be uploaded, in offset order. Parts left in flight by a previous attempt
+        come first, followed by the parts not yet read from the stream.
+
+        :rtype:
+            `Iterator` of :class:`InflightPart`
+        """
+        for inflight_part in list(self._inflight_parts.values()):
+            yield inflight_part
+        while self._stream_offset < self._file_size:
+            next_part = self._get_next_part()
+            self._inflight_parts[next_part.offset] = next_part
+            yield next_part
+
+    def _record_uploaded_part(self, inflight_part, uploaded_part):
+        """
+        Record that a part has been uploaded.
+
+        :param inflight_part:
+            The part that was uploaded.
+        :type inflight_part:
+            :class:`InflightPart`
+        :param uploaded_part:
+            The uploaded part record.
+        :type uploaded_part:
+            `dict`
+        """
+        self._inflight_parts.pop(inflight_part.offset, None)
+        if self._journal is not None and inflight_part.offset not in self._part_definitions:
+            self._journal.record_part(uploaded_part)
+        self._part_definitions[inflight_part.offset] = uploaded_part
 
     def _get_next_part(self):
         """
         Retrieves the next :class:`InflightPart` that needs to be uploaded
 
+        When the content stream is a regular file, the part is a :class:`memoryview` over a memory map of the file, so
+        no copy of its bytes is made. Otherwise the part is read into a buffer allocated once for the part.
+
+        Parts are read in offset order, so this is also where the whole-file SHA-1 is advanced, in the same pass that
+        computes the SHA-1 of the part itself.
+
         :returns:
             The :class:`InflightPart` object to be uploaded next.
         :rtype:
             :class:`InflightPart`
         """
+        offset = self._stream_offset
+        part_size = self._upload_session.part_size
+        if self._content_view is not None:
+            chunk = self._get_next_chunk_from_memory_map(part_size)
+        elif isinstance(self._content_stream, io.IOBase):
+            chunk = self._read_next_chunk_into_buffer(part_size)
+        else:
+            chunk = self._read_next_chunk(part_size)
+        self._stream_offset += part_size
+        # Parts that Box already has, e.g. when resuming with a fresh stream, only need to be added to the whole-file
+        # SHA-1.
+        part_sha1 = self._update_sha1(chunk, compute_part_sha1=offset not in self._part_definitions)
+        return InflightPart(offset, chunk, self._upload_session, self._file_size, part_sha1)
+
+    def _update_sha1(self, chunk, compute_part_sha1):
+        """
+        Add a chunk to the whole-file SHA-1, and optionally compute the SHA-1 of the chunk, while traversing the chunk
+        only once.
+
+        :param chunk:
+            The chunk of the file that comes next in offset order.
+        :type chunk:
+            `bytes` or :class:`memoryview`
+        :param compute_part_sha1:
+            Whether to also compute the SHA-1 of the chunk.
+        :type compute_part_sha1:
+            `bool`
+        :returns:
+            The SHA-1 digest of the chunk, or None if it was not computed.
+        :rtype:
+            `bytes` or None
+        """
+        part_sha1 = hashlib.sha1() if compute_part_sha1 else None
+        chunk = memoryview(chunk)
+        for start in range(0, len(chunk), _HASH_BLOCK_SIZE):
+            block = chunk[start:start + _HASH_BLOCK_SIZE]
+            self._sha1.update(block)
+            if part_sha1 is not None:
+                part_sha1.update(block)
+        return part_sha1.digest() if part_sha1 is not None else None
+
+    def _get_next_chunk_from_memory_map(self, part_size):
+        """
+        Slice the next chunk out of the memory mapped content stream, and advance the stream past it.
+
+        :param part_size:
+            The maximum number of bytes in the chunk.
+        :type part_size:
+            `int`
+        :rtype:
+            :class:`memoryview`
+        """
+        start = self._content_view_start + self._stream_offset
+        end = min(start + part_size, len(self._content_view))
+        self._content_stream.seek(end)
+        return self._content_view[start:end]
+
+    def _read_next_chunk_into_buffer(self, part_size):
+        """
+        Read the next chunk from the content stream directly into a buffer sized for the part.
+
+        :param part_size:
+            The maximum number of bytes in the chunk.
+        :type part_size:
+            `int`
+        :rtype:
+            :class:`memoryview`
+        """
+        chunk = memoryview(bytearray(part_size))
+        copied_length = 0
+        while copied_length < part_size:
+            bytes_read = self._content_stream.readinto(chunk[copied_length:])
+            if bytes_read is None:
+                # stream returns none when no bytes are ready currently but there are
+                # potentially more bytes in the stream to be read.
+                continue
+            if not bytes_read:
+                # stream is exhausted.
+                break
+            copied_length += bytes_read
+        return chunk[:copied_length]
+
+    def _read_next_chunk(self, part_size):
+        """
+        Read the next chunk from a content stream that only supports `read()`.
+
+        :param part_size:
+            The maximum number of bytes in the chunk.
+        :type part_size:
+            `int`
+        :rtype:
+            `bytes`
+        """
         copied_length = 0
-        chunk = b''
-        offset = len(self._part_array) * self._upload_session.part_size
-        while copied_length < self._upload_session.part_size:
-            bytes_read = self._content_stream.read(self._upload_session.part_size - copied_length)
+        pieces = []
+        while copied_length < part_size:
+            bytes_read = self._content_stream.read(part_size - copied_length)
             if bytes_read is None:
                 # stream returns none when no bytes are ready currently but there are
                 # potentially more bytes in the stream to be read.
@@ -131,14 +382,44 @@ def _get_next_part(self):
             if not bytes_read:
                 # stream is exhausted.
                 break
-            chunk += bytes_read
+            pieces.append(bytes_read)
             copied_length += len(bytes_read)
-        return InflightPart(offset, chunk, self._upload_session, self._file_size)
+        return b''.join(pieces)
+
+
+def _memory_map_stream(content_stream):
+    """
+    Memory map the regular file backing a content stream, if there is one.
+
+    :param content_stream:
+        The file-like object to upload.
+    :type content_stream:
+        :class:`File`
+    :returns:
+        The memory map, a read-only :class:`memoryview` over the whole file and the current position of the stream, or
+        `(None, None, None)` if the stream is not backed by a regular file that can be mapped.
+    :rtype:
+        (:class:`mmap.mmap`, :class:`memoryview`, `int`) or (None, None, None)
+    """
+    try:
+        fileno = content_stream.fileno()
+        if not stat.S_ISREG(os.fstat(fileno).st_mode):
+            return None, None, None
+        position = content_stream.tell()
+        content_map = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, TypeError, ValueError, EnvironmentError, mmap.error):
+        return None, None, None
+    try:
+        return content_map, memoryview(content_map), position
+    except TypeError:
+        # Python 2 memory maps do not support the buffer protocol used by memoryview.
+        content_map.close()
+        return None, None, None
 
 
 class InflightPart(object):
 
-    def __init__(self, offset, chunk, upload_session, total_size):
+    def __init__(self, offset, chunk, upload_session, total_size, sha1=None):
         """
         The initializer for the :class:`InflightPart` object.
 
@@ -149,7 +430,7 @@ def __init__(self, offset, chunk, upload_session, total_size):
         :param chunk:
             The chunk in bytes to be uploaded.
         :type chunk:
-            `bytes`
+            `bytes` or :class:`memoryview`
         :param upload_session:
             The :class:`UploadSession` for the :class:`InflightPart`.
         :type upload_session:
@@ -158,11 +439,16 @@ def __init__(self, offset, chunk, upload_session, total_size):
             The total size of the file to be chunked uploaded.
         :type total_size:
             `int`
+        :param sha1:
+            The SHA-1 digest of the chunk. If not specified, it will be calculated when the part is uploaded.
+        :type sha1:
+            `bytes` or None
         """
         self._offset = offset
         self._chunk = chunk
         self._upload_session = upload_session
         self._total_size = total_size
+        self._sha1 = sha1
 
     @property
     def offset(self):
@@ -178,6 +464,13 @@ def chunk(self):
         """
         return self._chunk
 
+    @property
+    def sha1(self):
+        """
+        Getter for the SHA-1 digest of the chunk of the :class:`InflightPart`
+        """
+        return self._sha1
+
     def upload(self):
         """
         Upload method for the :class:`InflightPart`
@@ -190,5 +483,6 @@ def upload(self):
         return self._upload_session.upload_part_bytes(
             part_bytes=self.chunk,
             offset=self.offset,
-            total_size=self._total_size
+            total_size=self._total_size,
+            part_content_sha1=self.sha1,
         )
@@ -0,0 +1,146 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from array import array
+from collections import OrderedDict
+
+from six import text_type
+from six.moves import zip  # pylint:disable=redefined-builtin
+
+
+def _get_int64_typecode():
+    """
+    Get an :class:`array` typecode that holds 64-bit integers. The 'q' typecode isn't available before Python 3.3, so
+    'l' is used instead where it is 64 bits wide, and 'd' otherwise, which holds integers exactly up to 2**53.
+
+    :rtype:
+        `unicode`
+    """
+    for typecode in ('q', 'l'):
+        try:
+            if array(str(typecode)).itemsize >= 8:
+                return typecode
+        except ValueError:
+            pass
+    return 'd'
+
+
+_INT64_TYPECODE = _get_int64_typecode()
+
+
+class ColumnBuilder(object):
+    """
+    Builds columns of the values of fields of Box API entries, e.g. the items of a folder, for analysis as a table.
+
+    Entries are added one at a time, and only the values of the requested fields are kept. A field can be nested, e.g.
+    'parent.id' for the ID of the parent folder of an item. Numeric fields can be stored in typed :class:`array`
+    columns, which hold the numbers themselves instead of a Python object for each of them. The values of other fields
+    are stored in lists; strings of fields with few distinct values, like `type`, are interned, so each distinct value
+    is only held once by the builder.
+    """
+
+    # The typecodes of fields that are stored in typed arrays, when no typecodes are given.
+    DEFAULT_TYPECODES = {
+        'size': _INT64_TYPECODE,
+        'space_amount': _INT64_TYPECODE,
+        'space_used': _INT64_TYPECODE,
+        'max_upload_size': _INT64_TYPECODE,
+    }
+
+    # Fields that have few distinct values, whose strings are interned.
+    _INTERNED_FIELDS = frozenset(['type', 'event_type', 'item_status', 'role', 'status'])
+
+    def __init__(self, fields, typecodes=None):
+        """
+        :param fields:
+            The names of the fields to build columns of. Nested fields are separated by '.', e.g. 'parent.id'.
+        :type fields:
+            `Iterable` of `unicode`
+        :param typecodes:
+            The :class:`array` typecode of each field that should be stored in a typed array, e.g. `{'size': 'q'}` to
+            store sizes as 64-bit integers on Python 3. Missing values are stored as NaN for floating-point typecodes, and as 0 for
+            integer typecodes. Defaults to :attr:`DEFAULT_TYPECODES`.
+        :type typecodes:
+            `dict` of `unicode` to `unicode` or None
+        """
+        super(ColumnBuilder, self).__init__()
+        if typecodes is None:
+            typecodes = self.DEFAULT_TYPECODES
+        self._fields = list(fields)
+        self._paths = [field.split('.') for field in self._fields]
+        self._columns = []
+        self._missing_values = []
+        self._interned = {}
+        for field in self._fields:
+            typecode = typecodes.get(field, None)
+            if typecode is None:
+                self._columns.append([])
+                self._missing_values.append(None)
+            else:
+                self._columns.append(array(str(typecode)))
+                self._missing_values.append(float('nan') if typecode in ('f', 'd') else 0)
+
+    def add(self, entry):
+        """
+        Add the values of the fields of an entry to the columns.
+
+        :param entry:
+            The entry, as returned by the Box API, or translated into a Box object.
+        :type entry:
+            `dict` or :class:`BaseAPIJSONObject`
+        """
+        for path, column, missing_value in zip(self._paths, self._columns, self._missing_values):
+            value = entry
+            for key in path:
+                try:
+                    value = value[key]
+                except (KeyError, TypeError):
+                    value = None
+                    break
+            if value is None:
+                value = missing_value
+            elif path[-1] in self._INTERNED_FIELDS and isinstance(value, (bytes, text_type)):
+                value = self._interned.setdefault(value, value)
+            column.append(value)
+
+    def add_all(self, entries):
+        """
+        Add the values of the fields of each of the entries to the columns.
+
+        :param entries:
+            The entries, as returned by the Box API, or translated into Box objects.
+        :type entries:
+            `Iterable` of `dict` or :class:`BaseAPIJSONObject`
+        """
+        for entry in entries:
+            self.add(entry)
+
+    @property
+    def columns(self):
+        """
+        The column of each field.
+
+        :rtype:
+            :class:`OrderedDict` of `unicode` to `list` or :class:`array`
+        """
+        return OrderedDict(zip(self._fields, self._columns))
+
+    def to_arrays(self):
+        """
+        Convert the columns to NumPy arrays. Typed columns are converted without copying them; the other columns are
+        converted to arrays of objects. Requires NumPy.
+
+        :rtype:
+            :class:`OrderedDict` of `unicode` to :class:`numpy.ndarray`
+        """
+        # NumPy is only needed for this method, so it's imported here, instead of requiring it for the whole SDK.
+        import numpy  # pylint:disable=import-outside-toplevel,import-error
+        arrays = OrderedDict()
+        for field, column in zip(self._fields, self._columns):
+            if isinstance(column, array):
+                arrays[field] = numpy.frombuffer(column, dtype=numpy.dtype(str(column.typecode)))
+            else:
+                arrays[field] = numpy.empty(len(column), dtype=object)
+                arrays[field][:] = column
+        return arrays
@@ -2,6 +2,8 @@
 
 from __future__ import absolute_import, division, unicode_literals
 
+import os
+
 import six
 from six.moves import map
 
@@ -9,6 +11,22 @@
 NoneType = type(None)
 
 
+def replace_file(source_path, destination_path):
+    """Atomically replace the destination file with the source file.
+
+    Python 2 has no ``os.replace()``; ``os.rename()`` does the same on POSIX,
+    but fails on Windows if the destination exists.
+
+    :type source_path:        `unicode`
+    :type destination_path:   `unicode`
+    """
+    try:
+        replace = os.replace
+    except AttributeError:
+        replace = os.rename
+    replace(source_path, destination_path)
+
+
 def with_metaclass(meta, *bases, **with_metaclass_kwargs):
     """Extends the behavior of six.with_metaclass.
 
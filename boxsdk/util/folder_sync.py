@@ -0,0 +1,457 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from collections import defaultdict
+import io
+import json
+import os
+
+from requests.exceptions import Timeout
+
+from ..exception import BoxException
+from ..object.base_api_json_object import BaseAPIJSONObject
+from ..object.events import Events, UserEventsStreamType
+from .compat import replace_file
+
+
+class FolderTreeSync(object):
+    """
+    A local index of the tree of items below a Box folder, kept up to date with the events stream instead of rescans.
+
+    :meth:`snapshot` lists the whole tree, with :meth:`Folder.walk`, and records the position of the events stream
+    from just before the listing. :meth:`sync` then applies the events since that position to the index: items that
+    are created, uploaded, renamed, moved, copied, trashed or restored are updated directly from the item in the event.
+    A folder is only listed again when an event can't be applied on its own, e.g. when a folder with contents is moved
+    into the tree, or when an item's parent isn't in the index yet because the events arrived out of order.
+
+    The index and the stream position are saved to a JSON file after every snapshot and sync, so another process can
+    pick up where the last one left off. Applying an event more than once has no further effect, so events received
+    again after a crash are harmless.
+    """
+
+    # The fields of each item that are kept in the index, when no fields are given.
+    DEFAULT_FIELDS = ('type', 'id', 'name', 'etag', 'sha1', 'size', 'modified_at')
+
+    # The events that change the tree. Other events, e.g. downloads and previews, are ignored.
+    _ITEM_EVENT_TYPES = frozenset([
+        'ITEM_CREATE',
+        'ITEM_UPLOAD',
+        'ITEM_RENAME',
+        'ITEM_MOVE',
+        'ITEM_COPY',
+        'ITEM_TRASH',
+        'ITEM_UNDELETE_VIA_TRASH',
+    ])
+
+    # The number of events to request at a time. The changes stream returns at most 500.
+    _EVENTS_LIMIT = 500
+
+    def __init__(self, folder, path, fields=None, max_workers=4):
+        """
+        :param folder:
+            The folder whose tree to index.
+        :type folder:
+            :class:`Folder`
+        :param path:
+            The local path of the index file. If it exists, and belongs to the same folder, the index is loaded from it.
+        :type path:
+            `unicode`
+        :param fields:
+            The fields of each item to keep in the index. The type, ID and parent ID of each item are always kept.
+            Defaults to :attr:`DEFAULT_FIELDS`.
+        :type fields:
+            `Iterable` of `unicode` or None
+        :param max_workers:
+            The maximum number of folders to list concurrently, when listing the tree.
+        :type max_workers:
+            `int`
+        :raises:
+            :class:`BoxException` if the index file belongs to a different folder.
+        """
+        super(FolderTreeSync, self).__init__()
+        self._folder = folder
+        self._path = path
+        self._fields = ['type', 'id'] + [field for field in (fields or self.DEFAULT_FIELDS) if field not in ('type', 'id')]
+        self._max_workers = max_workers
+        self._events = Events(folder.session)
+        self._stream_position = None
+        self._items = {}
+        self._children = defaultdict(set)
+        self._stale_folder_ids = set()
+        self._load()
+
+    @property
+    def folder_id(self):
+        """
+        The ID of the folder whose tree is indexed.
+
+        :rtype:
+            `unicode`
+        """
+        return self._folder.object_id
+
+    @property
+    def _folder_key(self):
+        """
+        The key of the folder whose tree is indexed. Items are keyed by their type and ID, since files, folders and web
+        links have separate ID spaces.
+
+        :rtype:
+            (`unicode`, `unicode`)
+        """
+        return 'folder', self.folder_id
+
+    @property
+    def stream_position(self):
+        """
+        The position in the events stream up to which events have been applied, or None before the first snapshot.
+
+        :rtype:
+            `int` or None
+        """
+        return self._stream_position
+
+    @property
+    def items(self):
+        """
+        The index of the items in the tree, not including the folder itself, by their type and ID, e.g.
+        `('file', '12345')`. Each item is a `dict` of its fields, and the ID of its parent folder, as 'parent_id'. The
+        index must not be modified.
+
+        :rtype:
+            `dict` of (`unicode`, `unicode`) to `dict`
+        """
+        return self._items
+
+    def get_path(self, item_type, item_id):
+        """
+        Get the names of the folders from the indexed folder down to an item, and the name of the item itself.
+
+        :param item_type:
+            The type of an item in the index, e.g. 'file'.
+        :type item_type:
+            `unicode`
+        :param item_id:
+            The ID of the item.
+        :type item_id:
+            `unicode`
+        :rtype:
+            `list` of `unicode`
+        :raises:
+            :class:`KeyError` if the item isn't in the index.
+        """
+        names = []
+        item_key = (item_type, item_id)
+        while item_key != self._folder_key:
+            item = self._items[item_key]
+            names.append(item.get('name'))
+            item_key = ('folder', item['parent_id'])
+        names.reverse()
+        return names
+
+    def snapshot(self):
+        """
+        List the whole tree, replacing the index, and save it.
+        """
+        # The position is taken before listing, so that changes made during the listing are applied by the next sync.
+        self._stream_position = self._events.get_latest_stream_position(stream_type=UserEventsStreamType.CHANGES)
+        self._relist(self.folder_id)
+        self._stale_folder_ids.clear()
+        self.save()
+
+    def sync(self):
+        """
+        Apply the events since the last snapshot or sync to the index, list the folders that the events couldn't be
+        applied to, and save the index. Takes a snapshot if there hasn't been one yet.
+
+        :returns:
+            The events that were applied.
+        :rtype:
+            `list` of :class:`Event`
+        """
+        if self._stream_position is None:
+            self.snapshot()
+            return []
+        applied_events = []
+        while True:
+            events = self._events.get_events(
+                limit=self._EVENTS_LIMIT,
+                stream_position=self._stream_position,
+                stream_type=UserEventsStreamType.CHANGES,
+            )
+            for event in events['entries']:
+                self.apply_event(event)
+                applied_events.append(event)
+            self._stream_position = events['next_stream_position']
+            if len(events['entries']) < self._EVENTS_LIMIT:
+                break
+        self._relist_stale_folders()
+        self.save()
+        return applied_events
+
+    def listen(self):
+        """
+        Keep the index up to date as changes happen, by long polling the events stream, and syncing whenever Box reports
+        new changes.
+
+        :returns:
+            The events that were applied, as soon as the index has been saved with them.
+        :rtype:
+            `Iterator` of :class:`Event`
+        """
+        if self._stream_position is None:
+            self.snapshot()
+        while True:
+            options = self._events.get_long_poll_options(stream_type=UserEventsStreamType.CHANGES)
+            while True:
+                try:
+                    long_poll_response = self._events.long_poll(options, self._stream_position)
+                except Timeout:
+                    break
+                message = long_poll_response.json()['message']
+                if message == 'reconnect':
+                    continue
+                if message == 'new_change':
+                    for event in self.sync():
+                        yield event
+                break
+
+    def apply_event(self, event):
+        """
+        Apply an event to the index, without saving it. Events that don't change the tree are ignored.
+
+        :param event:
+            An event from the events stream.
+        :type event:
+            :class:`Event` or `dict`
+        :returns:
+            False if the event couldn't be applied on its own, and the folder it belongs to will be listed again by the
+            next :meth:`sync`, or True otherwise.
+        :rtype:
+            `bool`
+        """
+        item = self._get_changed_item(event)
+        if item is None:
+            return True
+        item_key = (item['type'], item['id'])
+        if item_key == self._folder_key:
+            if event['event_type'] == 'ITEM_TRASH':
+                self._remove_descendants(self.folder_id)
+            return True
+        parent = item.get('parent')
+        if event['event_type'] == 'ITEM_TRASH' or item.get('item_status', 'active') != 'active' or not parent:
+            self._remove(item_key)
+            return True
+        parent_id = parent['id']
+        if not self._is_folder_in_tree(parent_id):
+            # The item isn't in the tree, has been moved out of it, or is in a folder that hasn't been indexed yet.
+            self._remove(item_key)
+            return not self._mark_closest_ancestor_stale(item)
+        is_new = item_key not in self._items
+        self._add(item, parent_id)
+        if is_new and item['type'] == 'folder' and event['event_type'] != 'ITEM_CREATE':
+            # A folder that was moved, copied or restored into the tree can have contents, which have no events of
+            # their own.
+            self._stale_folder_ids.add(item['id'])
+            return False
+        return True
+
+    def save(self):
+        """
+        Save the index and the stream position to the index file.
+        """
+        index = {
+            'folder_id': self.folder_id,
+            'stream_position': self._stream_position,
+            'items': list(self._items.values()),
+        }
+        # Write the index to a temporary file first, so that a crash can't leave a partially written index.
+        temporary_path = '{0}.tmp'.format(self._path)
+        with io.open(temporary_path, 'wb') as index_file:
+            index_file.write(json.dumps(index).encode('utf-8'))
+            index_file.flush()
+            os.fsync(index_file.fileno())
+        replace_file(temporary_path, self._path)
+
+    def _load(self):
+        """
+        Load the index file, if it exists.
+        """
+        try:
+            with io.open(self._path, 'rb') as index_file:
+                index = json.loads(index_file.read().decode('utf-8'))
+        except (IOError, OSError):
+            if os.path.exists(self._path):
+                raise
+            return
+        if index['folder_id'] != self.folder_id:
+            raise BoxException('The index at {0} belongs to folder {1}, not {2}.'.format(
+                self._path,
+                index['folder_id'],
+                self.folder_id,
+            ))
+        self._stream_position = index['stream_position']
+        for item in index['items']:
+            item_key = (item['type'], item['id'])
+            self._items[item_key] = item
+            self._children[item['parent_id']].add(item_key)
+
+    def _get_changed_item(self, event):
+        """
+        Get the item that an event changed, if it changes the tree.
+
+        :param event:
+            An event from the events stream.
+        :type event:
+            :class:`Event` or `dict`
+        :returns:
+            The JSON of the item, or None if the event doesn't change the tree.
+        :rtype:
+            `dict` or None
+        """
+        if event['event_type'] not in self._ITEM_EVENT_TYPES or 'source' not in event:
+            return None
+        item = event['source']
+        if isinstance(item, BaseAPIJSONObject):
+            item = item.response_object
+        if not isinstance(item, dict) or item.get('type') not in ('file', 'folder', 'web_link'):
+            return None
+        return item
+
+    def _mark_closest_ancestor_stale(self, item):
+        """
+        Mark the closest indexed ancestor of an item as needing to be listed again, if the item is in the tree.
+
+        :param item:
+            The JSON of the item, including its path collection.
+        :type item:
+            `dict`
+        :returns:
+            Whether the item is in the tree.
+        :rtype:
+            `bool`
+        """
+        ancestor_ids = [ancestor['id'] for ancestor in item.get('path_collection', {}).get('entries', [])]
+        if self.folder_id not in ancestor_ids:
+            return False
+        for ancestor_id in reversed(ancestor_ids):
+            if self._is_folder_in_tree(ancestor_id):
+                self._stale_folder_ids.add(ancestor_id)
+                break
+        return True
+
+    def _relist_stale_folders(self):
+        """
+        List the folders that events couldn't be applied to, skipping the ones whose ancestors are listed anyway.
+        """
+        stale_folder_ids, self._stale_folder_ids = self._stale_folder_ids, set()
+        for folder_id in stale_folder_ids:
+            if not self._is_folder_in_tree(folder_id):
+                continue
+            ancestor_id = self._get_parent_id(folder_id)
+            while ancestor_id is not None and ancestor_id not in stale_folder_ids:
+                ancestor_id = self._get_parent_id(ancestor_id)
+            if ancestor_id is None:
+                self._relist(folder_id)
+
+    def _relist(self, folder_id):
+        """
+        List the tree below a folder, replacing its descendants in the index.
+
+        :param folder_id:
+            The ID of the folder, which must be in the tree.
+        :type folder_id:
+            `unicode`
+        """
+        self._remove_descendants(folder_id)
+        folder = self._folder if folder_id == self.folder_id else self._folder.translator.get('folder')(
+            session=self._folder.session,
+            object_id=folder_id,
+        )
+        for listed_folder, subfolders, files in folder.walk(max_workers=self._max_workers, fields=self._fields):
+            for item in subfolders + files:
+                self._add(item.response_object, listed_folder.object_id)
+
+    def _get_parent_id(self, folder_id):
+        """
+        Get the ID of the parent of a folder in the tree.
+
+        :param folder_id:
+            The ID of the folder, which must be in the tree.
+        :type folder_id:
+            `unicode`
+        :returns:
+            The ID of the parent folder, or None for the indexed folder.
+        :rtype:
+            `unicode` or None
+        """
+        if folder_id == self.folder_id:
+            return None
+        return self._items[('folder', folder_id)]['parent_id']
+
+    def _is_folder_in_tree(self, folder_id):
+        """
+        Check whether a folder is the indexed folder, or a folder in the index.
+
+        :param folder_id:
+            The ID of the folder.
+        :type folder_id:
+            `unicode`
+        :rtype:
+            `bool`
+        """
+        return folder_id == self.folder_id or ('folder', folder_id) in self._items
+
+    def _add(self, item, parent_id):
+        """
+        Add an item to the index, or update it, moving it to its new parent if it has moved.
+
+        :param item:
+            The JSON of the item.
+        :type item:
+            `dict`
+        :param parent_id:
+            The ID of the parent folder of the item.
+        :type parent_id:
+            `unicode`
+        """
+        record = dict((field, item[field]) for field in self._fields if field in item and field != 'parent')
+        record['parent_id'] = parent_id
+        item_key = (record['type'], record['id'])
+        previous_record = self._items.get(item_key)
+        if previous_record is not None:
+            self._children[previous_record['parent_id']].discard(item_key)
+        self._items[item_key] = record
+        self._children[parent_id].add(item_key)
+
+    def _remove(self, item_key):
+        """
+        Remove an item, and everything below it, from the index, if it's in it.
+
+        :param item_key:
+            The type and ID of the item.
+        :type item_key:
+            (`unicode`, `unicode`)
+        """
+        record = self._items.pop(item_key, None)
+        if record is not None:
+            self._children[record['parent_id']].discard(item_key)
+            item_type, item_id = item_key
+            if item_type == 'folder':
+                self._remove_descendants(item_id)
+
+    def _remove_descendants(self, folder_id):
+        """
+        Remove everything below a folder from the index.
+
+        :param folder_id:
+            The ID of the folder.
+        :type folder_id:
+            `unicode`
+        """
+        folder_ids = [folder_id]
+        while folder_ids:
+            for child_type, child_id in self._children.pop(folder_ids.pop(), ()):
+                if self._items.pop((child_type, child_id), None) is not None and child_type == 'folder':
+                    folder_ids.append(child_id)
@@ -0,0 +1,163 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import codecs
+import json
+
+from six import text_type
+
+
+class StreamedJSONPage(object):
+    """
+    Incrementally parses a JSON page of entries from Box, e.g. `{"total_count": 2, "entries": [{...}, {...}]}`, as its
+    bytes are received, so that only one entry at a time has to be held in memory, instead of the whole page.
+
+    The entries are returned one by one by :meth:`entries`. The other values in the page, e.g. `next_marker` or
+    `total_count`, are collected in :attr:`metadata`, which is complete once all the entries have been returned.
+    """
+
+    _WHITESPACE = ' \t\n\r'
+
+    def __init__(self, chunks, entries_key='entries'):
+        """
+        :param chunks:
+            The bytes of the page, in the order they were received.
+        :type chunks:
+            `Iterable` of `bytes`
+        :param entries_key:
+            The key in the page whose value is the array of entries.
+        :type entries_key:
+            `unicode`
+        """
+        super(StreamedJSONPage, self).__init__()
+        self._chunks = iter(chunks)
+        self._entries_key = entries_key
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._exhausted = False
+        self.metadata = {}
+
+    def entries(self):
+        """
+        Parse the page, returning each of its entries as soon as it has been received.
+
+        Once all the entries have been returned, the rest of the page is parsed, so that :attr:`metadata` is complete.
+
+        :returns:
+            The parsed entries.
+        :rtype:
+            `Iterator` of `dict`
+        :raises:
+            :class:`ValueError` if the page isn't a JSON object.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._expect('}')
+            return
+        while True:
+            key = self._read_value()
+            if not isinstance(key, text_type):
+                raise ValueError('Expected a key at position {0}'.format(self._position))
+            self._expect(':')
+            if key == self._entries_key:
+                for entry in self._read_array():
+                    yield entry
+            else:
+                self.metadata[key] = self._read_value()
+            if self._expect(',', '}') == '}':
+                return
+
+    def _read_array(self):
+        """
+        Parse an array, returning each of its elements as soon as it has been received.
+
+        :rtype:
+            `Iterator`
+        """
+        self._expect('[')
+        if self._peek() == ']':
+            self._expect(']')
+            return
+        while True:
+            yield self._read_value()
+            if self._expect(',', ']') == ']':
+                return
+
+    def _read_value(self):
+        """
+        Parse the next JSON value, reading more of the page until all of it has been received.
+
+        :rtype:
+            varies
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+            except ValueError:
+                if not self._read_chunk():
+                    raise
+                continue
+            # A number at the end of the buffer might continue in the next chunk.
+            if end < len(self._buffer) or not self._read_chunk():
+                self._position = end
+                return value
+
+    def _expect(self, *characters):
+        """
+        Parse one of the given structural characters, e.g. the ',' between two values.
+
+        :param characters:
+            The characters that may come next.
+        :type characters:
+            `tuple` of `unicode`
+        :returns:
+            The character that was parsed.
+        :rtype:
+            `unicode`
+        """
+        character = self._peek()
+        if character not in characters:
+            raise ValueError('Expected {0} at position {1}'.format(' or '.join(characters), self._position))
+        self._position += 1
+        return character
+
+    def _peek(self):
+        """
+        Skip whitespace, and return the next character, reading more of the page if needed.
+
+        :returns:
+            The next character, or '' if the page has ended.
+        :rtype:
+            `unicode`
+        """
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in self._WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer) or not self._read_chunk():
+                return self._buffer[self._position:self._position + 1]
+
+    def _read_chunk(self):
+        """
+        Add the next chunk of the page to the buffer.
+
+        :returns:
+            False if the page has ended.
+        :rtype:
+            `bool`
+        """
+        if self._exhausted:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self._exhausted = True
+            self._buffer += self._decoder.decode(b'', final=True)
+            return False
+        # Only the part of the buffer that hasn't been parsed yet is kept.
+        self._buffer = self._buffer[self._position:] + self._decoder.decode(chunk)
+        self._position = 0
+        return True
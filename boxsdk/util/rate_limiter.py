@@ -0,0 +1,153 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import, division
+
+from threading import Lock
+import time
+
+from .text_enum import TextEnum
+
+
+class EndpointClass(TextEnum):
+    """The classes of Box API endpoints that have separate rate limits."""
+    API = 'api'
+    UPLOAD = 'upload'
+    SEARCH = 'search'
+
+
+class TokenBucket(object):
+    """
+    A token bucket, for limiting the rate at which requests are made.
+
+    The bucket holds up to `capacity` tokens, and is refilled at `rate` tokens per second. Each request takes a token
+    from the bucket. When the bucket is empty, the request reserves the next token to be added to it, and waits until
+    then. Requests therefore never wait longer than needed, and a burst of up to `capacity` requests can be made
+    without waiting.
+
+    The bucket is thread-safe, so it can be shared by the sessions of many threads. To share one bucket between
+    processes, use a :class:`RedisTokenBucket`.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        :param rate:
+            The number of tokens added to the bucket per second, i.e. the sustained number of requests per second.
+        :type rate:
+            `float`
+        :param capacity:
+            The maximum number of tokens in the bucket, i.e. the number of requests that can be made at once after the
+            bucket has been unused for a while. Defaults to one second's worth of tokens, and at least 1.
+        :type capacity:
+            `float` or None
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if capacity is None:
+            capacity = max(rate, 1)
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        super(TokenBucket, self).__init__()
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._timestamp = None
+        self._lock = Lock()
+
+    @property
+    def rate(self):
+        """
+        The number of tokens added to the bucket per second.
+
+        :rtype:
+            `float`
+        """
+        return self._rate
+
+    @property
+    def capacity(self):
+        """
+        The maximum number of tokens in the bucket.
+
+        :rtype:
+            `float`
+        """
+        return self._capacity
+
+    def acquire(self):
+        """
+        Take a token from the bucket, waiting until one is available.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def reserve(self):
+        """
+        Take a token from the bucket, or reserve the next one to be added to it, without waiting.
+
+        :returns:
+            The number of seconds to wait before the token may be used.
+        :rtype:
+            `float`
+        """
+        with self._lock:
+            now = time.time()
+            tokens = self._tokens
+            if self._timestamp is not None:
+                tokens = min(self._capacity, tokens + (now - self._timestamp) * self._rate)
+            self._timestamp = now
+            # The bucket goes into debt for reserved tokens, so later requests wait for them to be added first.
+            self._tokens = tokens - 1
+            return max(0, (1 - tokens) / self._rate)
+
+
+class RateLimiter(object):
+    """
+    Limits the rate of requests to each class of Box API endpoint, with a :class:`TokenBucket` for each.
+
+    Pass a rate limiter to a :class:`Session` to have the session wait for a token before making each request, including
+    retried requests. Sessions that share a rate limiter share its limits, so one rate limiter can be used by all of the
+    sessions of a process (and, with :class:`RedisTokenBucket` buckets, by many processes) to keep their requests under
+    the rate limits of the app, instead of relying on 429 Too Many Requests responses.
+    """
+
+    def __init__(self, buckets):
+        """
+        :param buckets:
+            The token bucket for each class of endpoint whose requests should be limited, e.g.
+            `{EndpointClass.API: TokenBucket(15), EndpointClass.UPLOAD: TokenBucket(4)}`. Requests to other endpoints
+            aren't limited.
+        :type buckets:
+            `dict` of :class:`EndpointClass` to :class:`TokenBucket`
+        """
+        super(RateLimiter, self).__init__()
+        self._buckets = dict(buckets)
+
+    def acquire(self, endpoint_class):
+        """
+        Wait until a request may be made to an endpoint of the given class.
+
+        :param endpoint_class:
+            The class of endpoint that the request is for, or None if it isn't for any of them.
+        :type endpoint_class:
+            :class:`EndpointClass` or None
+        """
+        bucket = self._buckets.get(endpoint_class)
+        if bucket is not None:
+            bucket.acquire()
+
+    def reserve(self, endpoint_class):
+        """
+        Reserve a request to an endpoint of the given class, without waiting.
+
+        :param endpoint_class:
+            The class of endpoint that the request is for, or None if it isn't for any of them.
+        :type endpoint_class:
+            :class:`EndpointClass` or None
+        :returns:
+            The number of seconds to wait before making the request.
+        :rtype:
+            `float`
+        """
+        bucket = self._buckets.get(endpoint_class)
+        return bucket.reserve() if bucket is not None else 0
@@ -0,0 +1,65 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from hashlib import sha1
+
+from redis import StrictRedis
+
+from .response_cache import ResponseCacheStorage
+
+
+class RedisResponseCacheStorage(ResponseCacheStorage):
+    """
+    Stores the values of a :class:`ResponseCache` in Redis, so that they can be shared by many processes, e.g. all of
+    the workers of an app.
+
+    Values are dropped by Redis according to its `maxmemory-policy`, e.g. `allkeys-lru`, and after `expiry` seconds.
+    """
+
+    def __init__(self, key_prefix='boxsdk:response_cache:', expiry=None, redis_server=None):
+        """
+        :param key_prefix:
+            The prefix of the Redis keys to store the values at. Processes that wish to share a cache must use the same
+            prefix.
+        :type key_prefix:
+            `unicode`
+        :param expiry:
+            The number of seconds after which Redis drops a value that hasn't been stored again, or None to keep values
+            until Redis needs the memory.
+        :type expiry:
+            `int` or None
+        :param redis_server:
+            An instance of a Redis server, configured to talk to Redis.
+        :type redis_server:
+            :class:`Redis`
+        """
+        super(RedisResponseCacheStorage, self).__init__()
+        self._key_prefix = key_prefix
+        self._expiry = expiry
+        self._redis_server = redis_server or StrictRedis()
+
+    def get(self, key):
+        """Base class override."""
+        return self._redis_server.get(self._get_redis_key(key))
+
+    def set(self, key, value):
+        """Base class override."""
+        self._redis_server.set(self._get_redis_key(key), value, ex=self._expiry)
+
+    def delete(self, key):
+        """Base class override."""
+        self._redis_server.delete(self._get_redis_key(key))
+
+    def _get_redis_key(self, key):
+        """
+        Get the Redis key that the value of a key is stored at.
+
+        :param key:
+            The key.
+        :type key:
+            `unicode`
+        :rtype:
+            `unicode`
+        """
+        return '{0}{1}'.format(self._key_prefix, sha1(key.encode('utf-8')).hexdigest())
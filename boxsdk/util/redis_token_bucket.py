@@ -0,0 +1,78 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import time
+
+from redis import StrictRedis
+
+from .rate_limiter import TokenBucket
+
+
+class RedisTokenBucket(TokenBucket):
+    """
+    A token bucket stored in Redis, so that it can be shared by many processes, e.g. all of the workers of an app.
+
+    Tokens are taken from the bucket by a Lua script, so taking a token is a single atomic round trip to Redis. The
+    clocks of the processes sharing the bucket are used to refill it, so they should be kept in sync.
+    """
+
+    _RESERVE_SCRIPT = """
+        local rate = tonumber(ARGV[1])
+        local capacity = tonumber(ARGV[2])
+        local now = tonumber(ARGV[3])
+        local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'timestamp')
+        local tokens = tonumber(bucket[1]) or capacity
+        local timestamp = tonumber(bucket[2]) or now
+        tokens = math.min(capacity, tokens + math.max(0, now - timestamp) * rate) - 1
+        redis.call('HMSET', KEYS[1], 'tokens', tostring(tokens), 'timestamp', tostring(math.max(now, timestamp)))
+        -- Once the bucket has refilled, including repaying any reserved tokens, it's the same as a new bucket, so
+        -- Redis can drop it.
+        redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+        return tostring(math.max(0, -tokens / rate))
+    """
+
+    def __init__(self, key, rate, capacity=None, redis_server=None):
+        """
+        :param key:
+            The Redis key to store the bucket at. Processes that wish to share a bucket must use the same key.
+        :type key:
+            `unicode`
+        :param rate:
+            The number of tokens added to the bucket per second.
+        :type rate:
+            `float`
+        :param capacity:
+            The maximum number of tokens in the bucket. Defaults to one second's worth of tokens, and at least 1.
+        :type capacity:
+            `float` or None
+        :param redis_server:
+            An instance of a Redis server, configured to talk to Redis.
+        :type redis_server:
+            :class:`Redis`
+        """
+        super(RedisTokenBucket, self).__init__(rate, capacity)
+        self._key = key
+        self._redis_server = redis_server or StrictRedis()
+        self._reserve_script = self._redis_server.register_script(self._RESERVE_SCRIPT)
+
+    @property
+    def key(self):
+        """
+        The Redis key that the bucket is stored at.
+
+        :rtype:
+            `unicode`
+        """
+        return self._key
+
+    def reserve(self):
+        """Base class override.
+
+        Take a token from the bucket in Redis, or reserve the next one to be added to it.
+        """
+        delay = self._reserve_script(
+            keys=[self._key],
+            args=[repr(float(self._rate)), repr(float(self._capacity)), repr(time.time())],
+        )
+        return float(delay)
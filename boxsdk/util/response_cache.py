@@ -0,0 +1,633 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from hashlib import sha1
+import io
+import json
+from logging import getLogger
+import os
+import tempfile
+from threading import Lock
+import time
+
+from six import add_metaclass, BytesIO
+from six.moves.urllib.parse import urlencode  # pylint:disable=import-error
+
+from ..network.network_interface import NetworkResponse
+from .compat import replace_file
+
+
+@add_metaclass(ABCMeta)
+class ResponseCacheStorage(object):
+    """
+    Abstract base class specifying the interface of the storage of a :class:`ResponseCache`.
+
+    The storage maps keys to values, which are both opaque to it. Storages are free to drop values at any time, e.g. to
+    stay under a size limit, but must be thread-safe.
+    """
+
+    @abstractmethod
+    def get(self, key):
+        """
+        Get the value stored for a key.
+
+        :param key:
+            The key.
+        :type key:
+            `unicode`
+        :returns:
+            The value, or None if there isn't one.
+        :rtype:
+            `bytes` or None
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def set(self, key, value):
+        """
+        Store a value for a key, replacing any value already stored for it.
+
+        :param key:
+            The key.
+        :type key:
+            `unicode`
+        :param value:
+            The value.
+        :type value:
+            `bytes`
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def delete(self, key):
+        """
+        Delete the value stored for a key, if there is one.
+
+        :param key:
+            The key.
+        :type key:
+            `unicode`
+        """
+        raise NotImplementedError  # pragma: no cover
+
+
+class MemoryResponseCacheStorage(ResponseCacheStorage):
+    """
+    Stores the values of a :class:`ResponseCache` in memory, dropping the least recently used ones when there are more
+    than `max_entries` of them, or they take up more than `max_bytes`.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=None):
+        """
+        :param max_entries:
+            The maximum number of values to store.
+        :type max_entries:
+            `int`
+        :param max_bytes:
+            The maximum total size of the values to store, or None for no limit.
+        :type max_bytes:
+            `int` or None
+        """
+        super(MemoryResponseCacheStorage, self).__init__()
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._values = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    @property
+    def size(self):
+        """
+        The total size of the stored values.
+
+        :rtype:
+            `int`
+        """
+        return self._size
+
+    def get(self, key):
+        """Base class override."""
+        with self._lock:
+            value = self._values.pop(key, None)
+            if value is not None:
+                self._values[key] = value
+            return value
+
+    def set(self, key, value):
+        """Base class override."""
+        with self._lock:
+            self._delete(key)
+            self._values[key] = value
+            self._size += len(value)
+            while len(self._values) > self._max_entries or (self._max_bytes is not None and self._size > self._max_bytes):
+                _, dropped_value = self._values.popitem(last=False)
+                self._size -= len(dropped_value)
+
+    def delete(self, key):
+        """Base class override."""
+        with self._lock:
+            self._delete(key)
+
+    def _delete(self, key):
+        """
+        Delete the value stored for a key, if there is one, while holding the lock.
+
+        :param key:
+            The key.
+        :type key:
+            `unicode`
+        """
+        value = self._values.pop(key, None)
+        if value is not None:
+            self._size -= len(value)
+
+
+class DiskResponseCacheStorage(ResponseCacheStorage):
+    """
+    Stores the values of a :class:`ResponseCache` in files in a directory, so that they can be shared by the processes
+    of a host, and outlive them.
+
+    With `max_bytes`, the least recently used files are deleted when the files take up more than `max_bytes`. The
+    size of the files is only added up when the storage is created, so processes sharing the directory each keep it
+    under the limit as they see it.
+    """
+
+    def __init__(self, directory, max_bytes=None):
+        """
+        :param directory:
+            The local path of the directory to store the files in. It's created if it doesn't exist.
+        :type directory:
+            `unicode`
+        :param max_bytes:
+            The maximum total size of the files, or None for no limit.
+        :type max_bytes:
+            `int` or None
+        """
+        super(DiskResponseCacheStorage, self).__init__()
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = Lock()
+        self._logger = getLogger(__name__)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._size = sum(os.path.getsize(path) for path in self._get_paths())
+
+    @property
+    def directory(self):
+        """
+        The local path of the directory that the files are stored in.
+
+        :rtype:
+            `unicode`
+        """
+        return self._directory
+
+    def get(self, key):
+        """Base class override."""
+        path = self._get_path(key)
+        try:
+            with io.open(path, 'rb') as value_file:
+                value = value_file.read()
+            # The modification time of the file is when it was last used, for dropping the least recently used files.
+            os.utime(path, None)
+        except (IOError, OSError):
+            return None
+        return value
+
+    def set(self, key, value):
+        """Base class override."""
+        path = self._get_path(key)
+        # Write the value to a temporary file first, so that other threads and processes never read a partially written
+        # value. Failing to store the value only means that it isn't cached, so the error is logged instead of raised.
+        try:
+            file_descriptor, temporary_path = tempfile.mkstemp(suffix='.tmp', dir=self._directory)
+        except (IOError, OSError):
+            self._logger.warning('Failed to cache a response in %s.', self._directory, exc_info=True)
+            return
+        try:
+            with io.open(file_descriptor, 'wb') as value_file:
+                value_file.write(value)
+            with self._lock:
+                self._size -= self._get_size(path)
+                replace_file(temporary_path, path)
+                self._size += len(value)
+                if self._max_bytes is not None and self._size > self._max_bytes:
+                    self._drop_least_recently_used()
+        except (IOError, OSError):
+            self._logger.warning('Failed to cache a response in %s.', self._directory, exc_info=True)
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+
+    def delete(self, key):
+        """Base class override."""
+        with self._lock:
+            self._remove(self._get_path(key))
+
+    def _get_path(self, key):
+        """
+        Get the path of the file that the value of a key is stored in.
+
+        :param key:
+            The key.
+        :type key:
+            `unicode`
+        :rtype:
+            `unicode`
+        """
+        return os.path.join(self._directory, '{0}.cache'.format(sha1(key.encode('utf-8')).hexdigest()))
+
+    def _get_paths(self):
+        """
+        Get the paths of all of the files that values are stored in.
+
+        :rtype:
+            `list` of `unicode`
+        """
+        return [os.path.join(self._directory, name) for name in os.listdir(self._directory) if name.endswith('.cache')]
+
+    def _drop_least_recently_used(self):
+        """
+        Delete the least recently used files, until the files take up at most `max_bytes`, while holding the lock.
+        """
+        paths = []
+        for path in self._get_paths():
+            try:
+                paths.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+        paths.sort()
+        for _, path in paths:
+            if self._size <= self._max_bytes:
+                break
+            self._remove(path)
+
+    def _remove(self, path):
+        """
+        Delete a file that a value is stored in, if it exists, while holding the lock.
+
+        :param path:
+            The path of the file.
+        :type path:
+            `unicode`
+        """
+        size = self._get_size(path)
+        try:
+            os.remove(path)
+        except OSError:
+            return
+        self._size -= size
+
+    @staticmethod
+    def _get_size(path):
+        """
+        Get the size of a file, or 0 if it doesn't exist.
+
+        :param path:
+            The path of the file.
+        :type path:
+            `unicode`
+        :rtype:
+            `int`
+        """
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+
+class ResponseCache(object):
+    """
+    Caches the JSON responses to GET requests made by a :class:`Session`, and revalidates them with their ETags, so that
+    unchanged objects aren't sent again by Box.
+
+    Responses are cached by the URL and parameters (e.g. `fields`) of the request, and the user it was made as. A
+    cached response is returned without making a request for `ttl` seconds after it was received or revalidated. After
+    that, the request is made with an `If-None-Match` header for the ETag of the cached response, and the cached
+    response is returned if Box responds with 304 Not Modified. Any other request to the same URL, e.g. a PUT that
+    updates the object, drops the cached responses for it.
+
+    A cache must only be shared by sessions that are authenticated as the same user, since a cached response is
+    returned without Box checking that the user may see it. A `ttl` greater than 0 also means that changes made to an
+    object through other URLs, or by other clients, can go unnoticed for that long.
+    """
+
+    def __init__(self, storage=None, ttl=0):
+        """
+        :param storage:
+            Where to store the cached responses. Defaults to a new :class:`MemoryResponseCacheStorage`.
+        :type storage:
+            :class:`ResponseCacheStorage` or None
+        :param ttl:
+            The number of seconds for which a cached response is returned without revalidating it.
+        :type ttl:
+            `float`
+        """
+        super(ResponseCache, self).__init__()
+        self._storage = storage if storage is not None else MemoryResponseCacheStorage()
+        self._ttl = ttl
+        self._lock = Lock()
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+
+    @property
+    def storage(self):
+        """
+        Where the cached responses are stored.
+
+        :rtype:
+            :class:`ResponseCacheStorage`
+        """
+        return self._storage
+
+    @property
+    def hits(self):
+        """
+        The number of cached responses that were returned without making a request.
+
+        :rtype:
+            `int`
+        """
+        return self._hits
+
+    @property
+    def revalidations(self):
+        """
+        The number of cached responses that were returned after Box responded with 304 Not Modified.
+
+        :rtype:
+            `int`
+        """
+        return self._revalidations
+
+    @property
+    def misses(self):
+        """
+        The number of cacheable requests whose response wasn't cached, or had changed.
+
+        :rtype:
+            `int`
+        """
+        return self._misses
+
+    @staticmethod
+    def get_key(url, headers):
+        """
+        Get the key that the responses from a URL are cached under, for the user that the request is made as.
+
+        :param url:
+            The URL of the request, without its parameters.
+        :type url:
+            `unicode`
+        :param headers:
+            The headers of the request.
+        :type headers:
+            `dict`
+        :rtype:
+            `unicode`
+        """
+        return '{0} {1} {2}'.format(url, headers.get('As-User', ''), headers.get('BoxApi', ''))
+
+    @staticmethod
+    def get_variant(params):
+        """
+        Get the variant of the responses from a URL that a request with the given parameters gets.
+
+        :param params:
+            The parameters of the request.
+        :type params:
+            `dict` or None
+        :rtype:
+            `unicode`
+        """
+        return urlencode(sorted((params or {}).items()))
+
+    def get(self, key, variant):
+        """
+        Get a cached response.
+
+        :param key:
+            The key that the response is cached under, from :meth:`get_key`.
+        :type key:
+            `unicode`
+        :param variant:
+            The variant of the response, from :meth:`get_variant`.
+        :type variant:
+            `unicode`
+        :returns:
+            The cached response, or None if it isn't cached.
+        :rtype:
+            :class:`CachedNetworkResponse` or None
+        """
+        entry = self._get_entries(key).get(variant)
+        return CachedNetworkResponse(entry) if entry is not None else None
+
+    def is_fresh(self, cached_response):
+        """
+        Check whether a cached response can be returned without revalidating it.
+
+        :param cached_response:
+            The cached response.
+        :type cached_response:
+            :class:`CachedNetworkResponse`
+        :rtype:
+            `bool`
+        """
+        return time.time() - cached_response.stored_at < self._ttl
+
+    def record_hit(self):
+        """
+        Record that a cached response was returned without making a request.
+        """
+        with self._lock:
+            self._hits += 1
+
+    def revalidate(self, key, variant, cached_response):
+        """
+        Record that Box responded with 304 Not Modified for a cached response, so that it's fresh for another `ttl`
+        seconds.
+
+        :param key:
+            The key that the response is cached under.
+        :type key:
+            `unicode`
+        :param variant:
+            The variant of the response.
+        :type variant:
+            `unicode`
+        :param cached_response:
+            The cached response.
+        :type cached_response:
+            :class:`CachedNetworkResponse`
+        :returns:
+            The cached response.
+        :rtype:
+            :class:`CachedNetworkResponse`
+        """
+        with self._lock:
+            self._revalidations += 1
+        if self._ttl > 0:
+            self._set_entry(key, variant, cached_response.etag, cached_response.content)
+        return cached_response
+
+    def store(self, key, variant, network_response):
+        """
+        Cache a response received from Box, if it can be revalidated or reused.
+
+        :param key:
+            The key to cache the response under.
+        :type key:
+            `unicode`
+        :param variant:
+            The variant of the response.
+        :type variant:
+            `unicode`
+        :param network_response:
+            The response.
+        :type network_response:
+            :class:`NetworkResponse`
+        """
+        with self._lock:
+            self._misses += 1
+        etag = network_response.headers.get('ETag')
+        if etag is None:
+            response_json = network_response.json()
+            etag = response_json.get('etag') if isinstance(response_json, dict) else None
+        if etag is None and self._ttl <= 0:
+            return
+        self._set_entry(key, variant, etag, network_response.content)
+
+    def invalidate(self, key):
+        """
+        Drop all of the responses cached under a key.
+
+        :param key:
+            The key.
+        :type key:
+            `unicode`
+        """
+        self._storage.delete(key)
+
+    def _get_entries(self, key):
+        """
+        Get the entries cached under a key, by variant.
+
+        :param key:
+            The key.
+        :type key:
+            `unicode`
+        :rtype:
+            `dict`
+        """
+        value = self._storage.get(key)
+        if value is None:
+            return {}
+        try:
+            return json.loads(value.decode('utf-8'))
+        except ValueError:
+            return {}
+
+    def _set_entry(self, key, variant, etag, content):
+        """
+        Cache a response under a key, keeping the other variants cached under it.
+
+        :param key:
+            The key.
+        :type key:
+            `unicode`
+        :param variant:
+            The variant of the response.
+        :type variant:
+            `unicode`
+        :param etag:
+            The ETag of the response, or None if it doesn't have one.
+        :type etag:
+            `unicode` or None
+        :param content:
+            The content of the response.
+        :type content:
+            `bytes`
+        """
+        entries = self._get_entries(key)
+        entries[variant] = {'etag': etag, 'stored_at': time.time(), 'content': content.decode('utf-8')}
+        self._storage.set(key, json.dumps(entries).encode('utf-8'))
+
+
+class CachedNetworkResponse(NetworkResponse):
+    """A response returned from a :class:`ResponseCache`, instead of being received from Box."""
+
+    def __init__(self, entry):
+        """
+        :param entry:
+            The cached entry of the response.
+        :type entry:
+            `dict`
+        """
+        super(CachedNetworkResponse, self).__init__()
+        self._entry = entry
+        self._content = entry['content'].encode('utf-8')
+
+    @property
+    def etag(self):
+        """
+        The ETag of the response, or None if it doesn't have one.
+
+        :rtype:
+            `unicode` or None
+        """
+        return self._entry['etag']
+
+    @property
+    def stored_at(self):
+        """
+        The time at which the response was received, or last revalidated.
+
+        :rtype:
+            `float`
+        """
+        return self._entry['stored_at']
+
+    def json(self):
+        """Base class override."""
+        return json.loads(self._entry['content'])
+
+    @property
+    def content(self):
+        """Base class override."""
+        return self._content
+
+    @property
+    def status_code(self):
+        """Base class override."""
+        return 200
+
+    @property
+    def ok(self):
+        """Base class override."""
+        return True
+
+    @property
+    def headers(self):
+        """Base class override."""
+        headers = {'Content-Type': 'application/json'}
+        if self.etag is not None:
+            headers['ETag'] = self.etag
+        return headers
+
+    @property
+    def response_as_stream(self):
+        """Base class override."""
+        return BytesIO(self._content)
+
+    @property
+    def access_token_used(self):
+        """Base class override."""
+        return None
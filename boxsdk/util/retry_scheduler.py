@@ -0,0 +1,362 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import random
+from threading import Lock
+import time
+
+from ..config import API
+from .text_enum import TextEnum
+
+
+class CircuitState(TextEnum):
+    """The states of a :class:`CircuitBreaker`."""
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class RetryPolicy(object):
+    """
+    How to retry requests that failed with a particular status code.
+
+    Retries are delayed with decorrelated jitter: each delay is chosen at random between `base_interval` and three times
+    the previous delay, up to `max_interval`. This spreads out the retries of many clients that failed at once, while
+    still backing off quickly.
+    """
+
+    def __init__(self, max_attempts=API.MAX_RETRY_ATTEMPTS, base_interval=1, max_interval=60, use_retry_after_header=True):
+        """
+        :param max_attempts:
+            The maximum number of times to retry a request.
+        :type max_attempts:
+            `int`
+        :param base_interval:
+            The minimum number of seconds to wait before retrying.
+        :type base_interval:
+            `float`
+        :param max_interval:
+            The maximum number of seconds to wait before retrying.
+        :type max_interval:
+            `float`
+        :param use_retry_after_header:
+            Whether to wait for as long as the Retry-After header of the response asks, when it has one, instead of
+            choosing a delay.
+        :type use_retry_after_header:
+            `bool`
+        """
+        super(RetryPolicy, self).__init__()
+        self.max_attempts = max_attempts
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.use_retry_after_header = use_retry_after_header
+
+    def get_delay(self, previous_delay, retry_after_header):
+        """
+        Get the number of seconds to wait before retrying a request.
+
+        :param previous_delay:
+            The number of seconds waited before the previous retry of the request, or None if this is the first retry.
+        :type previous_delay:
+            `float` or None
+        :param retry_after_header:
+            Value of the 'Retry-After' response header.
+        :type retry_after_header:
+            `unicode` or None
+        :rtype:
+            `float`
+        """
+        if self.use_retry_after_header and retry_after_header is not None:
+            try:
+                return int(retry_after_header)
+            except (ValueError, TypeError):
+                pass
+        upper_bound = max(self.base_interval, (previous_delay or self.base_interval) * 3)
+        return min(self.max_interval, random.uniform(self.base_interval, upper_bound))
+
+
+class CircuitBreaker(object):
+    """
+    Stops requests from being made while the Box API is failing, so that they fail fast instead of piling up retries.
+
+    The breaker opens after `failure_threshold` consecutive server errors. While it's open, requests aren't made. Once
+    `recovery_timeout` seconds have passed, it's half-open: one trial request is let through, and the breaker closes if
+    it succeeds, or opens again if it fails. If the trial request doesn't finish, another one is let through after
+    another `recovery_timeout` seconds.
+
+    The breaker is thread-safe. Its state can be read at any time, e.g. to report it as a metric.
+    """
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30):
+        """
+        :param failure_threshold:
+            The number of consecutive server errors after which the breaker opens.
+        :type failure_threshold:
+            `int`
+        :param recovery_timeout:
+            The number of seconds to keep the breaker open before letting a trial request through.
+        :type recovery_timeout:
+            `float`
+        """
+        super(CircuitBreaker, self).__init__()
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._consecutive_failures = 0
+        self._times_opened = 0
+        self._opened_at = None
+        self._lock = Lock()
+
+    @property
+    def state(self):
+        """
+        The current state of the breaker.
+
+        :rtype:
+            :class:`CircuitState`
+        """
+        with self._lock:
+            return self._get_state(time.time())
+
+    @property
+    def consecutive_failures(self):
+        """
+        The number of server errors since the last successful response.
+
+        :rtype:
+            `int`
+        """
+        return self._consecutive_failures
+
+    @property
+    def times_opened(self):
+        """
+        The number of times the breaker has opened after being closed.
+
+        :rtype:
+            `int`
+        """
+        return self._times_opened
+
+    def allow_request(self):
+        """
+        Check whether a request may be made.
+
+        :returns:
+            True if the breaker is closed, or it's half-open and the request is let through as the trial request.
+        :rtype:
+            `bool`
+        """
+        with self._lock:
+            now = time.time()
+            state = self._get_state(now)
+            if state == CircuitState.HALF_OPEN:
+                # Keep other requests out until the trial request has finished, or until it's time for another one.
+                self._opened_at = now
+                return True
+            return state == CircuitState.CLOSED
+
+    def record_success(self):
+        """
+        Record a response that wasn't a server error, which closes the breaker.
+        """
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        """
+        Record a server error, which opens the breaker if it's the trial request, or there have been enough in a row.
+        """
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._opened_at is not None:
+                self._opened_at = time.time()
+            elif self._consecutive_failures >= self._failure_threshold:
+                self._opened_at = time.time()
+                self._times_opened += 1
+
+    def _get_state(self, now):
+        """
+        Get the state of the breaker at the given time.
+
+        :param now:
+            The current time.
+        :type now:
+            `float`
+        :rtype:
+            :class:`CircuitState`
+        """
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if now - self._opened_at < self._recovery_timeout:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+
+class RetryScheduler(object):
+    """
+    Decides whether, and when, a :class:`Session` retries failed requests.
+
+    Each retryable status code has a :class:`RetryPolicy`. By default, 202 Accepted (e.g. a thumbnail that isn't ready
+    yet), 429 Too Many Requests, and all 5xx server errors are retried. The total time spent waiting to retry a request
+    can be limited with `max_retry_time`; a retry that would go over it isn't made, and the failed response is returned
+    instead.
+
+    With a :class:`CircuitBreaker`, requests fail fast with :class:`BoxCircuitOpenException` while the breaker is open,
+    and retries aren't made, instead of every request being retried during a Box incident.
+    """
+
+    def __init__(self, policies=None, server_error_policy=None, max_retry_time=None, circuit_breaker=None):
+        """
+        :param policies:
+            The retry policy for each status code that should be retried, overriding the defaults for 202 and 429, and
+            `server_error_policy` for 5xx status codes. A status code mapped to None isn't retried.
+        :type policies:
+            `dict` of `int` to :class:`RetryPolicy` or None
+        :param server_error_policy:
+            The retry policy for 5xx status codes that aren't in `policies`, or None to use the default policy.
+        :type server_error_policy:
+            :class:`RetryPolicy` or None
+        :param max_retry_time:
+            The maximum number of seconds to spend waiting to retry a request, or None for no limit.
+        :type max_retry_time:
+            `float` or None
+        :param circuit_breaker:
+            The circuit breaker to use, or None to always make requests. Sessions that share the scheduler share the
+            breaker.
+        :type circuit_breaker:
+            :class:`CircuitBreaker` or None
+        """
+        super(RetryScheduler, self).__init__()
+        self._policies = {202: RetryPolicy(), 429: RetryPolicy()}
+        self._policies.update(policies or {})
+        self._server_error_policy = server_error_policy or RetryPolicy()
+        self._max_retry_time = max_retry_time
+        self._circuit_breaker = circuit_breaker
+
+    @property
+    def circuit_breaker(self):
+        """
+        The circuit breaker used by the scheduler, if any.
+
+        :rtype:
+            :class:`CircuitBreaker` or None
+        """
+        return self._circuit_breaker
+
+    @property
+    def max_attempts(self):
+        """
+        The maximum number of times any request is retried.
+
+        :rtype:
+            `int`
+        """
+        policies = [policy for policy in self._policies.values() if policy is not None] + [self._server_error_policy]
+        return max(policy.max_attempts for policy in policies)
+
+    def allow_request(self):
+        """
+        Check whether a request may be made, according to the circuit breaker.
+
+        :rtype:
+            `bool`
+        """
+        return self._circuit_breaker is None or self._circuit_breaker.allow_request()
+
+    def record_response(self, status_code):
+        """
+        Record the status code of a response, for the circuit breaker.
+
+        :param status_code:
+            The status code of the response.
+        :type status_code:
+            `int`
+        """
+        if self._circuit_breaker is None:
+            return
+        if status_code >= 500:
+            self._circuit_breaker.record_failure()
+        else:
+            self._circuit_breaker.record_success()
+
+    def start(self):
+        """
+        Start keeping track of the retries of a new request.
+
+        :rtype:
+            :class:`RetryState`
+        """
+        # pylint:disable=no-self-use
+        return RetryState(start_time=time.time())
+
+    def get_retry_delay(self, retry_state, status_code, attempt_number, retry_after_header):
+        """
+        Get the number of seconds to wait before retrying a failed request, if it should be retried.
+
+        :param retry_state:
+            The retries of the request so far, as returned by :meth:`start`.
+        :type retry_state:
+            :class:`RetryState`
+        :param status_code:
+            The status code of the failed response.
+        :type status_code:
+            `int`
+        :param attempt_number:
+            How many times the request has already been retried.
+        :type attempt_number:
+            `int`
+        :param retry_after_header:
+            Value of the 'Retry-After' response header.
+        :type retry_after_header:
+            `unicode` or None
+        :returns:
+            The number of seconds to wait, or None if the request shouldn't be retried.
+        :rtype:
+            `float` or None
+        """
+        policy = self._get_policy(status_code)
+        if policy is None or attempt_number >= policy.max_attempts:
+            return None
+        if self._circuit_breaker is not None and self._circuit_breaker.state != CircuitState.CLOSED:
+            return None
+        delay = policy.get_delay(retry_state.previous_delay, retry_after_header)
+        if self._max_retry_time is not None and time.time() - retry_state.start_time + delay > self._max_retry_time:
+            return None
+        retry_state.previous_delay = delay
+        return delay
+
+    def _get_policy(self, status_code):
+        """
+        Get the retry policy for a status code.
+
+        :param status_code:
+            The status code of the failed response.
+        :type status_code:
+            `int`
+        :rtype:
+            :class:`RetryPolicy` or None
+        """
+        if status_code in self._policies:
+            return self._policies[status_code]
+        if status_code >= 500:
+            return self._server_error_policy
+        return None
+
+
+class RetryState(object):
+    """
+    The retries of a request so far.
+    """
+
+    def __init__(self, start_time):
+        """
+        :param start_time:
+            The time at which the request was first made.
+        :type start_time:
+            `float`
+        """
+        super(RetryState, self).__init__()
+        self.start_time = start_time
+        self.previous_delay = None
@@ -4,10 +4,13 @@
 
 import inspect
 
+import six
+from six import iteritems
+
 from .chain_map import ChainMap
 
 
-__all__ = list(map(str, ['Translator']))
+__all__ = list(map(str, ['Translator', 'LazyResponseObject']))
 
 # pylint: disable=invalid-name
 inspect_signature = None
@@ -18,6 +21,13 @@
     inspect_signature = funcsigs.signature
 
 
+# The arguments that the translator can pass to the constructor of a Box object class.
+_CONSTRUCTOR_ARGUMENTS = ('session', 'response_object', 'object_id')
+
+# Maps each Box object class that has been translated to the result of `_get_translation_info()` for it.
+_translation_info_cache = {}
+
+
 def _get_object_id(obj):
     """
     Gets the ID for an API object.
@@ -31,6 +41,57 @@ def _get_object_id(obj):
     return obj.get('id', None)
 
 
+def _translate_value(translator, session, value):
+    """
+    Translate a value of an API response object.
+
+    :param translator:
+        The translator to translate any Box objects in the value with.
+    :type translator:
+        :class:`Translator`
+    :param session:
+        The SDK session to use for any translated objects.
+    :type session:
+        :class:`Session`
+    :param value:
+        The value to translate.
+    :return:
+        The translated value.
+    """
+    # Leaf values are used as they are; only dicts, which might be Box objects, need to be translated.
+    if isinstance(value, dict):
+        return translator.translate(session, value)
+    if isinstance(value, list):
+        return [translator.translate(session, item) if isinstance(item, dict) else item for item in value]
+    return value
+
+
+def _get_translation_info(object_class):
+    """
+    Get what the translator needs to know about a Box object class, inspecting the class only the first time.
+
+    :param object_class:
+        The Box object class.
+    :type object_class:
+        :class:`BaseAPIJSONObjectMeta`
+    :return:
+        The names of the arguments that the constructor of the class accepts, and the fields of the class that
+        shouldn't be translated.
+    :rtype:
+        (`tuple` of `unicode`, `frozenset` of `unicode`)
+    """
+    try:
+        return _translation_info_cache[object_class]
+    except KeyError:
+        params = inspect_signature(object_class.__init__).parameters
+        translation_info = (
+            tuple(argument for argument in _CONSTRUCTOR_ARGUMENTS if argument in params),
+            frozenset(object_class.untranslated_fields()),
+        )
+        _translation_info_cache[object_class] = translation_info
+        return translation_info
+
+
 class Translator(ChainMap):
     """
     Translate item responses from the Box API to Box objects.
@@ -48,7 +109,7 @@ class Translator(ChainMap):
     that is useful.
     """
 
-    __slots__ = ()
+    __slots__ = ('_lazy',)
 
     # :attr _default_translator:
     #     A global `Translator` containing the default API object classes
@@ -97,16 +158,32 @@ def __init__(self, *translation_maps, **kwargs):
             Whereas when this is `True`, all items in `translation_maps` are
             safe from mutation in normal usage scenarios.
         :type new_child:  `bool`
+        :param lazy:
+            (optional, keyword-only) If `True`, then the fields of translated
+            objects are only translated when they are first used, instead of
+            all nested objects being translated up front. This saves time and
+            memory when only a few fields of each object are used, e.g. the
+            names of the items in a large folder. Defaults to `False`.
+        :type lazy:  `bool`
         """
         translation_maps = list(translation_maps)
         extend_default_translator = kwargs.pop('extend_default_translator', True)
         new_child = kwargs.pop('new_child', True)
+        self._lazy = kwargs.pop('lazy', False)
         if extend_default_translator:
             translation_maps.append(self._default_translator)
         if new_child:
             translation_maps.insert(0, {})
         super(Translator, self).__init__(*translation_maps, **kwargs)
 
+    @property
+    def lazy(self):
+        """Whether the fields of translated objects are only translated when they are first used.
+
+        :rtype:   `bool`
+        """
+        return self._lazy
+
     def register(self, type_name, box_cls):
         """Associate a Box object class to handle Box API item responses with the given type name.
 
@@ -134,10 +211,17 @@ def get(self, key, default=None):
         :type default:  :class:`BaseAPIJSONObjectMeta`
         :rtype:   :class:`BaseAPIJSONObjectMeta`
         """
-        from boxsdk.object.base_object import BaseObject
+        # Equivalent to `super().get()`, but this is called for every translated object, and looking the key up in each
+        # map once is faster than `ChainMap` checking whether it's in any of them before looking it up.
+        for translation_map in self.maps:
+            try:
+                return translation_map[key]
+            except KeyError:
+                pass
         if default is None:
+            from boxsdk.object.base_object import BaseObject
             default = BaseObject
-        return super(Translator, self).get(key, default)
+        return default
 
     def translate(self, session, response_object):
         """
@@ -158,21 +242,21 @@ def translate(self, session, response_object):
         if not isinstance(response_object, dict):
             return response_object
 
-        translated_obj = {}
         object_type = response_object.get('type', None)
         object_class = self.get(object_type) if object_type is not None else None
         # Parent classes have the ability to "blacklist" fields that they do not want translated
-        blacklisted_fields = object_class.untranslated_fields() if object_class is not None else ()
-        for key in response_object:
-            if key in blacklisted_fields:
-                translated_obj[key] = response_object[key]
-                continue
-            if isinstance(response_object[key], dict):
-                translated_obj[key] = self.translate(session, response_object[key])
-            elif isinstance(response_object[key], list):
-                translated_obj[key] = [self.translate(session, o) for o in response_object[key]]
-            else:
-                translated_obj[key] = response_object[key]
+        constructor_arguments, blacklisted_fields = (
+            _get_translation_info(object_class) if object_class is not None else ((), frozenset())
+        )
+        if self._lazy:
+            translated_obj = LazyResponseObject(response_object, self, session, blacklisted_fields)
+        else:
+            translated_obj = {}
+            for key, value in iteritems(response_object):
+                # Leaf values are used as they are; only dicts, which might be Box objects, need to be translated.
+                if key not in blacklisted_fields:
+                    value = _translate_value(self, session, value)
+                translated_obj[key] = value
 
         # Try to translate any API object with a `type` property, except for metadata instances
         # The $type value in metadata instances isn't directly usable, so we avoid it altogether
@@ -185,11 +269,87 @@ def translate(self, session, response_object):
                 'response_object': translated_obj,
                 'object_id': _get_object_id(translated_obj),
             }
-            params = inspect_signature(object_class.__init__).parameters
-            param_values = {p: param_values[p] for p in params if p in param_values}
-            return object_class(**param_values)
+            return object_class(**{argument: param_values[argument] for argument in constructor_arguments})
 
         return translated_obj
 
 
+class LazyResponseObject(dict):
+    """
+    An API response object, whose values are translated into Box objects the first time they are looked up.
+
+    Created by a lazy :class:`Translator`. It holds the values of the API response until they are used, so Box objects
+    that are never used are never created.
+    """
+
+    __slots__ = ('_translator', '_session', '_untranslated_fields', '_translated_keys')
+
+    def __init__(self, response_object, translator, session, untranslated_fields=frozenset()):
+        """
+        :param response_object:
+            The JSON response object from the API.
+        :type response_object:
+            `dict`
+        :param translator:
+            The translator to translate the values with.
+        :type translator:
+            :class:`Translator`
+        :param session:
+            The SDK session to use for any translated objects.
+        :type session:
+            :class:`Session`
+        :param untranslated_fields:
+            The fields that should never be translated.
+        :type untranslated_fields:
+            `frozenset` of `unicode`
+        """
+        super(LazyResponseObject, self).__init__(response_object)
+        self._translator = translator
+        self._session = session
+        self._untranslated_fields = untranslated_fields
+        self._translated_keys = set()
+
+    def __getitem__(self, key):
+        """Baseclass override.
+
+        Translate the value the first time it is looked up.
+        """
+        value = super(LazyResponseObject, self).__getitem__(key)
+        if isinstance(value, (dict, list)) and key not in self._translated_keys and key not in self._untranslated_fields:
+            value = _translate_value(self._translator, self._session, value)
+            super(LazyResponseObject, self).__setitem__(key, value)
+            self._translated_keys.add(key)
+        return value
+
+    def __setitem__(self, key, value):
+        """Baseclass override."""
+        super(LazyResponseObject, self).__setitem__(key, value)
+        self._translated_keys.add(key)
+
+    def get(self, key, default=None):
+        """Baseclass override."""
+        return self[key] if key in self else default
+
+    def items(self):
+        """Baseclass override."""
+        return [(key, self[key]) for key in self]
+
+    def values(self):
+        """Baseclass override."""
+        return [self[key] for key in self]
+
+    def copy(self):
+        """Baseclass override."""
+        return dict(self.items())
+
+    if six.PY2:  # pragma: no cover
+        def iteritems(self):
+            """Baseclass override."""
+            return iter(self.items())
+
+        def itervalues(self):
+            """Baseclass override."""
+            return iter(self.values())
+
+
 Translator._default_translator = Translator(extend_default_translator=False)  # pylint:disable=protected-access
@@ -64,8 +64,17 @@ def main():
     ]
     redis_requires = ['redis>=2.10.3']
     jwt_requires = ['pyjwt>=1.3.0', 'cryptography>=0.9.2']
+    # The asyncio client requires Python 3.6 or later, so it isn't part of 'all'.
+    async_requires = ['aiohttp>=3.5.0']
+    numpy_requires = ['numpy']
     extra_requires = defaultdict(list)
-    extra_requires.update({'jwt': jwt_requires, 'redis': redis_requires, 'all': jwt_requires + redis_requires})
+    extra_requires.update({
+        'jwt': jwt_requires,
+        'redis': redis_requires,
+        'async': async_requires,
+        'numpy': numpy_requires,
+        'all': jwt_requires + redis_requires,
+    })
     conditional_dependencies = {
         # Newer versions of pip and wheel, which support PEP 426, allow
         # environment markers for conditional dependencies to use operators
@@ -81,6 +90,7 @@ def main():
         'chainmap>=1.0.2': ['2.7'],  # <'3.4'
         'funcsigs>=1.0.0': ['2.7'],  # <'3.4'
         'enum34>=1.0.4': ['2.7'],   # <'3.4'
+        'futures>=3.0.0': ['2.7'],  # <'3.2'
     }
     for requirement, python_versions in conditional_dependencies.items():
         for python_version in python_versions:
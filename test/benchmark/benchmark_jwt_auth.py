@@ -0,0 +1,65 @@
+# coding: utf-8
+
+"""
+Measures how long it takes to create a JWT auth object from a passphrase-protected private key, and how many JWT grants
+per second an auth object makes, with a network layer that responds immediately.
+
+Run with `python -m test.benchmark.benchmark_jwt_auth`.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import timeit
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.rsa import generate_private_key
+from mock import Mock
+
+from boxsdk.auth.jwt_auth import JWTAuth
+from boxsdk.network.default_network import DefaultNetworkResponse
+from boxsdk.session.session import Session
+from boxsdk.util.lru_cache import LRUCache
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--grants', type=int, default=200, help='The number of JWT grants to make.')
+    parser.add_argument('--key-size', type=int, default=2048, help='The size of the RSA private key, in bits.')
+    args = parser.parse_args()
+
+    passphrase = b'benchmark'
+    private_key_data = generate_private_key(65537, args.key_size, default_backend()).private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.BestAvailableEncryption(passphrase),
+    )
+    network_response = Mock(DefaultNetworkResponse, ok=True)
+    network_response.json.return_value = {'access_token': 'access_token', 'expires_in': 3600}
+    session = Mock(Session)
+    session.request.return_value = network_response
+
+    def create_auth():
+        return JWTAuth(
+            client_id='client_id',
+            client_secret='client_secret',
+            enterprise_id='enterprise_id',
+            jwt_key_id='jwt_key_id',
+            rsa_private_key_data=private_key_data,
+            rsa_private_key_passphrase=passphrase,
+            session=session,
+        )
+
+    JWTAuth._rsa_private_key_cache = LRUCache(capacity=16)  # pylint:disable=protected-access
+    first = timeit.timeit(create_auth, number=1)
+    cached = timeit.timeit(create_auth, number=1)
+    print('Created an auth object in {0:.4f}s, and {1:.6f}s with the key already loaded'.format(first, cached))
+
+    auth = create_auth()
+    best = min(timeit.repeat(lambda: auth.request_token('user_id'), number=args.grants, repeat=3))
+    print('Made {0} JWT grants in {1:.4f}s: {2:,.0f} grants/second'.format(args.grants, best, args.grants / best))
+
+
+if __name__ == '__main__':
+    main()
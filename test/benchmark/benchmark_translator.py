@@ -0,0 +1,67 @@
+# coding: utf-8
+
+"""
+Measures how many entries per second the translator translates from a page of API responses into Box objects.
+
+Run with `python -m test.benchmark.benchmark_translator`.
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import argparse
+import timeit
+
+from mock import Mock
+
+from boxsdk.pagination.page import Page
+from boxsdk.session.session import Session
+from boxsdk.util.translator import Translator
+
+
+def _user(user_id):
+    return {'type': 'user', 'id': user_id, 'name': 'User {0}'.format(user_id), 'login': '{0}@example.com'.format(user_id)}
+
+
+def _file(file_id):
+    return {
+        'type': 'file',
+        'id': str(file_id),
+        'etag': '1',
+        'sequence_id': '1',
+        'name': 'file_{0}.txt'.format(file_id),
+        'size': 1024 * file_id,
+        'sha1': '85136c79cbf9fe36bb9d05d0639c70c265c18d37',
+        'created_at': '2020-01-01T00:00:00-08:00',
+        'modified_at': '2020-01-02T00:00:00-08:00',
+        'created_by': _user('11'),
+        'modified_by': _user('12'),
+        'owned_by': _user('13'),
+        'parent': {'type': 'folder', 'id': '0', 'sequence_id': None, 'etag': None, 'name': 'All Files'},
+        'path_collection': {
+            'total_count': 2,
+            'entries': [
+                {'type': 'folder', 'id': '0', 'sequence_id': None, 'etag': None, 'name': 'All Files'},
+                {'type': 'folder', 'id': '1', 'sequence_id': '1', 'etag': '1', 'name': 'Documents'},
+            ],
+        },
+        'tags': ['a', 'b', 'c'],
+        'shared_link': None,
+        'item_status': 'active',
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entries', type=int, default=1000, help='The number of entries in the page.')
+    parser.add_argument('--repeat', type=int, default=5, help='The number of times to translate the page.')
+    parser.add_argument('--lazy', action='store_true', help='Translate lazily, and use only the name of each entry.')
+    args = parser.parse_args()
+
+    session = Mock(Session, translator=Translator(lazy=args.lazy))
+    page = Page(session, {'total_count': args.entries, 'entries': [_file(i) for i in range(args.entries)]})
+    best = min(timeit.repeat(lambda: [item.name for item in page], number=1, repeat=args.repeat))
+    print('Translated {0} entries in {1:.4f}s: {2:,.0f} entries/second'.format(args.entries, best, args.entries / best))
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,14 @@
 from boxsdk.network.default_network import DefaultNetworkResponse
 
 
+# The asyncio client uses syntax that is only available from Python 3.6.
+collect_ignore = [
+    'unit/client/test_async_client.py',
+    'unit/network/test_async_network.py',
+    'unit/session/test_async_session.py',
+] if sys.version_info < (3, 6) else []
+
+
 @pytest.fixture(autouse=True, scope='session')
 def logger():
     logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
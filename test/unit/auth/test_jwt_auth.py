@@ -5,10 +5,8 @@
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 import io
-from itertools import cycle, product
+from itertools import product
 import json
-import random
-import string
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey, generate_private_key as generate_rsa_private_key
@@ -23,11 +21,13 @@
 from boxsdk.exception import BoxOAuthException
 from boxsdk.config import API
 from boxsdk.object.user import User
+from boxsdk.util.lru_cache import LRUCache
 
 
-@pytest.fixture(params=[16, 32, 128])
-def jti_length(request):
-    return request.param
+@pytest.fixture(autouse=True)
+def rsa_private_key_cache():
+    with patch.object(JWTAuth, '_rsa_private_key_cache', LRUCache(capacity=16)) as cache:
+        yield cache
 
 
 @pytest.fixture(params=('RS256', 'RS512'))
@@ -126,6 +126,26 @@ def test_jwt_auth_init_accepts_rsa_private_key_data(rsa_private_key_bytes, rsa_p
     )
 
 
+def test_jwt_auth_init_reuses_loaded_rsa_private_key(rsa_private_key_bytes, rsa_passphrase):
+    kwargs = dict(
+        rsa_private_key_data=rsa_private_key_bytes,
+        rsa_private_key_passphrase=rsa_passphrase,
+        client_id=None,
+        client_secret=None,
+        jwt_key_id=None,
+        enterprise_id=None,
+    )
+    with patch('cryptography.hazmat.primitives.serialization.load_pem_private_key') as load_pem_private_key:
+        load_pem_private_key.side_effect = lambda *_, **__: Mock(RSAPrivateKey)
+        auth = JWTAuth(**kwargs)
+        other_auth = JWTAuth(**kwargs)
+        load_pem_private_key.assert_called_once_with(rsa_private_key_bytes, password=rsa_passphrase, backend=default_backend())
+        assert other_auth._rsa_private_key is auth._rsa_private_key  # pylint:disable=protected-access
+        kwargs['rsa_private_key_passphrase'] = b'other_password'
+        JWTAuth(**kwargs)
+        assert load_pem_private_key.call_count == 2
+
+
 @pytest.fixture(params=[False, True])
 def pass_private_key_by_path(request):
     """For jwt_auth_init_mocks, whether to pass the private key via sys_path (True) or pass the data directly (False)."""
@@ -268,34 +288,24 @@ def jwt_encode():
 
 
 @pytest.fixture
-def jwt_auth_auth_mocks(jti_length, jwt_algorithm, jwt_key_id, jwt_encode):
+def jwt_auth_auth_mocks(jwt_algorithm, jwt_key_id, jwt_encode):
 
     @contextmanager
     def _jwt_auth_auth_mocks(sub, sub_type, oauth, assertion, client_id, secret, assert_authed=True):
         # pylint:disable=redefined-outer-name
         with patch('boxsdk.auth.jwt_auth.datetime') as mock_datetime:
-            with patch('boxsdk.auth.jwt_auth.random.SystemRandom') as mock_system_random:
+            with patch('boxsdk.auth.jwt_auth.urandom', side_effect=lambda length: b'\xab' * length) as mock_urandom:
                 jwt_encode.return_value = assertion
                 mock_datetime.utcnow.return_value = datetime(2015, 7, 6, 12, 1, 2)
                 mock_datetime.return_value = datetime(1970, 1, 1)
                 now_plus_30 = mock_datetime.utcnow.return_value + timedelta(seconds=30)
                 exp = int((now_plus_30 - datetime(1970, 1, 1)).total_seconds())
-                system_random = mock_system_random.return_value
-                system_random.randint.return_value = jti_length
-                random_choices = [random.random() for _ in range(jti_length)]
-
-                # Use cycle so that we can do auth more than once inside the context manager.
-                system_random.random.side_effect = cycle(random_choices)
-
-                ascii_alphabet = string.ascii_letters + string.digits
-                ascii_len = len(ascii_alphabet)
-                jti = ''.join(ascii_alphabet[int(r * ascii_len)] for r in random_choices)
+                jti = 'ab' * 32
 
                 yield oauth
 
                 if assert_authed:
-                    system_random.randint.assert_called_once_with(16, 128)
-                    assert len(system_random.random.mock_calls) == jti_length
+                    mock_urandom.assert_called_once_with(32)
                     jwt_encode.assert_called_once_with({
                         'iss': client_id,
                         'sub': sub,
@@ -371,6 +381,31 @@ def test_refresh_instance_sends_post_request_with_correct_params(jwt_auth_init_a
         oauth.refresh(None)
 
 
+@pytest.mark.parametrize(('user', 'sub', 'sub_type'), [
+    ('fake_user_id', 'fake_user_id', 'user'),
+    (User(None, 'fake_user_id'), 'fake_user_id', 'user'),
+    (None, 'fake_enterprise_id', 'enterprise'),
+])
+def test_request_token_does_not_store_the_token(jwt_auth_init_mocks, successful_token_response, jwt_encode, user, sub, sub_type):
+    # pylint:disable=redefined-outer-name
+    with jwt_auth_init_mocks(enterprise_id='fake_enterprise_id', assert_authed=False) as params:
+        auth = params[0]
+        token_response = auth.request_token(user)
+        assert token_response.access_token == successful_token_response.json()['access_token']
+        assert token_response.expires_in == 3600
+        assert jwt_encode.call_args[0][0]['sub'] == sub
+        assert jwt_encode.call_args[0][0]['box_sub_type'] == sub_type
+        assert auth.access_token is None
+        with pytest.raises(ValueError):
+            auth.authenticate_user()
+
+
+def test_request_token_raises_value_error_without_enterprise_id(jwt_auth_init_mocks):
+    with jwt_auth_init_mocks(assert_authed=False) as params:
+        with pytest.raises(ValueError):
+            params[0].request_token()
+
+
 @pytest.fixture()
 def jwt_subclass_that_just_stores_params():
     class StoreParamJWTAuth(JWTAuth):
@@ -0,0 +1,151 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from threading import Event, Thread
+
+from mock import Mock, patch
+import pytest
+
+from boxsdk.auth import jwt_token_pool
+from boxsdk.auth.jwt_auth import JWTAuth
+from boxsdk.auth.jwt_token_pool import JWTTokenPool, PooledJWTAuth
+from boxsdk.auth.oauth2 import TokenResponse
+from boxsdk.client import Client
+from boxsdk.object.user import User
+from boxsdk.session.session import Session
+
+
+# pylint:disable=redefined-outer-name,protected-access
+
+
+@pytest.fixture
+def mock_time():
+    with patch.object(jwt_token_pool, 'time') as mock_time:
+        mock_time.time.return_value = 1000
+        yield mock_time
+
+
+@pytest.fixture
+def mock_jwt_auth(mock_box_session):
+    auth = Mock(JWTAuth)
+    auth._client_id = 'fake_client_id'
+    auth._client_secret = 'fake_client_secret'
+    auth._session = mock_box_session
+    auth.enterprise_id = 'fake_enterprise_id'
+    token_counts = {}
+
+    def request_token(user=None):
+        user_id = user.object_id if isinstance(user, User) else user
+        token_counts[user_id] = token_counts.get(user_id, 0) + 1
+        return TokenResponse({'access_token': '{0}-{1}'.format(user_id, token_counts[user_id]), 'expires_in': 3600})
+
+    auth.request_token.side_effect = request_token
+    return auth
+
+
+@pytest.fixture
+def pool(mock_jwt_auth):
+    return JWTTokenPool(mock_jwt_auth, refresh_before_expiry=60, max_idle_time=600)
+
+
+@pytest.mark.usefixtures('mock_time')
+def test_tokens_are_cached_per_user(pool, mock_jwt_auth):
+    assert pool.get_access_token('1') == '1-1'
+    assert pool.get_access_token(User(None, '1')) == '1-1'
+    assert pool.get_access_token('2') == '2-1'
+    assert pool.get_access_token() == 'None-1'
+    assert mock_jwt_auth.request_token.call_count == 3
+    assert len(pool) == 3
+
+
+def test_tokens_are_refreshed_before_they_expire(pool, mock_time):
+    assert pool.get_access_token('1') == '1-1'
+    mock_time.time.return_value = 1000 + 3600 - 61
+    assert pool.get_access_token('1') == '1-1'
+    mock_time.time.return_value = 1000 + 3600 - 60
+    assert pool.get_access_token('1') == '1-2'
+
+
+@pytest.mark.usefixtures('mock_time')
+def test_stale_tokens_are_replaced(pool):
+    assert pool.get_access_token('1') == '1-1'
+    assert pool.get_access_token('1', stale_access_token='1-1') == '1-2'
+    assert pool.get_access_token('1', stale_access_token='1-1') == '1-2'
+
+
+def test_idle_tokens_are_evicted(pool, mock_time):
+    pool.get_access_token('1')
+    mock_time.time.return_value = 1300
+    pool.get_access_token('2')
+    mock_time.time.return_value = 1601
+    pool.evict_idle()
+    assert len(pool) == 1
+    assert pool.get_access_token('2') == '2-1'
+    assert pool.get_access_token('1') == '1-2'
+
+
+@pytest.mark.usefixtures('mock_time')
+def test_least_recently_used_tokens_are_evicted(mock_jwt_auth):
+    pool = JWTTokenPool(mock_jwt_auth, max_entries=2)
+    pool.get_access_token('1')
+    pool.get_access_token('2')
+    pool.get_access_token('1')
+    pool.get_access_token('3')
+    assert len(pool) == 2
+    assert pool.get_access_token('1') == '1-1'
+    assert pool.get_access_token('2') == '2-2'
+
+
+def test_concurrent_requests_for_a_user_are_combined(pool, mock_jwt_auth):
+    request_started, finish_request = Event(), Event()
+    request_token = mock_jwt_auth.request_token.side_effect
+
+    def slow_request_token(user=None):
+        request_started.set()
+        finish_request.wait()
+        return request_token(user)
+
+    mock_jwt_auth.request_token.side_effect = slow_request_token
+    access_tokens = []
+    threads = [Thread(target=lambda: access_tokens.append(pool.get_access_token('1'))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    request_started.wait()
+    finish_request.set()
+    for thread in threads:
+        thread.join()
+    assert access_tokens == ['1-1'] * 5
+    assert mock_jwt_auth.request_token.call_count == 1
+
+
+@pytest.mark.usefixtures('mock_time')
+def test_pooled_auth_gets_tokens_from_the_pool(pool):
+    auth = pool.get_auth('1')
+    assert isinstance(auth, PooledJWTAuth)
+    assert auth.access_token is None
+    assert auth.refresh(None) == ('1-1', None)
+    assert auth.access_token == '1-1'
+    assert pool.get_auth('1').access_token == '1-1'
+    assert auth.refresh('1-1') == ('1-2', None)
+    assert auth.refresh('1-1') == ('1-2', None)
+
+
+@pytest.mark.usefixtures('mock_time')
+def test_revoking_a_pooled_auth_drops_its_token(pool, mock_box_session):
+    mock_box_session.request.return_value = Mock(ok=True)
+    auth = pool.get_auth('1')
+    auth.refresh(None)
+    auth.revoke()
+    assert mock_box_session.request.call_args[1]['data']['token'] == '1-1'
+    assert len(pool) == 0
+
+
+@pytest.mark.usefixtures('mock_time')
+def test_pooled_clients_share_the_session_configuration(pool, mock_jwt_auth):
+    mock_jwt_auth._session = Session(default_headers={'X-Custom': 'value'})
+    client = pool.get_client('1')
+    assert isinstance(client, Client)
+    assert client.auth.refresh(None) == ('1-1', None)
+    assert client.session.get_constructor_kwargs()['default_headers']['X-Custom'] == 'value'
+    assert client.session.get_constructor_kwargs()['network_layer'] is mock_jwt_auth._session._network_layer
@@ -16,6 +16,7 @@
 
 from boxsdk.exception import BoxOAuthException
 from boxsdk.network.default_network import DefaultNetworkResponse
+from boxsdk.auth import oauth2
 from boxsdk.auth.oauth2 import OAuth2
 from boxsdk.config import API
 
@@ -487,3 +488,80 @@ def test_context_manager_skips_revoke_on_base_exception(client_id, client_secret
             with auth.closing(**close_kwargs):
                 raise MyBaseException
     mock_close.assert_called_once_with(revoke=False)
+
+
+@pytest.fixture()
+def mock_timer():
+    with patch.object(oauth2, 'Timer') as mock_timer_class:
+        with patch.object(oauth2, 'time') as mock_time:
+            with patch.object(oauth2.random, 'uniform', return_value=1.2):
+                mock_time.time.return_value = 1000
+                yield mock_timer_class
+
+
+def test_token_expiry_is_recorded(oauth, mock_box_session, successful_token_response):
+    mock_box_session.request.return_value = successful_token_response
+    with patch.object(oauth2, 'time') as mock_time:
+        mock_time.time.return_value = 1000
+        oauth.refresh(oauth.access_token)
+    assert oauth.access_token_expires_at == 4600
+
+
+def test_token_expiry_is_unknown_for_tokens_set_from_elsewhere(oauth, mock_box_session, successful_token_response):
+    mock_box_session.request.return_value = successful_token_response
+    oauth.refresh(oauth.access_token)
+    assert oauth.access_token_expires_at is not None
+    oauth._update_current_tokens('other_access_token', 'other_refresh_token')  # pylint:disable=protected-access
+    assert oauth.access_token_expires_at is None
+
+
+def test_refresh_is_not_scheduled_by_default(oauth, mock_box_session, successful_token_response, mock_timer):
+    mock_box_session.request.return_value = successful_token_response
+    oauth.refresh(oauth.access_token)
+    mock_timer.assert_not_called()
+
+
+def test_refresh_is_scheduled_before_expiry(client_id, client_secret, mock_box_session, successful_token_response, mock_timer):
+    mock_box_session.request.return_value = successful_token_response
+    auth = OAuth2(client_id, client_secret, session=mock_box_session, refresh_before_expiry=300)
+    auth.send_token_request({}, access_token=None)
+    (delay, callback), kwargs = mock_timer.call_args
+    assert delay == 3600 - 360
+    assert mock_timer.return_value.daemon is True
+    mock_timer.return_value.start.assert_called_once_with()
+    with patch.object(auth, 'refresh') as mock_refresh:
+        callback(*kwargs['args'])
+    mock_refresh.assert_called_once_with(successful_token_response.json()['access_token'])
+
+
+@pytest.mark.parametrize('refresh_before_expiry', [3000, 3600, 7200])
+def test_refresh_is_scheduled_no_sooner_than_halfway_to_expiry(
+        client_id,
+        client_secret,
+        mock_box_session,
+        successful_token_response,
+        mock_timer,
+        refresh_before_expiry,
+):
+    mock_box_session.request.return_value = successful_token_response
+    auth = OAuth2(client_id, client_secret, session=mock_box_session, refresh_before_expiry=refresh_before_expiry)
+    auth.send_token_request({}, access_token=None)
+    (delay, _), _ = mock_timer.call_args
+    assert delay == 1800
+
+
+def test_background_refresh_failure_is_not_raised(client_id, client_secret, mock_box_session, successful_token_response, mock_timer):
+    mock_box_session.request.return_value = successful_token_response
+    auth = OAuth2(client_id, client_secret, session=mock_box_session, refresh_before_expiry=300)
+    auth.send_token_request({}, access_token=None)
+    (_, callback), kwargs = mock_timer.call_args
+    with patch.object(auth, 'refresh', side_effect=BoxOAuthException(400)):
+        callback(*kwargs['args'])
+
+
+def test_scheduled_refresh_is_cancelled_on_close(client_id, client_secret, mock_box_session, successful_token_response, mock_timer):
+    mock_box_session.request.return_value = successful_token_response
+    auth = OAuth2(client_id, client_secret, session=mock_box_session, refresh_before_expiry=300)
+    auth.send_token_request({}, access_token=None)
+    auth.close(revoke=False)
+    mock_timer.return_value.cancel.assert_called_once_with()
@@ -7,6 +7,7 @@
 from mock import Mock, patch
 
 from boxsdk.auth import redis_managed_oauth2
+from boxsdk.auth.redis_token_manager import RedisTokenManager
 
 
 def test_redis_managed_oauth2_gets_tokens_from_redis_on_init(access_token, refresh_token):
@@ -64,3 +65,44 @@ def test_redis_managed_oauth2_stores_tokens_to_redis_during_refresh(
     mock_box_session.request.return_value = successful_token_response
     oauth2.send_token_request({}, access_token=None, expect_refresh_token=True)
     redis_server.hmset.assert_called_once_with(unique_id, {'access': access_token, 'refresh': refresh_token})
+
+
+def test_redis_managed_oauth2_reads_tokens_from_token_manager(access_token, refresh_token):
+    token_manager = Mock(RedisTokenManager, unique_id='box', redis_server=Mock(redis_managed_oauth2.StrictRedis))
+    token_manager.get_tokens.return_value = access_token, refresh_token
+    oauth2 = redis_managed_oauth2.RedisManagedOAuth2(client_id=None, client_secret=None, token_manager=token_manager)
+    assert oauth2.access_token == access_token
+    assert oauth2.unique_id == 'box'
+    token_manager.redis_server.hvals.assert_not_called()
+
+
+def test_redis_managed_oauth2_refreshes_through_token_manager(
+        access_token,
+        refresh_token,
+        new_access_token,
+        mock_box_session,
+        successful_token_response,
+):
+    token_manager = Mock(RedisTokenManager, unique_id='box', redis_server=Mock(redis_managed_oauth2.StrictRedis))
+    token_manager.get_tokens.return_value = None, None
+
+    def refresh(access_token_to_refresh, refresh_tokens):
+        assert access_token_to_refresh == 'bogus_access_token'
+        refresh_tokens(access_token, refresh_token)
+        return new_access_token, refresh_token
+
+    token_manager.refresh.side_effect = refresh
+    oauth2 = redis_managed_oauth2.RedisManagedOAuth2(
+        client_id=None,
+        client_secret=None,
+        session=mock_box_session,
+        token_manager=token_manager,
+    )
+    mock_box_session.request.return_value = successful_token_response
+    assert oauth2.refresh('bogus_access_token') == (new_access_token, refresh_token)
+    assert mock_box_session.request.call_args[1]['data']['refresh_token'] == refresh_token
+    token_manager.store_tokens.assert_called_once_with(
+        successful_token_response.json()['access_token'],
+        successful_token_response.json()['refresh_token'],
+    )
+    assert oauth2.access_token == new_access_token
@@ -0,0 +1,138 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+from threading import Thread
+
+from mock import Mock, patch
+import pytest
+from redis.exceptions import LockError
+
+from boxsdk.auth import redis_token_manager
+from boxsdk.auth.redis_token_manager import RedisTokenManager
+
+
+# pylint:disable=redefined-outer-name,protected-access
+
+
+@pytest.fixture
+def redis_server():
+    redis_server = Mock(redis_token_manager.StrictRedis)
+    redis_server.register_script.return_value = Mock(return_value=2)
+    redis_server.pipeline.return_value.execute.return_value = [{b'access': b'access_1', b'refresh': b'refresh_1'}, b'1']
+    return redis_server
+
+
+@pytest.fixture
+def mock_lease():
+    with patch.object(redis_token_manager, 'RedisLock') as lease_class:
+        lease_class.return_value.acquire.return_value = True
+        yield lease_class.return_value
+
+
+@pytest.fixture
+def token_manager(redis_server):
+    with patch.object(redis_token_manager, 'Thread'):
+        with patch.object(RedisTokenManager, '_POLL_INTERVAL', 0.01):
+            yield RedisTokenManager('box', redis_server=redis_server)
+
+
+def _message(version, access_token, refresh_token):
+    return {'type': 'message', 'data': json.dumps([version, access_token, refresh_token]).encode('utf-8')}
+
+
+def test_token_manager_subscribes_to_new_tokens(token_manager, redis_server):
+    redis_server.pubsub.assert_called_once_with(ignore_subscribe_messages=True)
+    redis_server.pubsub.return_value.subscribe.assert_called_once_with('box_tokens')
+    redis_server.register_script.assert_called_once_with(RedisTokenManager._STORE_SCRIPT)
+    token_manager._listener.start.assert_called_once_with()
+    assert token_manager.unique_id == 'box'
+    assert token_manager.redis_server is redis_server
+
+
+def test_tokens_are_loaded_from_redis_once(token_manager, redis_server):
+    assert token_manager.version is None
+    assert token_manager.get_tokens() == ('access_1', 'refresh_1')
+    assert token_manager.get_tokens() == ('access_1', 'refresh_1')
+    assert token_manager.version == 1
+    redis_server.pipeline.return_value.hgetall.assert_called_once_with('box')
+    redis_server.pipeline.return_value.get.assert_called_once_with('box_version')
+    assert redis_server.pipeline.return_value.execute.call_count == 1
+
+
+def test_stored_tokens_are_published_with_a_new_version(token_manager, redis_server):
+    token_manager.store_tokens('access_2', None)
+    redis_server.register_script.return_value.assert_called_once_with(
+        keys=['box', 'box_version', 'box_tokens'],
+        args=['access_2', ''],
+    )
+    assert token_manager.version == 2
+    assert token_manager.get_tokens() == ('access_2', None)
+    redis_server.pipeline.assert_not_called()
+
+
+def test_pushed_tokens_replace_older_local_tokens(token_manager, redis_server):
+    messages = [_message(3, 'access_3', 'refresh_3'), None, _message(2, 'access_2', 'refresh_2'), Exception()]
+
+    def get_message(timeout):
+        assert timeout == 0.01
+        if len(messages) == 1:
+            token_manager._closed = True
+        message = messages.pop(0)
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+    redis_server.pubsub.return_value.get_message.side_effect = get_message
+    token_manager._listen()
+    assert token_manager.get_tokens() == ('access_3', 'refresh_3')
+    assert token_manager.version == 3
+
+
+def test_refresh_refreshes_the_latest_tokens_while_holding_the_lease(token_manager, mock_lease):
+    refresh_tokens = Mock(side_effect=lambda *_: token_manager.store_tokens('access_2', 'refresh_2'))
+    assert token_manager.refresh('access_1', refresh_tokens) == ('access_2', 'refresh_2')
+    refresh_tokens.assert_called_once_with('access_1', 'refresh_1')
+    mock_lease.acquire.assert_called_once_with(blocking=False)
+    mock_lease.release.assert_called_once_with()
+
+
+@pytest.mark.usefixtures('mock_lease')
+def test_refresh_does_not_refresh_tokens_that_were_already_replaced(token_manager):
+    token_manager.store_tokens('access_2', 'refresh_2')
+    refresh_tokens = Mock()
+    assert token_manager.refresh('access_1', refresh_tokens) == ('access_2', 'refresh_2')
+    refresh_tokens.assert_not_called()
+
+
+def test_refresh_waits_for_the_process_holding_the_lease(token_manager, redis_server, mock_lease):
+    mock_lease.acquire.return_value = False
+    redis_server.pipeline.return_value.execute.side_effect = [
+        [{b'access': b'access_1', b'refresh': b'refresh_1'}, b'1'],
+        [{b'access': b'access_1', b'refresh': b'refresh_1'}, b'1'],
+        [{'access': 'access_2', 'refresh': 'refresh_2'}, '2'],
+    ]
+    refresh_tokens = Mock()
+    assert token_manager.refresh('access_1', refresh_tokens) == ('access_2', 'refresh_2')
+    refresh_tokens.assert_not_called()
+    assert mock_lease.acquire.call_count == 2
+
+
+def test_refresh_is_single_flight_within_a_process(token_manager, mock_lease):
+    refresh_tokens = Mock(side_effect=lambda *_: token_manager.store_tokens('access_2', 'refresh_2'))
+    results = []
+    threads = [Thread(target=lambda: results.append(token_manager.refresh('access_1', refresh_tokens))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [('access_2', 'refresh_2')] * 5
+    assert refresh_tokens.call_count == 1
+    assert mock_lease.acquire.call_count == 1
+
+
+def test_refresh_succeeds_if_the_lease_expired(token_manager, mock_lease):
+    mock_lease.release.side_effect = LockError()
+    refresh_tokens = Mock(side_effect=lambda *_: token_manager.store_tokens('access_2', 'refresh_2'))
+    assert token_manager.refresh('access_1', refresh_tokens) == ('access_2', 'refresh_2')
@@ -0,0 +1,144 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import asyncio
+from concurrent.futures import Executor
+
+from mock import MagicMock, Mock
+import pytest
+
+from boxsdk.auth.oauth2 import OAuth2
+from boxsdk.network.default_network import DefaultNetworkResponse
+from boxsdk.object.folder import Folder
+from boxsdk.session.box_response import BoxResponse
+
+pytest.importorskip('aiohttp')
+# pylint:disable=wrong-import-position
+from boxsdk.client.async_client import AsyncClient  # noqa: E402
+from boxsdk.network.async_network import AsyncDefaultNetwork  # noqa: E402
+from boxsdk.session.async_session import AsyncAuthorizedSession, AsyncSession  # noqa: E402
+# pylint:enable=wrong-import-position
+
+
+@pytest.fixture
+def run():
+    return asyncio.get_event_loop().run_until_complete
+
+
+@pytest.fixture
+def requests_made():
+    return []
+
+
+@pytest.fixture
+def mock_network_layer(requests_made):
+    mock_network_layer = Mock(AsyncDefaultNetwork)
+
+    async def request(method, url, access_token, **kwargs):
+        # pylint:disable=unused-argument
+        requests_made.append((method, url, kwargs.get('params')))
+        params = kwargs.get('params') or {}
+        if '/metadata/' in url:
+            response_json = {'foo': 'bar'}
+        elif url.endswith('/items'):
+            offset = params.get('offset', 0)
+            entries = [{'type': 'file', 'id': str(file_id)} for file_id in range(offset, min(offset + 2, 5))]
+            response_json = {'entries': entries, 'total_count': 5, 'offset': offset, 'limit': 2}
+        else:
+            response_json = {'type': 'folder', 'id': url.rsplit('/', 1)[-1], 'name': 'Folder'}
+        response = Mock(DefaultNetworkResponse, headers={}, status_code=200, ok=True)
+        response.json.return_value = response_json
+        return response
+
+    async def close():
+        pass
+
+    mock_network_layer.request.side_effect = request
+    mock_network_layer.close.side_effect = close
+    return mock_network_layer
+
+
+@pytest.fixture
+def client(mock_network_layer, access_token):
+    mock_oauth = MagicMock(OAuth2)
+    mock_oauth.access_token = access_token
+    return AsyncClient(mock_oauth, session=AsyncAuthorizedSession(mock_oauth, network_layer=mock_network_layer))
+
+
+def test_client_uses_async_session_by_default(access_token):
+    mock_oauth = MagicMock(OAuth2)
+    mock_oauth.access_token = access_token
+    client = AsyncClient(mock_oauth)
+    assert isinstance(client.session, AsyncAuthorizedSession)
+    assert issubclass(AsyncClient.unauthorized_session_class, AsyncSession)
+
+
+def test_object_api_calls_are_awaitable(client, run, requests_made):
+    folder = run(client.folder('42').get())
+    assert isinstance(folder, Folder)
+    assert folder.name == 'Folder'
+    assert folder.session is client.session
+    assert requests_made == [('GET', '{0}/folders/42'.format(client.session.api_config.BASE_API_URL), None)]
+
+
+def test_make_request_is_awaitable(client, run):
+    box_response = run(client.make_request('GET', client.folder('42').get_url()))
+    assert isinstance(box_response, BoxResponse)
+
+
+def test_collections_can_be_iterated_over_asynchronously(client, run, requests_made):
+    async def get_item_ids():
+        return [item.object_id async for item in client.folder('42').get_items(limit=2)]
+
+    assert run(get_item_ids()) == ['0', '1', '2', '3', '4']
+    assert [params['offset'] for _, _, params in requests_made] == [0, 2, 4]
+
+
+def test_collection_can_be_iterated_over_after_it_is_awaited(client, run):
+    async def get_pages():
+        collection = await client.folder('42').get_items(limit=2)
+        collection._return_full_pages = True  # pylint:disable=protected-access
+        return [len(page) async for page in collection]
+
+    assert run(get_pages()) == [2, 2, 1]
+
+
+def test_many_api_calls_can_be_awaited_at_once(client, run, requests_made):
+    async def get_folders():
+        return await asyncio.gather(*[client.folder(str(folder_id)).get() for folder_id in range(50)])
+
+    folders = run(get_folders())
+    assert [folder.object_id for folder in folders] == [str(folder_id) for folder_id in range(50)]
+    assert len(requests_made) == 50
+
+
+def test_common_api_calls_are_made_on_the_event_loop(mock_network_layer, access_token, run, requests_made):
+    mock_oauth = MagicMock(OAuth2)
+    mock_oauth.access_token = access_token
+    api_call_executor = Mock(Executor)
+    session = AsyncAuthorizedSession(mock_oauth, network_layer=mock_network_layer, api_call_executor=api_call_executor)
+    client = AsyncClient(mock_oauth, session=session)
+
+    async def make_api_calls():
+        folder = await client.folder('42').get(fields=['name'], etag='1')
+        metadata = await folder.metadata().get()
+        item_ids = [item.object_id async for item in folder.get_items(limit=2)]
+        return folder, metadata, item_ids
+
+    folder, metadata, item_ids = run(make_api_calls())
+    assert folder.name == 'Folder'
+    assert metadata == {'foo': 'bar'}
+    assert item_ids == ['0', '1', '2', '3', '4']
+    assert requests_made[0] == ('GET', '{0}/folders/42'.format(client.session.api_config.BASE_API_URL), {'fields': 'name'})
+    assert len(requests_made) == 5
+    api_call_executor.submit.assert_not_called()
+
+
+def test_client_can_be_used_as_async_context_manager(client, run, mock_network_layer):
+    async def use_client():
+        async with client:
+            pass
+
+    run(use_client())
+    assert mock_network_layer.close.call_count == 1
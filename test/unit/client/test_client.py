@@ -1464,3 +1464,14 @@ def test_device_pinner(mock_client):
 
     assert isinstance(pin, DevicePinner)
     assert pin.object_id == pin_id
+
+
+def test_users_with_fan_out(mock_client):
+    users = mock_client.users(fan_out_workers=4)
+    assert users._prefetch_workers == 4  # pylint:disable=protected-access
+
+
+@pytest.mark.parametrize('use_marker', [True, False])
+def test_users_with_stream_entries(mock_client, use_marker):
+    users = mock_client.users(use_marker=use_marker, stream_entries=True)
+    assert users._stream_entries is True  # pylint:disable=protected-access
@@ -0,0 +1,184 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import asyncio
+from io import BytesIO
+import json
+import threading
+
+from mock import Mock, patch
+import pytest
+
+from boxsdk.util.multipart_stream import MultipartStream
+
+aiohttp = pytest.importorskip('aiohttp')  # pylint:disable=invalid-name
+# pylint:disable=wrong-import-position
+from boxsdk.network.async_network import AsyncDefaultNetwork, AsyncDefaultNetworkResponse, AsyncNetwork  # noqa: E402
+from boxsdk.network.network_interface import Network  # noqa: E402
+# pylint:enable=wrong-import-position
+
+
+class MockClientResponse(object):
+
+    def __init__(self, status, headers, content):
+        self.status = status
+        self.headers = headers
+        self._content = content
+
+    async def read(self):
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+@pytest.fixture
+def run():
+    return asyncio.get_event_loop().run_until_complete
+
+
+@pytest.fixture
+def client_response():
+    return MockClientResponse(200, {'Content-Type': 'application/json'}, json.dumps({'foo': 'bar'}).encode('utf-8'))
+
+
+@pytest.fixture
+def mock_client_session(client_response):
+    mock_client_session = Mock(aiohttp.ClientSession)
+    mock_client_session.request.return_value = client_response
+    return mock_client_session
+
+
+@pytest.fixture
+def network(mock_client_session):
+    network = AsyncDefaultNetwork()
+    with patch.object(network, '_get_session', return_value=mock_client_session):
+        yield network
+
+
+def test_request_reads_response(network, run):
+    response = run(network.request('GET', 'https://example.com', access_token='token'))
+    assert isinstance(response, AsyncDefaultNetworkResponse)
+    assert response.ok
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/json'
+    assert response.json() == {'foo': 'bar'}
+    assert response.content == b'{"foo": "bar"}'
+    assert response.access_token_used == 'token'
+    assert b''.join(response.response_as_stream.stream(decode_content=True)) == b'{"foo": "bar"}'
+
+
+def test_request_response_for_error_status_is_not_ok(network, run, client_response):
+    client_response.status = 404
+    response = run(network.request('GET', 'https://example.com', access_token='token'))
+    assert not response.ok
+    assert response.status_code == 404
+
+
+def test_request_translates_request_kwargs(network, run, mock_client_session):
+    run(network.request(
+        'POST',
+        'https://example.com',
+        access_token='token',
+        headers={'Authorization': 'Bearer token'},
+        params={'fields': 'name', 'limit': 100, 'recursive': True, 'marker': None, 'ids': ['1', '2']},
+        data='{"name": "ƒøø"}',
+        stream=True,
+        proxies={'http': 'http://proxy', 'https': 'http://proxy'},
+        timeout=5,
+        allow_redirects=False,
+    ))
+    _, kwargs = mock_client_session.request.call_args
+    assert sorted(kwargs.pop('params')) == sorted([
+        ('fields', 'name'),
+        ('limit', '100'),
+        ('recursive', 'True'),
+        ('ids', '1'),
+        ('ids', '2'),
+    ])
+    assert kwargs.pop('timeout').total == 5
+    assert kwargs == {
+        'headers': {'Authorization': 'Bearer token'},
+        'data': '{"name": "ƒøø"}'.encode('utf-8'),
+        'skip_auto_headers': ['Content-Type'],
+        'proxy': 'http://proxy',
+        'allow_redirects': False,
+    }
+
+
+def test_request_reads_multipart_stream_in_chunks(network, run, mock_client_session):
+    multipart_stream = MultipartStream({'attributes': '{}'}, {'file': ('unused', BytesIO(b'data'))})
+    run(network.request('POST', 'https://example.com', access_token='token', data=multipart_stream))
+    _, kwargs = mock_client_session.request.call_args
+    assert kwargs['headers'] == {'Content-Length': str(multipart_stream.len)}
+
+    async def read_body():
+        return b''.join([chunk async for chunk in kwargs['data']])
+
+    assert b'data' in run(read_body())
+
+
+def test_request_reads_multipart_stream_off_the_event_loop_thread(network, run, mock_client_session):
+    multipart_stream = MultipartStream({'attributes': '{}'}, {'file': ('unused', BytesIO(b'data'))})
+    read = multipart_stream.read
+    reading_threads = set()
+
+    def read_in_thread(*args):
+        reading_threads.add(threading.current_thread())
+        return read(*args)
+
+    multipart_stream.read = read_in_thread
+    run(network.request('POST', 'https://example.com', access_token='token', data=multipart_stream))
+    _, kwargs = mock_client_session.request.call_args
+
+    async def read_body():
+        return b''.join([chunk async for chunk in kwargs['data']])
+
+    run(read_body())
+    assert reading_threads
+    assert threading.current_thread() not in reading_threads
+
+
+def test_async_network_is_not_a_synchronous_network():
+    assert issubclass(AsyncDefaultNetwork, AsyncNetwork)
+    assert not issubclass(AsyncDefaultNetwork, Network)
+
+
+def test_request_logs_and_reraises_exceptions(network, run, mock_client_session):
+    mock_client_session.request.side_effect = aiohttp.ClientConnectionError('Connection refused')
+    with patch.object(network, '_log_exception') as log_exception:
+        with pytest.raises(aiohttp.ClientConnectionError):
+            run(network.request('GET', 'https://example.com', access_token='token'))
+    assert log_exception.call_count == 1
+
+
+def test_retry_after_sleeps_then_makes_request(network, run):
+    async def request_method(*args, **kwargs):
+        return args, kwargs
+
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    with patch.object(asyncio, 'sleep', sleep):
+        result = run(network.retry_after(2.5, request_method, 'foo', bar='baz'))
+    assert delays == [2.5]
+    assert result == (('foo',), {'bar': 'baz'})
+
+
+def test_close_closes_client_session(run):
+    network = AsyncDefaultNetwork(connection_limit=10)
+    run(network.close())
+
+    async def open_and_close():
+        client_session = network._get_session()  # pylint:disable=protected-access
+        assert client_session.connector.limit == 10
+        await network.close()
+        return client_session
+
+    assert run(open_and_close()).closed
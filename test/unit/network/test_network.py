@@ -7,6 +7,7 @@
 from logging import Logger
 from operator import attrgetter
 from pprint import pformat
+import socket
 
 from mock import DEFAULT, Mock, patch, ANY
 import pytest
@@ -14,7 +15,7 @@
 from six import text_type
 
 from boxsdk.network import default_network
-from boxsdk.network.default_network import DefaultNetworkResponse, DefaultNetwork
+from boxsdk.network.default_network import ConnectionPoolStats, DefaultNetworkResponse, DefaultNetwork
 
 
 class ExceptionSubclass(Exception):
@@ -160,6 +161,42 @@ def test_default_network_request(make_network_request_and_assert_response):
     make_network_request_and_assert_response(default_network, custom_kwargs='test')
 
 
+def test_default_network_uses_pool_sizes_and_socket_options_for_all_hosts():
+    network = DefaultNetwork(pool_maxsize=64, pool_block=True)
+    # pylint:disable=protected-access
+    adapter = network._session.get_adapter('https://upload.box.com/api/2.0/files/content')
+    assert adapter is network._session.get_adapter('https://api.box.com/2.0/folders/0')
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 64
+    assert adapter.poolmanager.connection_pool_kw['block'] is True
+    assert adapter.poolmanager.connection_pool_kw['socket_options'] == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+
+def test_default_network_sets_custom_socket_options():
+    network = DefaultNetwork(tcp_nodelay=False, tcp_keepalive=True, send_buffer_size=1024, receive_buffer_size=2048)
+    pool = network._adapter.poolmanager.connection_from_url('https://api.box.com')  # pylint:disable=protected-access
+    assert pool.conn_kw['socket_options'] == [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, 1024),
+        (socket.SOL_SOCKET, socket.SO_RCVBUF, 2048),
+    ]
+
+
+def test_default_network_reports_connection_pool_stats():
+    network = DefaultNetwork(pool_maxsize=4)
+    assert network.get_connection_pool_stats() == []
+    pool = network._adapter.poolmanager.connection_from_url('https://api.box.com')  # pylint:disable=protected-access
+    connections = [pool._get_conn() for _ in range(3)]  # pylint:disable=protected-access
+    pool._put_conn(connections[0])  # pylint:disable=protected-access
+    assert network.get_connection_pool_stats() == [ConnectionPoolStats(
+        host='https://api.box.com:443',
+        maxsize=4,
+        in_use=2,
+        idle=1,
+        connections_opened=3,
+        requests=0,
+    )]
+
+
 @pytest.mark.parametrize('delay', (0, 1))
 def test_default_network_retry_after_sleeps(delay):
     default_network = DefaultNetwork()
@@ -0,0 +1,309 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import hashlib
+from io import BytesIO
+import json
+import os
+
+from mock import Mock
+import pytest
+from requests.packages.urllib3.exceptions import ProtocolError  # pylint:disable=import-error
+
+from boxsdk.config import API
+from boxsdk.exception import BoxAPIException, BoxException
+from boxsdk.object.file import File
+from boxsdk.object.file_version import FileVersion
+from boxsdk.util.chunked_downloader import ChunkedDownloader, ResumableDownloader
+
+
+CONTENT = b'abcdefghij'
+
+
+@pytest.fixture()
+def current_file_version(mock_box_session):
+    return FileVersion(mock_box_session, '1234', {'type': 'file_version', 'id': '1234'})
+
+
+@pytest.fixture()
+def mock_file(current_file_version):
+    mock_file = Mock(File)
+    mock_file.get.return_value = Mock(
+        File,
+        file_version=current_file_version,
+        size=len(CONTENT),
+        sha1=hashlib.sha1(CONTENT).hexdigest(),
+    )
+
+    def download_to(writeable_stream, file_version=None, byte_range=None):
+        # pylint:disable=unused-argument
+        start, end = byte_range if len(byte_range) == 2 else (byte_range[0], len(CONTENT) - 1)
+        writeable_stream.write(CONTENT[start:end + 1])
+
+    mock_file.download_to.side_effect = download_to
+    return mock_file
+
+
+@pytest.fixture()
+def mock_file_with_session(mock_file, mock_box_session, default_translator):
+    mock_file.object_id = '42'
+    mock_file.session = mock_box_session
+    mock_file.translator = default_translator
+    return mock_file
+
+
+@pytest.mark.parametrize('part_size,max_workers', [(3, 4), (3, 1), (20, 2), (1, 10)])
+def test_start_downloads_every_range(mock_file, current_file_version, part_size, max_workers):
+    # pylint:disable=redefined-outer-name
+    writeable_stream = BytesIO()
+    chunked_downloader = ChunkedDownloader(
+        mock_file,
+        writeable_stream,
+        part_size=part_size,
+        max_workers=max_workers,
+        verify_sha1=True,
+    )
+    chunked_downloader.start()
+    assert writeable_stream.getvalue() == CONTENT
+    assert writeable_stream.tell() == len(CONTENT)
+    mock_file.get.assert_called_once_with(fields=['file_version', 'size', 'sha1'])
+    requested_ranges = sorted(call[1]['byte_range'] for call in mock_file.download_to.call_args_list)
+    expected_ranges = [
+        (start, min(start + part_size, len(CONTENT)) - 1)
+        for start in range(0, len(CONTENT), part_size)
+    ]
+    assert requested_ranges == expected_ranges
+    assert all(call[1]['file_version'] is current_file_version for call in mock_file.download_to.call_args_list)
+
+
+def test_start_writes_at_current_position_of_stream(mock_file):
+    # pylint:disable=redefined-outer-name
+    writeable_stream = BytesIO(b'xyz')
+    writeable_stream.seek(3)
+    ChunkedDownloader(mock_file, writeable_stream, part_size=4).start()
+    assert writeable_stream.getvalue() == b'xyz' + CONTENT
+
+
+def test_failed_range_is_retried_from_last_written_byte(mock_file):
+    # pylint:disable=redefined-outer-name
+    requested_ranges = []
+
+    def download_to(writeable_stream, file_version=None, byte_range=None):
+        # pylint:disable=unused-argument
+        requested_ranges.append(byte_range)
+        start, end = byte_range
+        if byte_range == (3, 5):
+            writeable_stream.write(CONTENT[3:4])
+            raise ProtocolError('Connection broken', IOError('Connection reset by peer'))
+        writeable_stream.write(CONTENT[start:end + 1])
+
+    mock_file.download_to.side_effect = download_to
+    writeable_stream = BytesIO()
+    ChunkedDownloader(mock_file, writeable_stream, part_size=3, max_workers=1).start()
+    assert writeable_stream.getvalue() == CONTENT
+    assert requested_ranges == [(0, 2), (3, 5), (4, 5), (6, 8), (9, 9)]
+
+
+def test_failed_range_is_not_retried_forever(mock_file):
+    # pylint:disable=redefined-outer-name
+    mock_file.download_to.side_effect = ProtocolError('Connection broken', IOError('Connection reset by peer'))
+    with pytest.raises(ProtocolError):
+        ChunkedDownloader(mock_file, BytesIO(), part_size=20).start()
+    assert mock_file.download_to.call_count == API.MAX_RETRY_ATTEMPTS
+
+
+def test_local_write_errors_are_not_retried(mock_file):
+    # pylint:disable=redefined-outer-name
+    mock_file.download_to.side_effect = OSError(28, 'No space left on device')
+    with pytest.raises(OSError):
+        ChunkedDownloader(mock_file, BytesIO(), part_size=20).start()
+    assert mock_file.download_to.call_count == 1
+
+
+def test_api_errors_are_not_retried(mock_file):
+    # pylint:disable=redefined-outer-name
+    mock_file.download_to.side_effect = BoxAPIException(404)
+    with pytest.raises(BoxAPIException):
+        ChunkedDownloader(mock_file, BytesIO(), part_size=20).start()
+    assert mock_file.download_to.call_count == 1
+
+
+def test_sha1_mismatch_raises(mock_file):
+    # pylint:disable=redefined-outer-name
+    mock_file.get.return_value.sha1 = hashlib.sha1(b'something else').hexdigest()
+    with pytest.raises(BoxException):
+        ChunkedDownloader(mock_file, BytesIO(), part_size=3, verify_sha1=True).start()
+
+
+def test_start_downloads_given_file_version_of_unknown_size(mock_file, mock_box_session):
+    # pylint:disable=redefined-outer-name
+    file_version = FileVersion(mock_box_session, '5678')
+    mock_file.session = mock_box_session
+    mock_file.get_url.return_value = '{0}/files/42/content'.format(API.BASE_API_URL)
+    mock_box_session.get.return_value.headers = {'Content-Range': 'bytes 0-0/{0}'.format(len(CONTENT))}
+    writeable_stream = BytesIO()
+    ChunkedDownloader(mock_file, writeable_stream, file_version=file_version, part_size=4).start()
+    assert writeable_stream.getvalue() == CONTENT
+    mock_file.get.assert_not_called()
+    mock_box_session.get.assert_called_once_with(
+        '{0}/files/42/content'.format(API.BASE_API_URL),
+        expect_json_response=False,
+        stream=True,
+        params={'version': '5678'},
+        headers={'Range': 'bytes=0-0'},
+    )
+    assert all(call[1]['file_version'] is file_version for call in mock_file.download_to.call_args_list)
+
+
+def test_get_chunked_downloader(test_file):
+    chunked_downloader = test_file.get_chunked_downloader(BytesIO(), max_workers=2)
+    assert isinstance(chunked_downloader, ChunkedDownloader)
+
+
+def _write_checkpoint(file_path, offset, file_version_id='1234', offset_sha1=None):
+    with open('{0}.checkpoint'.format(file_path), 'w') as checkpoint_file:
+        json.dump({
+            'file_id': '42',
+            'file_version_id': file_version_id,
+            'size': len(CONTENT),
+            'sha1': hashlib.sha1(CONTENT).hexdigest(),
+            'offset': offset,
+            'offset_sha1': offset_sha1,
+        }, checkpoint_file)
+
+
+@pytest.mark.parametrize('checkpoint_interval', [1, 3, 20])
+def test_resumable_download_writes_file_and_removes_checkpoint(
+        mock_file_with_session,
+        tmpdir,
+        checkpoint_interval,
+):
+    # pylint:disable=redefined-outer-name
+    file_path = str(tmpdir.join('file'))
+    with open(file_path, 'wb') as existing_file:
+        existing_file.write(b'stale content that is longer')
+    ResumableDownloader(
+        mock_file_with_session,
+        file_path,
+        checkpoint_interval=checkpoint_interval,
+        verify_sha1=True,
+    ).download()
+    with open(file_path, 'rb') as downloaded_file:
+        assert downloaded_file.read() == CONTENT
+    assert not os.path.exists('{0}.checkpoint'.format(file_path))
+    mock_file_with_session.download_to.assert_called_once()
+    assert mock_file_with_session.download_to.call_args[1]['byte_range'] == (0,)
+
+
+def test_resumable_download_checkpoints_progress(mock_file_with_session, tmpdir):
+    # pylint:disable=redefined-outer-name
+    file_path = str(tmpdir.join('file'))
+
+    def download_to(writeable_stream, file_version=None, byte_range=None):
+        # pylint:disable=unused-argument
+        for index in range(0, 7):
+            writeable_stream.write(CONTENT[index:index + 1])
+        raise BoxException('Download interrupted')
+
+    mock_file_with_session.download_to.side_effect = download_to
+    with pytest.raises(BoxException):
+        ResumableDownloader(mock_file_with_session, file_path, checkpoint_interval=3, verify_sha1=True).download()
+    with open('{0}.checkpoint'.format(file_path)) as checkpoint_file:
+        checkpoint = json.load(checkpoint_file)
+    assert checkpoint['file_version_id'] == '1234'
+    assert checkpoint['offset'] == 6
+    assert checkpoint['offset_sha1'] == hashlib.sha1(CONTENT[:6]).hexdigest()
+
+
+@pytest.mark.parametrize('verify_sha1', [True, False])
+def test_resumable_download_continues_from_checkpoint(mock_file_with_session, tmpdir, verify_sha1):
+    # pylint:disable=redefined-outer-name
+    file_path = str(tmpdir.join('file'))
+    with open(file_path, 'wb') as partial_file:
+        # Bytes written after the last checkpoint are discarded.
+        partial_file.write(CONTENT[:7])
+    _write_checkpoint(file_path, 6, offset_sha1=hashlib.sha1(CONTENT[:6]).hexdigest() if verify_sha1 else None)
+    ResumableDownloader(mock_file_with_session, file_path, verify_sha1=verify_sha1).download()
+    with open(file_path, 'rb') as downloaded_file:
+        assert downloaded_file.read() == CONTENT
+    mock_file_with_session.get.assert_not_called()
+    mock_file_with_session.download_to.assert_called_once()
+    call_kwargs = mock_file_with_session.download_to.call_args[1]
+    assert call_kwargs['byte_range'] == (6,)
+    assert call_kwargs['file_version'].object_id == '1234'
+    assert not os.path.exists('{0}.checkpoint'.format(file_path))
+
+
+@pytest.mark.parametrize('partial_content', [CONTENT[:3], b'XXXXXXX'])
+def test_resumable_download_restarts_if_partial_file_is_invalid(mock_file_with_session, tmpdir, partial_content):
+    # pylint:disable=redefined-outer-name
+    file_path = str(tmpdir.join('file'))
+    with open(file_path, 'wb') as partial_file:
+        partial_file.write(partial_content)
+    _write_checkpoint(file_path, 6, offset_sha1=hashlib.sha1(CONTENT[:6]).hexdigest())
+    ResumableDownloader(mock_file_with_session, file_path, verify_sha1=True).download()
+    with open(file_path, 'rb') as downloaded_file:
+        assert downloaded_file.read() == CONTENT
+    assert mock_file_with_session.download_to.call_args[1]['byte_range'] == (0,)
+
+
+def test_resumable_download_ignores_checkpoint_for_other_file_version(
+        mock_file_with_session,
+        current_file_version,
+        tmpdir,
+):
+    # pylint:disable=redefined-outer-name
+    file_path = str(tmpdir.join('file'))
+    with open(file_path, 'wb') as partial_file:
+        partial_file.write(CONTENT[:6])
+    _write_checkpoint(file_path, 6, file_version_id='1111')
+    current_file_version._response_object['size'] = len(CONTENT)  # pylint:disable=protected-access
+    ResumableDownloader(mock_file_with_session, file_path, file_version=current_file_version).download()
+    with open(file_path, 'rb') as downloaded_file:
+        assert downloaded_file.read() == CONTENT
+    assert mock_file_with_session.download_to.call_args[1]['byte_range'] == (0,)
+    assert mock_file_with_session.download_to.call_args[1]['file_version'] is current_file_version
+
+
+def test_resumable_download_retries_from_last_written_byte(mock_file_with_session, tmpdir):
+    # pylint:disable=redefined-outer-name
+    file_path = str(tmpdir.join('file'))
+    requested_ranges = []
+
+    def download_to(writeable_stream, file_version=None, byte_range=None):
+        # pylint:disable=unused-argument
+        requested_ranges.append(byte_range)
+        if byte_range == (0,):
+            writeable_stream.write(CONTENT[:4])
+            raise ProtocolError('Connection broken', IOError('Connection reset by peer'))
+        writeable_stream.write(CONTENT[byte_range[0]:])
+
+    mock_file_with_session.download_to.side_effect = download_to
+    ResumableDownloader(mock_file_with_session, file_path, verify_sha1=True).download()
+    with open(file_path, 'rb') as downloaded_file:
+        assert downloaded_file.read() == CONTENT
+    assert requested_ranges == [(0,), (4,)]
+
+
+def test_resumable_download_does_not_retry_local_write_errors(mock_file_with_session, tmpdir):
+    # pylint:disable=redefined-outer-name
+    mock_file_with_session.download_to.side_effect = OSError(28, 'No space left on device')
+    with pytest.raises(OSError):
+        ResumableDownloader(mock_file_with_session, str(tmpdir.join('file'))).download()
+    assert mock_file_with_session.download_to.call_count == 1
+
+
+def test_resumable_download_sha1_mismatch_raises_and_removes_checkpoint(mock_file_with_session, tmpdir):
+    # pylint:disable=redefined-outer-name
+    file_path = str(tmpdir.join('file'))
+    mock_file_with_session.get.return_value.sha1 = hashlib.sha1(b'something else').hexdigest()
+    with pytest.raises(BoxException):
+        ResumableDownloader(mock_file_with_session, file_path, checkpoint_interval=3, verify_sha1=True).download()
+    assert not os.path.exists('{0}.checkpoint'.format(file_path))
+
+
+def test_get_resumable_downloader(test_file, tmpdir):
+    resumable_downloader = test_file.get_resumable_downloader(str(tmpdir.join('file')))
+    assert isinstance(resumable_downloader, ResumableDownloader)
+    assert resumable_downloader.checkpoint_path == str(tmpdir.join('file.checkpoint'))
@@ -3,8 +3,10 @@
 
 from __future__ import unicode_literals, absolute_import
 
+import hashlib
 import io
 import json
+import os
 import pytest
 
 from mock import MagicMock, Mock, call
@@ -14,9 +16,14 @@
 from boxsdk.object.file import File
 from boxsdk.pagination.limit_offset_based_dict_collection import LimitOffsetBasedDictCollection
 from boxsdk.object.upload_session import UploadSession
+from boxsdk.util.chunked_upload_journal import ChunkedUploadJournal
 from boxsdk.util.chunked_uploader import ChunkedUploader
 
 
+def _sha1(part_bytes):
+    return hashlib.sha1(part_bytes).digest()
+
+
 @pytest.fixture()
 def test_upload_session(mock_box_session):
     upload_session_response_object = {
@@ -197,8 +204,8 @@ def test_resume_cross_process(test_file, mock_upload_session):
     chunked_uploader = ChunkedUploader(mock_upload_session, stream, file_size)
     uploaded_file = chunked_uploader.resume()
     calls = [
-        call(offset=2, part_bytes=b'cd', total_size=7),
-        call(offset=4, part_bytes=b'ef', total_size=7),
+        call(offset=2, part_bytes=b'cd', total_size=7, part_content_sha1=_sha1(b'cd')),
+        call(offset=4, part_bytes=b'ef', total_size=7, part_content_sha1=_sha1(b'ef')),
     ]
     mock_upload_session.upload_part_bytes.assert_has_calls(calls, any_order=False)
     mock_upload_session.commit.assert_called_once_with(
@@ -253,7 +260,7 @@ def test_resume_in_process(test_file, mock_upload_session):
         chunked_uploader.start()
     except BoxAPIException:
         uploaded_file = chunked_uploader.resume()
-    calls = [call(offset=6, part_bytes=b'g', total_size=7)]
+    calls = [call(offset=6, part_bytes=b'g', total_size=7, part_content_sha1=_sha1(b'g'))]
     mock_upload_session.upload_part_bytes.assert_has_calls(calls, any_order=False)
     mock_upload_session.commit.assert_called_once_with(
         content_sha1=b'/\xb5\xe14\x19\xfc\x89$he\xe7\xa3$\xf4v\xecbN\x87@',
@@ -290,3 +297,224 @@ def test_abort_with_resume(mock_upload_session):
         pass
     mock_upload_session.abort.assert_called_once_with()
     assert is_aborted is True
+
+
+def _uploaded_part_for_offset(offset, part_bytes):
+    return {
+        'part_id': 'PART{0}'.format(offset),
+        'offset': offset,
+        'size': len(part_bytes),
+        'sha1': None,
+    }
+
+
+def test_start_concurrently(test_file, mock_upload_session):
+    file_size = 7
+    stream = io.BytesIO(b'abcdefg')
+    mock_upload_session.upload_part_bytes.side_effect = lambda part_bytes, offset, total_size, part_content_sha1: \
+        _uploaded_part_for_offset(offset, part_bytes)
+    mock_upload_session.commit.return_value = test_file
+    chunked_uploader = ChunkedUploader(mock_upload_session, stream, file_size, max_workers=3)
+    uploaded_file = chunked_uploader.start()
+    calls = [
+        call(offset=0, part_bytes=b'ab', total_size=7, part_content_sha1=_sha1(b'ab')),
+        call(offset=2, part_bytes=b'cd', total_size=7, part_content_sha1=_sha1(b'cd')),
+        call(offset=4, part_bytes=b'ef', total_size=7, part_content_sha1=_sha1(b'ef')),
+        call(offset=6, part_bytes=b'g', total_size=7, part_content_sha1=_sha1(b'g')),
+    ]
+    mock_upload_session.upload_part_bytes.assert_has_calls(calls, any_order=True)
+    assert mock_upload_session.upload_part_bytes.call_count == 4
+    mock_upload_session.commit.assert_called_once_with(
+        content_sha1=b'/\xb5\xe14\x19\xfc\x89$he\xe7\xa3$\xf4v\xecbN\x87@',
+        parts=[
+            _uploaded_part_for_offset(0, b'ab'),
+            _uploaded_part_for_offset(2, b'cd'),
+            _uploaded_part_for_offset(4, b'ef'),
+            _uploaded_part_for_offset(6, b'g'),
+        ],
+    )
+    assert uploaded_file is test_file
+
+
+def test_resume_concurrently_after_part_failure(test_file, mock_upload_session):
+    file_size = 7
+    stream = io.BytesIO(b'abcdefg')
+    uploaded_parts = []
+    failed_offsets = []
+
+    def upload_part_bytes(part_bytes, offset, total_size, part_content_sha1):
+        # pylint:disable=unused-argument
+        if offset == 2 and not failed_offsets:
+            failed_offsets.append(offset)
+            raise BoxAPIException(502)
+        part = _uploaded_part_for_offset(offset, part_bytes)
+        uploaded_parts.append(part)
+        return part
+
+    mock_upload_session.upload_part_bytes.side_effect = upload_part_bytes
+    mock_upload_session.commit.return_value = test_file
+    chunked_uploader = ChunkedUploader(mock_upload_session, stream, file_size, max_workers=2)
+    with pytest.raises(BoxAPIException):
+        chunked_uploader.start()
+    mock_iterator = MagicMock(LimitOffsetBasedDictCollection)
+    mock_iterator.__iter__.return_value = list(uploaded_parts)
+    mock_upload_session.get_parts.return_value = mock_iterator
+    uploaded_file = chunked_uploader.resume()
+    assert sorted(part['offset'] for part in uploaded_parts) == [0, 2, 4, 6]
+    mock_upload_session.commit.assert_called_once_with(
+        content_sha1=b'/\xb5\xe14\x19\xfc\x89$he\xe7\xa3$\xf4v\xecbN\x87@',
+        parts=[
+            _uploaded_part_for_offset(0, b'ab'),
+            _uploaded_part_for_offset(2, b'cd'),
+            _uploaded_part_for_offset(4, b'ef'),
+            _uploaded_part_for_offset(6, b'g'),
+        ],
+    )
+    assert uploaded_file is test_file
+
+
+def test_start_reads_parts_without_copying(tmpdir, test_file, mock_upload_session):
+    file_path = tmpdir.join('file.txt')
+    file_path.write_binary(b'xyabcdefg')
+    uploaded_chunks = []
+
+    def upload_part_bytes(part_bytes, offset, total_size, part_content_sha1):
+        # pylint:disable=unused-argument
+        uploaded_chunks.append(part_bytes)
+        return _uploaded_part_for_offset(offset, part_bytes)
+
+    mock_upload_session.upload_part_bytes.side_effect = upload_part_bytes
+    mock_upload_session.commit.return_value = test_file
+    with open(str(file_path), 'rb') as content_stream:
+        content_stream.seek(2)
+        chunked_uploader = ChunkedUploader(mock_upload_session, content_stream, 7)
+        uploaded_file = chunked_uploader.start()
+        assert content_stream.tell() == 9
+    assert all(isinstance(chunk, memoryview) for chunk in uploaded_chunks)
+    assert [chunk.tobytes() for chunk in uploaded_chunks] == [b'ab', b'cd', b'ef', b'g']
+    mock_upload_session.commit.assert_called_once_with(
+        content_sha1=b'/\xb5\xe14\x19\xfc\x89$he\xe7\xa3$\xf4v\xecbN\x87@',
+        parts=[
+            _uploaded_part_for_offset(0, b'ab'),
+            _uploaded_part_for_offset(2, b'cd'),
+            _uploaded_part_for_offset(4, b'ef'),
+            _uploaded_part_for_offset(6, b'g'),
+        ],
+    )
+    assert uploaded_file is test_file
+
+
+def test_start_closes_memory_map_after_commit(tmpdir, test_file, mock_upload_session):
+    # pylint:disable=protected-access
+    file_path = tmpdir.join('file.txt')
+    file_path.write_binary(b'abcdefg')
+    # Unlike a mock, this doesn't keep references to the chunks, which would keep the map from being closed.
+    mock_upload_session.upload_part_bytes = lambda part_bytes, offset, **_: _uploaded_part_for_offset(offset, part_bytes)
+    mock_upload_session.commit.return_value = test_file
+    with open(str(file_path), 'rb') as content_stream:
+        chunked_uploader = ChunkedUploader(mock_upload_session, content_stream, 7)
+        content_map = chunked_uploader._content_map
+        assert not content_map.closed
+        chunked_uploader.start()
+    assert content_map.closed
+    assert chunked_uploader._content_map is None
+
+
+def test_abort_closes_memory_map_with_parts_in_flight(tmpdir, mock_upload_session):
+    # pylint:disable=protected-access
+    file_path = tmpdir.join('file.txt')
+    file_path.write_binary(b'abcdefg')
+    mock_upload_session.upload_part_bytes.side_effect = BoxAPIException(502)
+    with open(str(file_path), 'rb') as content_stream:
+        chunked_uploader = ChunkedUploader(mock_upload_session, content_stream, 7)
+        content_map = chunked_uploader._content_map
+        with pytest.raises(BoxAPIException):
+            chunked_uploader.start()
+        assert not content_map.closed
+        chunked_uploader.abort()
+    assert content_map.closed
+
+
+def test_get_next_part_reads_into_part_buffer(mock_upload_session):
+    stream = io.BytesIO(b'abcdefg')
+    chunked_uploader = ChunkedUploader(mock_upload_session, stream, 7)
+    parts = [chunked_uploader._get_next_part() for _ in range(4)]  # pylint:disable=protected-access
+    assert all(isinstance(part.chunk, memoryview) for part in parts)
+    assert [part.chunk.tobytes() for part in parts] == [b'ab', b'cd', b'ef', b'g']
+    assert [part.offset for part in parts] == [0, 2, 4, 6]
+
+
+@pytest.mark.parametrize('file_size', [0, 1, 64 * 1024, 200 * 1024 + 7])
+def test_get_next_part_computes_part_and_whole_file_sha1_together(mock_upload_session, file_size):
+    content = bytes(bytearray(i % 251 for i in range(file_size)))
+    mock_upload_session.part_size = max(file_size, 1)
+    chunked_uploader = ChunkedUploader(mock_upload_session, io.BytesIO(content), file_size)
+    part = chunked_uploader._get_next_part()  # pylint:disable=protected-access
+    assert part.sha1 == _sha1(content)
+    assert chunked_uploader._sha1.digest() == _sha1(content)  # pylint:disable=protected-access
+
+
+def test_get_next_part_skips_part_sha1_for_parts_already_uploaded(mock_upload_session):
+    chunked_uploader = ChunkedUploader(mock_upload_session, io.BytesIO(b'abcdefg'), 7)
+    chunked_uploader._part_definitions[0] = _uploaded_part_for_offset(0, b'ab')  # pylint:disable=protected-access
+    first_part = chunked_uploader._get_next_part()  # pylint:disable=protected-access
+    second_part = chunked_uploader._get_next_part()  # pylint:disable=protected-access
+    assert first_part.sha1 is None
+    assert second_part.sha1 == _sha1(b'cd')
+    assert chunked_uploader._sha1.digest() == _sha1(b'abcd')  # pylint:disable=protected-access
+
+
+def test_resume_from_journal_in_new_process(tmpdir, test_file, mock_upload_session):
+    journal_path = str(tmpdir.join('upload.journal'))
+    mock_upload_session.object_id = mock_upload_session.id
+    uploaded_parts = []
+    failed_offsets = []
+
+    def upload_part_bytes(part_bytes, offset, total_size, part_content_sha1):
+        # pylint:disable=unused-argument
+        if offset == 4 and not failed_offsets:
+            failed_offsets.append(offset)
+            raise BoxAPIException(502)
+        part = _uploaded_part_for_offset(offset, part_bytes)
+        uploaded_parts.append(part)
+        return part
+
+    mock_upload_session.upload_part_bytes.side_effect = upload_part_bytes
+    mock_upload_session.commit.return_value = test_file
+    chunked_uploader = ChunkedUploader(
+        mock_upload_session,
+        io.BytesIO(b'abcdefg'),
+        7,
+        journal=ChunkedUploadJournal(journal_path),
+    )
+    with pytest.raises(BoxAPIException):
+        chunked_uploader.start()
+    assert ChunkedUploadJournal(journal_path).parts == uploaded_parts
+
+    # Box doesn't list the second part, so it is uploaded again, even though the journal recorded it.
+    mock_iterator = MagicMock(LimitOffsetBasedDictCollection)
+    mock_iterator.__iter__.return_value = uploaded_parts[:1]
+    mock_upload_session.get_parts.return_value = mock_iterator
+    resumed_chunked_uploader = ChunkedUploader(
+        mock_upload_session,
+        io.BytesIO(b'abcdefg'),
+        7,
+        journal=ChunkedUploadJournal(journal_path),
+    )
+    uploaded_file = resumed_chunked_uploader.resume()
+    assert [part['offset'] for part in uploaded_parts] == [0, 2, 2, 4, 6]
+    mock_upload_session.commit.assert_called_once_with(
+        content_sha1=b'/\xb5\xe14\x19\xfc\x89$he\xe7\xa3$\xf4v\xecbN\x87@',
+        parts=uploaded_parts[:1] + uploaded_parts[2:],
+    )
+    assert uploaded_file is test_file
+    assert not os.path.exists(journal_path)
+
+
+def test_abort_deletes_journal(tmpdir, mock_upload_session):
+    journal = ChunkedUploadJournal(str(tmpdir.join('upload.journal')))
+    journal.start(mock_upload_session.id, 7, 2)
+    chunked_uploader = ChunkedUploader(mock_upload_session, io.BytesIO(b'abcdefg'), 7, journal=journal)
+    mock_upload_session.abort.return_value = True
+    assert chunked_uploader.abort() is True
+    assert not os.path.exists(journal.path)
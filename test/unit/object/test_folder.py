@@ -17,6 +17,7 @@
 from boxsdk.object.collaboration import Collaboration, CollaborationRole
 from boxsdk.object.folder import Folder, FolderSyncState
 from boxsdk.object.upload_session import UploadSession
+from boxsdk.pagination.compact_page import CompactRecord
 from boxsdk.session.box_response import BoxResponse
 from boxsdk.util.chunked_uploader import ChunkedUploader
 
@@ -209,6 +210,117 @@ def test_get_items(test_folder, mock_box_session, mock_items_response, limit, of
     assert all([i.id == e.object_id for i, e in zip(items, expected_items)])
 
 
+@pytest.mark.parametrize('use_marker', [True, False])
+def test_get_items_with_prefetch_pages(test_folder, use_marker):
+    items = test_folder.get_items(limit=100, use_marker=use_marker, prefetch_pages=2)
+    assert items._prefetch_pages == 2  # pylint:disable=protected-access
+
+
+@pytest.mark.parametrize('use_marker', [True, False])
+def test_get_items_compact(test_folder, mock_box_session, mock_items, mock_items_response, use_marker):
+    # pylint:disable=redefined-outer-name
+    items_json, _ = mock_items
+    mock_box_session.get.return_value, _ = mock_items_response(100, 0)
+    records = list(test_folder.get_items(limit=100, use_marker=use_marker, compact=True))
+    assert all(isinstance(record, CompactRecord) for record in records)
+    assert records == items_json
+
+
+@pytest.fixture()
+def mock_folder_tree(test_folder, mock_box_session):
+    # The items of each folder in the tree, by folder ID.
+    tree = {
+        test_folder.object_id: [('folder', 'A'), ('folder', 'B'), ('file', 'f1')],
+        'A': [('folder', 'C'), ('file', 'f2'), ('web_link', 'w1')],
+        'B': [],
+        'C': [('file', 'f3')],
+    }
+
+    def get(url, params):
+        folder_id = url.split('/')[-2]
+        assert params['usemarker'] is True
+        mock_box_response = Mock(BoxResponse)
+        mock_box_response.json.return_value = {
+            'entries': [{'type': item_type, 'id': item_id} for item_type, item_id in tree[folder_id]],
+            'next_marker': None,
+        }
+        return mock_box_response
+
+    mock_box_session.get.side_effect = get
+    return tree
+
+
+def _walked_ids(walk):
+    return {
+        folder.object_id: ([subfolder.object_id for subfolder in subfolders], [item.object_id for item in files])
+        for folder, subfolders, files in walk
+    }
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+@pytest.mark.usefixtures('mock_folder_tree')
+def test_walk(test_folder, max_workers):
+    walked = _walked_ids(test_folder.walk(max_workers=max_workers))
+    assert walked == {
+        test_folder.object_id: (['A', 'B'], ['f1']),
+        'A': (['C'], ['f2', 'w1']),
+        'B': ([], []),
+        'C': ([], ['f3']),
+    }
+
+
+@pytest.mark.usefixtures('mock_folder_tree')
+def test_walk_yields_subfolders_as_folders(test_folder):
+    for folder, subfolders, files in test_folder.walk():
+        assert isinstance(folder, Folder)
+        assert all(isinstance(subfolder, Folder) for subfolder in subfolders)
+        assert all(isinstance(item, (File, WebLink)) for item in files)
+
+
+@pytest.mark.usefixtures('mock_folder_tree')
+def test_walk_passes_fields_and_limit(test_folder, mock_box_session):
+    list(test_folder.walk(fields=['name', 'size'], limit=10, max_depth=0))
+    _, kwargs = mock_box_session.get.call_args
+    assert kwargs['params']['fields'] == 'name,size'
+    assert kwargs['params']['limit'] == 10
+
+
+@pytest.mark.usefixtures('mock_folder_tree')
+def test_walk_prunes_by_depth(test_folder):
+    walked = _walked_ids(test_folder.walk(max_depth=1))
+    assert set(walked) == {test_folder.object_id, 'A', 'B'}
+    assert walked['A'] == (['C'], ['f2', 'w1'])
+
+
+@pytest.mark.usefixtures('mock_folder_tree')
+def test_walk_prunes_by_filter(test_folder):
+    walked = _walked_ids(test_folder.walk(folder_filter=lambda folder: folder.object_id != 'A'))
+    assert set(walked) == {test_folder.object_id, 'B'}
+
+
+@pytest.mark.usefixtures('mock_folder_tree')
+def test_walk_prunes_removed_subfolders(test_folder):
+    walked = []
+    for folder, subfolders, _ in test_folder.walk(max_workers=1):
+        walked.append(folder.object_id)
+        subfolders[:] = [subfolder for subfolder in subfolders if subfolder.object_id != 'A']
+    assert walked == [test_folder.object_id, 'B']
+
+
+@pytest.mark.usefixtures('mock_folder_tree')
+def test_walk_raises_when_a_listing_fails(test_folder, mock_box_session):
+    get = mock_box_session.get.side_effect
+
+    def get_or_fail(url, params):
+        if url.split('/')[-2] == 'B':
+            raise BoxAPIException(404)
+        return get(url, params)
+
+    mock_box_session.get.side_effect = get_or_fail
+    with pytest.raises(BoxAPIException):
+        list(test_folder.walk())
+
+
 @pytest.mark.parametrize('is_stream', (True, False))
 def test_upload(
         test_folder,
@@ -262,3 +262,8 @@ def test_base_api_json_object_returns_correctly(test_group_membership, mock_box_
     assert isinstance(membership_response, dict)
     assert membership_response is not expected_data
     assert membership_response == expected_data
+
+
+def test_get_memberships_with_fan_out(test_group):
+    all_members = test_group.get_memberships(fan_out_workers=4)
+    assert all_members._prefetch_workers == 4  # pylint:disable=protected-access
@@ -276,3 +276,8 @@ def test_make_single_metadata_filter(test_search):
     filter_as_dict = metadata_filter.as_dict()
     assert filter_as_dict['templateKey'] == template_key
     assert filter_as_dict['scope'] == scope
+
+
+def test_query_with_fan_out(test_search):
+    results = test_search.query('query', fan_out_workers=4)
+    assert results._prefetch_workers == 4  # pylint:disable=protected-access
@@ -4,6 +4,7 @@
 from abc import ABCMeta, abstractmethod
 from six import add_metaclass
 from six.moves import range   # pylint:disable=redefined-builtin
+from mock import patch
 import pytest
 
 from boxsdk.util.translator import Translator
@@ -42,12 +43,22 @@ def mock_session(self, translator, mock_items_response):
         raise NotImplementedError
 
     @abstractmethod
-    def _object_collection_instance(self, session, limit, return_full_pages=False, starting_pointer=None):
+    def _object_collection_instance(
+            self,
+            session,
+            limit,
+            return_full_pages=False,
+            starting_pointer=None,
+            prefetch_pages=0,
+            stream_entries=False,
+    ):
         """
         :type session: :class:`BoxSession`
         :type limit: `int`
         :type return_full_pages: `bool`
         :type starting_pointer: varies
+        :type prefetch_pages: `int`
+        :type stream_entries: `bool`
         :rtype: :class:`BoxObjectCollection`
         """
         raise NotImplementedError
@@ -85,6 +96,81 @@ def test_object_collection_pages_through_all_entries(self, mock_session, entries
                 iterated_items.append(item_or_page)
         self._assert_items_dict_and_objects_same(entries, iterated_items)
 
+    @pytest.mark.parametrize('return_full_pages', (True, False))
+    @pytest.mark.parametrize('limit', (1, 3, NUM_ENTRIES))
+    @pytest.mark.parametrize('prefetch_pages', (1, 4))
+    def test_object_collection_with_prefetch_pages_through_all_entries(
+            self,
+            mock_session,
+            entries,
+            limit,
+            return_full_pages,
+            prefetch_pages,
+    ):
+        object_collection = self._object_collection_instance(
+            mock_session,
+            limit,
+            return_full_pages,
+            prefetch_pages=prefetch_pages,
+        )
+        iterated_items = []
+        for item_or_page in object_collection:
+            if return_full_pages:
+                iterated_items.extend(item_or_page)
+            else:
+                iterated_items.append(item_or_page)
+        assert [item.name for item in iterated_items] == [entry['name'] for entry in entries]
+        assert mock_session.get.call_count == -(-self.NUM_ENTRIES // limit)
+
+    @pytest.mark.parametrize('limit', (1, 3, NUM_ENTRIES))
+    def test_object_collection_with_stream_entries_pages_through_all_entries(self, mock_session, entries, limit):
+        object_collection = self._object_collection_instance(mock_session, limit, stream_entries=True)
+        assert [item.name for item in object_collection] == [entry['name'] for entry in entries]
+        assert mock_session.get.call_count == -(-self.NUM_ENTRIES // limit)
+        for _, kwargs in mock_session.get.call_args_list:
+            assert kwargs['stream'] is True
+            assert kwargs['expect_json_response'] is False
+
+    def test_object_collection_with_stream_entries_closes_response_when_iteration_stops(self, mock_session):
+        box_responses = []
+        get = mock_session.get.side_effect
+
+        def get_and_record_response(*args, **kwargs):
+            box_responses.append(get(*args, **kwargs))
+            return box_responses[-1]
+
+        mock_session.get.side_effect = get_and_record_response
+        object_collection = self._object_collection_instance(mock_session, limit=5, stream_entries=True)
+        starting_pointer = object_collection.next_pointer()
+        object_collection.next()
+        object_collection._all_items.close()  # pylint:disable=protected-access
+        box_responses[0].network_response.response_as_stream.close.assert_called_once_with()
+        # The pointer only moves on once all the entries of the page have been returned.
+        assert object_collection.next_pointer() == starting_pointer
+
+    def test_object_collection_with_stream_entries_returns_full_pages(self, mock_session, entries):
+        object_collection = self._object_collection_instance(mock_session, 5, return_full_pages=True, stream_entries=True)
+        iterated_items = [item for page in object_collection for item in page]
+        self._assert_items_dict_and_objects_same(entries, iterated_items)
+        for _, kwargs in mock_session.get.call_args_list:
+            assert 'stream' not in kwargs
+
+    @pytest.mark.parametrize('stream_entries', (True, False))
+    @pytest.mark.parametrize('limit', (1, 3, NUM_ENTRIES))
+    def test_to_columns_returns_fields_of_all_entries(self, mock_session, entries, limit, stream_entries):
+        object_collection = self._object_collection_instance(mock_session, limit, stream_entries=stream_entries)
+        with patch.object(Translator, 'translate') as mock_translate:
+            columns = object_collection.to_columns(['name', 'id'])
+        mock_translate.assert_not_called()
+        assert columns == {'name': [entry['name'] for entry in entries], 'id': [entry['id'] for entry in entries]}
+        assert mock_session.get.call_count == -(-self.NUM_ENTRIES // limit)
+
+    def test_to_arrays_returns_fields_of_all_entries(self, mock_session, entries):
+        pytest.importorskip('numpy')
+        object_collection = self._object_collection_instance(mock_session, 5)
+        arrays = object_collection.to_arrays(['sequence_id'])
+        assert list(arrays['sequence_id']) == [entry['sequence_id'] for entry in entries]
+
     def test_new_object_collection_starts_off_from_last_pointer(self, mock_session, entries):
         """
         Start paging with one object collection instance, and then finish paging with a new object collection
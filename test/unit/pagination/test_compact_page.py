@@ -0,0 +1,88 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import pickle
+
+from mock import Mock, PropertyMock
+import pytest
+
+from boxsdk.object.file import File
+from boxsdk.object.folder import Folder
+from boxsdk.pagination.compact_page import CompactPage, CompactRecord
+from boxsdk.session.session import Session
+from boxsdk.util.translator import Translator
+
+
+@pytest.fixture()
+def mock_session():
+    mock_box_session = Mock(Session)
+    type(mock_box_session).translator = PropertyMock(return_value=Translator())
+    return mock_box_session
+
+
+@pytest.fixture()
+def entries():
+    return [
+        {'type': 'folder', 'id': '192429928', 'etag': '1', 'name': 'Stephen Curry Three Pointers'},
+        {'type': 'file', 'id': '818853862', 'etag': '0', 'name': 'Warriors.jpg', 'parent': {'type': 'folder', 'id': '0'}},
+    ]
+
+
+@pytest.fixture()
+def page(mock_session, entries):
+    return CompactPage(session=mock_session, response_object={'entries': entries})
+
+
+def test_page_entries_are_compact_records(page, entries):
+    assert len(page) == 2
+    for record, entry in zip(page, entries):
+        assert isinstance(record, CompactRecord)
+        assert dict(record) == entry
+        assert record == entry
+        assert record.object_id == entry['id']
+        assert record.object_type == entry['type']
+
+
+def test_record_fields_can_be_read_as_attributes_and_keys(page):
+    record = page[1]
+    assert record.name == record['name'] == 'Warriors.jpg'
+    assert record.get('size') is None
+    assert 'etag' in record
+    # Nested objects are left as dicts.
+    assert record.parent == {'type': 'folder', 'id': '0'}
+
+
+def test_record_raises_for_missing_fields(page):
+    record = page[0]
+    with pytest.raises(AttributeError):
+        record.size  # pylint:disable=pointless-statement
+    with pytest.raises(KeyError):
+        record['size']  # pylint:disable=pointless-statement
+
+
+def test_record_is_compact(page):
+    record = page[0]
+    assert not hasattr(record, '__dict__')
+    with pytest.raises(AttributeError):
+        record.name = 'new name'
+
+
+def test_records_with_the_same_fields_share_field_names(mock_session, entries):
+    other_record = CompactRecord(mock_session, dict(entries[0], id='1'))
+    record = CompactRecord(mock_session, entries[0])
+    assert record._field_indexes is other_record._field_indexes  # pylint:disable=protected-access
+
+
+def test_to_object_returns_full_object(page, mock_session, entries):
+    folder, file_ = page[0].to_object(), page[1].to_object()
+    assert isinstance(folder, Folder)
+    assert isinstance(file_, File)
+    assert file_.session is mock_session
+    assert file_.response_object == entries[1]
+    assert isinstance(file_.parent, Folder)
+
+
+def test_record_can_be_pickled(entries):
+    record = CompactRecord(None, entries[0])
+    assert pickle.loads(pickle.dumps(record)) == record
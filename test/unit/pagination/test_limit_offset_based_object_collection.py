@@ -3,8 +3,9 @@
 from __future__ import unicode_literals, absolute_import
 
 import json
+import time
 
-from mock import Mock, PropertyMock
+from mock import Mock, PropertyMock, patch
 import pytest
 
 from boxsdk.network.default_network import DefaultNetworkResponse
@@ -30,7 +31,10 @@ def get_response(limit, offset):
                 'total_count': len(entries),
                 'limit': limit,
             }
-            mock_box_response.content = json.dumps(mock_json).encode()
+            mock_box_response.content = content = json.dumps(mock_json).encode()
+            mock_network_response.response_as_stream.stream.side_effect = lambda **kwargs: (
+                content[i:i + 7] for i in range(0, len(content), 7)
+            )
             mock_box_response.status_code = 200
             mock_box_response.ok = True
             return mock_box_response
@@ -44,7 +48,7 @@ def mock_session(self, translator, mock_items_response):
             return_value=translator
         )
 
-        def mock_items_side_effect(_, params):
+        def mock_items_side_effect(_, params, **kwargs):  # pylint:disable=unused-argument
             limit = min(params.get('limit', self.DEFAULT_LIMIT), self.DEFAULT_LIMIT)
             offset = params.get('offset', 0)
             return mock_items_response(limit, offset)
@@ -65,7 +69,15 @@ def mock_items_side_effect(_, params):
         mock_session.get.side_effect = mock_items_side_effect
         return mock_session
 
-    def _object_collection_instance(self, session, limit=None, return_full_pages=False, starting_pointer=None):
+    def _object_collection_instance(
+            self,
+            session,
+            limit=None,
+            return_full_pages=False,
+            starting_pointer=None,
+            prefetch_pages=0,
+            stream_entries=False,
+    ):
         """Baseclass override."""
         if starting_pointer is None:
             starting_pointer = 0
@@ -75,6 +87,8 @@ def _object_collection_instance(self, session, limit=None, return_full_pages=Fal
             limit=limit,
             return_full_pages=return_full_pages,
             offset=starting_pointer,
+            prefetch_pages=prefetch_pages,
+            stream_entries=stream_entries,
         )
 
     @pytest.mark.parametrize('return_full_pages', (True, False))
@@ -134,3 +148,98 @@ def test_box_returning_bogus_limit_raises_runtime_error(self, mock_session_with_
         )
         with pytest.raises(RuntimeError):
             object_collection.next()
+
+    @staticmethod
+    def _wait_for_requests(mock_session, count):
+        deadline = time.time() + 5
+        while mock_session.get.call_count < count and time.time() < deadline:
+            time.sleep(0.001)
+
+    def test_object_collection_requests_next_pages_while_current_page_is_iterated(self, mock_session):
+        object_collection = self._object_collection_instance(mock_session, limit=5, prefetch_pages=3)
+        object_collection.next()
+        self._wait_for_requests(mock_session, 4)
+        assert sorted(kwargs['params']['offset'] for _, kwargs in mock_session.get.call_args_list) == [0, 5, 10, 15]
+        # Pages aren't requested beyond the total count.
+        assert len(list(object_collection)) == self.NUM_ENTRIES - 1
+        assert sorted(kwargs['params']['offset'] for _, kwargs in mock_session.get.call_args_list) == [0, 5, 10, 15, 20]
+        assert object_collection.next_pointer() == self.NUM_ENTRIES
+
+    def test_object_collection_requests_pages_again_when_total_count_changes(self, mock_session, mock_items_response):
+        def mock_items_side_effect(_, params):
+            offset = params['offset']
+            response = mock_items_response(5, offset)
+            if offset > 0:
+                response.json.return_value['total_count'] = 12
+            return response
+
+        mock_session.get.side_effect = mock_items_side_effect
+        object_collection = self._object_collection_instance(mock_session, limit=5, return_full_pages=True, prefetch_pages=3)
+        assert [len(page) for page in object_collection] == [5, 5, 5]
+        offsets = sorted(kwargs['params']['offset'] for _, kwargs in mock_session.get.call_args_list)
+        assert offsets == [0, 5, 10, 10, 15]
+        assert object_collection.next_pointer() == 12
+
+    @pytest.mark.parametrize('return_full_pages', (True, False))
+    def test_object_collection_with_fan_out_requests_all_pages_after_first_page(self, mock_session, entries, return_full_pages):
+        object_collection = LimitOffsetBasedObjectCollection(
+            mock_session,
+            '/some/endpoint',
+            limit=3,
+            return_full_pages=return_full_pages,
+            fan_out_workers=4,
+        )
+        first = object_collection.next()
+        self._wait_for_requests(mock_session, 9)
+        offsets = sorted(kwargs['params']['offset'] for _, kwargs in mock_session.get.call_args_list)
+        assert offsets == list(range(0, self.NUM_ENTRIES, 3))
+        iterated_items = list(first) if return_full_pages else [first]
+        for item_or_page in object_collection:
+            if return_full_pages:
+                iterated_items.extend(item_or_page)
+            else:
+                iterated_items.append(item_or_page)
+        assert [item.name for item in iterated_items] == [entry['name'] for entry in entries]
+        assert mock_session.get.call_count == 9
+
+    def test_object_collection_with_fan_out_requests_at_most_twice_as_many_pages_ahead(self, mock_session, entries):
+        object_collection = LimitOffsetBasedObjectCollection(
+            mock_session,
+            '/some/endpoint',
+            limit=3,
+            return_full_pages=True,
+            fan_out_workers=1,
+        )
+        pages = [object_collection.next()]
+        self._wait_for_requests(mock_session, 3)
+        time.sleep(0.01)
+        offsets = sorted(kwargs['params']['offset'] for _, kwargs in mock_session.get.call_args_list)
+        assert offsets == [0, 3, 6]
+        pages.extend(object_collection)
+        assert [item.name for page in pages for item in page] == [entry['name'] for entry in entries]
+        offsets = [kwargs['params']['offset'] for _, kwargs in mock_session.get.call_args_list]
+        assert offsets == list(range(0, self.NUM_ENTRIES, 3))
+
+    def test_object_collection_with_fan_out_falls_back_to_sequential_paging(self, mock_session, mock_items_response):
+        # pylint:disable=no-self-use
+        def mock_items_side_effect(_, params):
+            offset = params['offset']
+            response = mock_items_response(5, offset)
+            if offset > 0:
+                response.json.return_value['total_count'] = 12
+            return response
+
+        mock_session.get.side_effect = mock_items_side_effect
+        object_collection = LimitOffsetBasedObjectCollection(
+            mock_session,
+            '/some/endpoint',
+            limit=5,
+            return_full_pages=True,
+            fan_out_workers=2,
+        )
+        # pylint:disable=protected-access
+        with patch.object(object_collection, '_load_next_page', wraps=object_collection._load_next_page) as load_next_page:
+            assert [len(page) for page in object_collection] == [5, 5, 5]
+        # The first page, and the page at offset 10 after the total count changed, are requested sequentially.
+        assert load_next_page.call_count == 2
+        assert object_collection.next_pointer() == 12
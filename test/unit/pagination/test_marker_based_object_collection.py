@@ -2,6 +2,7 @@
 
 from __future__ import unicode_literals, absolute_import
 import json
+import time
 from mock import Mock, PropertyMock, ANY
 import pytest
 
@@ -50,7 +51,10 @@ def get_response(limit, marker):
                 mock_json['next_marker'] = next_marker_value_for_last_page
 
             mock_box_response.json.return_value = mock_json
-            mock_box_response.content = json.dumps(mock_json).encode()
+            mock_box_response.content = content = json.dumps(mock_json).encode()
+            mock_network_response.response_as_stream.stream.side_effect = lambda **kwargs: (
+                content[i:i + 7] for i in range(0, len(content), 7)
+            )
             mock_box_response.status_code = 200
             mock_box_response.ok = True
             return mock_box_response
@@ -62,7 +66,7 @@ def mock_session(self, translator, mock_items_response):
         mock_box_session = Mock(Session)
         type(mock_box_session).translator = PropertyMock(return_value=translator)
 
-        def mock_items_side_effect(_, params):
+        def mock_items_side_effect(_, params, **kwargs):  # pylint:disable=unused-argument
             limit = params['limit']
             marker = params.get('marker', None)
             return mock_items_response(limit, marker)
@@ -76,6 +80,8 @@ def _object_collection_instance(  # pylint:disable=arguments-differ
             limit,
             return_full_pages=False,
             starting_pointer=None,
+            prefetch_pages=0,
+            stream_entries=False,
             supports_limit_offset_paging=False
     ):
         """Baseclass override."""
@@ -86,6 +92,8 @@ def _object_collection_instance(  # pylint:disable=arguments-differ
             return_full_pages=return_full_pages,
             marker=starting_pointer,
             supports_limit_offset_paging=supports_limit_offset_paging,
+            prefetch_pages=prefetch_pages,
+            stream_entries=stream_entries,
         )
 
     @pytest.mark.parametrize('return_full_pages', (True, False))
@@ -109,3 +117,12 @@ def test_object_collection_specifies_marker_param(self, mock_session, supports_l
         if supports_limit_offset_paging:
             expected_params['useMarker'] = True
         mock_session.get.assert_called_with(ANY, params=expected_params)
+
+    def test_object_collection_requests_next_page_while_current_page_is_iterated(self, mock_session):
+        object_collection = self._object_collection_instance(mock_session, limit=5, return_full_pages=True, prefetch_pages=3)
+        object_collection.next()
+        deadline = time.time() + 5
+        while mock_session.get.call_count < 2 and time.time() < deadline:
+            time.sleep(0.001)
+        # Only the page after the current one can be requested, since its marker is in the current page.
+        assert [kwargs['params'].get('marker') for _, kwargs in mock_session.get.call_args_list] == [None, 'marker_5']
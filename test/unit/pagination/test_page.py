@@ -2,7 +2,7 @@
 
 from __future__ import unicode_literals, absolute_import
 
-from mock import Mock, PropertyMock
+from mock import Mock, PropertyMock, patch
 import pytest
 from six.moves import range  # pylint:disable=redefined-builtin
 
@@ -105,3 +105,13 @@ def test_translation_of_page_entries(page_builder, mock_session, item_checker):
     page = page_builder(response=response)
     for i, item in enumerate(page):
         item_checker(mock_session.translator.get(response_entries[i]['type']), response_entries[i], item)
+
+
+def test_to_columns(page_builder):
+    response = {'entries': [{'type': 'file', 'id': '1', 'size': 10}, {'type': 'folder', 'id': '2', 'size': 20}]}
+    page = page_builder(response)
+    with patch.object(Translator, 'translate') as mock_translate:
+        columns = page.to_columns(['type', 'size'])
+    mock_translate.assert_not_called()
+    assert columns['type'] == ['file', 'folder']
+    assert list(columns['size']) == [10, 20]
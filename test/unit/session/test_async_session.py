@@ -0,0 +1,350 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import asyncio
+from concurrent.futures import Executor
+import threading
+
+from mock import MagicMock, Mock, PropertyMock, patch
+import pytest
+
+from boxsdk.auth.oauth2 import OAuth2
+from boxsdk.config import API
+from boxsdk.exception import BoxAPIException
+from boxsdk.network.default_network import DefaultNetworkResponse
+from boxsdk.object.cloneable import Cloneable
+from boxsdk.session.box_response import BoxResponse
+from boxsdk.util.api_call_decorator import api_call
+from boxsdk.util.rate_limiter import EndpointClass, RateLimiter
+from boxsdk.util.response_cache import ResponseCache
+
+pytest.importorskip('aiohttp')
+# pylint:disable=wrong-import-position
+from boxsdk.network.async_network import AsyncDefaultNetwork  # noqa: E402
+from boxsdk.session.async_session import AsyncAPICall, AsyncAuthorizedSession, AsyncSession  # noqa: E402
+# pylint:enable=wrong-import-position
+
+
+@pytest.fixture
+def run():
+    return asyncio.get_event_loop().run_until_complete
+
+
+@pytest.fixture
+def mock_oauth(access_token):
+    mock_oauth = MagicMock(OAuth2)
+    mock_oauth.access_token = access_token
+    return mock_oauth
+
+
+@pytest.fixture
+def network_responses():
+    return []
+
+
+@pytest.fixture
+def mock_network_layer(network_responses):
+    mock_network_layer = Mock(AsyncDefaultNetwork)
+
+    async def request(method, url, access_token, **kwargs):
+        # pylint:disable=unused-argument
+        return network_responses.pop(0)
+
+    async def retry_after(delay, request_method, *args, **kwargs):
+        # pylint:disable=unused-argument
+        return await request_method(*args, **kwargs)
+
+    mock_network_layer.request.side_effect = request
+    mock_network_layer.retry_after.side_effect = retry_after
+    return mock_network_layer
+
+
+@pytest.fixture
+def unauthorized_session(mock_network_layer):
+    return AsyncSession(network_layer=mock_network_layer)
+
+
+@pytest.fixture
+def box_session(mock_oauth, mock_network_layer):
+    return AsyncAuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer)
+
+
+@pytest.mark.parametrize('method_name', ['get', 'post', 'put', 'delete', 'options'])
+def test_request_is_awaitable(unauthorized_session, run, network_responses, generic_successful_response, test_url, method_name):
+    network_responses.append(generic_successful_response)
+    box_response = run(getattr(unauthorized_session, method_name)(test_url))
+    assert isinstance(box_response, BoxResponse)
+    assert box_response.status_code == 200
+
+
+def test_session_uses_async_default_network_by_default():
+    # pylint:disable=protected-access
+    assert isinstance(AsyncSession()._network_layer, AsyncDefaultNetwork)
+
+
+def test_request_is_retried_after_server_error(
+        unauthorized_session,
+        run,
+        mock_network_layer,
+        network_responses,
+        server_error_response,
+        generic_successful_response,
+        test_url,
+):
+    network_responses.extend([server_error_response, generic_successful_response])
+    box_response = run(unauthorized_session.get(test_url))
+    assert box_response.status_code == 200
+    assert mock_network_layer.retry_after.call_count == 1
+    assert mock_network_layer.request.call_count == 2
+
+
+def test_request_is_retried_at_most_max_retry_attempts_times(
+        unauthorized_session,
+        run,
+        mock_network_layer,
+        network_responses,
+        server_error_response,
+        test_url,
+):
+    network_responses.extend([server_error_response] * (API.MAX_RETRY_ATTEMPTS + 1))
+    with pytest.raises(BoxAPIException):
+        run(unauthorized_session.get(test_url))
+    assert mock_network_layer.request.call_count == API.MAX_RETRY_ATTEMPTS + 1
+
+
+def test_request_revalidates_cached_response(
+        mock_network_layer,
+        run,
+        network_responses,
+        generic_successful_response,
+        test_url,
+):
+    not_modified_response = Mock(DefaultNetworkResponse, status_code=304, ok=True, headers={})
+    network_responses.extend([generic_successful_response, not_modified_response])
+    generic_successful_response.headers = {'ETag': '3'}
+    unauthorized_session = AsyncSession(network_layer=mock_network_layer, response_cache=ResponseCache())
+    run(unauthorized_session.get(test_url))
+    box_response = run(unauthorized_session.get(test_url))
+    assert box_response.status_code == 200
+    assert box_response.content == generic_successful_response.content
+    _, kwargs = mock_network_layer.request.call_args
+    assert kwargs['headers']['If-None-Match'] == '3'
+
+
+def test_failed_request_raises(unauthorized_session, run, network_responses, bad_network_response, test_url):
+    network_responses.append(bad_network_response)
+    with pytest.raises(BoxAPIException) as exc_info:
+        run(unauthorized_session.get(test_url))
+    assert exc_info.value.status == 404
+
+
+def test_authorized_session_renews_session_after_unauthorized_response(
+        box_session,
+        run,
+        mock_oauth,
+        mock_network_layer,
+        network_responses,
+        unauthorized_response,
+        generic_successful_response,
+        test_url,
+        access_token,
+        new_access_token,
+):
+    type(unauthorized_response).access_token_used = PropertyMock(return_value=access_token)
+    network_responses.extend([unauthorized_response, generic_successful_response])
+
+    def refresh(access_token_used):
+        assert access_token_used == access_token
+        mock_oauth.access_token = new_access_token
+        return new_access_token, None
+
+    mock_oauth.refresh.side_effect = refresh
+    box_response = run(box_session.get(test_url))
+    assert box_response.status_code == 200
+    assert mock_oauth.refresh.call_count == 1
+    _, kwargs = mock_network_layer.request.call_args
+    assert kwargs['headers']['Authorization'] == 'Bearer {0}'.format(new_access_token)
+    assert kwargs['access_token'] == new_access_token
+
+
+@pytest.mark.parametrize('access_token', [None])
+def test_authorized_session_gets_access_token_before_request(
+        box_session,
+        run,
+        mock_oauth,
+        mock_network_layer,
+        network_responses,
+        generic_successful_response,
+        test_url,
+        new_access_token,
+):
+    network_responses.append(generic_successful_response)
+
+    def refresh(access_token_used):
+        assert access_token_used is None
+        mock_oauth.access_token = new_access_token
+        return new_access_token, None
+
+    mock_oauth.refresh.side_effect = refresh
+    run(box_session.get(test_url))
+    assert mock_oauth.refresh.call_count == 1
+    _, kwargs = mock_network_layer.request.call_args
+    assert kwargs['headers']['Authorization'] == 'Bearer {0}'.format(new_access_token)
+
+
+def test_as_user_returns_async_session_sharing_network_layer(box_session, mock_network_layer, mock_user_id):
+    # pylint:disable=protected-access
+    user_session = box_session.as_user(Mock(object_id=mock_user_id))
+    assert isinstance(user_session, AsyncAuthorizedSession)
+    assert user_session._network_layer is mock_network_layer
+
+
+def test_close_closes_network_layer(unauthorized_session, run, mock_network_layer):
+    async def close():
+        pass
+
+    mock_network_layer.close.side_effect = close
+    run(unauthorized_session.close())
+    assert mock_network_layer.close.call_count == 1
+
+
+def test_close_shuts_down_the_api_call_executor_only_of_the_session_that_created_it(
+        box_session,
+        run,
+        mock_network_layer,
+        mock_user_id,
+):
+    # pylint:disable=protected-access
+    async def close():
+        pass
+
+    mock_network_layer.close.side_effect = close
+    api_call_executor = box_session._api_call_executor = Mock(Executor)
+    run(box_session.as_user(Mock(object_id=mock_user_id)).close())
+    api_call_executor.shutdown.assert_not_called()
+    run(box_session.close())
+    api_call_executor.shutdown.assert_called_once_with(wait=False)
+
+
+def test_close_does_not_shut_down_an_api_call_executor_passed_to_the_session(run, mock_network_layer):
+    async def close():
+        pass
+
+    mock_network_layer.close.side_effect = close
+    api_call_executor = Mock(Executor)
+    run(AsyncSession(network_layer=mock_network_layer, api_call_executor=api_call_executor).close())
+    api_call_executor.shutdown.assert_not_called()
+
+
+def test_request_waits_for_rate_limiter_without_blocking(mock_oauth, mock_network_layer, run, network_responses, generic_successful_response):
+    mock_rate_limiter = Mock(RateLimiter)
+    mock_rate_limiter.reserve.return_value = 0.5
+    box_session = AsyncAuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, rate_limiter=mock_rate_limiter)
+    network_responses.append(generic_successful_response)
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    with patch.object(asyncio, 'sleep', sleep):
+        run(box_session.get(box_session.get_url('files', '42')))
+    mock_rate_limiter.reserve.assert_called_once_with(EndpointClass.API)
+    mock_rate_limiter.acquire.assert_not_called()
+    assert delays == [0.5]
+
+
+class Endpoint(Cloneable):
+    """A cloneable with API call methods that make several requests."""
+
+    def __init__(self, session):
+        super(Endpoint, self).__init__()
+        self._session = session
+        self.runs = 0
+
+    @property
+    def session(self):
+        return self._session
+
+    def clone(self, session=None):
+        return self.__class__(session or self._session)
+
+    @api_call
+    def get_two(self, url):
+        self.runs += 1
+        first = self._session.get(url).json()
+        second = self._session.post(url, data=first['key0']).json()
+        return first, second
+
+    @api_call
+    def get_or_none(self, url):
+        try:
+            return self._session.get(url).json()
+        except BoxAPIException:
+            return None
+
+    @api_call
+    def get_nested(self, url):
+        return self.get_or_none(url), self.get_or_none(url)
+
+    @api_call
+    def get_thread(self, url):
+        self._session.get(url)
+        return threading.current_thread()
+
+
+def test_api_call_method_returns_awaitable_result(unauthorized_session, run, network_responses, generic_successful_response, test_url):
+    network_responses.extend([generic_successful_response, generic_successful_response])
+    endpoint = Endpoint(unauthorized_session)
+    api_call_result = endpoint.get_two(test_url)
+    assert isinstance(api_call_result, AsyncAPICall)
+    first, second = run(api_call_result)
+    assert first == second == generic_successful_response.json()
+    assert endpoint.runs == 1
+    assert not network_responses
+
+
+def test_api_call_method_can_handle_failed_requests(unauthorized_session, run, network_responses, bad_network_response, test_url):
+    network_responses.append(bad_network_response)
+    assert run(Endpoint(unauthorized_session).get_or_none(test_url)) is None
+
+
+def test_api_call_method_can_call_other_api_call_methods(
+        unauthorized_session,
+        run,
+        mock_network_layer,
+        network_responses,
+        generic_successful_response,
+        bad_network_response,
+        test_url,
+):
+    network_responses.extend([bad_network_response, generic_successful_response])
+    assert run(Endpoint(unauthorized_session).get_nested(test_url)) == (None, generic_successful_response.json())
+    assert mock_network_layer.request.call_count == 2
+
+
+def test_api_call_method_runs_off_the_event_loop_thread(unauthorized_session, run, network_responses, generic_successful_response, test_url):
+    network_responses.append(generic_successful_response)
+    assert run(Endpoint(unauthorized_session).get_thread(test_url)) is not threading.current_thread()
+
+
+def test_sessions_created_from_a_session_share_its_api_call_executor(box_session, mock_user_id):
+    # pylint:disable=protected-access
+    assert box_session.as_user(Mock(object_id=mock_user_id))._api_call_executor is box_session._api_call_executor
+
+
+def test_api_call_methods_can_be_awaited_concurrently(
+        unauthorized_session,
+        run,
+        mock_network_layer,
+        network_responses,
+        generic_successful_response,
+        test_url,
+):
+    network_responses.extend([generic_successful_response] * 20)
+
+    async def get_all():
+        return await asyncio.gather(*[Endpoint(unauthorized_session).get_two(test_url) for _ in range(10)])
+
+    assert len(run(get_all())) == 10
+    assert mock_network_layer.request.call_count == 20
@@ -4,6 +4,7 @@
 
 from functools import partial
 from io import IOBase
+import json
 from numbers import Number
 
 from mock import MagicMock, Mock, PropertyMock, call, patch, ANY
@@ -11,10 +12,13 @@
 
 from boxsdk.auth.oauth2 import OAuth2
 from boxsdk.config import API, Proxy
-from boxsdk.exception import BoxAPIException, BoxException
+from boxsdk.exception import BoxAPIException, BoxCircuitOpenException, BoxException
 from boxsdk.network.default_network import DefaultNetwork, DefaultNetworkResponse
 from boxsdk.session.box_response import BoxResponse
 from boxsdk.session.session import Session, Translator, AuthorizedSession
+from boxsdk.util.rate_limiter import EndpointClass, RateLimiter
+from boxsdk.util.response_cache import ResponseCache
+from boxsdk.util.retry_scheduler import CircuitBreaker, CircuitState, RetryPolicy, RetryScheduler
 
 
 @pytest.fixture(scope='function', params=[False, True])
@@ -350,3 +354,173 @@ def test_proxy_malformed_dict_does_not_attach(box_session, monkeypatch, mock_net
 
 def test_proxy_network_config_property(box_session):
     assert isinstance(box_session.proxy_config, Proxy)
+
+
+@pytest.mark.parametrize('url,expected_endpoint_class', [
+    ('{0}/files/42'.format(API.BASE_API_URL), EndpointClass.API),
+    ('{0}/files/content'.format(API.UPLOAD_URL), EndpointClass.UPLOAD),
+    ('{0}/search'.format(API.BASE_API_URL), EndpointClass.SEARCH),
+    ('{0}/token'.format(API.OAUTH2_API_URL), None),
+])
+def test_session_waits_for_rate_limiter_before_each_request(
+        mock_oauth,
+        mock_network_layer,
+        server_error_response,
+        generic_successful_response,
+        url,
+        expected_endpoint_class,
+):
+    mock_rate_limiter = Mock(RateLimiter)
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, rate_limiter=mock_rate_limiter)
+    mock_network_layer.request.side_effect = [server_error_response, generic_successful_response]
+    mock_network_layer.retry_after.side_effect = lambda delay, request, *args, **kwargs: request(*args, **kwargs)
+    box_session.get(url)
+    assert mock_rate_limiter.acquire.call_args_list == [call(expected_endpoint_class)] * 2
+
+
+def test_sessions_created_from_session_share_rate_limiter(mock_oauth, mock_network_layer, mock_user_id):
+    mock_rate_limiter = Mock(RateLimiter)
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, rate_limiter=mock_rate_limiter)
+    user_session = box_session.as_user(Mock(object_id=mock_user_id))
+    assert user_session.get_constructor_kwargs()['rate_limiter'] is mock_rate_limiter
+
+
+def test_session_retries_according_to_retry_scheduler(
+        mock_oauth,
+        mock_network_layer,
+        server_error_response,
+        bad_network_response,
+        test_url,
+):
+    retry_scheduler = RetryScheduler(server_error_policy=RetryPolicy(max_attempts=7, use_retry_after_header=False))
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, retry_scheduler=retry_scheduler)
+    mock_network_layer.request.side_effect = [server_error_response] * 7 + [bad_network_response]
+    mock_network_layer.retry_after.side_effect = lambda delay, request, *args, **kwargs: request(*args, **kwargs)
+    with patch('random.uniform', return_value=0.5):
+        with pytest.raises(BoxAPIException) as exc_info:
+            box_session.get(test_url)
+    assert exc_info.value.status == 404
+    assert [args[0] for args, _ in mock_network_layer.retry_after.call_args_list] == [0.5] * 7
+
+
+def test_session_does_not_retry_when_retry_scheduler_declines(mock_oauth, mock_network_layer, retry_after_response, test_url):
+    retry_scheduler = RetryScheduler(policies={202: None, 429: None})
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, retry_scheduler=retry_scheduler)
+    mock_network_layer.request.side_effect = [retry_after_response]
+    box_response = box_session.get(test_url)
+    assert box_response.status_code == retry_after_response.status_code
+    mock_network_layer.retry_after.assert_not_called()
+
+
+def test_session_fails_fast_while_circuit_breaker_is_open(
+        mock_oauth,
+        mock_network_layer,
+        server_error_response,
+        test_url,
+):
+    circuit_breaker = CircuitBreaker(failure_threshold=2)
+    retry_scheduler = RetryScheduler(circuit_breaker=circuit_breaker)
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, retry_scheduler=retry_scheduler)
+    mock_network_layer.request.return_value = server_error_response
+    mock_network_layer.retry_after.side_effect = lambda delay, request, *args, **kwargs: request(*args, **kwargs)
+    with pytest.raises(BoxAPIException):
+        box_session.get(test_url)
+    assert mock_network_layer.request.call_count == 2
+    assert circuit_breaker.state == CircuitState.OPEN
+    with pytest.raises(BoxCircuitOpenException) as exc_info:
+        box_session.as_user(Mock(object_id='42')).get(test_url)
+    assert exc_info.value.url == test_url
+    assert mock_network_layer.request.call_count == 2
+
+
+def _json_network_response(status_code, json_value=None):
+    mock_network_response = Mock(DefaultNetworkResponse, headers={})
+    mock_network_response.status_code = status_code
+    mock_network_response.ok = status_code < 400
+    if json_value is None:
+        mock_network_response.content = b''
+        mock_network_response.json.side_effect = ValueError
+    else:
+        mock_network_response.content = json.dumps(json_value).encode('utf-8')
+        mock_network_response.json.return_value = json_value
+    return mock_network_response
+
+
+@pytest.fixture
+def folder_json():
+    return {'type': 'folder', 'id': '42', 'etag': '3', 'name': 'Reports'}
+
+
+def test_session_revalidates_cached_responses_with_etag(mock_oauth, mock_network_layer, test_url, folder_json):
+    cache = ResponseCache()
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, response_cache=cache)
+    mock_network_layer.request.side_effect = [_json_network_response(200, folder_json), _json_network_response(304)]
+    assert box_session.get(test_url, params={'fields': 'name,etag'}).json() == folder_json
+    box_response = box_session.get(test_url, params={'fields': 'name,etag'})
+    assert box_response.status_code == 200
+    assert box_response.json() == folder_json
+    _, kwargs = mock_network_layer.request.call_args
+    assert kwargs['headers']['If-None-Match'] == '3'
+    assert (cache.misses, cache.revalidations, cache.hits) == (1, 1, 0)
+
+
+def test_session_returns_fresh_cached_responses_without_request(mock_oauth, mock_network_layer, test_url, folder_json):
+    cache = ResponseCache(ttl=60)
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, response_cache=cache)
+    mock_network_layer.request.side_effect = [_json_network_response(200, folder_json)]
+    box_session.get(test_url)
+    assert box_session.get(test_url).json() == folder_json
+    assert mock_network_layer.request.call_count == 1
+    assert cache.hits == 1
+
+
+def test_session_replaces_changed_cached_responses(mock_oauth, mock_network_layer, test_url, folder_json):
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, response_cache=ResponseCache())
+    changed_folder_json = dict(folder_json, etag='4', name='Archive')
+    mock_network_layer.request.side_effect = [
+        _json_network_response(200, folder_json),
+        _json_network_response(200, changed_folder_json),
+        _json_network_response(304),
+    ]
+    box_session.get(test_url)
+    assert box_session.get(test_url).json() == changed_folder_json
+    assert box_session.get(test_url).json() == changed_folder_json
+    _, kwargs = mock_network_layer.request.call_args
+    assert kwargs['headers']['If-None-Match'] == '4'
+
+
+def test_session_caches_responses_separately_for_each_user(mock_oauth, mock_network_layer, test_url, folder_json):
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, response_cache=ResponseCache(ttl=60))
+    mock_network_layer.request.side_effect = [_json_network_response(200, folder_json)] * 2
+    box_session.get(test_url)
+    box_session.as_user(Mock(object_id='7')).get(test_url)
+    assert mock_network_layer.request.call_count == 2
+
+
+@pytest.mark.parametrize('method', ['PUT', 'DELETE'])
+def test_session_drops_cached_responses_after_other_requests(mock_oauth, mock_network_layer, test_url, folder_json, method):
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, response_cache=ResponseCache(ttl=60))
+    mock_network_layer.request.side_effect = [_json_network_response(200, folder_json)] * 3
+    box_session.get(test_url)
+    box_session.request(method, test_url, expect_json_response=False)
+    box_session.get(test_url)
+    assert mock_network_layer.request.call_count == 3
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'headers': {'If-None-Match': '3'}},
+    {'stream': True},
+    {'expect_json_response': False},
+])
+def test_session_does_not_cache_conditional_streamed_or_non_json_requests(
+        mock_oauth,
+        mock_network_layer,
+        test_url,
+        folder_json,
+        kwargs,
+):
+    box_session = AuthorizedSession(oauth=mock_oauth, network_layer=mock_network_layer, response_cache=ResponseCache(ttl=60))
+    mock_network_layer.request.side_effect = [_json_network_response(200, folder_json)] * 2
+    box_session.get(test_url, **kwargs)
+    box_session.get(test_url, **kwargs)
+    assert mock_network_layer.request.call_count == 2
@@ -5,7 +5,7 @@
 from mock import Mock
 import pytest
 
-from boxsdk.exception import BoxAPIException, BoxOAuthException
+from boxsdk.exception import BoxAPIException, BoxCircuitOpenException, BoxOAuthException
 from boxsdk.network.default_network import DefaultNetworkResponse
 
 
@@ -68,3 +68,10 @@ def test_box_oauth_exception(has_network_response):
 Method: {3}
 Headers: {4}'''.format(message, status, url, method, headers if has_network_response else 'N/A')
     assert box_exception.network_response is network_response
+
+
+def test_box_circuit_open_exception():
+    box_exception = BoxCircuitOpenException(url='https://example.com', method='GET')
+    assert box_exception.url == 'https://example.com'
+    assert box_exception.method == 'GET'
+    assert str(box_exception) == 'Request "GET https://example.com" was not made, because the circuit breaker is open.'
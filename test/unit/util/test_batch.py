@@ -0,0 +1,138 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import json
+from threading import Lock
+import time
+
+from mock import MagicMock, Mock, patch
+import pytest
+
+from boxsdk.auth.oauth2 import OAuth2
+from boxsdk.client import Client
+from boxsdk.exception import BoxAPIException
+from boxsdk.network.default_network import DefaultNetwork, DefaultNetworkResponse
+from boxsdk.object.file import File
+from boxsdk.object.user import User
+from boxsdk.session.session import AuthorizedSession
+from boxsdk.util import batch
+from boxsdk.util.batch import BatchExecutor, BatchOperation
+
+
+def _network_response(status_code, json_value, headers=None):
+    network_response = Mock(DefaultNetworkResponse, headers=headers or {}, status_code=status_code, ok=status_code < 400)
+    network_response.json.return_value = json_value
+    network_response.content = json.dumps(json_value).encode('utf-8')
+    return network_response
+
+
+@pytest.fixture
+def mock_network_layer():
+    mock_network_layer = Mock(DefaultNetwork)
+
+    def request(method, url, access_token, **kwargs):
+        # pylint:disable=unused-argument
+        file_id = url.rsplit('/', 1)[-1]
+        if file_id == 'missing':
+            return _network_response(404, {'code': 'not_found', 'message': 'Not Found'})
+        return _network_response(200, {'type': 'file', 'id': file_id, 'name': json.loads(kwargs['data'])['name']})
+
+    mock_network_layer.request.side_effect = request
+    mock_network_layer.retry_after.side_effect = lambda delay, request_method, *args, **kwargs: request_method(*args, **kwargs)
+    return mock_network_layer
+
+
+@pytest.fixture
+def session(mock_network_layer, access_token):
+    mock_oauth = MagicMock(OAuth2)
+    mock_oauth.access_token = access_token
+    return AuthorizedSession(mock_oauth, network_layer=mock_network_layer)
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_execute_returns_results_and_exceptions_in_order(session, max_workers):
+    file_ids = ['1', 'missing', '3', '4', '5']
+    operations = [BatchOperation(File(session, file_id).rename, 'name {0}'.format(file_id)) for file_id in file_ids]
+    results = BatchExecutor(session, max_workers=max_workers).execute(operations)
+    assert isinstance(results[1], BoxAPIException)
+    assert results[1].status == 404
+    renamed_files = [results[0]] + results[2:]
+    assert [renamed_file.object_id for renamed_file in renamed_files] == ['1', '3', '4', '5']
+    assert [renamed_file.name for renamed_file in renamed_files] == ['name 1', 'name 3', 'name 4', 'name 5']
+
+
+def test_execute_makes_api_calls_through_batch_session(session, mock_network_layer):
+    file_to_rename = File(session, '1')
+    BatchExecutor(session).execute([BatchOperation(file_to_rename.rename, 'new name')])
+    _, kwargs = mock_network_layer.request.call_args
+    assert kwargs['headers']['Authorization'] == 'Bearer {0}'.format(session._oauth.access_token)  # pylint:disable=protected-access
+
+
+def test_execute_keeps_the_default_headers_of_the_object_session(session, mock_network_layer):
+    file_to_rename = File(session, '1').clone(session.as_user(User(session, '2')))
+    results = BatchExecutor(session).execute([BatchOperation(file_to_rename.rename, 'new name')])
+    assert results[0].name == 'new name'
+    _, kwargs = mock_network_layer.request.call_args
+    assert kwargs['headers']['As-User'] == '2'
+
+
+def test_execute_limits_requests_per_host(session, mock_network_layer):
+    lock = Lock()
+    in_flight = {'count': 0, 'max': 0}
+    request = mock_network_layer.request.side_effect
+
+    def slow_request(*args, **kwargs):
+        with lock:
+            in_flight['count'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['count'])
+        time.sleep(0.01)
+        with lock:
+            in_flight['count'] -= 1
+        return request(*args, **kwargs)
+
+    mock_network_layer.request.side_effect = slow_request
+    operations = [BatchOperation(File(session, str(file_id)).rename, 'name') for file_id in range(20)]
+    results = BatchExecutor(session, max_workers=8, max_requests_per_host=2).execute(operations)
+    assert all(isinstance(result, File) for result in results)
+    assert in_flight['max'] == 2
+
+
+def test_retry_after_response_holds_back_new_requests(mock_network_layer):
+    retry_after_response = _network_response(429, {}, headers={'Retry-After': '30'})
+    mock_network_layer.request.side_effect = [retry_after_response]
+    # pylint:disable=protected-access
+    batch_network = batch._BatchNetwork(mock_network_layer, max_requests_per_host=None)
+    with patch.object(batch, 'time') as mock_time:
+        mock_time.time.side_effect = [100, 100, 110, 130]
+        assert batch_network.request('GET', 'https://api.box.com/2.0/files/1', 'token') is retry_after_response
+        batch_network._wait_until_unpaused()
+    mock_time.sleep.assert_called_once_with(20)
+
+
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_iterate_takes_operations_from_a_bounded_window(session, max_workers):
+    taken_file_ids = []
+
+    def operations():
+        for file_id in range(20):
+            taken_file_ids.append(file_id)
+            yield BatchOperation(File(session, str(file_id)).rename, 'name')
+
+    results = BatchExecutor(session, max_workers=max_workers).iterate(operations())
+    for file_id, result in enumerate(results):
+        assert result.object_id == str(file_id)
+        assert len(taken_file_ids) <= file_id + 1 + max_workers * 2
+    assert len(taken_file_ids) == 20
+
+
+@pytest.mark.parametrize('kwargs', [{'max_workers': 0}, {'max_requests_per_host': 0}])
+def test_batch_executor_rejects_invalid_limits(session, kwargs):
+    with pytest.raises(ValueError):
+        BatchExecutor(session, **kwargs)
+
+
+def test_client_batch_executes_operations(session):
+    client = Client(session._oauth, session=session)  # pylint:disable=protected-access
+    results = client.batch([BatchOperation(client.file('1').rename, 'new name')], max_workers=2)
+    assert [result.name for result in results] == ['new name']
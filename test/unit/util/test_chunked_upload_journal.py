@@ -0,0 +1,91 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import io
+import os
+
+import pytest
+
+from boxsdk.exception import BoxException
+from boxsdk.util.chunked_upload_journal import ChunkedUploadJournal
+
+
+@pytest.fixture
+def journal_path(tmpdir):
+    return str(tmpdir.join('upload.journal'))
+
+
+def _part(offset):
+    return {'part_id': 'PART{0}'.format(offset), 'offset': offset, 'size': 2, 'sha1': None}
+
+
+def test_new_journal_is_empty(journal_path):
+    # pylint:disable=redefined-outer-name
+    journal = ChunkedUploadJournal(journal_path)
+    assert journal.upload_session_id is None
+    assert journal.file_size is None
+    assert journal.parts == []
+    assert not os.path.exists(journal_path)
+
+
+def test_journal_is_reloaded_by_another_instance(journal_path):
+    # pylint:disable=redefined-outer-name
+    journal = ChunkedUploadJournal(journal_path)
+    journal.start('F971964745A5CD0C001BZ4E58196BFD', 7, 2)
+    journal.record_part(_part(2))
+    journal.record_part(_part(0))
+    reloaded_journal = ChunkedUploadJournal(journal_path)
+    assert reloaded_journal.upload_session_id == 'F971964745A5CD0C001BZ4E58196BFD'
+    assert reloaded_journal.file_size == 7
+    assert reloaded_journal.parts == [_part(0), _part(2)]
+
+
+def test_start_keeps_parts_recorded_for_the_same_upload_session(journal_path):
+    # pylint:disable=redefined-outer-name
+    journal = ChunkedUploadJournal(journal_path)
+    journal.start('F971964745A5CD0C001BZ4E58196BFD', 7, 2)
+    journal.record_part(_part(0))
+    reloaded_journal = ChunkedUploadJournal(journal_path)
+    reloaded_journal.start('F971964745A5CD0C001BZ4E58196BFD', 7, 2)
+    reloaded_journal.record_part(_part(2))
+    assert ChunkedUploadJournal(journal_path).parts == [_part(0), _part(2)]
+
+
+def test_start_raises_for_a_different_upload_session(journal_path):
+    # pylint:disable=redefined-outer-name
+    ChunkedUploadJournal(journal_path).start('F971964745A5CD0C001BZ4E58196BFD', 7, 2)
+    with pytest.raises(BoxException):
+        ChunkedUploadJournal(journal_path).start('D5E3F7ADA11A38A0A66AD0B64AACA658', 7, 2)
+
+
+def test_partially_written_last_line_is_ignored_and_overwritten(journal_path):
+    # pylint:disable=redefined-outer-name
+    journal = ChunkedUploadJournal(journal_path)
+    journal.start('F971964745A5CD0C001BZ4E58196BFD', 7, 2)
+    journal.record_part(_part(0))
+    with io.open(journal_path, 'ab') as journal_file:
+        journal_file.write(b'{"offset": 2, "part_')
+    reloaded_journal = ChunkedUploadJournal(journal_path)
+    assert reloaded_journal.parts == [_part(0)]
+    reloaded_journal.start('F971964745A5CD0C001BZ4E58196BFD', 7, 2)
+    reloaded_journal.record_part(_part(4))
+    assert ChunkedUploadJournal(journal_path).parts == [_part(0), _part(4)]
+
+
+def test_record_part_raises_before_start(journal_path):
+    # pylint:disable=redefined-outer-name
+    with pytest.raises(BoxException):
+        ChunkedUploadJournal(journal_path).record_part(_part(0))
+
+
+def test_delete_removes_the_journal(journal_path):
+    # pylint:disable=redefined-outer-name
+    journal = ChunkedUploadJournal(journal_path)
+    journal.start('F971964745A5CD0C001BZ4E58196BFD', 7, 2)
+    journal.record_part(_part(0))
+    journal.delete()
+    assert not os.path.exists(journal_path)
+    assert journal.upload_session_id is None
+    assert journal.parts == []
+    journal.delete()
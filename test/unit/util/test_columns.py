@@ -0,0 +1,81 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from array import array
+import math
+
+from mock import Mock, patch
+import pytest
+
+from boxsdk.object.file import File
+from boxsdk.session.session import Session
+from boxsdk.util import columns
+from boxsdk.util.columns import ColumnBuilder
+
+
+@pytest.fixture
+def entries():
+    return [
+        {'type': 'file', 'id': '1', 'name': 'a.txt', 'size': 10, 'parent': {'type': 'folder', 'id': '100'}},
+        {'type': 'folder', 'id': '2', 'name': 'b', 'size': 20, 'parent': {'type': 'folder', 'id': '100'}},
+        {'type': 'web_link', 'id': '3', 'name': 'c', 'parent': None},
+    ]
+
+
+def test_columns_hold_values_of_fields_in_order(entries):
+    column_builder = ColumnBuilder(['id', 'name', 'parent.id'])
+    column_builder.add_all(entries)
+    assert list(column_builder.columns.items()) == [
+        ('id', ['1', '2', '3']),
+        ('name', ['a.txt', 'b', 'c']),
+        ('parent.id', ['100', '100', None]),
+    ]
+
+
+def test_numeric_fields_are_stored_in_typed_arrays(entries):
+    column_builder = ColumnBuilder(['size', 'id'])
+    column_builder.add_all(entries)
+    assert column_builder.columns['size'] == array(str(ColumnBuilder.DEFAULT_TYPECODES['size']), [10, 20, 0])
+    column_builder = ColumnBuilder(['size'], typecodes={'size': 'd'})
+    column_builder.add_all(entries)
+    sizes = column_builder.columns['size']
+    assert sizes.typecode == 'd'
+    assert sizes[:2] == array(str('d'), [10, 20])
+    assert math.isnan(sizes[2])
+
+
+@pytest.mark.parametrize('long_itemsize,expected_typecode', [(8, 'l'), (4, 'd')])
+def test_int64_typecode_falls_back_when_q_is_not_available(long_itemsize, expected_typecode):
+    # pylint:disable=protected-access
+    def make_array(typecode):
+        if typecode == 'q':
+            raise ValueError('bad typecode (must be c, b, B, u, h, H, i, I, l, L, f or d)')
+        return Mock(itemsize=long_itemsize if typecode == 'l' else 8)
+
+    with patch.object(columns, 'array', make_array):
+        assert columns._get_int64_typecode() == expected_typecode
+
+
+def test_strings_of_categorical_fields_are_interned(entries):
+    column_builder = ColumnBuilder(['type'])
+    column_builder.add_all(dict(entry, type=''.join(['fi', 'le'])) for entry in entries)
+    types = column_builder.columns['type']
+    assert types[0] is types[1] is types[2]
+
+
+def test_translated_objects_can_be_added(entries):
+    column_builder = ColumnBuilder(['name', 'size'])
+    column_builder.add(File(Mock(Session), '1', entries[0]))
+    assert column_builder.columns == {'name': ['a.txt'], 'size': array(str(ColumnBuilder.DEFAULT_TYPECODES['size']), [10])}
+
+
+def test_to_arrays(entries):
+    numpy = pytest.importorskip('numpy')
+    column_builder = ColumnBuilder(['name', 'size'])
+    column_builder.add_all(entries)
+    arrays = column_builder.to_arrays()
+    assert arrays['size'].dtype == numpy.int64
+    assert arrays['size'].sum() == 30
+    assert arrays['name'].dtype == object
+    assert list(arrays['name']) == ['a.txt', 'b', 'c']
@@ -3,7 +3,7 @@
 from __future__ import unicode_literals
 from datetime import datetime, timedelta
 import pytest
-from boxsdk.util.compat import with_metaclass
+from boxsdk.util.compat import replace_file, with_metaclass
 
 
 @pytest.fixture(params=(
@@ -50,3 +50,13 @@ class Subclass(temporary_class):
 
     assert type(Subclass) is Meta   # pylint:disable=unidiomatic-typecheck
     assert Subclass.__bases__ == bases
+
+
+def test_replace_file_replaces_existing_destination(tmpdir):
+    source = tmpdir.join('source')
+    destination = tmpdir.join('destination')
+    source.write('new')
+    destination.write('old')
+    replace_file(str(source), str(destination))
+    assert destination.read() == 'new'
+    assert not source.exists()
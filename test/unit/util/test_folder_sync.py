@@ -0,0 +1,217 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+from mock import Mock, patch
+import pytest
+from requests.exceptions import Timeout
+
+from boxsdk.exception import BoxException
+from boxsdk.object.event import Event
+from boxsdk.object.events import Events, UserEventsStreamType
+from boxsdk.object.folder import Folder
+from boxsdk.util.folder_sync import FolderTreeSync
+
+
+# pylint:disable=redefined-outer-name
+
+
+ROOT_ID = '100'
+
+
+@pytest.fixture
+def index_path(tmpdir):
+    return str(tmpdir.join('tree.json'))
+
+
+@pytest.fixture
+def tree():
+    # The items of each folder in the tree, by folder ID.
+    return {
+        ROOT_ID: [('folder', 'A', 'Documents'), ('file', 'f1', 'notes.txt')],
+        'A': [('folder', 'B', 'Reports'), ('file', 'f2', 'budget.xlsx')],
+        'B': [('file', 'f3', 'q1.pdf')],
+    }
+
+
+@pytest.fixture
+def root_folder(mock_box_session, tree):
+    def walk(folder, **_):
+        folder_ids = [folder.object_id]
+        while folder_ids:
+            folder_id = folder_ids.pop(0)
+            items = [
+                mock_box_session.translator.translate(mock_box_session, {'type': item_type, 'id': item_id, 'name': name})
+                for item_type, item_id, name in tree.get(folder_id, [])
+            ]
+            subfolders = [item for item in items if item.type == 'folder']
+            folder_ids.extend(subfolder.object_id for subfolder in subfolders)
+            yield Folder(mock_box_session, folder_id), subfolders, [item for item in items if item.type != 'folder']
+
+    with patch.object(Folder, 'walk', autospec=True, side_effect=walk) as mock_walk:
+        folder = Folder(mock_box_session, ROOT_ID)
+        folder.mock_walk = mock_walk
+        yield folder
+
+
+@pytest.fixture
+def mock_events():
+    with patch('boxsdk.util.folder_sync.Events') as events_class:
+        events = events_class.return_value = Mock(Events)
+        events.get_latest_stream_position.return_value = 1000
+        events.get_events.return_value = {'entries': [], 'next_stream_position': 1000}
+        yield events
+
+
+@pytest.fixture
+def tree_sync(root_folder, index_path, mock_events):
+    # pylint:disable=unused-argument
+    tree_sync = FolderTreeSync(root_folder, index_path)
+    tree_sync.snapshot()
+    return tree_sync
+
+
+def _event(event_type, item_type, item_id, name, parent_id=None, ancestor_ids=(), **fields):
+    source = {'type': item_type, 'id': item_id, 'name': name, 'item_status': 'active'}
+    if parent_id is not None:
+        source['parent'] = {'type': 'folder', 'id': parent_id}
+        source['path_collection'] = {'entries': [{'type': 'folder', 'id': folder_id} for folder_id in ancestor_ids]}
+    source.update(fields)
+    return Event({'type': 'event', 'event_id': '{0}-{1}'.format(event_type, item_id), 'event_type': event_type, 'source': source})
+
+
+def test_snapshot_indexes_the_tree(tree_sync, mock_events):
+    mock_events.get_latest_stream_position.assert_called_once_with(stream_type=UserEventsStreamType.CHANGES)
+    assert tree_sync.stream_position == 1000
+    assert set(tree_sync.items) == {('folder', 'A'), ('file', 'f1'), ('folder', 'B'), ('file', 'f2'), ('file', 'f3')}
+    assert tree_sync.items[('file', 'f3')] == {'type': 'file', 'id': 'f3', 'name': 'q1.pdf', 'parent_id': 'B'}
+    assert tree_sync.get_path('file', 'f3') == ['Documents', 'Reports', 'q1.pdf']
+
+
+@pytest.mark.usefixtures('mock_events')
+def test_index_is_reloaded_by_another_instance(tree_sync, root_folder, index_path):
+    reloaded_tree_sync = FolderTreeSync(root_folder, index_path)
+    assert reloaded_tree_sync.stream_position == tree_sync.stream_position
+    assert reloaded_tree_sync.items == tree_sync.items
+    assert reloaded_tree_sync.get_path('file', 'f3') == ['Documents', 'Reports', 'q1.pdf']
+
+
+@pytest.mark.usefixtures('mock_events', 'tree_sync')
+def test_index_of_another_folder_raises(mock_box_session, index_path):
+    with pytest.raises(BoxException):
+        FolderTreeSync(Folder(mock_box_session, '200'), index_path)
+
+
+@pytest.mark.parametrize('event', [
+    _event('ITEM_UPLOAD', 'file', 'f4', 'q2.pdf', 'B', [ROOT_ID, 'A', 'B']),
+    _event('ITEM_CREATE', 'folder', 'C', 'Drafts', ROOT_ID, [ROOT_ID]),
+    _event('ITEM_COPY', 'file', 'f4', 'q2.pdf', 'B', [ROOT_ID, 'A', 'B']),
+])
+def test_created_items_are_added(tree_sync, event):
+    assert tree_sync.apply_event(event) is True
+    item = event['source']
+    assert tree_sync.items[(item['type'], item['id'])]['name'] == item['name']
+    assert tree_sync.items[(item['type'], item['id'])]['parent_id'] == item['parent']['id']
+
+
+def test_renamed_items_are_updated(tree_sync):
+    assert tree_sync.apply_event(_event('ITEM_RENAME', 'folder', 'A', 'Docs', ROOT_ID, [ROOT_ID])) is True
+    assert tree_sync.get_path('file', 'f3') == ['Docs', 'Reports', 'q1.pdf']
+
+
+def test_moved_folders_keep_their_contents(tree_sync):
+    assert tree_sync.apply_event(_event('ITEM_MOVE', 'folder', 'B', 'Reports', ROOT_ID, [ROOT_ID])) is True
+    assert tree_sync.get_path('file', 'f3') == ['Reports', 'q1.pdf']
+
+
+@pytest.mark.parametrize('event', [
+    _event('ITEM_TRASH', 'folder', 'A', 'Documents', ROOT_ID, [ROOT_ID], item_status='trashed'),
+    _event('ITEM_MOVE', 'folder', 'A', 'Documents', '999', ['0', '999']),
+])
+def test_trashed_or_moved_out_folders_are_removed_with_their_contents(tree_sync, event):
+    assert tree_sync.apply_event(event) is True
+    assert set(tree_sync.items) == {('file', 'f1')}
+
+
+def test_files_and_folders_with_the_same_id_are_indexed_separately(tree_sync):
+    assert tree_sync.apply_event(_event('ITEM_UPLOAD', 'file', 'A', 'a.txt', ROOT_ID, [ROOT_ID])) is True
+    assert tree_sync.get_path('file', 'A') == ['a.txt']
+    assert tree_sync.get_path('file', 'f3') == ['Documents', 'Reports', 'q1.pdf']
+    assert tree_sync.apply_event(_event('ITEM_TRASH', 'file', 'A', 'a.txt', ROOT_ID, [ROOT_ID], item_status='trashed')) is True
+    assert ('file', 'A') not in tree_sync.items
+    assert tree_sync.get_path('file', 'f3') == ['Documents', 'Reports', 'q1.pdf']
+
+
+def test_trashing_a_file_with_the_id_of_the_indexed_folder_only_removes_the_file(tree_sync):
+    items = dict(tree_sync.items)
+    assert tree_sync.apply_event(_event('ITEM_UPLOAD', 'file', ROOT_ID, 'root.txt', 'A', [ROOT_ID, 'A'])) is True
+    assert tree_sync.get_path('file', ROOT_ID) == ['Documents', 'root.txt']
+    assert tree_sync.apply_event(_event('ITEM_TRASH', 'file', ROOT_ID, 'root.txt', 'A', [ROOT_ID, 'A'], item_status='trashed')) is True
+    assert tree_sync.items == items
+
+
+def test_events_outside_the_tree_are_ignored(tree_sync):
+    items = dict(tree_sync.items)
+    assert tree_sync.apply_event(_event('ITEM_UPLOAD', 'file', 'f9', 'other.txt', '999', ['0', '999'])) is True
+    assert tree_sync.apply_event(_event('ITEM_DOWNLOAD', 'file', 'f1', 'notes.txt', ROOT_ID, [ROOT_ID])) is True
+    assert tree_sync.items == items
+
+
+def test_folders_moved_into_the_tree_are_listed(tree_sync, root_folder, tree):
+    tree['D'] = [('file', 'f5', 'slides.pptx')]
+    assert tree_sync.apply_event(_event('ITEM_MOVE', 'folder', 'D', 'Talks', 'A', [ROOT_ID, 'A'])) is False
+    assert ('file', 'f5') not in tree_sync.items
+    root_folder.mock_walk.reset_mock()
+    tree_sync.sync()
+    assert root_folder.mock_walk.call_count == 1
+    assert tree_sync.get_path('file', 'f5') == ['Documents', 'Talks', 'slides.pptx']
+
+
+def test_items_with_unindexed_parents_relist_the_closest_indexed_ancestor(tree_sync, root_folder, tree):
+    tree['B'].append(('folder', 'E', 'Archive'))
+    tree['E'] = [('file', 'f6', 'q4.pdf')]
+    assert tree_sync.apply_event(_event('ITEM_UPLOAD', 'file', 'f6', 'q4.pdf', 'E', [ROOT_ID, 'A', 'B', 'E'])) is False
+    root_folder.mock_walk.reset_mock()
+    tree_sync.sync()
+    (listed_folder,), _ = root_folder.mock_walk.call_args
+    assert listed_folder.object_id == 'B'
+    assert tree_sync.get_path('file', 'f6') == ['Documents', 'Reports', 'Archive', 'q4.pdf']
+
+
+def test_sync_applies_all_pages_of_events_and_saves(tree_sync, mock_events, root_folder, index_path):
+    first_page = [_event('ITEM_UPLOAD', 'file', 'f{0}'.format(i), 'n', 'B', [ROOT_ID, 'A', 'B']) for i in range(500)]
+    second_page = [_event('ITEM_TRASH', 'file', 'f1', 'notes.txt', ROOT_ID, [ROOT_ID], item_status='trashed')]
+    mock_events.get_events.side_effect = [
+        {'entries': first_page, 'next_stream_position': 1500},
+        {'entries': second_page, 'next_stream_position': 1501},
+    ]
+    assert tree_sync.sync() == first_page + second_page
+    assert mock_events.get_events.call_args_list[1][1]['stream_position'] == 1500
+    assert tree_sync.stream_position == 1501
+    assert ('file', 'f1') not in tree_sync.items
+    reloaded_tree_sync = FolderTreeSync(root_folder, index_path)
+    assert reloaded_tree_sync.stream_position == 1501
+    assert reloaded_tree_sync.items == tree_sync.items
+
+
+@pytest.mark.usefixtures('mock_events')
+def test_sync_takes_a_snapshot_first(root_folder, index_path):
+    tree_sync = FolderTreeSync(root_folder, index_path)
+    assert tree_sync.sync() == []
+    assert tree_sync.stream_position == 1000
+    assert ('file', 'f3') in tree_sync.items
+
+
+def test_listen_syncs_on_new_changes(tree_sync, mock_events):
+    event = _event('ITEM_UPLOAD', 'file', 'f4', 'q2.pdf', 'B', [ROOT_ID, 'A', 'B'])
+    mock_events.get_long_poll_options.return_value = options = {'url': 'https://realtime.box.com', 'retry_timeout': 610}
+    mock_events.long_poll.side_effect = [
+        Mock(json=Mock(return_value={'message': 'reconnect'})),
+        Timeout(),
+        Mock(json=Mock(return_value={'message': 'new_change'})),
+    ]
+    mock_events.get_events.return_value = {'entries': [event], 'next_stream_position': 1001}
+    assert next(tree_sync.listen()) is event
+    mock_events.long_poll.assert_called_with(options, 1000)
+    assert tree_sync.stream_position == 1001
+    assert ('file', 'f4') in tree_sync.items
@@ -0,0 +1,63 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+
+import pytest
+from six.moves import range  # pylint:disable=redefined-builtin
+
+from boxsdk.util.json_stream import StreamedJSONPage
+
+
+def _chunks(content, chunk_size):
+    return [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+
+
+@pytest.fixture
+def page():
+    return {
+        'total_count': 3,
+        'entries': [
+            {'type': 'user', 'id': '1', 'name': 'Zoë'},
+            {'type': 'user', 'id': '2', 'tags': [1, 2.5, None, True, False]},
+            {'type': 'user', 'id': '3', 'nested': {'entries': [{'id': '4'}]}},
+        ],
+        'limit': 1000,
+        'next_marker': 'abc',
+    }
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 1024])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_entries_and_metadata_are_parsed_from_chunks(page, chunk_size, indent):
+    content = json.dumps(page, indent=indent, ensure_ascii=False).encode('utf-8')
+    streamed_page = StreamedJSONPage(_chunks(content, chunk_size))
+    assert list(streamed_page.entries()) == page['entries']
+    del page['entries']
+    assert streamed_page.metadata == page
+
+
+def test_entries_are_parsed_as_they_are_received(page):
+    content = json.dumps(page).encode('utf-8')
+    chunks = iter(_chunks(content, 16))
+    entries = StreamedJSONPage(chunks).entries()
+    assert next(entries) == page['entries'][0]
+    assert next(chunks, None) is not None
+
+
+def test_numbers_split_across_chunks_are_parsed_whole():
+    streamed_page = StreamedJSONPage([b'{"total_count": 12', b'34, "entries": [5', b'6]}'])
+    assert list(streamed_page.entries()) == [56]
+    assert streamed_page.metadata == {'total_count': 1234}
+
+
+@pytest.mark.parametrize('content', [b'{}', b'{"entries": []}', b' { "entries" : [ ] } '])
+def test_page_without_entries(content):
+    assert list(StreamedJSONPage(_chunks(content, 3)).entries()) == []
+
+
+@pytest.mark.parametrize('content', [b'[]', b'{"entries": [1,', b'{"entries": [1 2]}', b'{1: 2}', b''])
+def test_invalid_page_raises_value_error(content):
+    with pytest.raises(ValueError):
+        list(StreamedJSONPage(_chunks(content, 3)).entries())
@@ -0,0 +1,70 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+from mock import Mock, patch
+import pytest
+
+from boxsdk.util import rate_limiter
+from boxsdk.util.rate_limiter import EndpointClass, RateLimiter, TokenBucket
+
+
+@pytest.fixture
+def mock_time():
+    with patch.object(rate_limiter, 'time') as mock_time:
+        mock_time.time.return_value = 1000
+        yield mock_time
+
+
+def test_token_bucket_allows_burst_of_capacity_requests(mock_time):
+    bucket = TokenBucket(rate=2, capacity=3)
+    assert [bucket.reserve() for _ in range(5)] == [0, 0, 0, 0.5, 1]
+    mock_time.sleep.assert_not_called()
+
+
+def test_token_bucket_refills_at_rate(mock_time):
+    bucket = TokenBucket(rate=2, capacity=2)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0.5]
+    mock_time.time.return_value = 1001
+    # The reserved token has been added, along with another one.
+    assert [bucket.reserve() for _ in range(2)] == [0, 0.5]
+    mock_time.time.return_value = 1100
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0.5]
+
+
+def test_token_bucket_acquire_sleeps_until_token_is_available(mock_time):
+    bucket = TokenBucket(rate=4)
+    for _ in range(5):
+        bucket.acquire()
+    mock_time.sleep.assert_called_once_with(0.25)
+
+
+def test_token_bucket_capacity_defaults_to_one_second_of_tokens():
+    assert TokenBucket(rate=10).capacity == 10
+    assert TokenBucket(rate=0.5).capacity == 1
+
+
+@pytest.mark.parametrize('rate,capacity', [(0, None), (-1, 5), (1, 0.5)])
+def test_token_bucket_rejects_invalid_arguments(rate, capacity):
+    with pytest.raises(ValueError):
+        TokenBucket(rate, capacity)
+
+
+def test_rate_limiter_uses_bucket_of_endpoint_class():
+    api_bucket, upload_bucket = Mock(TokenBucket), Mock(TokenBucket)
+    upload_bucket.reserve.return_value = 2
+    limiter = RateLimiter({EndpointClass.API: api_bucket, EndpointClass.UPLOAD: upload_bucket})
+    limiter.acquire(EndpointClass.API)
+    api_bucket.acquire.assert_called_once_with()
+    assert limiter.reserve(EndpointClass.UPLOAD) == 2
+    upload_bucket.acquire.assert_not_called()
+
+
+@pytest.mark.parametrize('endpoint_class', [EndpointClass.SEARCH, None])
+def test_rate_limiter_does_not_limit_other_endpoints(endpoint_class):
+    api_bucket = Mock(TokenBucket)
+    limiter = RateLimiter({EndpointClass.API: api_bucket})
+    limiter.acquire(endpoint_class)
+    assert limiter.reserve(endpoint_class) == 0
+    api_bucket.acquire.assert_not_called()
+    api_bucket.reserve.assert_not_called()
@@ -0,0 +1,22 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+from hashlib import sha1
+
+from mock import Mock
+
+from boxsdk.util import redis_response_cache
+
+
+def test_redis_storage_stores_values_at_prefixed_keys():
+    redis_server = Mock(redis_response_cache.StrictRedis)
+    redis_server.get.return_value = b'{}'
+    storage = redis_response_cache.RedisResponseCacheStorage('box:', expiry=300, redis_server=redis_server)
+    redis_key = 'box:{0}'.format(sha1(b'https://api.box.com/2.0/folders/0').hexdigest())
+    storage.set('https://api.box.com/2.0/folders/0', b'{}')
+    redis_server.set.assert_called_once_with(redis_key, b'{}', ex=300)
+    assert storage.get('https://api.box.com/2.0/folders/0') == b'{}'
+    redis_server.get.assert_called_once_with(redis_key)
+    storage.delete('https://api.box.com/2.0/folders/0')
+    redis_server.delete.assert_called_once_with(redis_key)
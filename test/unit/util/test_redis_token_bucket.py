@@ -0,0 +1,57 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+from mock import Mock, patch
+import pytest
+
+from boxsdk.util import redis_token_bucket
+
+
+def test_redis_token_bucket_reserves_token_with_script():
+    redis_server = Mock(redis_token_bucket.StrictRedis)
+    redis_server.register_script.return_value = reserve_script = Mock(return_value=b'0.25')
+    bucket = redis_token_bucket.RedisTokenBucket('box-api-tokens', rate=4, capacity=8, redis_server=redis_server)
+    redis_server.register_script.assert_called_once_with(bucket._RESERVE_SCRIPT)  # pylint:disable=protected-access
+    with patch.object(redis_token_bucket, 'time') as mock_time:
+        mock_time.time.return_value = 1000.5
+        assert bucket.reserve() == 0.25
+    reserve_script.assert_called_once_with(keys=['box-api-tokens'], args=['4.0', '8.0', '1000.5'])
+    assert bucket.key == 'box-api-tokens'
+
+
+def test_redis_token_bucket_acquire_sleeps_for_reserved_delay():
+    redis_server = Mock(redis_token_bucket.StrictRedis)
+    redis_server.register_script.return_value = Mock(return_value=b'1.5')
+    bucket = redis_token_bucket.RedisTokenBucket('box-api-tokens', rate=1, redis_server=redis_server)
+    with patch('boxsdk.util.rate_limiter.time') as mock_time:
+        bucket.acquire()
+    mock_time.sleep.assert_called_once_with(1.5)
+
+
+def test_redis_token_bucket_does_not_expire_while_in_debt():
+    lupa = pytest.importorskip('lupa')
+    lua = lupa.LuaRuntime()
+    hashes, expiries = {}, {}
+
+    def call(command, key, *args):
+        if command == 'HMGET':
+            return lua.table(*[hashes.get(key, {}).get(field) for field in args])
+        if command == 'HMSET':
+            hashes[key] = dict(zip(args[::2], args[1::2]))
+        elif command == 'PEXPIRE':
+            expiries[key] = args[0]
+        return None
+
+    lua.globals().call = call
+    lua.execute('redis = {call = function(...) return call(...) end}')
+    script = lua.eval('function(KEYS, ARGV) {0} end'.format(redis_token_bucket.RedisTokenBucket._RESERVE_SCRIPT))  # pylint:disable=protected-access
+
+    def reserve(now):
+        return float(script(lua.table('box-api-tokens'), lua.table('2.0', '4.0', repr(now))))
+
+    # Reserve three buckets' worth of tokens at once, so that the bucket is 8 tokens in debt.
+    delays = [reserve(1000.0) for _ in range(12)]
+    assert delays[-1] == 4
+    # It takes 6 seconds to repay the debt and refill the bucket at 2 tokens per second.
+    assert expiries['box-api-tokens'] == 7000
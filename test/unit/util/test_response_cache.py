@@ -0,0 +1,175 @@
+# coding: utf-8
+
+from __future__ import unicode_literals, absolute_import
+
+import json
+import os
+from threading import Thread
+
+from mock import Mock, patch
+import pytest
+
+from boxsdk.network.default_network import DefaultNetworkResponse
+from boxsdk.util import response_cache
+from boxsdk.util.response_cache import (
+    DiskResponseCacheStorage,
+    MemoryResponseCacheStorage,
+    ResponseCache,
+)
+
+
+# pylint:disable=redefined-outer-name
+
+
+@pytest.fixture
+def mock_time():
+    with patch.object(response_cache, 'time') as mock_time:
+        mock_time.time.return_value = 1000
+        yield mock_time
+
+
+def _network_response(response_json, headers=None):
+    mock_network_response = Mock(DefaultNetworkResponse)
+    mock_network_response.json.return_value = response_json
+    mock_network_response.content = json.dumps(response_json).encode('utf-8')
+    mock_network_response.headers = headers or {}
+    return mock_network_response
+
+
+def test_memory_storage_drops_least_recently_used_values():
+    storage = MemoryResponseCacheStorage(max_entries=2)
+    storage.set('a', b'1')
+    storage.set('b', b'2')
+    assert storage.get('a') == b'1'
+    storage.set('c', b'3')
+    assert storage.get('b') is None
+    assert storage.get('a') == b'1'
+    assert storage.get('c') == b'3'
+    assert len(storage) == 2
+
+
+def test_memory_storage_stays_under_max_bytes():
+    storage = MemoryResponseCacheStorage(max_bytes=10)
+    storage.set('a', b'1234')
+    storage.set('b', b'5678')
+    storage.set('a', b'12')
+    assert storage.size == 6
+    storage.set('c', b'901234')
+    assert storage.get('b') is None
+    assert storage.size == 8
+    storage.delete('c')
+    assert storage.size == 2
+
+
+def test_disk_storage_is_shared_by_instances(tmpdir):
+    directory = str(tmpdir.join('cache'))
+    storage = DiskResponseCacheStorage(directory)
+    storage.set('https://api.box.com/2.0/folders/0', b'{"id": "0"}')
+    assert DiskResponseCacheStorage(directory).get('https://api.box.com/2.0/folders/0') == b'{"id": "0"}'
+    storage.delete('https://api.box.com/2.0/folders/0')
+    assert storage.get('https://api.box.com/2.0/folders/0') is None
+    assert os.listdir(directory) == []
+
+
+def test_disk_storage_handles_concurrent_writes_of_a_key(tmpdir):
+    storage = DiskResponseCacheStorage(str(tmpdir))
+    threads = [Thread(target=storage.set, args=('k', 'value {0}'.format(i).encode('utf-8'))) for i in range(4)]
+    with patch.object(storage, '_logger') as mock_logger:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    mock_logger.warning.assert_not_called()
+    assert storage.get('k') in [b'value 0', b'value 1', b'value 2', b'value 3']
+    assert os.listdir(str(tmpdir)) == [os.path.basename(storage._get_path('k'))]  # pylint:disable=protected-access
+
+
+def test_disk_storage_logs_failed_writes(tmpdir):
+    storage = DiskResponseCacheStorage(str(tmpdir))
+    with patch.object(response_cache, 'replace_file', side_effect=OSError()):
+        with patch.object(storage, '_logger') as mock_logger:
+            storage.set('k', b'value')
+    assert mock_logger.warning.call_count == 1
+    assert storage.get('k') is None
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_disk_storage_drops_least_recently_used_files(tmpdir):
+    storage = DiskResponseCacheStorage(str(tmpdir), max_bytes=10)
+    storage.set('a', b'1234')
+    storage.set('b', b'5678')
+    os.utime(storage._get_path('a'), (1, 1))  # pylint:disable=protected-access
+    storage.set('c', b'9012')
+    assert storage.get('a') is None
+    assert storage.get('b') == b'5678'
+    assert storage.get('c') == b'9012'
+
+
+def test_get_key_depends_on_user_and_shared_link():
+    url = 'https://api.box.com/2.0/folders/0'
+    keys = {
+        ResponseCache.get_key(url, {}),
+        ResponseCache.get_key(url, {'As-User': '42'}),
+        ResponseCache.get_key(url, {'BoxApi': 'shared_link=https://app.box.com/s/abc'}),
+    }
+    assert len(keys) == 3
+    assert ResponseCache.get_key(url, {'Authorization': 'Bearer a'}) == ResponseCache.get_key(url, {})
+
+
+def test_get_variant_ignores_parameter_order():
+    assert ResponseCache.get_variant({'fields': 'name', 'limit': 1}) == ResponseCache.get_variant({'limit': 1, 'fields': 'name'})
+    assert ResponseCache.get_variant(None) == ResponseCache.get_variant({}) == ''
+
+
+@pytest.mark.parametrize('headers', [{}, {'ETag': '7'}])
+@pytest.mark.usefixtures('mock_time')
+def test_store_caches_response_with_etag(headers):
+    cache = ResponseCache()
+    cache.store('key', 'fields=name', _network_response({'type': 'folder', 'id': '0', 'etag': '7'}, headers))
+    cached_response = cache.get('key', 'fields=name')
+    assert cached_response.etag == '7'
+    assert cached_response.stored_at == 1000
+    assert cached_response.json() == {'type': 'folder', 'id': '0', 'etag': '7'}
+    assert cached_response.status_code == 200
+    assert cached_response.ok
+    assert cache.get('key', '') is None
+    assert cache.misses == 1
+
+
+def test_store_keeps_other_variants():
+    cache = ResponseCache()
+    cache.store('key', 'fields=name', _network_response({'etag': '1', 'name': 'a'}))
+    cache.store('key', 'fields=size', _network_response({'etag': '1', 'size': 2}))
+    assert cache.get('key', 'fields=name').json() == {'etag': '1', 'name': 'a'}
+    assert cache.get('key', 'fields=size').json() == {'etag': '1', 'size': 2}
+    cache.invalidate('key')
+    assert cache.get('key', 'fields=name') is None
+    assert cache.get('key', 'fields=size') is None
+
+
+def test_responses_without_etags_are_only_cached_with_ttl():
+    cache = ResponseCache()
+    cache.store('key', '', _network_response({'entries': []}))
+    assert cache.get('key', '') is None
+    cache = ResponseCache(ttl=60)
+    cache.store('key', '', _network_response({'entries': []}))
+    assert cache.get('key', '').etag is None
+
+
+def test_responses_are_fresh_for_ttl(mock_time):
+    cache = ResponseCache(ttl=60)
+    cache.store('key', '', _network_response({'etag': '1'}))
+    mock_time.time.return_value = 1059
+    assert cache.is_fresh(cache.get('key', ''))
+    mock_time.time.return_value = 1060
+    cached_response = cache.get('key', '')
+    assert not cache.is_fresh(cached_response)
+    assert cache.revalidate('key', '', cached_response) is cached_response
+    assert cache.is_fresh(cache.get('key', ''))
+    assert cache.revalidations == 1
+
+
+def test_cache_works_with_disk_storage(tmpdir):
+    cache = ResponseCache(DiskResponseCacheStorage(str(tmpdir)))
+    cache.store('key', '', _network_response({'etag': '1', 'name': '☃'}))
+    assert ResponseCache(DiskResponseCacheStorage(str(tmpdir))).get('key', '').json() == {'etag': '1', 'name': '☃'}
@@ -0,0 +1,156 @@
+# coding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+from mock import patch
+import pytest
+
+from boxsdk.util import retry_scheduler
+from boxsdk.util.retry_scheduler import CircuitBreaker, CircuitState, RetryPolicy, RetryScheduler
+
+
+@pytest.fixture
+def mock_time():
+    with patch.object(retry_scheduler, 'time') as mock_time:
+        mock_time.time.return_value = 1000
+        yield mock_time
+
+
+@pytest.mark.parametrize('retry_after_header,use_retry_after_header,expected_delay', [
+    ('7', True, 7),
+    ('7', False, 2.5),
+    ('not a number', True, 2.5),
+    (None, True, 2.5),
+])
+def test_retry_policy_uses_retry_after_header(retry_after_header, use_retry_after_header, expected_delay):
+    policy = RetryPolicy(use_retry_after_header=use_retry_after_header)
+    with patch('random.uniform', return_value=2.5):
+        assert policy.get_delay(None, retry_after_header) == expected_delay
+
+
+@pytest.mark.parametrize('previous_delay,expected_upper_bound', [(None, 6), (2, 6), (5, 15), (0.5, 2)])
+def test_retry_policy_uses_decorrelated_jitter(previous_delay, expected_upper_bound):
+    policy = RetryPolicy(base_interval=2, max_interval=100)
+    with patch('random.uniform', return_value=3) as mock_uniform:
+        assert policy.get_delay(previous_delay, None) == 3
+    mock_uniform.assert_called_once_with(2, expected_upper_bound)
+
+
+def test_retry_policy_caps_delay_at_max_interval():
+    policy = RetryPolicy(base_interval=1, max_interval=10)
+    with patch('random.uniform', return_value=27):
+        assert policy.get_delay(9, None) == 10
+
+
+@pytest.mark.usefixtures('mock_time')
+def test_circuit_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.consecutive_failures == 3
+    assert breaker.times_opened == 1
+    assert not breaker.allow_request()
+
+
+def test_circuit_breaker_lets_one_trial_request_through_when_half_open(mock_time):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+    breaker.record_failure()
+    mock_time.time.return_value = 1030
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.consecutive_failures == 0
+
+
+def test_circuit_breaker_opens_again_when_trial_request_fails(mock_time):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+    breaker.record_failure()
+    mock_time.time.return_value = 1030
+    assert breaker.allow_request()
+    mock_time.time.return_value = 1031
+    breaker.record_failure()
+    mock_time.time.return_value = 1060
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.times_opened == 1
+    mock_time.time.return_value = 1061
+    assert breaker.allow_request()
+
+
+def test_circuit_breaker_lets_another_trial_request_through_if_one_does_not_finish(mock_time):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30)
+    breaker.record_failure()
+    mock_time.time.return_value = 1030
+    assert breaker.allow_request()
+    mock_time.time.return_value = 1059
+    assert not breaker.allow_request()
+    mock_time.time.return_value = 1060
+    assert breaker.allow_request()
+
+
+@pytest.mark.parametrize('status_code,expected_delay', [(202, 2), (429, 2), (500, 2), (503, 2), (400, None), (404, None)])
+def test_retry_scheduler_retries_default_status_codes(status_code, expected_delay):
+    scheduler = RetryScheduler()
+    with patch('random.uniform', return_value=2):
+        assert scheduler.get_retry_delay(scheduler.start(), status_code, 0, None) == expected_delay
+
+
+def test_retry_scheduler_uses_policy_for_status_code():
+    scheduler = RetryScheduler(
+        policies={429: RetryPolicy(max_attempts=10), 202: None},
+        server_error_policy=RetryPolicy(max_attempts=2),
+    )
+    retry_state = scheduler.start()
+    assert scheduler.max_attempts == 10
+    assert scheduler.get_retry_delay(retry_state, 202, 0, '1') is None
+    assert scheduler.get_retry_delay(retry_state, 429, 9, '1') == 1
+    assert scheduler.get_retry_delay(retry_state, 429, 10, '1') is None
+    assert scheduler.get_retry_delay(retry_state, 502, 1, '1') == 1
+    assert scheduler.get_retry_delay(retry_state, 502, 2, '1') is None
+
+
+def test_retry_scheduler_passes_previous_delay_to_policy():
+    scheduler = RetryScheduler(server_error_policy=RetryPolicy(base_interval=1, max_interval=100))
+    retry_state = scheduler.start()
+    with patch('random.uniform', side_effect=[2, 5]) as mock_uniform:
+        scheduler.get_retry_delay(retry_state, 500, 0, None)
+        scheduler.get_retry_delay(retry_state, 500, 1, None)
+    assert [args for args, _ in mock_uniform.call_args_list] == [(1, 3), (1, 6)]
+
+
+def test_retry_scheduler_does_not_retry_beyond_max_retry_time(mock_time):
+    scheduler = RetryScheduler(max_retry_time=60)
+    retry_state = scheduler.start()
+    mock_time.time.return_value = 1030
+    assert scheduler.get_retry_delay(retry_state, 429, 0, '30') == 30
+    mock_time.time.return_value = 1061
+    assert scheduler.get_retry_delay(retry_state, 429, 1, '0') is None
+
+
+@pytest.mark.usefixtures('mock_time')
+def test_retry_scheduler_fails_fast_while_circuit_is_open():
+    scheduler = RetryScheduler(circuit_breaker=CircuitBreaker(failure_threshold=2))
+    retry_state = scheduler.start()
+    scheduler.record_response(503)
+    assert scheduler.allow_request()
+    assert scheduler.get_retry_delay(retry_state, 503, 0, '1') == 1
+    scheduler.record_response(503)
+    assert scheduler.circuit_breaker.state == CircuitState.OPEN
+    assert not scheduler.allow_request()
+    assert scheduler.get_retry_delay(retry_state, 503, 1, '1') is None
+
+
+def test_retry_scheduler_without_circuit_breaker_always_allows_requests():
+    scheduler = RetryScheduler()
+    for _ in range(100):
+        scheduler.record_response(500)
+    assert scheduler.allow_request()
+    assert scheduler.circuit_breaker is None
@@ -4,6 +4,7 @@
 
 from itertools import product
 
+from mock import patch
 import pytest
 
 from boxsdk.object.base_object import BaseObject
@@ -12,6 +13,7 @@
 from boxsdk.object.group import Group
 from boxsdk.object.user import User
 from boxsdk.object.web_link import WebLink
+from boxsdk.util import translator
 from boxsdk.util.translator import Translator
 
 
@@ -226,3 +228,97 @@ def test_translator_translates_metadata_template(default_translator, mock_box_se
 
     if metadata_template_response.get('id') is None:
         assert metadata_template.object_id is None
+
+
+def test_translate_inspects_each_class_once(default_translator, mock_box_session):
+
+    class Widget(BaseObject):
+        def __init__(self, session, object_id, response_object=None, extra=None):
+            super(Widget, self).__init__(session, object_id, response_object)
+            self.extra = extra
+
+    default_translator.register('widget', Widget)
+    with patch.object(translator, 'inspect_signature', wraps=translator.inspect_signature) as mock_inspect_signature:
+        widgets = [default_translator.translate(mock_box_session, {'type': 'widget', 'id': str(i)}) for i in range(3)]
+    assert [widget.object_id for widget in widgets] == ['0', '1', '2']
+    assert all(widget.extra is None for widget in widgets)
+    mock_inspect_signature.assert_called_once_with(Widget.__init__)
+
+
+def test_translate_keeps_leaf_values_and_untranslated_fields(default_translator, mock_box_session):
+    fields = [{'type': 'string', 'key': 'name'}]
+    response_object = {
+        'type': 'metadata_template',
+        'id': '12345',
+        'fields': fields,
+        'tags': ['a', {'type': 'user', 'id': '1'}],
+    }
+    metadata_template = default_translator.translate(mock_box_session, response_object)
+    assert metadata_template.fields is fields
+    assert metadata_template.tags[0] == 'a'
+    assert isinstance(metadata_template.tags[1], User)
+
+
+def test_translator_is_not_lazy_by_default():
+    assert Translator().lazy is False
+    assert Translator(lazy=True).lazy is True
+
+
+@pytest.fixture
+def lazy_file_response():
+    return {
+        'type': 'file',
+        'id': '22222',
+        'name': 'Test File',
+        'created_by': {'type': 'user', 'id': '33333', 'name': 'Test User'},
+        'path_collection': {'total_count': 1, 'entries': [{'type': 'folder', 'id': '0', 'name': 'All Files'}]},
+        'lock': {'type': 'lock', 'id': '44444', 'is_download_prevented': False},
+        'tags': ['a', 'b'],
+    }
+
+
+def test_lazy_translator_translates_fields_when_first_used(mock_box_session, lazy_file_response):
+    lazy_translator = Translator(lazy=True)
+    test_file = lazy_translator.translate(mock_box_session, lazy_file_response)
+    assert isinstance(test_file, File)
+    assert test_file.object_id == '22222'
+    assert test_file.name == 'Test File'
+    # pylint:disable=protected-access
+    assert dict.__getitem__(test_file._response_object, 'created_by') is lazy_file_response['created_by']
+
+    created_by = test_file.created_by
+    assert isinstance(created_by, User)
+    assert created_by.name == 'Test User'
+    assert created_by._session is mock_box_session
+    assert test_file.created_by is created_by
+    assert test_file['created_by'] is created_by
+    assert isinstance(test_file.path_collection['entries'][0], Folder)
+    assert test_file.tags == ['a', 'b']
+
+
+def test_lazy_translator_sets_fields_that_shadow_class_attributes(mock_box_session, lazy_file_response):
+    eager_file = Translator().translate(mock_box_session, lazy_file_response)
+    lazy_file = Translator(lazy=True).translate(mock_box_session, lazy_file_response)
+    assert lazy_file.lock == eager_file.lock
+    assert not callable(lazy_file.lock)
+
+
+def test_lazily_translated_object_has_same_response_object(mock_box_session, lazy_file_response):
+    lazy_file = Translator(lazy=True).translate(mock_box_session, lazy_file_response)
+    assert lazy_file.created_by.name == 'Test User'
+    assert lazy_file.response_object == lazy_file_response
+
+
+def test_lazily_translated_object_raises_attribute_error_for_missing_field(mock_box_session, lazy_file_response):
+    lazy_file = Translator(lazy=True).translate(mock_box_session, lazy_file_response)
+    with pytest.raises(AttributeError):
+        lazy_file.size  # pylint:disable=pointless-statement
+
+
+def test_lazy_translator_keeps_untranslated_fields(mock_box_session):
+    fields = [{'type': 'string', 'key': 'name'}]
+    metadata_template = Translator(lazy=True).translate(
+        mock_box_session,
+        {'type': 'metadata_template', 'id': '12345', 'fields': fields},
+    )
+    assert metadata_template.fields is fields